@@ -0,0 +1,24 @@
+"""Fixtures for the CPU hot-path benchmark suite.
+
+Sizes default to 1k, 10k and 100k tokens; set ``CLTK_BENCH_SIZES``
+(comma-separated) to run a subset, e.g. ``CLTK_BENCH_SIZES=1000,10000`` for a
+quick local check.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure src/ is importable when running benchmarks without installation
+_SRC = Path(__file__).resolve().parents[1] / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from synthetic import bench_sizes  # noqa: E402
+
+
+@pytest.fixture(params=bench_sizes(), ids=lambda n: f"{n // 1000}k")
+def n_tokens(request: pytest.FixtureRequest) -> int:
+    """Parametrize a benchmark over the configured document sizes."""
+    return int(request.param)
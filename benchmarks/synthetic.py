@@ -0,0 +1,106 @@
+"""Synthetic, fully annotated inputs for the hot-path benchmarks.
+
+Documents are built from a fixed Latin sentence template so that every size
+exercises the same code paths.
+"""
+
+import os
+from functools import cache
+
+from cltk.core.data_types import Classification, Doc, Language, Word
+from cltk.morphosyntax.conll import words_to_conllu
+from cltk.morphosyntax.normalization import convert_pos_features_to_ud
+from cltk.morphosyntax.ud_deprels import get_ud_deprel_tag
+from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
+
+DEFAULT_SIZES: tuple[int, ...] = (1_000, 10_000, 100_000)
+
+# (form, lemma, upos, feats, head (1-based, 0=root), deprel)
+SENTENCE_TEMPLATE: tuple[tuple[str, str, str, str, int, str], ...] = (
+    ("Gallia", "Gallia", "PROPN", "Case=Nom|Gender=Fem|Number=Sing", 4, "nsubj"),
+    ("est", "sum", "AUX", "Mood=Ind|Number=Sing|Person=3|Tense=Pres", 4, "cop"),
+    ("omnis", "omnis", "ADJ", "Case=Nom|Gender=Fem|Number=Sing", 1, "amod"),
+    ("divisa", "divido", "VERB", "Aspect=Perf|Gender=Fem|VerbForm=Part", 0, "root"),
+    ("in", "in", "ADP", "_", 6, "case"),
+    ("partes", "pars", "NOUN", "Case=Acc|Gender=Fem|Number=Plur", 4, "obl"),
+    ("tres", "tres", "NUM", "Case=Acc|Gender=Fem|NumType=Card", 6, "nummod"),
+    ("quarum", "qui", "PRON", "Case=Gen|Number=Plur|PronType=Rel", 9, "nmod"),
+    ("unam", "unus", "NUM", "Case=Acc|Gender=Fem|Number=Sing", 4, "conj"),
+    (".", ".", "PUNCT", "_", 4, "punct"),
+)
+
+
+def bench_sizes() -> list[int]:
+    """Return the token counts to benchmark."""
+    raw = os.environ.get("CLTK_BENCH_SIZES")
+    if not raw:
+        return list(DEFAULT_SIZES)
+    return [int(part) for part in raw.split(",") if part.strip()]
+
+
+def _language() -> Language:
+    return Language(
+        name="Latin",
+        glottolog_id="lati1261",
+        level="language",
+        classification=Classification(level="language"),
+    )
+
+
+@cache
+def synthetic_words(n_tokens: int) -> tuple[Word, ...]:
+    """Return ``n_tokens`` annotated words in 10-token sentences."""
+    upos = {row[2]: UDPartOfSpeechTag(tag=row[2]) for row in SENTENCE_TEMPLATE}
+    feats = {
+        row[3]: convert_pos_features_to_ud(row[3])
+        for row in SENTENCE_TEMPLATE
+        if row[3] != "_"
+    }
+    deprels = {row[5]: get_ud_deprel_tag(row[5]) for row in SENTENCE_TEMPLATE}
+    words: list[Word] = []
+    offset = 0
+    for idx in range(n_tokens):
+        form, lemma, pos, feat, head, deprel = SENTENCE_TEMPLATE[
+            idx % len(SENTENCE_TEMPLATE)
+        ]
+        words.append(
+            Word(
+                index_token=idx,
+                index_sentence=idx // len(SENTENCE_TEMPLATE),
+                index_char_start=offset,
+                index_char_stop=offset + len(form),
+                string=form,
+                lemma=lemma,
+                upos=upos[pos],
+                features=feats.get(feat),
+                governor=head - 1 if head else None,
+                dependency_relation=deprels[deprel],
+            )
+        )
+        offset += len(form) + 1
+    return tuple(words)
+
+
+def synthetic_doc(n_tokens: int) -> Doc:
+    """Return a fresh ``Doc`` over ``n_tokens`` synthetic words."""
+    words = list(synthetic_words(n_tokens))
+    text = " ".join(w.string or "" for w in words)
+    return Doc(language=_language(), raw=text, normalized_text=text, words=words)
+
+
+@cache
+def synthetic_text(n_tokens: int) -> str:
+    """Return raw text of roughly ``n_tokens`` tokens."""
+    return " ".join(w.string or "" for w in synthetic_words(n_tokens))
+
+
+@cache
+def synthetic_conllu(n_tokens: int) -> str:
+    """Return a multi-sentence CoNLL-U string of ``n_tokens`` tokens."""
+    words = synthetic_words(n_tokens)
+    size = len(SENTENCE_TEMPLATE)
+    blocks = [
+        words_to_conllu(words[start : start + size])
+        for start in range(0, n_tokens, size)
+    ]
+    return "\n".join(blocks)
@@ -0,0 +1,129 @@
+"""pytest-benchmark suite for CLTK's CPU-bound hot paths.
+
+Run, save, and compare against the stored baseline with::
+
+    make benchmark        # compare against the saved baseline, fail on regression
+    make benchmarkSave    # record a new baseline
+
+"""
+
+from typing import Any
+
+import pytest
+from synthetic import (
+    SENTENCE_TEMPLATE,
+    synthetic_conllu,
+    synthetic_doc,
+    synthetic_text,
+    synthetic_words,
+)
+
+from cltk.cli.dispatch import doc_to_json
+from cltk.core.data_types import UDFeatureTag
+from cltk.evaluation.compare_backends import _align_tokens
+from cltk.exports.tei import doc_to_tei_xml
+from cltk.morphosyntax.conll import conllu_to_words, words_to_conllu
+from cltk.morphosyntax.normalization import convert_pos_features_to_ud
+from cltk.sentence.utils import split_sentences_multilang
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _feature_strings(n_tokens: int) -> list[str]:
+    feats = [row[3] for row in SENTENCE_TEMPLATE]
+    return [
+        feats[i % len(feats)] for i in range(n_tokens) if feats[i % len(feats)] != "_"
+    ]
+
+
+def _feature_pairs(n_tokens: int) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
+    for feats in _feature_strings(n_tokens):
+        for pair in feats.split("|"):
+            key, value = pair.split("=", 1)
+            pairs.append((key, value))
+            if len(pairs) >= n_tokens:
+                return pairs
+    return pairs
+
+
+def test_split_sentences_multilang(benchmark: Any, n_tokens: int) -> None:
+    text = synthetic_text(n_tokens)
+    bounds = benchmark(split_sentences_multilang, text, "lati1261")
+    assert len(bounds) == n_tokens // len(SENTENCE_TEMPLATE)
+
+
+def test_convert_pos_features_to_ud(benchmark: Any, n_tokens: int) -> None:
+    feats = _feature_strings(n_tokens)
+
+    def run() -> list[Any]:
+        return [convert_pos_features_to_ud(f) for f in feats]
+
+    result = benchmark(run)
+    assert len(result) == len(feats)
+
+
+def test_ud_feature_tag_validation(benchmark: Any, n_tokens: int) -> None:
+    pairs = _feature_pairs(n_tokens)
+
+    def run() -> list[UDFeatureTag]:
+        return [UDFeatureTag(key=key, value=value) for key, value in pairs]
+
+    result = benchmark(run)
+    assert len(result) == len(pairs)
+
+
+def test_conllu_to_words(benchmark: Any, n_tokens: int) -> None:
+    conllu = synthetic_conllu(n_tokens)
+    words = benchmark(conllu_to_words, conllu)
+    assert len(words) == n_tokens
+
+
+def test_words_to_conllu(benchmark: Any, n_tokens: int) -> None:
+    words = list(synthetic_words(n_tokens))
+    conllu = benchmark(words_to_conllu, words)
+    assert conllu.count("\n") == n_tokens
+
+
+def test_doc_to_feature_table(benchmark: Any, n_tokens: int) -> None:
+    pytest.importorskip("pyarrow")
+    from cltk.utils.file_outputs import doc_to_feature_table
+
+    doc = synthetic_doc(n_tokens)
+    table = benchmark(doc_to_feature_table, doc)
+    assert table.num_rows == n_tokens
+
+
+def test_doc_to_json(benchmark: Any, n_tokens: int) -> None:
+    doc = synthetic_doc(n_tokens)
+    data = benchmark(doc_to_json, doc)
+    assert data
+
+
+def test_doc_to_tei_xml(benchmark: Any, n_tokens: int) -> None:
+    doc = synthetic_doc(n_tokens)
+    xml = benchmark(doc_to_tei_xml, doc)
+    assert xml.startswith("<")
+
+
+def test_align_tokens(benchmark: Any, n_tokens: int) -> None:
+    # Per-sentence alignment, as compare_backends does, with one differing
+    # token per sentence so the DP path (not the positional fast path) runs.
+    size = len(SENTENCE_TEMPLATE)
+    forms = [w.string or "" for w in synthetic_words(n_tokens)]
+    pairs = []
+    for start in range(0, n_tokens, size):
+        base = forms[start : start + size]
+        other = base[:-1] + ["?"]
+        pairs.append((base, other))
+
+    def run() -> int:
+        return sum(_align_tokens(base, other).cost for base, other in pairs)
+
+    assert benchmark(run) == len(pairs)
+
+
+def test_doc_sentences(benchmark: Any, n_tokens: int) -> None:
+    doc = synthetic_doc(n_tokens)
+    sentences = benchmark(lambda: doc.sentences)
+    assert len(sentences) == n_tokens // len(SENTENCE_TEMPLATE)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import mkdocs_gen_files
 
-LANGUAGES_PATH = Path("src/cltk/languages/languages.py")
+LANGUAGES_PATH = Path("src/cltk/languages/languages.jsonl")
 USER_DEFINED_EXAMPLE_PATH = Path("scripts/example_user_defined_language.py")
 DOCS_PATH = Path("docs/languages.md")
 
@@ -14,20 +15,18 @@ USER_START_MARKER = "<!-- USER_DEFINED_LANG:START -->"
 USER_END_MARKER = "<!-- USER_DEFINED_LANG:END -->"
 
 
-def _extract_languages_block(text: str) -> str:
-    lines = text.splitlines()
-    start = None
-    end = None
-    for i, line in enumerate(lines):
-        if line.startswith("LANGUAGES:"):
-            start = i
-            continue
-        if start is not None and line.startswith("__all__"):
-            end = i
-            break
-    if start is None or end is None:
-        raise ValueError("Could not find LANGUAGES block boundaries.")
-    return "\n".join(lines[start:end]).rstrip()
+def _extract_languages_block(data: bytes) -> str:
+    """Render the compiled language artifact as one pretty-printed JSON object."""
+    lines = data.splitlines()
+    header = json.loads(lines[0])
+    if header.get("format") != "cltk-languages":
+        raise ValueError(f"{LANGUAGES_PATH} is not a CLTK language artifact.")
+    body_start = len(lines[0]) + 1
+    languages = {}
+    for key, entry in header["entries"].items():
+        start = body_start + entry["offset"]
+        languages[key] = json.loads(data[start : start + entry["length"]])
+    return json.dumps(languages, ensure_ascii=False, indent=2)
 
 
 def _build_languages_insert(block: str) -> str:
@@ -35,9 +34,9 @@ def _build_languages_insert(block: str) -> str:
         [
             START_MARKER,
             "<details>",
-            "<summary>Current curated list (generated from `src/cltk/languages/languages.py`)</summary>",
+            "<summary>Current curated list (generated from `src/cltk/languages/languages.jsonl`)</summary>",
             "",
-            "```python",
+            "```json",
             block,
             "```",
             "",
@@ -64,8 +63,7 @@ def _build_user_example_insert(block: str) -> str:
     )
 
 
-lang_text = LANGUAGES_PATH.read_text()
-lang_block = _extract_languages_block(lang_text)
+lang_block = _extract_languages_block(LANGUAGES_PATH.read_bytes())
 lang_insert = _build_languages_insert(lang_block)
 user_block = USER_DEFINED_EXAMPLE_PATH.read_text().rstrip()
 user_insert = _build_user_example_insert(user_block)
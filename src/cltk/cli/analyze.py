@@ -20,6 +20,7 @@ from cltk.cli.utils import (
     write_json_output,
     write_text_output,
 )
+from cltk.core.corpus_archive import CorpusArchiveWriter
 from cltk.core.data_types import CLTKConfig, Doc
 
 
@@ -53,8 +54,10 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
     )
     parser.add_argument(
         "--out",
-        required=True,
-        help="Output type (raw, conllu, readers-guide, feature-table, json).",
+        help=(
+            "Output type (raw, conllu, readers-guide, feature-table, json). "
+            "Optional in batch mode when --archive is given."
+        ),
     )
     parser.add_argument(
         "--format",
@@ -68,6 +71,21 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         "--out-dir",
         help="Output directory for batch mode (--input-dir).",
     )
+    parser.add_argument(
+        "--archive",
+        help=(
+            "Batch mode: also store every analyzed Doc in this corpus archive, "
+            "appending if it exists. Files already in the archive are skipped."
+        ),
+    )
+    parser.add_argument(
+        "--archive-compression",
+        choices=("zlib", "zstd"),
+        help=(
+            "Codec for a new --archive (default: zlib). zstd requires "
+            'pip install "cltk[zstd]".'
+        ),
+    )
     parser.add_argument(
         "--config",
         help="JSON string or path to JSON file for backend/pipeline settings.",
@@ -121,6 +139,10 @@ def run(args: argparse.Namespace) -> int:
 
     if args.out_dir:
         raise SystemExit("--out-dir is only valid with --input-dir.")
+    if args.archive:
+        raise SystemExit("--archive is only valid with --input-dir.")
+    if not args.out:
+        raise SystemExit("--out is required.")
 
     text = load_text(args.text, args.text_file)
     try:
@@ -141,16 +163,21 @@ def _run_batch(args: argparse.Namespace, cltk_config: CLTKConfig) -> int:
         raise SystemExit(f"Input path is not a directory: {input_dir}")
     if args.text or args.text_file:
         raise SystemExit("Batch mode does not accept --text or --text-file.")
-    if not args.out_dir:
-        raise SystemExit("Batch mode requires --out-dir.")
+    if not args.out_dir and not args.archive:
+        raise SystemExit("Batch mode requires --out-dir or --archive.")
+    if args.archive_compression and not args.archive:
+        raise SystemExit("--archive-compression requires --archive.")
+    if args.out_dir and not args.out:
+        raise SystemExit("--out-dir requires --out.")
     if args.out_file:
         raise SystemExit("Batch mode does not accept --out-file.")
 
-    try:
-        fmt = dispatch.resolve_format(args.out, args.format)
-    except ValueError as exc:
-        raise SystemExit(str(exc)) from exc
-    out_dir = Path(args.out_dir)
+    fmt: Optional[str] = None
+    if args.out_dir:
+        try:
+            fmt = dispatch.resolve_format(args.out, args.format)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
     pattern = args.glob or "*.txt"
     files = sorted(input_dir.rglob(pattern))
     if not files:
@@ -158,25 +185,55 @@ def _run_batch(args: argparse.Namespace, cltk_config: CLTKConfig) -> int:
 
     try:
         nlp = NLP(cltk_config=cltk_config, suppress_banner=True)
+        archive = (
+            CorpusArchiveWriter(args.archive, compression=args.archive_compression)
+            if args.archive
+            else None
+        )
     except Exception as exc:
         raise SystemExit(str(exc)) from exc
-    for path in files:
-        if not path.is_file():
-            continue
-        rel_path = path.relative_to(input_dir)
-        out_path = out_dir / rel_path
-        out_path = out_path.with_suffix(_output_extension(args.out, fmt))
-        try:
-            text = path.read_text(encoding="utf-8")
-            if not text.strip():
-                raise ValueError("Input text is empty.")
-            doc = nlp.analyze(text)
-            _emit_output(doc, args, out_path=out_path, format_override=fmt)
-        except Exception as exc:
-            if args.continue_on_error:
-                print(f"Error processing {path}: {exc}", file=sys.stderr)
+    try:
+        for path in files:
+            if not path.is_file():
                 continue
-            raise SystemExit(f"Error processing {path}: {exc}") from exc
+            rel_path = path.relative_to(input_dir)
+            doc_id = rel_path.as_posix()
+            archived = archive is not None and doc_id in archive
+            if archived:
+                # Re-running a batch resumes it instead of failing on the
+                # first document already stored.
+                if not args.out_dir:
+                    print(
+                        f"Skipping {path}: '{doc_id}' is already in {args.archive}.",
+                        file=sys.stderr,
+                    )
+                    continue
+                print(
+                    f"{path}: '{doc_id}' is already in {args.archive}; "
+                    "writing --out-dir output only.",
+                    file=sys.stderr,
+                )
+            try:
+                text = path.read_text(encoding="utf-8")
+                if not text.strip():
+                    raise ValueError("Input text is empty.")
+                doc = nlp.analyze(text)
+                if archive is not None and not archived:
+                    archive.add(doc, doc_id=doc_id)
+                if args.out_dir:
+                    out_path = (Path(args.out_dir) / rel_path).with_suffix(
+                        _output_extension(args.out, fmt)
+                    )
+                    _emit_output(doc, args, out_path=out_path, format_override=fmt)
+            except Exception as exc:
+                if args.continue_on_error:
+                    print(f"Error processing {path}: {exc}", file=sys.stderr)
+                    continue
+                raise SystemExit(f"Error processing {path}: {exc}") from exc
+    finally:
+        # Keep the documents analyzed so far, even if a later one failed.
+        if archive is not None:
+            archive.close()
     return 0
 
 
@@ -0,0 +1,148 @@
+"""CLI handler for the ``cltk bench`` subcommand."""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from cltk import NLP
+from cltk.cli.utils import (
+    HelpFormatter,
+    build_cltk_config,
+    parse_json_input,
+    resolve_pipeline,
+    set_log_level,
+    write_json_output,
+    write_text_output,
+)
+from cltk.evaluation.bench import (
+    check_regressions,
+    load_corpus,
+    report_to_markdown,
+    run_benchmark,
+)
+
+
+def configure_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the bench subcommand parser."""
+    parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark pipeline throughput and latency over a corpus.",
+        formatter_class=HelpFormatter,
+    )
+    parser.add_argument(
+        "--lang",
+        "--language",
+        dest="language",
+        required=True,
+        help="Glottolog id or CLTK language key.",
+    )
+    parser.add_argument(
+        "--backend",
+        default="stanza",
+        help="Backend to use (stanza, openai, ollama, mistral, spacy).",
+    )
+    parser.add_argument("--pipeline", help="Optional pipeline class name to use.")
+    parser.add_argument(
+        "--config",
+        help="JSON string or path to JSON file for backend/pipeline settings.",
+    )
+    parser.add_argument(
+        "--corpus-dir",
+        help="Directory of text files; defaults to the built-in example text.",
+    )
+    parser.add_argument(
+        "--glob",
+        default="*.txt",
+        help="Glob pattern for --corpus-dir (default: *.txt).",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=3,
+        help="Measured passes over the corpus (default: 3).",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Unmeasured passes before measuring (default: 1).",
+    )
+    parser.add_argument("--json", dest="json_path", help="Write JSON report here.")
+    parser.add_argument(
+        "--markdown",
+        dest="markdown_path",
+        help="Write Markdown report here; defaults to stdout.",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Earlier JSON report; exit 1 if any metric regresses.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed relative change versus --baseline (default: 0.1).",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress non-error logs.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable info-level logs.",
+    )
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the bench command."""
+    set_log_level(quiet=args.quiet, verbose=args.verbose)
+    if args.iterations <= 0:
+        raise SystemExit("--iterations must be a positive integer.")
+    if args.warmup < 0:
+        raise SystemExit("--warmup must be zero or a positive integer.")
+    if args.tolerance < 0:
+        raise SystemExit("--tolerance must not be negative.")
+    baseline = _load_baseline(args.baseline) if args.baseline else None
+    config = parse_json_input(args.config) if args.config else None
+    pipeline = resolve_pipeline(args.pipeline) if args.pipeline else None
+    cltk_config = build_cltk_config(
+        language=args.language,
+        backend=args.backend,
+        config=config,
+        pipeline=pipeline,
+    )
+    try:
+        nlp = NLP(cltk_config=cltk_config, suppress_banner=True)
+        corpus = load_corpus(str(nlp.language.glottolog_id), args.corpus_dir, args.glob)
+        report = run_benchmark(
+            nlp, corpus, iterations=args.iterations, warmup=args.warmup
+        )
+    except Exception as exc:
+        raise SystemExit(str(exc)) from exc
+
+    regressions = None
+    if baseline is not None:
+        regressions = check_regressions(report, baseline, tolerance=args.tolerance)
+        report["regressions"] = regressions
+    if args.json_path:
+        write_json_output(report, Path(args.json_path), pretty=True)
+    markdown_path = Path(args.markdown_path) if args.markdown_path else None
+    write_text_output(report_to_markdown(report, regressions), markdown_path)
+    return 1 if regressions else 0
+
+
+def _load_baseline(path: str) -> dict[str, Any]:
+    """Read a baseline JSON report."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise SystemExit(f"Baseline file not found: {path}") from exc
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Invalid JSON in baseline: {exc}") from exc
+    if not isinstance(data, dict):
+        raise SystemExit("Baseline JSON must be an object (mapping).")
+    return data
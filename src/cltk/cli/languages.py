@@ -0,0 +1,54 @@
+"""CLI handler for the ``cltk languages`` subcommand."""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+
+from cltk.cli.utils import HelpFormatter
+from cltk.languages.glottolog import search_languages
+
+
+def configure_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the languages subcommand parser."""
+    parser = subparsers.add_parser(
+        "languages",
+        help="Search language names, alt-names, and codes for --lang values.",
+        formatter_class=HelpFormatter,
+    )
+    parser.add_argument(
+        "query",
+        help='Name, code, or partial name (e.g. "ancient greek", "grc", "lat").',
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Maximum number of candidates (default: 10).",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="Print matches as JSON.")
+    output.add_argument(
+        "--ids",
+        action="store_true",
+        help="Print only glottocodes, one per line (for shell completion).",
+    )
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the languages command."""
+    if args.limit <= 0:
+        raise SystemExit("--limit must be a positive integer.")
+    matches = search_languages(args.query, limit=args.limit)
+    if args.json:
+        json.dump([asdict(m) for m in matches], sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+    elif args.ids:
+        for match in matches:
+            print(match.dialect_id or match.glottolog_id)
+    else:
+        for match in matches:
+            code = match.dialect_id or match.glottolog_id
+            print(f"{code}\t{match.name}\t{match.matched}\t{match.kind}")
+    return 0 if matches else 1
@@ -3,7 +3,7 @@
 import argparse
 from typing import Callable, Optional, cast
 
-from cltk.cli import analyze, compare, export, pipeline
+from cltk.cli import analyze, bench, compare, export, languages, pipeline, simulate
 from cltk.cli.utils import HelpFormatter
 
 
@@ -16,9 +16,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
     analyze.configure_parser(subparsers)
+    bench.configure_parser(subparsers)
     compare.configure_parser(subparsers)
     export.configure_parser(subparsers)
+    languages.configure_parser(subparsers)
     pipeline.configure_parser(subparsers)
+    simulate.configure_parser(subparsers)
     return parser
 
 
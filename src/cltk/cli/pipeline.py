@@ -55,11 +55,10 @@ def _validate(args: argparse.Namespace) -> int:
     """Validate that all steps in a spec are registered processes."""
     spec = load_pipeline_spec(args.toml)
     steps = spec.steps or []
-    missing = [
-        step.id for step in steps if step.id not in ProcessRegistry.list_processes()
-    ]
+    known = ProcessRegistry.list_process_ids()
+    missing = [step.id for step in steps if step.id not in known]
     if missing:
-        available = ", ".join(sorted(ProcessRegistry.list_processes()))
+        available = ", ".join(known)
         raise SystemExit(
             f"Unknown process_id(s): {', '.join(missing)}. Available: {available}"
         )
@@ -0,0 +1,121 @@
+"""CLI handler for the ``cltk simulate`` subcommand."""
+
+import argparse
+
+from cltk.cli.utils import HelpFormatter, set_log_level
+from cltk.genai.simulator import LatencyProfile, LLMSimulator, SimulatorConfig
+
+
+def configure_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the simulate subcommand parser."""
+    parser = subparsers.add_parser(
+        "simulate",
+        help="Serve a local OpenAI/Ollama/Mistral API simulator for offline runs.",
+        formatter_class=HelpFormatter,
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+    parser.add_argument("--port", type=int, default=8089, help="Port to bind.")
+    parser.add_argument(
+        "--latency",
+        default="fixed",
+        choices=["fixed", "uniform", "normal", "lognormal"],
+        help="Latency distribution for each completion.",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Mean latency in milliseconds.",
+    )
+    parser.add_argument(
+        "--latency-stddev-ms",
+        type=float,
+        default=0.0,
+        help="Latency standard deviation (normal, lognormal).",
+    )
+    parser.add_argument(
+        "--latency-min-ms",
+        type=float,
+        default=0.0,
+        help="Lower latency bound in milliseconds.",
+    )
+    parser.add_argument(
+        "--latency-max-ms",
+        type=float,
+        help="Upper latency bound in milliseconds.",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with HTTP 500.",
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with HTTP 429.",
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=0.0,
+        help="Retry-After seconds sent with HTTP 429 responses.",
+    )
+    parser.add_argument("--seed", type=int, help="Seed for latency and faults.")
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress non-error logs.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable info-level logs.",
+    )
+    parser.set_defaults(func=run)
+
+
+def build_simulator_config(args: argparse.Namespace) -> SimulatorConfig:
+    """Translate CLI flags into a ``SimulatorConfig``."""
+    try:
+        return SimulatorConfig(
+            latency=LatencyProfile(
+                distribution=args.latency,
+                mean_ms=args.latency_ms,
+                stddev_ms=args.latency_stddev_ms,
+                min_ms=args.latency_min_ms,
+                max_ms=args.latency_max_ms,
+            ),
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after_s=args.retry_after,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        raise SystemExit(f"Invalid simulator settings: {exc}") from exc
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the simulate command until interrupted."""
+    set_log_level(quiet=args.quiet, verbose=args.verbose)
+    simulator = LLMSimulator(
+        build_simulator_config(args), host=args.host, port=args.port
+    )
+    base = f"http://{args.host}:{args.port}"
+    print(f"CLTK GenAI simulator listening on {base}")
+    print("Point CLTK at it with:")
+    print(f"  export OPENAI_BASE_URL={base}/v1 OPENAI_API_KEY=sk-simulator")
+    print(f"  export OLLAMA_HOST={base}")
+    print(f"  export MISTRAL_SERVER_URL={base} MISTRAL_API_KEY=simulator")
+    try:
+        simulator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    stats = simulator.stats
+    print(
+        f"Served {stats.completed} completions "
+        f"({stats.rate_limited} rate-limited, {stats.errors_injected} errors); "
+        f"tokens in={stats.input_tokens} out={stats.output_tokens}"
+    )
+    return 0
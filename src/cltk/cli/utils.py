@@ -124,6 +124,8 @@ def build_cltk_config(
             data.update(config)
         else:
             data[normalized_backend] = config
+    if "language" not in data:
+        _check_language(language)
     data["language_code"] = language
     data["backend"] = normalized_backend
     data["suppress_banner"] = True
@@ -135,6 +137,25 @@ def build_cltk_config(
         raise SystemExit(str(exc)) from exc
 
 
+def _check_language(language: str) -> None:
+    """Exit with close matches when ``language`` does not resolve."""
+    from cltk.languages.glottolog import get_language, search_languages
+
+    try:
+        get_language(language)
+    except KeyError as exc:
+        message = str(exc.args[0]) if exc.args else f"Unknown language '{language}'"
+        suggestions = [
+            f"{m.dialect_id} ({m.matched}, {m.name})"
+            if m.dialect_id
+            else f"{m.glottolog_id} ({m.name})"
+            for m in search_languages(language, limit=5)
+        ]
+        if suggestions:
+            message += ". Did you mean: " + ", ".join(suggestions) + "?"
+        raise SystemExit(message) from exc
+
+
 def feature_table_rows(table: Any) -> tuple[list[str], list[dict[str, Any]]]:
     """Return column names and rows for a pyarrow-style table."""
     rows = table.to_pylist() if hasattr(table, "to_pylist") else None
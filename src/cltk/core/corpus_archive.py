@@ -0,0 +1,385 @@
+"""Single-file, compressed archives of analyzed ``Doc`` objects.
+
+A corpus archive stores many documents in one file instead of one JSON file
+per document. Each ``Doc`` is serialized with ``cltk.core.doc_store`` and
+compressed on its own, and an index at the end of the file records the
+position, document id and metadata of every block:
+
+    header | block 0 | block 1 | ... | index | trailer
+
+Any document can therefore be read without decompressing the others, and the
+index can be searched without reading any document. Appending writes the new
+blocks and a new index after the old trailer. If an append is interrupted
+before the new index is written, readers and writers fall back to the last
+complete index, so the documents it lists stay readable.
+
+Blocks are compressed with zlib unless Zstandard is requested, which needs
+the ``zstandard`` package (``pip install "cltk[zstd]"``) or, on Python 3.14+,
+the ``compression.zstd`` standard library module. The codec is recorded in
+the archive.
+"""
+
+import importlib
+import json
+import mmap
+import struct
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from types import ModuleType, TracebackType
+from typing import Any, BinaryIO, Callable, NamedTuple, Optional, Union
+
+from cltk.core.data_types import Doc
+from cltk.core.doc_store import doc_from_bytes, doc_to_bytes
+
+#: First bytes of every corpus archive.
+ARCHIVE_MAGIC = b"CLTKARC\x00"
+#: Last bytes of every corpus archive, after the index position.
+INDEX_MAGIC = b"CLTKIDX\x00"
+#: Version of the archive layout written by ``CorpusArchiveWriter``.
+ARCHIVE_VERSION = 1
+
+# Magic, version, reserved.
+_HEADER = struct.Struct("<8sII")
+# Index offset, index size, magic.
+_TRAILER = struct.Struct("<QQ8s")
+
+
+class ArchiveEntry(NamedTuple):
+    """Index record of one document in a corpus archive."""
+
+    doc_id: str
+    offset: int
+    size: int
+    raw_size: int
+    metadata: dict[str, Any]
+
+
+def _zstd() -> Optional[ModuleType]:
+    """Return ``compression.zstd`` (Python 3.14+) or ``zstandard``, if installed."""
+    for name in ("compression.zstd", "zstandard"):
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+def _codec(
+    name: str, level: Optional[int] = None
+) -> tuple[Callable[[bytes], bytes], Callable[[bytes, int], bytes]]:
+    """Return ``(compress, decompress)`` functions for codec ``name``.
+
+    Raises:
+        ImportError: If ``name`` is ``"zstd"`` and no Zstandard module exists.
+        ValueError: If ``name`` is not a known codec.
+
+    """
+    if name == "zlib":
+        zlib_level = 6 if level is None else level
+        return (
+            lambda data: zlib.compress(data, zlib_level),
+            lambda data, _: zlib.decompress(data),
+        )
+    if name != "zstd":
+        raise ValueError(f"Unknown archive compression '{name}'; use zstd or zlib.")
+    module = _zstd()
+    if module is None:
+        raise ImportError(
+            "Zstandard compression requires `zstandard`. "
+            'Install it via `pip install "cltk[zstd]"`.'
+        )
+    zstd_level = 3 if level is None else level
+    if module.__name__ == "zstandard":
+        compressor = module.ZstdCompressor(level=zstd_level)
+        decompressor = module.ZstdDecompressor()
+        return (
+            compressor.compress,
+            lambda data, size: decompressor.decompress(data, max_output_size=size),
+        )
+    return (
+        lambda data: module.compress(data, level=zstd_level),
+        lambda data, _: module.decompress(data),
+    )
+
+
+def _index_ending_at(buffer: Any, end: int) -> Optional[dict[str, Any]]:
+    """Return the index whose trailer ends at ``end``, or None if there is none."""
+    trailer = end - _TRAILER.size
+    index_offset, index_size, index_magic = _TRAILER.unpack_from(buffer, trailer)
+    if (
+        index_magic != INDEX_MAGIC
+        or index_offset < _HEADER.size
+        or index_offset + index_size != trailer
+    ):
+        return None
+    try:
+        index: dict[str, Any] = json.loads(
+            zlib.decompress(buffer[index_offset:trailer])
+        )
+    except (zlib.error, ValueError):
+        return None
+    return index
+
+
+def _read_index(buffer: Any, source: str) -> tuple[str, list[ArchiveEntry], int]:
+    """Return the codec, index entries and end of the last complete index.
+
+    An append that was interrupted before ``close()`` leaves blocks after the
+    last trailer; the index before them is used instead.
+
+    Raises:
+        ValueError: If ``buffer`` does not hold a corpus archive, or no index
+            was ever completed.
+
+    """
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f"{source} is not a CLTK corpus archive.")
+    magic, version, _ = _HEADER.unpack_from(buffer)
+    if magic != ARCHIVE_MAGIC:
+        raise ValueError(f"{source} is not a CLTK corpus archive.")
+    if version != ARCHIVE_VERSION:
+        raise ValueError(
+            f"Unsupported CLTK corpus archive version {version} in {source}."
+        )
+    end = len(buffer)
+    while end >= _HEADER.size + _TRAILER.size:
+        index = _index_ending_at(buffer, end)
+        if index is not None:
+            entries = [
+                ArchiveEntry(
+                    entry["id"],
+                    entry["offset"],
+                    entry["size"],
+                    entry["raw_size"],
+                    entry["metadata"],
+                )
+                for entry in index["entries"]
+            ]
+            return index["compression"], entries, end
+        found = buffer.rfind(INDEX_MAGIC, _HEADER.size, end - 1)
+        if found < 0:
+            break
+        end = found + len(INDEX_MAGIC)
+    raise ValueError(f"{source} has no complete index; it was never closed.")
+
+
+class CorpusArchiveWriter:
+    """Add ``Doc`` objects to a new or existing corpus archive.
+
+    Use as a context manager; the index is written on ``close()``::
+
+        with CorpusArchiveWriter("corpus.cltkarc") as archive:
+            archive.add(doc, doc_id="aeneid-1", metadata={"author": "Vergil"})
+
+    Args:
+        path: Archive file. An existing archive is appended to; documents
+            left without an index by an interrupted append are dropped.
+        compression: ``"zlib"`` or ``"zstd"``. Defaults to the codec of an
+            existing archive, else ``"zlib"``.
+        level: Compression level for the codec.
+
+    Raises:
+        ValueError: If ``path`` exists but is not an archive (or has no
+            complete index), or ``compression`` differs from the codec of the
+            existing archive.
+        ImportError: If the archive uses Zstandard and no Zstandard module
+            is installed.
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+    ) -> None:
+        self.path = Path(path)
+        self._entries: dict[str, ArchiveEntry] = {}
+        self._fh: BinaryIO
+        exists = self.path.exists() and self.path.stat().st_size > 0
+        if exists:
+            with (
+                self.path.open("rb") as fh,
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+            ):
+                codec, entries, end = _read_index(buffer, str(self.path))
+            if compression is not None and compression != codec:
+                raise ValueError(
+                    f"{self.path} uses {codec} compression, not {compression}."
+                )
+            self._entries = {entry.doc_id: entry for entry in entries}
+        else:
+            codec = compression or "zlib"
+        self.compression = codec
+        self._compress, _ = _codec(codec, level)
+        if exists:
+            # Drop any blocks left after the last index by an interrupted append.
+            self._fh = self.path.open("r+b")
+            self._start = self._fh.seek(end)
+            self._fh.truncate()
+        else:
+            self._fh = self.path.open("wb")
+            self._fh.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, 0))
+            self._start = 0
+        self._offset = self._fh.tell()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._entries
+
+    def add(
+        self,
+        doc: Doc,
+        *,
+        doc_id: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> ArchiveEntry:
+        """Compress ``doc`` into the archive.
+
+        Args:
+            doc: Document to store.
+            doc_id: Unique id; defaults to the number of documents so far.
+            metadata: JSON-serializable values stored in the index. The
+                document's ``language`` (Glottolog id or name) and number of
+                ``words`` are recorded unless given here.
+
+        Returns:
+            The index entry of the stored document.
+
+        Raises:
+            ValueError: If ``doc_id`` is already in the archive.
+
+        """
+        if doc_id is None:
+            doc_id = str(len(self._entries))
+        if doc_id in self._entries:
+            raise ValueError(f"Document id '{doc_id}' is already in {self.path}.")
+        data = doc_to_bytes(doc)
+        block = self._compress(data)
+        self._fh.write(block)
+        entry = ArchiveEntry(
+            doc_id,
+            self._offset,
+            len(block),
+            len(data),
+            {
+                "language": doc.language.glottolog_id or doc.language.name,
+                "words": len(doc.words),
+                **(metadata or {}),
+            },
+        )
+        self._entries[doc_id] = entry
+        self._offset += len(block)
+        return entry
+
+    def close(self) -> None:
+        """Write the index and trailer and close the file."""
+        if self._fh.closed:
+            return
+        index = {
+            "compression": self.compression,
+            "entries": [
+                {
+                    "id": entry.doc_id,
+                    "offset": entry.offset,
+                    "size": entry.size,
+                    "raw_size": entry.raw_size,
+                    "metadata": entry.metadata,
+                }
+                for entry in self._entries.values()
+            ],
+        }
+        data = zlib.compress(json.dumps(index).encode("utf-8"))
+        self._fh.write(data)
+        self._fh.write(_TRAILER.pack(self._offset, len(data), INDEX_MAGIC))
+        self._fh.close()
+
+    def abort(self) -> None:
+        """Close without writing an index, dropping documents added since opening."""
+        if self._fh.closed:
+            return
+        self._fh.truncate(self._start)
+        self._fh.close()
+        if self._start == 0:
+            self.path.unlink()
+
+    def __enter__(self) -> "CorpusArchiveWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class CorpusArchive(Mapping[str, Doc]):
+    """Read-only, random-access view of a corpus archive.
+
+    ``archive[doc_id]`` decompresses only that document, and iterating over
+    ``archive.docs()`` (or ``values()``) yields documents one at a time.
+    ``entries`` gives the index, including per-document metadata, without
+    reading any document.
+
+    Args:
+        path: Archive file written by ``CorpusArchiveWriter``.
+
+    Raises:
+        ValueError: If ``path`` is not a corpus archive of a supported version
+            or has no complete index.
+        ImportError: If the archive is Zstandard-compressed and no Zstandard
+            module is installed.
+
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            self._buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self.compression, entries, _ = _read_index(self._buffer, str(self.path))
+        self.entries: dict[str, ArchiveEntry] = {
+            entry.doc_id: entry for entry in entries
+        }
+        _, self._decompress = _codec(self.compression)
+
+    def __getitem__(self, doc_id: str) -> Doc:
+        entry = self.entries[doc_id]
+        data = self._decompress(
+            self._buffer[entry.offset : entry.offset + entry.size], entry.raw_size
+        )
+        return doc_from_bytes(data, source=f"{self.path}[{doc_id}]")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def docs(self, doc_ids: Optional[Iterable[str]] = None) -> Iterator[Doc]:
+        """Yield documents in archive order, or those in ``doc_ids``."""
+        for doc_id in self.entries if doc_ids is None else doc_ids:
+            yield self[doc_id]
+
+    def close(self) -> None:
+        """Release the memory map of the archive file."""
+        self._buffer.close()
+
+    def __enter__(self) -> "CorpusArchive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
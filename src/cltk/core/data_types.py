@@ -8,17 +8,41 @@ and render well in documentation.
 """
 
 from abc import abstractmethod
-from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from copy import deepcopy
 from datetime import date
-from typing import Any, ClassVar, Iterable, Literal, Optional, TypeAlias, Union
+from pathlib import Path
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Optional,
+    TypeAlias,
+    Union,
+)
 
 import numpy as np
-from pydantic import AnyUrl, BaseModel, Field, PrivateAttr, model_validator
+from pydantic import (
+    AnyUrl,
+    BaseModel,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    WrapSerializer,
+    model_validator,
+)
 
 from cltk.core.cltk_logger import logger
+from cltk.core.embedding_store import EmbeddingMatrix
 from cltk.core.provenance import ProvenanceRecord
+from cltk.core.token_store import MISSING, TokenTable, WordSequence
+from cltk.core.trusted_models import construct_trusted
 from cltk.morphosyntax.ud_deprels import UDDeprelTag
 from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
+from cltk.text.utils import NormalizationOffsets
 
 # --- Type aliases (mark with TypeAlias to appease linters/IDEs) ---------------
 Level: TypeAlias = Literal["family", "language", "dialect"]
@@ -114,8 +138,12 @@ class UDFeatureTag(BaseModel):
         category: Feature category populated from the canonical definition.
         inflectional_class: Optional inflectional class for the feature.
 
+    Tags are immutable; ``UDFeatureTag.trusted`` hands out shared instances.
+
     """
 
+    model_config = {"frozen": True}
+
     # Use this when instantiated a tagged word
     key: str
     value: str
@@ -170,6 +198,23 @@ class UDFeatureTag(BaseModel):
         data["value_label"] = feature.values[value].label
         return data
 
+    @classmethod
+    def trusted(cls, key: str, value: str) -> "UDFeatureTag":
+        """Return the shared tag for ``(key, value)``, validating it once.
+
+        Tags are immutable, so every pair that normalizes to the same feature
+        gets the same instance and later calls are a dict lookup. Invalid
+        pairs raise exactly as the constructor does.
+        """
+        interned = _TRUSTED_FEATURE_TAGS.get((key, value))
+        if interned is None:
+            validated = cls(key=key, value=value)
+            interned = _TRUSTED_FEATURE_TAGS.setdefault(
+                (validated.key, validated.value), validated
+            )
+            _TRUSTED_FEATURE_TAGS[(key, value)] = interned
+        return interned
+
     def __str__(self) -> str:
         """Return a short, readable representation of the feature tag."""
         return f"UDFeatureTag({self.key}={self.value_label}" + ")"
@@ -179,39 +224,114 @@ class UDFeatureTag(BaseModel):
         return self.__str__()
 
 
+class _FeatureIndex(NamedTuple):
+    """Lookups derived from ``UDFeatureTagSet.features``, built on first use."""
+
+    features: tuple["UDFeatureTag", ...]
+    by_key: dict[str, "UDFeatureTag"]
+    values: dict[str, str]
+    pairs: tuple[tuple[str, str], ...]
+    feats_string: str
+    canonical_string: str
+
+
 class UDFeatureTagSet(BaseModel):
-    """A collection of feature tags for a token.
+    """An immutable, key-indexed collection of feature tags for a token.
 
-    Attributes:
-        features: Ordered list of ``UDFeatureTag`` entries.
+    Sets are frozen so that one instance can be shared by every token with
+    the same features (see ``convert_pos_features_to_ud``). Lists passed as
+    ``features`` are stored as tuples; JSON output is unchanged.
 
-    Notes:
-        This uses a list to retain insertion order. A dictionary keyed by
-        feature "key" may be more efficient for lookups in some contexts.
+    Lookups by key (``get``, ``in``, ``as_dict``) and the FEATS strings are
+    computed once per set and cached. If a key occurs more than once, the
+    last tag wins for lookups; ``features`` keeps every entry.
+
+    Attributes:
+        features: Ordered ``UDFeatureTag`` entries.
 
     """
 
-    # `add_feature` would be a little faster if this were a dict
-    # `features: dict[str, UDFeatureTag] = {}`
-    features: list[UDFeatureTag] = []
+    model_config = {"frozen": True}
+
+    features: tuple[UDFeatureTag, ...] = ()
+    _index: Optional[_FeatureIndex] = PrivateAttr(default=None)
+
+    def _lookup(self) -> _FeatureIndex:
+        """Return the cached index, rebuilding it if ``features`` changed."""
+        index = self._index
+        if index is None or index.features is not self.features:
+            pairs = tuple((f.key, f.value) for f in self.features)
+            items = [f"{key}={value}" for key, value in pairs]
+            index = _FeatureIndex(
+                features=self.features,
+                by_key={f.key: f for f in self.features},
+                values=dict(pairs),
+                pairs=pairs,
+                feats_string="|".join(items) or "_",
+                canonical_string="|".join(sorted(items)),
+            )
+            self._index = index
+        return index
+
+    def get(
+        self, key: str, default: Optional[UDFeatureTag] = None
+    ) -> Optional[UDFeatureTag]:
+        """Return the tag for feature ``key`` (e.g. ``"Case"``), or ``default``."""
+        return self._lookup().by_key.get(key, default)
+
+    def __contains__(self, item: object) -> bool:
+        """Return whether ``item`` is a feature key, or a tag, in this set."""
+        if isinstance(item, UDFeatureTag):
+            return self._lookup().by_key.get(item.key) == item
+        return item in self._lookup().by_key
+
+    def as_dict(self) -> dict[str, str]:
+        """Return a new ``{key: value}`` mapping of the features, in order."""
+        return dict(self._lookup().values)
+
+    @property
+    def pairs(self) -> tuple[tuple[str, str], ...]:
+        """The ``(key, value)`` pairs, in order; hashable, e.g. as a cache key."""
+        return self._lookup().pairs
+
+    @property
+    def feats_string(self) -> str:
+        """The CoNLL-U FEATS column in stored order (``"_"`` when empty)."""
+        return self._lookup().feats_string
+
+    @property
+    def canonical_string(self) -> str:
+        """Sorted ``Key=Val|...`` string (empty when there are no features)."""
+        return self._lookup().canonical_string
 
-    def add_feature(self, feature: UDFeatureTag) -> None:
-        """Add a feature to the set if the key is not already present.
+    def add_feature(self, feature: UDFeatureTag) -> "UDFeatureTagSet":
+        """Return a set with ``feature`` added if its key is not already present.
 
         Args:
             feature: Feature tag to add.
 
         Returns:
-            None
+            A new ``UDFeatureTagSet``, or this one if the key already exists.
 
         """
-        if any(f.key == feature.key for f in self.features):
+        if feature.key in self:
             logger.error(
                 f"Feature with key '{feature.key}' already exists in the tag set."
             )
-            return None
-        self.features.append(feature)
+            return self
         logger.debug(f"Added feature {feature.key} to UDFeatureTagSet.")
+        return construct_trusted(
+            UDFeatureTagSet, {"features": (*self.features, feature)}
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # Compare features only; pydantic would also compare the cached index.
+        if isinstance(other, UDFeatureTagSet):
+            return self.features == other.features
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.pairs)
 
     def __str__(self) -> str:
         """Return a compact, readable representation of the tag set."""
@@ -223,6 +343,9 @@ class UDFeatureTagSet(BaseModel):
         return self.__str__()
 
 
+# Interned ``UDFeatureTag`` by raw and canonical ``(key, value)``.
+_TRUSTED_FEATURE_TAGS: dict[tuple[str, str], UDFeatureTag] = {}
+
 ################# UD types above #################
 
 
@@ -498,6 +621,10 @@ class CLTKBaseModel(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
 
+# ``Word`` fields holding lists or dicts, copied by ``Word.copy_for_edit``.
+_WORD_CONTAINER_FIELDS = ("syllables", "annotation_sources", "confidence")
+
+
 class Word(CLTKBaseModel):
     """Contains attributes of each processed word in a list of words."""
 
@@ -527,6 +654,33 @@ class Word(CLTKBaseModel):
     annotation_sources: dict[str, str] = Field(default_factory=dict)
     confidence: dict[str, float] = Field(default_factory=dict)
 
+    @classmethod
+    def trusted(cls, **fields: Any) -> "Word":
+        """Build a ``Word`` from already-validated values without validation.
+
+        For internal producers whose values are known to have the right
+        types (e.g. tags from ``UDPartOfSpeechTag.trusted``). Code handling
+        user input should call ``Word(...)``.
+        """
+        return construct_trusted(cls, fields)
+
+    def copy_for_edit(self, **changes: Any) -> "Word":
+        """Return a copy with its own dicts and lists, with ``changes`` applied.
+
+        Tag models, ``enrichment`` and ``embedding`` are shared with the
+        original; stages replace them rather than editing them in place.
+        """
+        fields = dict(self.__dict__)
+        for name in _WORD_CONTAINER_FIELDS:
+            value = fields[name]
+            if value is not None:
+                fields[name] = value.copy()
+        fields_set = self.model_fields_set
+        if changes:
+            fields.update(changes)
+            fields_set = fields_set | changes.keys()
+        return construct_trusted(Word, fields, fields_set=fields_set)
+
 
 class Sentence(CLTKBaseModel):
     """A sentence containing words and optional embedding."""
@@ -689,6 +843,65 @@ class CLTKConfig(BaseModel):
         return self
 
 
+class _SentenceIndex(NamedTuple):
+    """Word positions grouped by sentence, for one ``Doc.words`` list."""
+
+    words: Any  # the indexed ``Doc.words`` object, compared by identity
+    size: int
+    # Positions of sentence words in (sentence, token) order, or None when
+    # ``words`` is already in that order with every word in a sentence.
+    order: Optional[list[int]]
+    ranges: dict[int, tuple[int, int]]  # sentence id -> [start, stop) in order
+
+
+def _column_sentence_index(words: WordSequence) -> _SentenceIndex:
+    """Build the sentence index of a compact ``Doc`` from its index columns."""
+    sentence_ids = words.table.ints("index_sentence")
+    token_ids = words.table.ints("index_token")
+    positions = np.flatnonzero(sentence_ids != MISSING)
+    missing_tokens = positions[token_ids[positions] == MISSING]
+    if len(missing_tokens):
+        string = words.table.strings("string")[int(missing_tokens[0])]
+        raise ValueError(f"Index token is not defined for {string}")
+    ordered = positions[
+        np.lexsort((positions, token_ids[positions], sentence_ids[positions]))
+    ]
+    order: Optional[list[int]] = ordered.tolist()
+    if len(ordered) == len(words) and bool(np.all(ordered[1:] > ordered[:-1])):
+        order = None
+    sorted_ids = sentence_ids[ordered]
+    unique_ids = np.unique(sorted_ids)
+    starts = np.searchsorted(sorted_ids, unique_ids, side="left").tolist()
+    stops = np.searchsorted(sorted_ids, unique_ids, side="right").tolist()
+    ranges = dict(zip(unique_ids.tolist(), zip(starts, stops)))
+    return _SentenceIndex(words, len(words), order, ranges)
+
+
+# ``Doc`` fields whose reassignment drops the cached sentence views.
+_SENTENCE_VIEW_FIELDS = frozenset({"words", "sentence_boundaries", "normalized_text"})
+# ``Doc`` fields that ``snapshot()`` shares instead of copying: language
+# metadata, the producing pipeline and embedding model, and read-only stores.
+_SNAPSHOT_SHARED_FIELDS = frozenset(
+    {
+        "language",
+        "dialect",
+        "pipeline",
+        "embeddings_model",
+        "normalized_offsets",
+        "tokens",
+        "token_embeddings",
+        "sentence_embedding_matrix",
+    }
+)
+
+
+def _serialize_words(words: Any, handler: SerializerFunctionWrapHandler) -> Any:
+    """Dump a compact doc's ``WordSequence`` as the list of words it stands for."""
+    if isinstance(words, WordSequence):
+        words = list(words)
+    return handler(words)
+
+
 class Doc(CLTKBaseModel):
     """Top‑level container returned from ``NLP()`` pipelines.
 
@@ -698,6 +911,8 @@ class Doc(CLTKBaseModel):
       pipeline: Pipeline instance that produced this document, if any.
       raw: Original raw text.
       normalized_text: Normalized version of the text.
+      normalized_offsets: Map from ``normalized_text`` offsets back to ``raw``
+        offsets, when the normalizer was asked to track it.
       sentence_embeddings: Optional embeddings per sentence index.
       sentence_translations: Structured translations keyed by sentence index.
       translation: Optional document-level translation string (usually aggregated).
@@ -709,14 +924,39 @@ class Doc(CLTKBaseModel):
       sentence_boundaries: List of (start, stop) character offsets.
       genai_use: List of usage/metadata dicts from model calls.
       metadata: Arbitrary metadata about the document.
+      tokens: Column-wise word storage set by ``compact()``; ``words`` then
+        reads from it.
+      token_embeddings: Word embeddings as one matrix (a row per word, in
+        ``words`` order), set by ``pack_embeddings()`` and ``compact()``.
+      sentence_embedding_matrix: Sentence embeddings as one matrix (a row per
+        sentence index), set by ``pack_embeddings()``.
+
+    ``sentences`` and ``sentence_strings`` are served from caches that are
+    dropped when ``words``, ``sentence_boundaries`` or ``normalized_text`` is
+    reassigned or ``words`` changes length. Code that edits
+    ``Word.index_sentence``/``index_token`` or sentence boundaries in place
+    must call ``invalidate_sentence_index()``.
+
+    Pipeline stages hand documents on with ``fork()``: the output ``Doc``
+    gets its own top-level lists and dicts but shares ``Word`` objects with
+    the input, so a stage either replaces words or first calls
+    ``detach_words()``. ``snapshot()`` returns a fully isolated copy.
 
     """
 
+    _sentence_index: Optional[_SentenceIndex] = PrivateAttr(default=None)
+    _sentence_strings: Optional[tuple[Any, Any, int, list[str]]] = PrivateAttr(
+        default=None
+    )
+
     language: Language
-    words: list[Word] = Field(default_factory=list)
+    words: Annotated[list[Word], WrapSerializer(_serialize_words)] = Field(
+        default_factory=list
+    )
     pipeline: Optional["Pipeline"] = None
     raw: Optional[str] = None
     normalized_text: Optional[str] = None
+    normalized_offsets: Optional[NormalizationOffsets] = None
     embeddings_model: Optional[Any] = None
     sentence_embeddings: dict[int, np.ndarray] = Field(default_factory=dict)
     sentence_translations: dict[int, Translation] = Field(default_factory=dict)
@@ -738,65 +978,337 @@ class Doc(CLTKBaseModel):
     provenance: dict[str, ProvenanceRecord] = Field(default_factory=dict)
     default_provenance_id: Optional[str] = None
     sentence_annotation_sources: dict[int, dict[str, str]] = Field(default_factory=dict)
+    tokens: Optional[TokenTable] = None
+    token_embeddings: Optional[EmbeddingMatrix] = None
+    sentence_embedding_matrix: Optional[EmbeddingMatrix] = None
+
+    def compact(self) -> "Doc":
+        """Move ``words`` into a columnar ``TokenTable`` to save memory.
+
+        ``words`` is replaced by a read-only sequence that builds each
+        ``Word`` on access. Use ``expand()`` before editing words.
+
+        Returns:
+          This ``Doc``.
+
+        """
+        words = self.words
+        if not (isinstance(words, WordSequence) and words.table is self.tokens):
+            self.tokens = TokenTable.from_words(words, embeddings=self.token_embeddings)
+            self.words = WordSequence(self.tokens)  # type: ignore[assignment]
+        self.token_embeddings = self.tokens.embeddings
+        return self
+
+    def pack_embeddings(self) -> "Doc":
+        """Move word and sentence embeddings into contiguous ``float32`` matrices.
+
+        Sets ``token_embeddings`` (a row per word) and
+        ``sentence_embedding_matrix`` (a row per sentence index) and replaces
+        ``Word.embedding`` and the values of ``sentence_embeddings`` with
+        read-only views of their rows, so each vector is stored once and
+        similarity search can run over a whole matrix. Words with embeddings
+        are replaced by copies, as ``fork()`` requires. Compact documents
+        already keep word embeddings in a matrix (``tokens.embeddings``),
+        which is used as is. Call again after adding words or embeddings;
+        rows do not follow later edits.
+
+        Returns:
+          This ``Doc``.
+
+        Raises:
+          ValueError: If the embeddings differ in size, are empty or start
+            with NaN.
+
+        """
+        words = self.words
+        if isinstance(words, WordSequence):
+            self.token_embeddings = words.table.embeddings
+        elif any(word.embedding is not None for word in words):
+            vectors = [word.embedding for word in words]
+            matrix = self.token_embeddings
+            if matrix is None or not matrix.holds_rows(vectors):
+                matrix = EmbeddingMatrix.from_rows(vectors)
+                self.words = [
+                    word.copy_for_edit(embedding=vector)
+                    if word.embedding is not None
+                    else word
+                    for word, vector in zip(words, matrix.rows())
+                ]
+            self.token_embeddings = matrix
+        else:
+            self.token_embeddings = None
+        embeddings = self.sentence_embeddings
+        if embeddings:
+            rows: list[Optional[np.ndarray]] = [None] * (max(embeddings) + 1)
+            for key, vector in embeddings.items():
+                rows[key] = vector
+            sentence_matrix = self.sentence_embedding_matrix
+            if sentence_matrix is None or not sentence_matrix.holds_rows(rows):
+                sentence_matrix = EmbeddingMatrix.from_rows(rows)
+                self.sentence_embeddings = {
+                    key: sentence_matrix.values[key] for key in embeddings
+                }
+            self.sentence_embedding_matrix = sentence_matrix
+        else:
+            self.sentence_embedding_matrix = None
+        return self
+
+    def expand(self) -> "Doc":
+        """Turn ``words`` back into a list of ``Word`` objects after ``compact()``.
+
+        Returns:
+          This ``Doc``.
+
+        """
+        if isinstance(self.words, WordSequence):
+            self.words = self.words.table.to_words()
+        self.tokens = None
+        return self
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write this ``Doc`` to ``path`` in CLTK's binary ``Doc`` format.
+
+        Every field is kept, including provenance, confidence, enrichment and
+        translations; see ``cltk.core.doc_store`` for the layout and the few
+        fields stored in JSON form.
+
+        Returns:
+          The path written.
+
+        """
+        from cltk.core.doc_store import save_doc
+
+        return save_doc(self, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], *, mmap_file: bool = True) -> "Doc":
+        """Read a ``Doc`` written by ``save()``.
+
+        By default the file is memory-mapped and words are read from it on
+        access, so opening large documents is fast. The returned ``Doc`` is
+        compact; call ``expand()`` before editing its words.
+
+        Raises:
+          ValueError: If ``path`` is not a ``Doc`` file of a supported version.
+
+        """
+        from cltk.core.doc_store import load_doc
+
+        return load_doc(path, mmap_file=mmap_file)
+
+    def fork(self) -> "Doc":
+        """Return a copy to hand to the next pipeline stage.
+
+        Every top-level list and dict is copied (one level deep), so adding,
+        removing or reassigning entries on the fork leaves this ``Doc`` as it
+        was; so are provenance records with per-sentence prompt digests.
+        Everything else inside them, ``Word`` objects included, is shared:
+        replace words rather than editing them, or call ``detach_words()``
+        on the fork first. Nothing is serialized or validated, and the cached
+        sentence views carry over.
+
+        Returns:
+          A new ``Doc``.
+
+        """
+        fields = {
+            name: value.copy() if isinstance(value, (dict, list)) else value
+            for name, value in self.__dict__.items()
+        }
+        # ``add_provenance_record`` extends these digests in place.
+        provenance = dict(self.provenance)
+        for prov_id, record in provenance.items():
+            if record.sentence_prompt_digests:
+                provenance[prov_id] = record.copy_for_edit()
+        fields["provenance"] = provenance
+        doc = construct_trusted(Doc, fields, fields_set=self.model_fields_set)
+        index = self._sentence_index
+        if index is not None and index.words is self.words:
+            doc._sentence_index = index._replace(words=doc.words)
+        strings = self._sentence_strings
+        if strings is not None and strings[1] is self.sentence_boundaries:
+            doc._sentence_strings = (
+                strings[0],
+                doc.sentence_boundaries,
+                strings[2],
+                strings[3],
+            )
+        return doc
+
+    def detach_words(self) -> "Doc":
+        """Replace ``words`` with copies that may be edited in place.
+
+        Each word gets its own dicts and lists (see ``Word.copy_for_edit``).
+        Compact documents are left as they are; their words are read-only.
+
+        Returns:
+          This ``Doc``.
+
+        """
+        if isinstance(self.words, list):
+            self.words = [word.copy_for_edit() for word in self.words]
+        return self
+
+    def snapshot(self) -> "Doc":
+        """Return a copy that shares no mutable state with this ``Doc``.
+
+        Words are copied as by ``detach_words()`` and the other containers
+        deeply. Language metadata, ``pipeline``, ``embeddings_model``,
+        ``normalized_offsets``, ``tokens`` and the read-only embedding
+        matrices (with their row views) are shared; they are not edited by
+        pipeline stages.
+
+        Returns:
+          A new ``Doc``.
+
+        """
+        fields: dict[str, Any] = {}
+        memo: dict[int, Any] = {}  # keeps objects shared between fields shared
+        matrix = self.sentence_embedding_matrix
+        if matrix is not None:  # keep row views of the shared matrix as views
+            for key, vector in self.sentence_embeddings.items():
+                if matrix.holds(key, vector):
+                    memo[id(vector)] = vector
+        for name, value in self.__dict__.items():
+            if name == "words":
+                if isinstance(value, list):
+                    value = [word.copy_for_edit() for word in value]
+            elif name not in _SNAPSHOT_SHARED_FIELDS:
+                value = deepcopy(value, memo)
+            fields[name] = value
+        return construct_trusted(Doc, fields, fields_set=self.model_fields_set)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SENTENCE_VIEW_FIELDS:
+            self.invalidate_sentence_index()
+        super().__setattr__(name, value)
+
+    def invalidate_sentence_index(self) -> None:
+        """Drop the cached sentence index and sentence strings.
+
+        Needed only after editing sentence or token indices of existing
+        words, or ``sentence_boundaries``, in place; reassigning those fields
+        invalidates the caches automatically.
+        """
+        self._sentence_index = None
+        self._sentence_strings = None
 
     @property
     def sentence_strings(self) -> list[str]:
         """Return sentence strings derived from boundaries and text.
 
+        The list is cached and shared between calls; do not modify it.
+
         Returns:
           A list of substrings of ``normalized_text`` cut by
           ``sentence_boundaries``. Returns an empty list if either field is
           missing.
 
         """
+        text, boundaries = self.normalized_text, self.sentence_boundaries
+        cached = self._sentence_strings
+        if (
+            cached is not None
+            and cached[0] is text
+            and cached[1] is boundaries
+            and cached[2] == len(boundaries)
+        ):
+            return cached[3]
         # TODO: Decide if this is preventable
         from cltk.sentence.utils import extract_sentences_from_boundaries
 
-        if not self.normalized_text or not self.sentence_boundaries:
+        strings: list[str]
+        if not text or not boundaries:
             logger.warning(
                 "`Doc.normalized_text` or `.sentence_boundaries` is empty, cannot return sentence strings."
             )
-            return []
-        return extract_sentences_from_boundaries(
-            self.normalized_text, self.sentence_boundaries
-        )
+            strings = []
+        else:
+            strings = extract_sentences_from_boundaries(text, boundaries)
+        self._sentence_strings = (text, boundaries, len(boundaries), strings)
+        return strings
+
+    def _sentence_lookup(self) -> _SentenceIndex:
+        """Return the sentence index for the current ``words``, building it once."""
+        words = self.words
+        index = self._sentence_index
+        if index is not None and index.words is words and index.size == len(words):
+            return index
+        if isinstance(words, WordSequence):
+            index = _column_sentence_index(words)
+            self._sentence_index = index
+            return index
+        keys: list[tuple[int, int, int]] = []
+        for position, word in enumerate(words):
+            if word.index_sentence is None:
+                continue
+            if word.index_token is None:
+                raise ValueError(f"Index token is not defined for {word.string}")
+            keys.append((word.index_sentence, word.index_token, position))
+        ordered = sorted(keys)
+        order: Optional[list[int]] = [position for _, _, position in ordered]
+        if ordered == keys and len(keys) == len(words):
+            order = None  # already grouped and sorted; slice ``words`` directly
+        sentence_ids = [sentence_id for sentence_id, _, _ in ordered]
+        ranges = {
+            sentence_id: (
+                bisect_left(sentence_ids, sentence_id),
+                bisect_right(sentence_ids, sentence_id),
+            )
+            for sentence_id in set(sentence_ids)
+        }
+        if isinstance(words, list):
+            for word in words:
+                word._doc = self
+        index = _SentenceIndex(words, len(words), order, ranges)
+        self._sentence_index = index
+        return index
+
+    def sentence_words(self, index: int) -> list[Word]:
+        """Return the words of sentence ``index`` in token order.
+
+        Uses the cached sentence index, so only the requested sentence's words
+        are touched.
+
+        Raises:
+          KeyError: If no word belongs to sentence ``index``.
+
+        """
+        lookup = self._sentence_lookup()
+        start, stop = lookup.ranges[index]
+        if lookup.order is None:
+            return list(self.words[start:stop])
+        words = self.words
+        return [words[position] for position in lookup.order[start:stop]]
 
     @property
     def sentences(self) -> list[Sentence]:
         if not self.words:
             return []
-        sents: dict[int, list[Word]] = defaultdict(list)
-        for word in self.words or []:
-            if word.index_sentence is not None:
-                sents[word.index_sentence].append(word)
-        for key in sents:
-            for w in sents[key]:
-                if w.index_token is None:
-                    raise ValueError(f"Index token is not defined for {w.string}")
-        for key in sents:
-            sents[key].sort(
-                key=lambda x: x.index_token if x.index_token is not None else -1
-            )
-        if self.sentence_embeddings is None:
-            self.sentence_embeddings = dict()
+        lookup = self._sentence_lookup()
+        words, order = self.words, lookup.order
+        relink = not isinstance(words, list)
         sentences: list[Sentence] = []
-        for key, val in sorted(sents.items(), key=lambda x: x[0]):
-            for w in val:
-                try:
+        for key in sorted(lookup.ranges):
+            start, stop = lookup.ranges[key]
+            if order is None:
+                val = list(words[start:stop])
+            else:
+                val = [words[position] for position in order[start:stop]]
+            if relink:  # words rebuilt on access (compact docs)
+                for w in val:
                     w._doc = self
-                except Exception:
-                    pass
-            sentence = Sentence(
-                words=val,
-                index=key,
-                embedding=self.sentence_embeddings.get(key),
-                translation=self.sentence_translations.get(key),
-                annotation_sources=self.sentence_annotation_sources.get(key, {}),
+            sentence = construct_trusted(
+                Sentence,
+                {
+                    "words": val,
+                    "index": key,
+                    "embedding": self.sentence_embeddings.get(key),
+                    "translation": self.sentence_translations.get(key),
+                    "annotation_sources": self.sentence_annotation_sources.get(key, {}),
+                },
             )
-            try:
-                sentence._doc = self
-            except Exception:
-                pass
+            sentence._doc = self
             sentences.append(sentence)
         return sentences
 
@@ -956,14 +1468,8 @@ class Pipeline(BaseModel):
         """Return a human-friendly list describing pipeline order."""
         lines: list[str] = []
         if self.spec and getattr(self.spec, "steps", None):
-            try:
-                from cltk.core.process_registry import ProcessRegistry
-
-                registry = ProcessRegistry.list_processes()
-            except Exception:
-                registry = {}
             for idx, step in enumerate(self.spec.steps, 1):
-                proc_cls = registry.get(step.id)
+                proc_cls = _lookup_process(step.id)
                 class_name = proc_cls.__name__ if proc_cls else step.id
                 provides = getattr(proc_cls, "provides", None) if proc_cls else None
                 requires = getattr(proc_cls, "requires", None) if proc_cls else None
@@ -1004,18 +1510,13 @@ class Pipeline(BaseModel):
             for p in self.processes
         ):
             return
-        try:
-            from cltk.core.process_registry import ProcessRegistry
-
-            registry = ProcessRegistry.list_processes()
-        except Exception:
-            registry = {}
-        proc_cls = registry.get(process_id)
-        if not proc_cls:
-            for candidate in registry.values():
-                if candidate.__name__ == process_id:
-                    proc_cls = candidate
-                    break
+        registry = _process_class_names()
+        if process_id not in registry:
+            process_id = next(
+                (pid for pid, name in registry.items() if name == process_id),
+                process_id,
+            )
+        proc_cls = _lookup_process(process_id)
         if proc_cls:
             self.processes.append(proc_cls)
 
@@ -1032,13 +1533,7 @@ class Pipeline(BaseModel):
     def remove(self, process_id: str) -> None:
         """Remove a step from the pipeline entirely."""
         if self.spec and getattr(self.spec, "steps", None):
-            registry = {}
-            try:
-                from cltk.core.process_registry import ProcessRegistry
-
-                registry = ProcessRegistry.list_processes()
-            except Exception:
-                registry = {}
+            registry = _process_class_names()
             original = list(self.spec.steps)
             self.spec.steps = [
                 step
@@ -1178,13 +1673,32 @@ def _matches_identifier(value: str, identifier: str) -> bool:
 def _step_matches(
     step_id: Optional[str],
     identifier: str,
-    registry: dict[str, type[Any]],
+    registry: dict[str, str],
 ) -> bool:
     """Return True when a step id or class name matches the identifier."""
     if step_id == identifier:
         return True
-    proc_cls = registry.get(step_id or "")
-    return bool(proc_cls and proc_cls.__name__ == identifier)
+    return registry.get(step_id or "") == identifier
+
+
+def _process_class_names() -> dict[str, str]:
+    """Return ``{process_id: class name}`` without importing process modules."""
+    try:
+        from cltk.core.process_registry import ProcessRegistry
+
+        return ProcessRegistry.class_names()
+    except Exception:
+        return {}
+
+
+def _lookup_process(process_id: str) -> Optional[type[Any]]:
+    """Return the registered class for ``process_id``, or None if unavailable."""
+    try:
+        from cltk.core.process_registry import ProcessRegistry
+
+        return ProcessRegistry.get_process(process_id)
+    except Exception:
+        return None
 
 
 def _find_index(processes: Iterable[Any], identifier: str) -> Optional[int]:
@@ -1204,18 +1718,10 @@ def _find_step_index(steps: Iterable[Any], identifier: str) -> Optional[int]:
         step_id = getattr(step, "id", None)
         if step_id == identifier:
             return idx
-    try:
-        from cltk.core.process_registry import ProcessRegistry
-
-        registry = ProcessRegistry.list_processes()
-    except Exception:
-        registry = {}
+    registry = _process_class_names()
     for idx, step in enumerate(steps):
         step_id = getattr(step, "id", None)
-        if not isinstance(step_id, str):
-            continue
-        proc_cls = registry.get(step_id)
-        if proc_cls and proc_cls.__name__ == identifier:
+        if isinstance(step_id, str) and registry.get(step_id) == identifier:
             return idx
     return None
 
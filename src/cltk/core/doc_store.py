@@ -0,0 +1,532 @@
+"""Binary ``Doc`` files with memory-mapped loading.
+
+``Doc.save()`` writes a document to a single file and ``Doc.load()`` reads it
+back. The file holds a small JSON header followed by 64-byte aligned binary
+blocks:
+
+- the words, as the columns of a ``TokenTable`` (see ``cltk.core.token_store``):
+  integer and code arrays are stored raw, distinct strings once in a string
+  table, and tag, feature and annotation-source tables by value;
+- ``raw`` and ``normalized_text`` as UTF-8, ``normalized_offsets`` and
+  ``sentence_boundaries`` as ``int64`` arrays;
+- the word and sentence embedding matrices (see
+  ``cltk.core.embedding_store``) as one block each;
+- every other field (translations, provenance, metadata, ...) as JSON in the
+  header, with NumPy arrays (e.g. unpacked sentence embeddings) in their own
+  blocks.
+
+Loading maps the file into memory. The token columns and embedding matrices
+are used in place (word and sentence embeddings are views of their rows), and
+per-word values outside the columns (enrichment, confidence, ...) are decoded
+on first access, so reopening a large annotated document costs little more
+than reading its header and string table. The loaded ``Doc`` is compact
+(see ``Doc.compact()``); call ``expand()`` before editing its words.
+
+Values in ``metadata`` and other untyped fields come back as their JSON form
+(models as dicts, tuples as lists); backend settings are stored redacted as
+in provenance records. ``pipeline`` is restored from its spec without
+compiling its processes, and ``embeddings_model`` only if it is JSON
+serializable.
+"""
+
+import io
+import json
+import mmap
+import struct
+from array import array
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+
+import numpy as np
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+
+from cltk.core.cltk_logger import logger
+from cltk.core.data_types import Doc, Pipeline, UDFeatureTag, UDFeatureTagSet, Word
+from cltk.core.embedding_store import EmbeddingMatrix
+from cltk.core.provenance import normalize_config
+from cltk.core.token_store import TokenTable, WordSequence
+from cltk.core.trusted_models import construct_trusted
+from cltk.morphosyntax.ud_deprels import UDDeprelTag
+from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
+from cltk.text.utils import NormalizationOffsets
+
+#: First bytes of every ``Doc`` file.
+MAGIC = b"CLTKDOC\x00"
+#: Version of the file layout written by ``save_doc``.
+FORMAT_VERSION = 1
+
+# Magic, format version, reserved, header length.
+_PREFIX = struct.Struct("<8sIIQ")
+_ALIGN = 64
+# Markers for values JSON cannot hold directly.
+_ARRAY_KEY = "__cltk_array__"
+_ITEMS_KEY = "__cltk_items__"
+# ``Doc`` fields stored in their own blocks rather than as header JSON.
+_BLOCK_FIELDS = frozenset(
+    {
+        "words",
+        "tokens",
+        "raw",
+        "normalized_text",
+        "normalized_offsets",
+        "sentence_boundaries",
+        "pipeline",
+        "embeddings_model",
+        "token_embeddings",
+        "sentence_embedding_matrix",
+    }
+)
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+class _BlockWriter:
+    """Collect arrays to write after the header, recording their layout."""
+
+    def __init__(self) -> None:
+        self.arrays: list[np.ndarray] = []
+        self.layout: list[dict[str, Any]] = []
+        self.size = 0
+
+    def add(self, values: np.ndarray) -> int:
+        """Queue ``values`` and return its block number."""
+        if values.dtype.hasobject:
+            raise ValueError("Arrays of Python objects cannot be saved.")
+        values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+        offset = _aligned(self.size)
+        self.arrays.append(values)
+        self.layout.append(
+            {"dtype": values.dtype.str, "shape": list(values.shape), "offset": offset}
+        )
+        self.size = offset + values.nbytes
+        return len(self.arrays) - 1
+
+    def add_text(self, text: str) -> int:
+        """Queue ``text`` as UTF-8 and return its block number."""
+        return self.add(np.frombuffer(text.encode("utf-8"), dtype=np.uint8))
+
+
+class _BlockReader:
+    """Read the blocks of a loaded file from a (memory-mapped) buffer."""
+
+    def __init__(self, buffer: Any, start: int, layout: list[dict[str, Any]]):
+        self.buffer = buffer
+        self.start = start
+        self.layout = layout
+
+    def array(self, block: int, *, copy: bool = False) -> np.ndarray:
+        """Return block ``block`` as an array, read-only unless ``copy``."""
+        spec = self.layout[block]
+        shape = tuple(spec["shape"])
+        values = np.frombuffer(
+            self.buffer,
+            dtype=np.dtype(spec["dtype"]),
+            count=int(np.prod(shape)),
+            offset=self.start + spec["offset"],
+        ).reshape(shape)
+        return values.copy() if copy else values
+
+    def text(self, block: int) -> str:
+        """Return block ``block`` decoded as UTF-8."""
+        return self.array(block).tobytes().decode("utf-8")
+
+
+def _encode(value: Any, blocks: _BlockWriter) -> Any:
+    """Turn ``value`` into JSON data, moving arrays into ``blocks``."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, np.ndarray):
+        return {_ARRAY_KEY: blocks.add(value)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, BaseModel):
+        return {
+            name: _encode(getattr(value, name), blocks)
+            for name in type(value).model_fields
+        }
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value) and not (
+            len(value) == 1 and next(iter(value)) in (_ARRAY_KEY, _ITEMS_KEY)
+        ):
+            return {key: _encode(item, blocks) for key, item in value.items()}
+        return {
+            _ITEMS_KEY: [
+                [_encode(key, blocks), _encode(item, blocks)]
+                for key, item in value.items()
+            ]
+        }
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, blocks) for item in value]
+    return to_jsonable_python(value)
+
+
+def _hashable(value: Any) -> Any:
+    return (
+        tuple(_hashable(item) for item in value) if isinstance(value, list) else value
+    )
+
+
+def _decode(value: Any, blocks: _BlockReader) -> Any:
+    """Invert ``_encode``; arrays are copied out of the file."""
+    if isinstance(value, list):
+        return [_decode(item, blocks) for item in value]
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if _ARRAY_KEY in value:
+                return blocks.array(value[_ARRAY_KEY], copy=True)
+            if _ITEMS_KEY in value:
+                return {
+                    _hashable(_decode(key, blocks)): _decode(item, blocks)
+                    for key, item in value[_ITEMS_KEY]
+                }
+        return {key: _decode(item, blocks) for key, item in value.items()}
+    return value
+
+
+def _validate_word_fields(fields: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild typed ``Word`` values (e.g. ``enrichment``) from JSON data."""
+    word = Word.model_validate(fields)
+    return {name: getattr(word, name) for name in fields}
+
+
+class _LazyExtras(Mapping[int, dict[str, Any]]):
+    """Sparse per-row ``Word`` values, decoded from the file on first access."""
+
+    def __init__(self, blocks: _BlockReader, block: int) -> None:
+        self._blocks = blocks
+        self._block = block
+        self._rows: Optional[dict[int, dict[str, Any]]] = None
+
+    def _load(self) -> dict[int, dict[str, Any]]:
+        if self._rows is None:
+            encoded = json.loads(self._blocks.text(self._block))
+            self._rows = {
+                int(row): _validate_word_fields(_decode(fields, self._blocks))
+                for row, fields in encoded.items()
+            }
+        return self._rows
+
+    def __getitem__(self, row: int) -> dict[str, Any]:
+        return self._load()[row]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return dict, (dict(self._load()),)
+
+
+def _encode_tokens(table: TokenTable, blocks: _BlockWriter) -> dict[str, Any]:
+    state = table.to_state()
+    strings: list[str] = state["strings"]
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in strings], out=offsets[1:])
+    extras = {
+        str(row): {name: _encode(value, blocks) for name, value in fields.items()}
+        for row, fields in state["extras"].items()
+    }
+    return {
+        "ints": {name: blocks.add(col) for name, col in state["ints"].items()},
+        "string_codes": {
+            name: blocks.add(col) for name, col in state["string_codes"].items()
+        },
+        "strings": blocks.add_text("".join(strings)),
+        "string_offsets": blocks.add(offsets),
+        "upos_codes": blocks.add(state["upos_codes"]),
+        "upos": [tag.tag for tag in state["upos"]],
+        "deprel_codes": blocks.add(state["deprel_codes"]),
+        "deprels": [tag.model_dump() for tag in state["deprels"]],
+        "feature_codes": blocks.add(state["feature_codes"]),
+        "features": [tag_set.pairs for tag_set in state["features"]],
+        "source_codes": blocks.add(state["source_codes"]),
+        "sources": state["sources"],
+        "extras": blocks.add_text(json.dumps(extras)) if extras else None,
+        "embeddings": (
+            blocks.add(state["embeddings"]) if state["embeddings"] is not None else None
+        ),
+    }
+
+
+def _decode_tokens(header: dict[str, Any], blocks: _BlockReader) -> TokenTable:
+    text = blocks.text(header["strings"])
+    offsets = blocks.array(header["string_offsets"]).tolist()
+    extras: Mapping[int, dict[str, Any]] = (
+        _LazyExtras(blocks, header["extras"]) if header["extras"] is not None else {}
+    )
+    return TokenTable.from_state(
+        {
+            "ints": {
+                name: blocks.array(block) for name, block in header["ints"].items()
+            },
+            "string_codes": {
+                name: blocks.array(block)
+                for name, block in header["string_codes"].items()
+            },
+            "strings": [text[start:stop] for start, stop in zip(offsets, offsets[1:])],
+            "upos_codes": blocks.array(header["upos_codes"]),
+            "upos": [UDPartOfSpeechTag.trusted(tag) for tag in header["upos"]],
+            "deprel_codes": blocks.array(header["deprel_codes"]),
+            "deprels": [
+                construct_trusted(UDDeprelTag, fields) for fields in header["deprels"]
+            ],
+            "feature_codes": blocks.array(header["feature_codes"]),
+            "features": [
+                construct_trusted(
+                    UDFeatureTagSet,
+                    {
+                        "features": tuple(
+                            UDFeatureTag.trusted(key, value) for key, value in pairs
+                        )
+                    },
+                )
+                for pairs in header["features"]
+            ],
+            "source_codes": blocks.array(header["source_codes"]),
+            "sources": header["sources"],
+            "extras": extras,
+            "embeddings": (
+                blocks.array(header["embeddings"])
+                if header.get("embeddings") is not None
+                else None
+            ),
+        }
+    )
+
+
+def _encode_pipeline(pipeline: Optional[Pipeline]) -> Optional[dict[str, Any]]:
+    """Return the pipeline's description, language and spec as JSON data."""
+    if pipeline is None:
+        return None
+    spec = pipeline.to_spec()
+    try:
+        spec_data = spec.model_dump(mode="json") if spec is not None else None
+    except PydanticSerializationError as exc:
+        logger.warning("Pipeline spec is not serializable and is not saved: %s", exc)
+        spec_data = None
+    return {
+        "description": pipeline.description,
+        "glottolog_id": pipeline.glottolog_id,
+        "language": pipeline.language.model_dump(mode="json")
+        if pipeline.language
+        else None,
+        "dialect": pipeline.dialect.model_dump(mode="json")
+        if pipeline.dialect
+        else None,
+        "spec": spec_data,
+    }
+
+
+def _decode_pipeline(data: Optional[dict[str, Any]]) -> Optional[Pipeline]:
+    if data is None:
+        return None
+    spec = data.pop("spec")
+    pipeline = Pipeline.model_validate(data)
+    if spec is not None:
+        from cltk.pipeline.specs import PipelineSpec
+
+        pipeline.spec = PipelineSpec.model_validate(spec)
+    return pipeline
+
+
+def save_doc(doc: Doc, path: Union[str, Path]) -> Path:
+    """Write ``doc`` to ``path`` in the binary ``Doc`` format.
+
+    Args:
+        doc: Document to save.
+        path: Destination file; overwritten if it exists.
+
+    Returns:
+        The path written.
+
+    Raises:
+        ValueError: If a field holds a value that cannot be stored.
+
+    """
+    path = Path(path)
+    with path.open("wb") as fh:
+        _write_doc(doc, fh)
+    return path
+
+
+def doc_to_bytes(doc: Doc) -> bytes:
+    """Return the bytes ``save_doc`` would write for ``doc``."""
+    buffer = io.BytesIO()
+    _write_doc(doc, buffer)
+    return buffer.getvalue()
+
+
+def _write_doc(doc: Doc, fh: BinaryIO) -> None:
+    blocks = _BlockWriter()
+    words = doc.words
+    table = (
+        doc.tokens
+        if isinstance(words, WordSequence) and words.table is doc.tokens
+        else TokenTable.from_words(words, embeddings=doc.token_embeddings)
+    )
+    sentence_matrix = doc.sentence_embedding_matrix
+    # Sentence embeddings that are row views are restored from the matrix.
+    packed_sentences = sentence_matrix is not None and all(
+        sentence_matrix.holds(key, vector)
+        for key, vector in doc.sentence_embeddings.items()
+    )
+    fields: dict[str, Any] = {}
+    for name, value in doc.__dict__.items():
+        if name in _BLOCK_FIELDS:
+            continue
+        if name == "sentence_embeddings" and packed_sentences:
+            fields[name] = {}
+            continue
+        if name == "metadata" and "backend_config" in value:
+            value = {
+                **value,
+                "backend_config": normalize_config(value["backend_config"]),
+            }
+        try:
+            fields[name] = _encode(value, blocks)
+        except (PydanticSerializationError, ValueError) as exc:
+            raise ValueError(f"Cannot save Doc.{name}: {exc}") from exc
+    try:
+        embeddings_model = _encode(doc.embeddings_model, blocks)
+    except PydanticSerializationError:
+        logger.warning("Doc.embeddings_model is not serializable and is not saved.")
+        embeddings_model = None
+    texts = {
+        name: blocks.add_text(text) if text is not None else None
+        for name, text in (("raw", doc.raw), ("normalized_text", doc.normalized_text))
+    }
+    offsets = doc.normalized_offsets
+    header = {
+        "fields": fields,
+        "fields_set": sorted(doc.model_fields_set),
+        "texts": texts,
+        "normalized_offsets": blocks.add(np.frombuffer(offsets.starts, np.int64))
+        if offsets is not None
+        else None,
+        "sentence_boundaries": blocks.add(
+            np.array(doc.sentence_boundaries, dtype=np.int64).reshape(-1, 2)
+        ),
+        "embeddings_model": embeddings_model,
+        "pipeline": _encode_pipeline(doc.pipeline),
+        "tokens": _encode_tokens(table, blocks),
+        "token_embeddings": doc.token_embeddings is not None,
+        "sentence_embedding_matrix": {
+            "block": blocks.add(sentence_matrix.values),
+            "keys": list(doc.sentence_embeddings) if packed_sentences else None,
+        }
+        if sentence_matrix is not None
+        else None,
+    }
+    header["blocks"] = blocks.layout
+    header_bytes = json.dumps(header).encode("utf-8")
+    start = _aligned(_PREFIX.size + len(header_bytes))
+    fh.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, 0, len(header_bytes)))
+    fh.write(header_bytes)
+    written = _PREFIX.size + len(header_bytes)
+    for values, spec in zip(blocks.arrays, blocks.layout):
+        fh.write(b"\0" * (start + spec["offset"] - written))
+        fh.write(values.data)
+        written = start + spec["offset"] + values.nbytes
+
+
+def load_doc(path: Union[str, Path], *, mmap_file: bool = True) -> Doc:
+    """Read a ``Doc`` written by ``save_doc``.
+
+    Args:
+        path: File to read.
+        mmap_file: Map the file into memory instead of reading it, so token
+            columns are paged in only when used. The file must not change
+            while the returned ``Doc`` is in use.
+
+    Returns:
+        A compact ``Doc`` equal to the saved one.
+
+    Raises:
+        ValueError: If ``path`` is not a ``Doc`` file of a supported version.
+
+    """
+    path = Path(path)
+    buffer: Any
+    with path.open("rb") as fh:
+        if mmap_file and path.stat().st_size > 0:
+            buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = fh.read()
+    return _read_doc(buffer, str(path))
+
+
+def doc_from_bytes(data: bytes, *, source: str = "<bytes>") -> Doc:
+    """Read a ``Doc`` from the output of ``doc_to_bytes``.
+
+    The token columns of the returned ``Doc`` are views into ``data``.
+
+    Raises:
+        ValueError: If ``data`` is not a ``Doc`` file of a supported version;
+            ``source`` names it in the message.
+
+    """
+    return _read_doc(data, source)
+
+
+def _read_doc(buffer: Any, source: str) -> Doc:
+    if len(buffer) < _PREFIX.size:
+        raise ValueError(f"{source} is not a CLTK Doc file.")
+    magic, version, _, header_size = _PREFIX.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{source} is not a CLTK Doc file.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported CLTK Doc file version {version} in {source}.")
+    header = json.loads(bytes(buffer[_PREFIX.size : _PREFIX.size + header_size]))
+    blocks = _BlockReader(
+        buffer, _aligned(_PREFIX.size + header_size), header["blocks"]
+    )
+    doc = Doc.model_validate(_decode(header["fields"], blocks))
+    table = _decode_tokens(header["tokens"], blocks)
+    offsets = header["normalized_offsets"]
+    boundaries = blocks.array(header["sentence_boundaries"]).tolist()
+    values = doc.__dict__
+    values.update(
+        {
+            "words": WordSequence(table),
+            "tokens": table,
+            "raw": _maybe_text(blocks, header["texts"]["raw"]),
+            "normalized_text": _maybe_text(blocks, header["texts"]["normalized_text"]),
+            "normalized_offsets": _decode_offsets(blocks, offsets),
+            "sentence_boundaries": [(start, stop) for start, stop in boundaries],
+            "embeddings_model": _decode(header["embeddings_model"], blocks),
+            "pipeline": _decode_pipeline(header["pipeline"]),
+            "token_embeddings": (
+                table.embeddings if header.get("token_embeddings") else None
+            ),
+        }
+    )
+    sentence_matrix = header.get("sentence_embedding_matrix")
+    if sentence_matrix is not None:
+        matrix = EmbeddingMatrix(blocks.array(sentence_matrix["block"]))
+        values["sentence_embedding_matrix"] = matrix
+        if sentence_matrix["keys"] is not None:
+            values["sentence_embeddings"] = {
+                key: matrix.values[key] for key in sentence_matrix["keys"]
+            }
+    object.__setattr__(doc, "__pydantic_fields_set__", set(header["fields_set"]))
+    return doc
+
+
+def _maybe_text(blocks: _BlockReader, block: Optional[int]) -> Optional[str]:
+    return blocks.text(block) if block is not None else None
+
+
+def _decode_offsets(
+    blocks: _BlockReader, block: Optional[int]
+) -> Optional[NormalizationOffsets]:
+    if block is None:
+        return None
+    starts = array("q")
+    starts.frombytes(blocks.array(block).astype("=i8").tobytes())
+    return NormalizationOffsets(starts)
@@ -0,0 +1,242 @@
+"""Contiguous embedding matrices for documents.
+
+An ``EmbeddingMatrix`` holds one embedding per row in a single 2-D array:
+one row per word for ``Doc.token_embeddings`` and one row per sentence index
+for ``Doc.sentence_embedding_matrix``. Rows without an embedding are NaN.
+``Word.embedding`` and the values of ``Doc.sentence_embeddings`` become
+read-only views of these rows after ``Doc.pack_embeddings()``, so the vectors
+are stored once and similarity search runs over the whole matrix at once::
+
+    doc.pack_embeddings()
+    scores = doc.token_embeddings.cosine_similarity(query_vector)
+    best = doc.words[int(np.nanargmax(scores))]
+
+Matrices are read from ``Doc.load()`` files and from ``.npy`` files
+(``EmbeddingMatrix.load``) as memory maps, and convert to and from Arrow
+``fixed_size_list`` arrays without copying the vectors.
+"""
+
+import importlib
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+
+class EmbeddingMatrix:
+    """Embeddings stored as the rows of one contiguous 2-D array.
+
+    Args:
+        values: Array of shape ``(rows, dim)``; NaN rows mark missing
+            embeddings. It is used as given (not copied) and made read-only.
+
+    Raises:
+        ValueError: If ``values`` is not 2-D or not a floating-point array.
+
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: np.ndarray) -> None:
+        if values.ndim != 2 or not np.issubdtype(values.dtype, np.floating):
+            raise ValueError("Embedding matrices must be 2-D floating-point arrays.")
+        if values.flags.writeable:
+            values.flags.writeable = False
+        self.values = values
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Optional[ArrayLike]],
+        *,
+        dim: Optional[int] = None,
+        dtype: DTypeLike = np.float32,
+    ) -> "EmbeddingMatrix":
+        """Stack per-item embeddings into a new matrix.
+
+        Args:
+            rows: One embedding (or ``None``) per row.
+            dim: Embedding size; required only when every row is ``None``.
+            dtype: Floating-point type of the matrix.
+
+        Raises:
+            ValueError: If the embeddings are not 1-D, differ in size, are
+                empty or have NaN as their first value.
+
+        """
+        vectors = [None if row is None else np.asarray(row) for row in rows]
+        if dim is None:
+            dim = next((len(v) for v in vectors if v is not None), 0)
+        values = np.full((len(vectors), dim), np.nan, dtype=dtype)
+        for index, vector in enumerate(vectors):
+            if vector is None:
+                continue
+            if vector.shape != (dim,):
+                raise ValueError(
+                    f"Embedding {index} has shape {vector.shape}, expected ({dim},)."
+                )
+            values[index] = vector
+            # A NaN first value is how ``row()`` recognizes a missing row.
+            if not dim or np.isnan(values[index, 0]):
+                raise ValueError(
+                    f"Embedding {index} is empty or starts with NaN, "
+                    "which would read back as a missing embedding."
+                )
+        return cls(values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return (
+            f"EmbeddingMatrix(rows={len(self)}, dim={self.dim}, "
+            f"dtype={self.values.dtype})"
+        )
+
+    @property
+    def dim(self) -> int:
+        """Number of values in each embedding."""
+        return int(self.values.shape[1])
+
+    @property
+    def present(self) -> np.ndarray:
+        """Boolean mask of the rows that hold an embedding."""
+        if not self.dim:
+            return np.zeros(len(self), dtype=bool)
+        return ~np.isnan(self.values[:, 0])
+
+    def row(self, index: int) -> Optional[np.ndarray]:
+        """Return row ``index`` as a read-only view, or None if it is missing."""
+        vector: np.ndarray = self.values[index]
+        if not self.dim or np.isnan(vector[0]):
+            return None
+        return vector
+
+    def rows(self) -> list[Optional[np.ndarray]]:
+        """Return every row as by ``row()``."""
+        present = self.present.tolist()
+        return [
+            vector if has_row else None for vector, has_row in zip(self.values, present)
+        ]
+
+    def holds(self, index: int, vector: Any) -> bool:
+        """Return True if ``vector`` is the view of row ``index`` of this matrix."""
+        if not isinstance(vector, np.ndarray) or not 0 <= index < len(self):
+            return False
+        row = self.values[index]
+        return bool(
+            vector.shape == row.shape
+            and vector.dtype == row.dtype
+            and vector.__array_interface__["data"][0]
+            == row.__array_interface__["data"][0]
+        )
+
+    def holds_rows(self, vectors: Sequence[Any]) -> bool:
+        """Return True if ``vectors`` are this matrix's rows, as by ``rows()``.
+
+        That is, one entry per row, each the view of its row, or ``None``
+        where the row is missing.
+        """
+        if len(vectors) != len(self):
+            return False
+        present = self.present.tolist()
+        return all(
+            self.holds(index, vector) if vector is not None else not has_row
+            for index, (vector, has_row) in enumerate(zip(vectors, present))
+        )
+
+    def normalized(self) -> np.ndarray:
+        """Return the rows scaled to unit length (a new array; NaN rows stay NaN)."""
+        norms = np.linalg.norm(self.values, axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized: np.ndarray = self.values / norms
+        return normalized
+
+    def cosine_similarity(self, query: ArrayLike) -> np.ndarray:
+        """Return the cosine similarity of every row to ``query``.
+
+        Missing rows (and zero vectors) score NaN; use ``np.nanargmax`` and
+        friends to rank.
+        """
+        vector = np.asarray(query, dtype=self.values.dtype)
+        norm = np.linalg.norm(vector)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores: np.ndarray = self.normalized() @ (vector / norm)
+        return scores
+
+    def to_arrow(self) -> Any:
+        """Return a ``pyarrow.FixedSizeListArray`` with nulls for missing rows.
+
+        The vectors are not copied.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+
+        """
+        pa = _pyarrow()
+        values = np.ascontiguousarray(self.values)
+        present = self.present
+        return pa.FixedSizeListArray.from_arrays(
+            pa.array(values.reshape(-1)),
+            self.dim,
+            mask=None if present.all() else pa.array(~present),
+        )
+
+    @classmethod
+    def from_arrow(cls, array: Any) -> "EmbeddingMatrix":
+        """Build a matrix from a ``fixed_size_list`` Arrow array or chunked array.
+
+        Without nulls, the matrix is a view of the Arrow buffer.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+            ValueError: If ``array`` is not a list array of floats.
+
+        """
+        pa = _pyarrow()
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks()
+        if not pa.types.is_fixed_size_list(array.type):
+            raise ValueError("Embeddings must be a fixed_size_list Arrow array.")
+        dim = array.type.list_size
+        flat = array.values.slice(array.offset * dim, len(array) * dim)
+        values = flat.to_numpy(zero_copy_only=False).reshape(len(array), dim)
+        if array.null_count:
+            values = values.copy()
+            values[array.is_null().to_numpy(zero_copy_only=False)] = np.nan
+        return cls(values)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the matrix to ``path`` as a NumPy ``.npy`` file.
+
+        Returns:
+            The path written.
+
+        """
+        path = Path(path)
+        with path.open("wb") as fh:
+            np.save(fh, self.values, allow_pickle=False)
+        return path
+
+    @classmethod
+    def load(
+        cls, path: Union[str, Path], *, mmap_file: bool = True
+    ) -> "EmbeddingMatrix":
+        """Read a matrix written by ``save``, memory-mapped unless ``mmap_file`` is False."""
+        return cls(
+            np.load(
+                Path(path), mmap_mode="r" if mmap_file else None, allow_pickle=False
+            )
+        )
+
+
+def _pyarrow() -> Any:
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "Arrow conversion of embeddings requires `pyarrow`. "
+            "Install it via `pip install pyarrow`."
+        ) from exc
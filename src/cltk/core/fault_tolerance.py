@@ -0,0 +1,138 @@
+"""Sentence-level failure bookkeeping for fault-tolerant GenAI runs.
+
+When a ``Doc`` is analyzed in fault-tolerant mode, per-sentence LLM calls that
+raise are not propagated. Instead, the failure is recorded under
+``doc.metadata["failed_sentences"]`` keyed by stage (``"pos"``, ``"dep"``) and
+sentence index, and the successfully annotated sentences are kept. The
+recorded indices can later be re-run with ``NLP.retry_failed()``.
+"""
+
+from typing import Any, Iterable, Optional
+
+from cltk.core.data_types import Doc, Word
+
+FAULT_TOLERANT_KEY = "fault_tolerant"
+FAILED_SENTENCES_KEY = "failed_sentences"
+
+
+def is_fault_tolerant(doc: Doc) -> bool:
+    """Return True when ``doc`` was created for a fault-tolerant run."""
+    try:
+        return bool(doc.metadata.get(FAULT_TOLERANT_KEY, False))
+    except Exception:
+        return False
+
+
+def record_sentence_failure(
+    doc: Doc, *, stage: str, sentence_idx: int, error: BaseException
+) -> None:
+    """Store a sentence failure for ``stage`` in ``doc.metadata``.
+
+    Args:
+        doc: Document being annotated.
+        stage: Stage label, e.g. ``"pos"`` or ``"dep"``.
+        sentence_idx: Index of the failed sentence.
+        error: Exception raised while annotating the sentence.
+
+    """
+    # Rebuilt rather than edited in place: a forked ``Doc`` shares these
+    # nested dicts with the ``Doc`` it was forked from.
+    failures: dict[str, dict[int, dict[str, Any]]] = dict(
+        doc.metadata.get(FAILED_SENTENCES_KEY) or {}
+    )
+    failures[stage] = {
+        **failures.get(stage, {}),
+        sentence_idx: {"error": str(error), "error_type": type(error).__name__},
+    }
+    doc.metadata[FAILED_SENTENCES_KEY] = failures
+
+
+def clear_sentence_failure(doc: Doc, *, stage: str, sentence_idx: int) -> None:
+    """Drop a recorded failure, removing empty containers afterwards."""
+    failures = doc.metadata.get(FAILED_SENTENCES_KEY)
+    if not isinstance(failures, dict):
+        return
+    failures = dict(failures)
+    stage_failures = failures.get(stage)
+    if isinstance(stage_failures, dict):
+        stage_failures = {
+            idx: value for idx, value in stage_failures.items() if idx != sentence_idx
+        }
+        if stage_failures:
+            failures[stage] = stage_failures
+        else:
+            failures.pop(stage, None)
+    if failures:
+        doc.metadata[FAILED_SENTENCES_KEY] = failures
+    else:
+        doc.metadata.pop(FAILED_SENTENCES_KEY, None)
+
+
+def get_failed_sentences(
+    doc: Doc, stage: Optional[str] = None
+) -> dict[str, dict[int, dict[str, Any]]]:
+    """Return recorded failures, optionally restricted to one stage.
+
+    Args:
+        doc: Document to inspect.
+        stage: Optional stage label to filter on.
+
+    Returns:
+        Mapping of stage to ``{sentence_idx: {"error", "error_type"}}``.
+
+    """
+    failures = doc.metadata.get(FAILED_SENTENCES_KEY)
+    if not isinstance(failures, dict):
+        return {}
+    if stage is None:
+        return {key: dict(val) for key, val in failures.items() if val}
+    stage_failures = failures.get(stage)
+    return {stage: dict(stage_failures)} if stage_failures else {}
+
+
+def failed_sentence_indices(doc: Doc, stage: str) -> list[int]:
+    """Return sorted sentence indices that failed for ``stage``."""
+    return sorted(get_failed_sentences(doc, stage).get(stage, {}))
+
+
+def merge_sentence_words(
+    existing: Iterable[Word], replacements: dict[int, list[Word]]
+) -> list[Word]:
+    """Replace the words of selected sentences and renumber ``index_token``.
+
+    Words of sentences not present in ``replacements`` are kept as-is. The
+    result is ordered by sentence index, then by the original token order
+    within each sentence, and ``index_token`` is reassigned globally.
+
+    Args:
+        existing: Current document words.
+        replacements: New words keyed by sentence index.
+
+    Returns:
+        The merged word list.
+
+    """
+    by_sentence: dict[int, list[Word]] = {}
+    unplaced: list[Word] = []
+    for word in existing:
+        idx = word.index_sentence
+        if idx is None:
+            unplaced.append(word)
+            continue
+        if idx in replacements:
+            continue
+        by_sentence.setdefault(idx, []).append(word)
+    for idx, words in replacements.items():
+        by_sentence[idx] = list(words)
+    merged: list[Word] = []
+    for idx in sorted(by_sentence):
+        merged.extend(by_sentence[idx])
+    merged.extend(unplaced)
+    # Kept words may be shared with the ``Doc`` this one was forked from, so
+    # renumbered words are copied instead of edited.
+    return [
+        word
+        if word.index_token == token_idx
+        else word.copy_for_edit(index_token=token_idx)
+        for token_idx, word in enumerate(merged)
+    ]
@@ -0,0 +1,114 @@
+"""Table-driven, on-demand creation of per-language model subclasses.
+
+Language pipelines and processes differ only by a few field defaults
+(``glottolog_id``, ``description``, the process list). Rather than defining
+hundreds of near-identical classes at import time, modules keep a data table
+of those defaults and create each class the first time its name is looked
+up, via a module-level ``__getattr__`` (PEP 562)::
+
+    _CLASSES = LazyClassTable(globals(), _TABLE, _build)
+
+    def __getattr__(name: str) -> Any:
+        return _CLASSES.resolve(name)
+
+Created classes are stored in the module globals, so each name maps to a
+single class object that pickles and compares like a statically defined one.
+"""
+
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, create_model
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+RowT = TypeVar("RowT")
+
+
+def build_subclass(
+    base: type[ModelT],
+    name: str,
+    module: str,
+    doc: str,
+    fields: Mapping[str, tuple[Any, Any]],
+) -> type[ModelT]:
+    """Create a pydantic subclass of ``base`` with the given field defaults.
+
+    Args:
+      base: Model class to subclass.
+      name: Class name; also used as ``__qualname__``.
+      module: Module the class is attributed to (for repr and pickling).
+      doc: Class docstring.
+      fields: ``{field: (annotation, default)}``; defaults may be ``Field(...)``.
+
+    Returns:
+      The new subclass.
+
+    """
+    cls = create_model(  # type: ignore[call-overload]
+        name,
+        __base__=base,
+        __module__=module,
+        __doc__=doc,
+        **fields,
+    )
+    cls.__qualname__ = name
+    return cls  # type: ignore[no-any-return]
+
+
+class LazyClassTable(Generic[RowT]):
+    """Resolve module attributes from a table of class definitions on demand.
+
+    Args:
+      namespace: The owning module's ``globals()``.
+      rows: ``{class name: row}`` describing each class.
+      factory: Builds the class for ``(name, row)``.
+
+    """
+
+    def __init__(
+        self,
+        namespace: dict[str, Any],
+        rows: Mapping[str, RowT],
+        factory: Callable[[str, RowT], type],
+    ) -> None:
+        self._namespace = namespace
+        self._rows = rows
+        self._factory = factory
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._rows
+
+    def names(self) -> Iterator[str]:
+        """Yield every class name in the table, in table order."""
+        return iter(self._rows)
+
+    def is_created(self, name: str) -> bool:
+        """Return True if ``name`` has already been created."""
+        return name in self._rows and name in self._namespace
+
+    def resolve(self, name: str) -> type:
+        """Return the class for ``name``, creating it on first access.
+
+        Raises:
+          AttributeError: If ``name`` is not in the table, matching the error a
+            module raises for a missing attribute.
+
+        """
+        cls = self._namespace.get(name)
+        if cls is not None:
+            return cls  # type: ignore[no-any-return]
+        row = self._rows.get(name)
+        if row is None:
+            module = self._namespace.get("__name__", "module")
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+        with self._lock:
+            cls = self._namespace.get(name)
+            if cls is None:
+                cls = self._namespace[name] = self._factory(name, row)
+        return cls
+
+    def dir(self) -> list[str]:
+        """Return module attribute names including not-yet-created classes."""
+        return sorted({*self._namespace, *self._rows})
@@ -0,0 +1,18 @@
+"""Built-in ``process_id`` to ``(module, class name)`` manifest.
+
+Generated by ``python -m cltk.core.process_registry``; do not edit by hand.
+"""
+
+PROCESS_MANIFEST: dict[str, tuple[str, str]] = {
+    "dependency.genai": ("cltk.dependency.processes", "GenAIDependencyProcess"),
+    "enrichment.genai": ("cltk.enrichment.processes", "GenAIEnrichmentProcess"),
+    "enrichment.idioms": ("cltk.enrichment.processes", "IdiomsEnrichmentProcess"),
+    "enrichment.lexicon": ("cltk.enrichment.processes", "LexiconEnrichmentProcess"),
+    "enrichment.pedagogy": ("cltk.enrichment.processes", "PedagogyEnrichmentProcess"),
+    "enrichment.phonology": ("cltk.enrichment.processes", "PhonologyEnrichmentProcess"),
+    "morphosyntax.genai": ("cltk.morphosyntax.processes", "GenAIMorphosyntaxProcess"),
+    "normalize": ("cltk.text.processes", "NormalizeProcess"),
+    "sentence_split": ("cltk.sentence.processes", "SentenceSplittingProcess"),
+    "stanza.analyze": ("cltk.stanza.processes", "StanzaAnalyzeProcess"),
+    "translation.genai": ("cltk.translation.processes", "GenAITranslationProcess"),
+}
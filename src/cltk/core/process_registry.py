@@ -1,9 +1,21 @@
-"""Registry for mapping process IDs to concrete Process classes."""
+"""Registry for mapping process IDs to concrete Process classes.
 
+Built-in processes are listed in ``cltk.core.process_manifest`` as
+``process_id -> (module, class name)``. ``get_process`` imports only the module
+that defines the requested process, so compiling a pipeline spec does not pull
+in unrelated backends (e.g. Stanza). Regenerate the manifest after adding or
+renaming a built-in process with::
+
+    python -m cltk.core.process_registry
+"""
+
+import ast
 import importlib
-from typing import TYPE_CHECKING, ClassVar
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Optional
 
 from cltk.core.cltk_logger import logger
+from cltk.core.process_manifest import PROCESS_MANIFEST
 
 if TYPE_CHECKING:  # pragma: no cover - import only for typing
     from cltk.core.data_types import Process
@@ -23,6 +35,7 @@ class ProcessRegistry:
         "cltk.enrichment.processes",
         "cltk.stanza.processes",
     )
+    _manifest: ClassVar[dict[str, tuple[str, str]]] = PROCESS_MANIFEST
 
     @classmethod
     def register(cls, process_cls: type["Process"]) -> type["Process"]:
@@ -43,22 +56,61 @@ class ProcessRegistry:
 
     @classmethod
     def get_process(cls, process_id: str) -> type["Process"]:
-        """Return the registered Process class for ``process_id``."""
-        cls._ensure_defaults_loaded()
+        """Return the registered Process class for ``process_id``.
+
+        Built-in processes are imported on first request from the module named
+        in the manifest; no other process module is loaded.
+
+        Raises:
+          KeyError: If ``process_id`` is unknown or its module cannot be
+            imported (e.g. a missing optional extra).
+
+        """
+        process_cls = cls._registry.get(process_id)
+        if process_cls is not None:
+            return process_cls
+        entry = cls._manifest.get(process_id)
+        if entry is None:
+            available = ", ".join(cls.list_process_ids())
+            raise KeyError(f"Unknown process_id '{process_id}'. Available: {available}")
+        module, _ = entry
+        try:
+            importlib.import_module(module)
+        except Exception as exc:
+            raise KeyError(
+                f"process_id '{process_id}' is provided by {module}, "
+                f"which could not be imported: {exc}"
+            ) from exc
         try:
             return cls._registry[process_id]
         except KeyError as exc:
-            available = ", ".join(sorted(cls._registry))
             raise KeyError(
-                f"Unknown process_id '{process_id}'. Available: {available}"
+                f"process_id '{process_id}' is listed for {module} but was not "
+                "registered on import; regenerate the process manifest."
             ) from exc
 
     @classmethod
     def list_processes(cls) -> dict[str, type["Process"]]:
-        """Return a snapshot of registered processes."""
+        """Return a snapshot of registered processes.
+
+        This imports every built-in process module. Use ``list_process_ids`` or
+        ``class_names`` when only the identifiers are needed.
+        """
         cls._ensure_defaults_loaded()
         return dict(cls._registry)
 
+    @classmethod
+    def list_process_ids(cls) -> list[str]:
+        """Return sorted ids of built-in and registered processes without importing them."""
+        return sorted({*cls._manifest, *cls._registry})
+
+    @classmethod
+    def class_names(cls) -> dict[str, str]:
+        """Return ``{process_id: class name}`` without importing process modules."""
+        names = {pid: class_name for pid, (_, class_name) in cls._manifest.items()}
+        names.update((pid, p.__name__) for pid, p in cls._registry.items())
+        return names
+
     @classmethod
     def _ensure_defaults_loaded(cls) -> None:
         """Import default process modules once to populate the registry."""
@@ -75,3 +127,76 @@ class ProcessRegistry:
 def register_process(process_cls: type["Process"]) -> type["Process"]:
     """Decorate a Process class to register in the ProcessRegistry."""
     return ProcessRegistry.register(process_cls)
+
+
+def _registered_process_ids(tree: ast.Module) -> dict[str, str]:
+    """Return ``{process_id: class name}`` for ``@register_process`` classes."""
+    found: dict[str, str] = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(
+            isinstance(d, ast.Name) and d.id == "register_process"
+            for d in node.decorator_list
+        ):
+            continue
+        for stmt in node.body:
+            target: Optional[ast.expr] = None
+            if isinstance(stmt, ast.AnnAssign):
+                target = stmt.target
+            elif isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+                target = stmt.targets[0]
+            value = getattr(stmt, "value", None)
+            if (
+                isinstance(target, ast.Name)
+                and target.id == "process_id"
+                and isinstance(value, ast.Constant)
+                and isinstance(value.value, str)
+            ):
+                found[value.value] = node.name
+    return found
+
+
+def generate_manifest(
+    modules: tuple[str, ...] = ProcessRegistry._default_modules,
+) -> dict[str, tuple[str, str]]:
+    """Build the process manifest by parsing (not importing) ``modules``.
+
+    Parsing keeps generation independent of optional extras such as Stanza,
+    whose package ``__init__`` imports the backend.
+    """
+    package_root = Path(__file__).resolve().parents[1]
+    manifest: dict[str, tuple[str, str]] = {}
+    for module in modules:
+        package, *parts = module.split(".")
+        if package != "cltk":
+            raise ValueError(f"{module} is not a CLTK module.")
+        source = package_root.joinpath(*parts).with_suffix(".py")
+        tree = ast.parse(source.read_text(encoding="utf-8"))
+        for process_id, class_name in _registered_process_ids(tree).items():
+            if process_id in manifest:
+                raise ValueError(f"Duplicate process_id '{process_id}' in {module}.")
+            manifest[process_id] = (module, class_name)
+    return dict(sorted(manifest.items()))
+
+
+def write_manifest(path: Optional[Path] = None) -> Path:
+    """Write ``generate_manifest()`` to ``cltk/core/process_manifest.py``."""
+    path = path or Path(__file__).with_name("process_manifest.py")
+    lines = [
+        '"""Built-in ``process_id`` to ``(module, class name)`` manifest.',
+        "",
+        "Generated by ``python -m cltk.core.process_registry``; do not edit by hand.",
+        '"""',
+        "",
+        "PROCESS_MANIFEST: dict[str, tuple[str, str]] = {",
+    ]
+    for process_id, (module, class_name) in generate_manifest().items():
+        lines.append(f'    "{process_id}": ("{module}", "{class_name}"),')
+    lines.append("}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_manifest()}")
@@ -1,16 +1,30 @@
-"""Provenance helpers for reproducible CLTK annotations."""
+"""Provenance helpers for reproducible CLTK annotations.
+
+``Doc.provenance`` is a table of interned records: ``add_provenance_record``
+stores a record once per distinct (process, model, backend, config, prompt
+version, ...) combination and gives it a short id (``"p0"``, ``"p1"``, ...).
+The GenAI stages make one call per sentence; their records differ only in
+the sentence index and the digest of the full prompt, so all of a stage's
+sentences share one record and the per-sentence prompt digests are kept in
+its ``sentence_prompt_digests``. Words and sentences point at records through
+their ``annotation_sources`` ids.
+"""
 
 import hashlib
 import json
 import platform as _platform
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 
 from pydantic import BaseModel
 
 _SENSITIVE_KEYS = {"api_key", "token", "password", "secret", "key"}
 
+# Fields that do not decide whether two records describe the same annotation.
+_NON_KEY_FIELDS = {"id", "created_at", "sentence_prompt_digests"}
+
 
 class ProvenanceRecord(BaseModel):
     """Compact record describing how annotations were produced."""
@@ -30,9 +44,40 @@ class ProvenanceRecord(BaseModel):
     python_version: Optional[str] = None
     platform: Optional[str] = None
     notes: Optional[dict[str, Any]] = None
+    # SHA256 of the full prompt of each sentence, for per-sentence calls.
+    sentence_prompt_digests: Optional[dict[int, str]] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
+    def prompt_digest_for(self, sentence_idx: Optional[int] = None) -> Optional[str]:
+        """Return the digest of the prompt sent for ``sentence_idx``.
+
+        Falls back to ``prompt_digest`` (set for whole-document calls and
+        custom prompt templates) when no per-sentence digest was recorded.
+        """
+        digests = self.sentence_prompt_digests or {}
+        if sentence_idx is not None and sentence_idx in digests:
+            return digests[sentence_idx]
+        return self.prompt_digest
+
+    def intern_key(self) -> str:
+        """Return the canonical JSON of the fields shared by interned records."""
+        return json.dumps(
+            self.model_dump(mode="json", exclude=_NON_KEY_FIELDS),
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+
+    def copy_for_edit(self) -> "ProvenanceRecord":
+        """Return a copy with its own ``sentence_prompt_digests`` dict."""
+        digests = self.sentence_prompt_digests
+        return self.model_copy(
+            update={
+                "sentence_prompt_digests": None if digests is None else dict(digests)
+            }
+        )
+
 
 def canonical_json(obj: Any) -> str:
     """Return a stable JSON string with sorted keys and no whitespace."""
@@ -96,6 +141,26 @@ def extract_doc_config(doc: Any) -> Optional[dict[str, Any]]:
     return config
 
 
+@lru_cache(maxsize=1)
+def _runtime_info() -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return the CLTK version, Python version and platform string."""
+    try:
+        import cltk
+
+        cltk_version: Optional[str] = cltk.__version__
+    except Exception:
+        cltk_version = None
+    try:
+        python_version: Optional[str] = _platform.python_version()
+    except Exception:
+        python_version = None
+    try:
+        platform: Optional[str] = _platform.platform()
+    except Exception:
+        platform = None
+    return cltk_version, python_version, platform
+
+
 def build_provenance_record(
     *,
     language: Optional[str] = None,
@@ -115,35 +180,36 @@ def build_provenance_record(
     created_at: Optional[datetime] = None,
     record_id: Optional[str] = None,
 ) -> ProvenanceRecord:
-    """Build a ProvenanceRecord, computing digests when needed."""
+    """Build a ProvenanceRecord, computing digests when needed.
+
+    When ``notes`` holds an integer ``"sentence_idx"`` and ``prompt_text`` is
+    given, the index is moved out of ``notes`` and the prompt digest is stored
+    under it in ``sentence_prompt_digests``, so that the records of a stage's
+    per-sentence calls intern to one record in ``add_provenance_record``.
+    """
     if created_at is None:
         created_at = datetime.now(timezone.utc)
     if record_id is None:
         record_id = make_provenance_id()
-    if prompt_digest is None and prompt_text:
+    sentence_prompt_digests: Optional[dict[int, str]] = None
+    sentence_idx = (notes or {}).get("sentence_idx")
+    if prompt_text and isinstance(sentence_idx, int):
+        notes = {k: v for k, v in (notes or {}).items() if k != "sentence_idx"}
+        sentence_prompt_digests = {sentence_idx: sha256_hex(prompt_text)}
+    elif prompt_digest is None and prompt_text:
         prompt_digest = sha256_hex(prompt_text)
     if config_digest is None and config:
         try:
             config_digest = sha256_hex(canonical_json(config))
         except Exception:
             config_digest = None
+    runtime_cltk, runtime_python, runtime_platform = _runtime_info()
     if cltk_version is None:
-        try:
-            import cltk
-
-            cltk_version = cltk.__version__
-        except Exception:
-            cltk_version = None
+        cltk_version = runtime_cltk
     if python_version is None:
-        try:
-            python_version = _platform.python_version()
-        except Exception:
-            python_version = None
+        python_version = runtime_python
     if platform is None:
-        try:
-            platform = _platform.platform()
-        except Exception:
-            platform = None
+        platform = runtime_platform
     return ProvenanceRecord(
         id=record_id,
         created_at=created_at,
@@ -160,25 +226,109 @@ def build_provenance_record(
         python_version=python_version,
         platform=platform,
         notes=notes,
+        sentence_prompt_digests=sentence_prompt_digests,
     )
 
 
+def _next_provenance_id(prov_map: dict[str, ProvenanceRecord]) -> str:
+    """Return the smallest unused ``"p<N>"`` id, starting from the table size."""
+    number = len(prov_map)
+    while f"p{number}" in prov_map:
+        number += 1
+    return f"p{number}"
+
+
+def _intern_record(
+    prov_map: dict[str, ProvenanceRecord], record: ProvenanceRecord
+) -> str:
+    """Store ``record`` in ``prov_map`` unless an equivalent one exists; return its id."""
+    key: Optional[str] = None
+    for prov_id, existing in prov_map.items():
+        # Cheap checks first; most records in a table differ in process.
+        if (
+            existing.process != record.process
+            or existing.model != record.model
+            or existing.prompt_version != record.prompt_version
+        ):
+            continue
+        if key is None:
+            key = record.intern_key()
+        if existing.intern_key() != key:
+            continue
+        digests = record.sentence_prompt_digests
+        if digests:
+            if existing.sentence_prompt_digests is None:
+                # Possibly shared with another table; give it a digests dict
+                # only in this one. Tables own the digests dicts they hold.
+                existing = existing.copy_for_edit()
+                existing.sentence_prompt_digests = {}
+                prov_map[prov_id] = existing
+            existing.sentence_prompt_digests.update(digests)
+        return prov_id
+    prov_id = _next_provenance_id(prov_map)
+    record.id = prov_id
+    prov_map[prov_id] = record
+    return prov_id
+
+
 def add_provenance_record(
     doc: Any, record: ProvenanceRecord, *, set_default: bool = False
 ) -> str:
-    """Add a provenance record to a Doc-like object and return its id."""
+    """Add a provenance record to a Doc-like object and return its id.
+
+    A record equal to one already on the ``Doc`` (ignoring its id, creation
+    time and per-sentence prompt digests) is not stored again: the existing
+    id is returned and the new prompt digests are added to the stored record.
+    New records get the next short id (``"p0"``, ``"p1"``, ...).
+    """
+    prov_id = record.id
     try:
         prov_map = getattr(doc, "provenance", None)
         if prov_map is None:
             doc.provenance = {}
             prov_map = doc.provenance
         if isinstance(prov_map, dict):
-            prov_map[record.id] = record
+            prov_id = _intern_record(prov_map, record)
         if set_default and not getattr(doc, "default_provenance_id", None):
-            doc.default_provenance_id = record.id
+            doc.default_provenance_id = prov_id
     except Exception:
         pass
-    return record.id
+    return prov_id
+
+
+def merge_provenance(doc: Any, source: Any) -> dict[str, str]:
+    """Add the provenance records of ``source`` to ``doc``.
+
+    Use this when moving words or sentences from a temporary ``Doc`` into
+    ``doc``. Short ids are only unique within one ``Doc``, so records may get
+    a different id in ``doc``; pass the returned mapping to
+    ``remap_annotation_sources`` for the moved words.
+
+    Returns:
+        Mapping from ids in ``source`` to ids in ``doc``, for the ids that changed.
+
+    """
+    remap: dict[str, str] = {}
+    for prov_id, record in list((getattr(source, "provenance", None) or {}).items()):
+        new_id = add_provenance_record(doc, record.copy_for_edit())
+        if new_id != prov_id:
+            remap[prov_id] = new_id
+    default_id = getattr(source, "default_provenance_id", None)
+    if getattr(doc, "default_provenance_id", None) is None and default_id:
+        doc.default_provenance_id = remap.get(default_id, default_id)
+    return remap
+
+
+def remap_annotation_sources(items: Iterable[Any], remap: dict[str, str]) -> None:
+    """Rewrite the ``annotation_sources`` ids of words or sentences, in place."""
+    if not remap:
+        return
+    for item in items:
+        sources = getattr(item, "annotation_sources", None)
+        if sources and any(value in remap for value in sources.values()):
+            item.annotation_sources = {
+                field: remap.get(value, value) for field, value in sources.items()
+            }
 
 
 def get_token_provenance(
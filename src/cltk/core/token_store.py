@@ -0,0 +1,477 @@
+"""Columnar (struct-of-arrays) storage for the words of a ``Doc``.
+
+A list of ``Word`` models costs several pydantic objects per token. For large
+corpora, ``Doc.compact()`` moves the words into a ``TokenTable`` instead:
+
+- token, sentence and character indices and governors are NumPy ``int64``
+  arrays, with ``MISSING`` (the smallest ``int64``) for a missing value;
+- forms, lemmas and XPOS tags are codes into one shared string table;
+- UPOS tags, dependency relations, feature bundles and annotation sources
+  are codes into tables holding one object per distinct value;
+- word embeddings are the rows of one ``EmbeddingMatrix``, and words built
+  from the table get read-only views of their rows;
+- any other non-default ``Word`` field is kept sparsely, per row.
+
+``Doc.words`` then becomes a ``WordSequence`` that builds ``Word`` objects on
+access, so existing code keeps working, while statistics can read the columns
+directly. Exporters such as ``doc_to_conllu`` and ``doc_to_feature_table``
+still read the built words. Words built this way share their interned tag
+models and embeddings but get their own lists, dicts and enrichment, and edits
+to them are not written back to the table; call ``Doc.expand()`` before
+editing words.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Generic, Hashable, Optional, TypeVar, overload
+
+import numpy as np
+from pydantic import BaseModel
+from pydantic_core import core_schema
+
+from cltk.core.embedding_store import EmbeddingMatrix
+from cltk.core.trusted_models import construct_trusted
+
+if TYPE_CHECKING:  # pragma: no cover - import only for typing
+    from cltk.core.data_types import UDFeatureTagSet, Word
+    from cltk.morphosyntax.ud_deprels import UDDeprelTag
+    from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
+
+#: Value stored in integer columns for a missing value.
+MISSING = int(np.iinfo(np.int64).min)
+# Code stored in code arrays for a missing value.
+_NO_CODE = -1
+
+#: ``Word`` fields stored as ``int64`` columns.
+INT_COLUMNS: tuple[str, ...] = (
+    "index_token",
+    "index_sentence",
+    "index_char_start",
+    "index_char_stop",
+    "governor",
+)
+#: ``Word`` fields stored as codes into the shared string table.
+STRING_COLUMNS: tuple[str, ...] = ("string", "lemma", "xpos")
+
+_T = TypeVar("_T")
+
+
+class InternTable(Generic[_T]):
+    """Assign a small integer code to each distinct value, in first-seen order."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self) -> None:
+        self.values: list[_T] = []
+        self._codes: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, key: Hashable, value: _T) -> int:
+        """Return the code for ``key``, storing ``value`` if it is new."""
+        code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __getstate__(self) -> tuple[list[_T], dict[Hashable, int]]:
+        return self.values, self._codes
+
+    def __setstate__(self, state: tuple[list[_T], dict[Hashable, int]]) -> None:
+        self.values, self._codes = state
+
+
+def _upos_key(tag: "UDPartOfSpeechTag") -> Hashable:
+    return tag.tag, tag.name, tag.open_class
+
+
+def _deprel_key(tag: "UDDeprelTag") -> Hashable:
+    return tag.code, tag.name, tag.subtype
+
+
+def _features_key(features: "UDFeatureTagSet") -> Hashable:
+    return features.pairs
+
+
+# Fields with dedicated columns, and defaults of the sparsely stored ones.
+_COLUMN_FIELDS = frozenset(
+    (
+        *INT_COLUMNS,
+        *STRING_COLUMNS,
+        "upos",
+        "features",
+        "dependency_relation",
+        "annotation_sources",
+        "embedding",
+    )
+)
+_EMPTY_DEFAULTS: dict[str, Any] = {"syllables": [], "confidence": {}}
+
+
+def _embedding_column(
+    words: list["Word"], embeddings: Optional[EmbeddingMatrix]
+) -> Optional[EmbeddingMatrix]:
+    """Return the words' embeddings as a matrix, or None to keep them per row.
+
+    ``embeddings`` is returned as is when every word's embedding is a view of
+    its row. Embeddings that cannot share one matrix without changing (mixed
+    shapes or types, empty or non-float vectors, NaN in the first component)
+    are kept with the sparse per-row values instead.
+    """
+    vectors = [word.embedding for word in words]
+    present = [vector for vector in vectors if vector is not None]
+    if not present:
+        return None
+    if embeddings is not None and embeddings.holds_rows(vectors):
+        return embeddings
+    first = present[0]
+    if (
+        first.ndim != 1
+        or not len(first)
+        or not np.issubdtype(first.dtype, np.floating)
+        or any(
+            vector.shape != first.shape
+            or vector.dtype != first.dtype
+            or np.isnan(vector[0])
+            for vector in present
+        )
+    ):
+        return None
+    return EmbeddingMatrix.from_rows(vectors, dtype=first.dtype)
+
+
+def _copy_extra(value: Any) -> Any:
+    """Return a sparse value for a built word, so edits stay off the table."""
+    if isinstance(value, (list, dict)):
+        return value.copy()
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    return value
+
+
+class TokenTable:
+    """Struct-of-arrays store for a sequence of ``Word`` objects.
+
+    Build one with ``TokenTable.from_words``; read a column with
+    ``table.ints("governor")``, ``table.strings("lemma")`` or
+    ``table.upos_tags()``, or a whole ``Word`` with ``table.word(i)``.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: Any
+    ) -> core_schema.CoreSchema:
+        """Accept instances only; JSON gets null, since ``Doc.words`` has the data."""
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda table: None, when_used="json"
+            ),
+        )
+
+    def __init__(
+        self,
+        ints: dict[str, np.ndarray],
+        string_codes: dict[str, np.ndarray],
+        strings: InternTable[str],
+        upos_codes: np.ndarray,
+        upos: InternTable["UDPartOfSpeechTag"],
+        deprel_codes: np.ndarray,
+        deprels: InternTable["UDDeprelTag"],
+        feature_codes: np.ndarray,
+        features: InternTable["UDFeatureTagSet"],
+        source_codes: np.ndarray,
+        sources: InternTable[dict[str, str]],
+        extras: Mapping[int, dict[str, Any]],
+        embeddings: Optional[EmbeddingMatrix] = None,
+    ) -> None:
+        self._ints = ints
+        self._string_codes = string_codes
+        self._strings = strings
+        self._upos_codes = upos_codes
+        self._upos = upos
+        self._deprel_codes = deprel_codes
+        self._deprels = deprels
+        self._feature_codes = feature_codes
+        self._features = features
+        self._source_codes = source_codes
+        self._sources = sources
+        self._extras = extras
+        self._embeddings = embeddings
+
+    @classmethod
+    def from_words(
+        cls,
+        words: Iterable["Word"],
+        *,
+        embeddings: Optional[EmbeddingMatrix] = None,
+    ) -> "TokenTable":
+        """Return a table holding the values of ``words``, in order.
+
+        Args:
+            words: Words to store.
+            embeddings: Matrix whose rows the words' embeddings already view
+                (e.g. ``Doc.token_embeddings``); reused instead of copied.
+
+        """
+        words = list(words)
+        embeddings = _embedding_column(words, embeddings)
+        ints = {name: np.full(len(words), MISSING, np.int64) for name in INT_COLUMNS}
+        string_codes = {
+            name: np.full(len(words), _NO_CODE, np.int32) for name in STRING_COLUMNS
+        }
+        upos_codes = np.full(len(words), _NO_CODE, np.int16)
+        deprel_codes = np.full(len(words), _NO_CODE, np.int16)
+        feature_codes = np.full(len(words), _NO_CODE, np.int32)
+        source_codes = np.full(len(words), _NO_CODE, np.int32)
+        strings: InternTable[str] = InternTable()
+        upos: InternTable[UDPartOfSpeechTag] = InternTable()
+        deprels: InternTable[UDDeprelTag] = InternTable()
+        features: InternTable[UDFeatureTagSet] = InternTable()
+        sources: InternTable[dict[str, str]] = InternTable()
+        extras: dict[int, dict[str, Any]] = {}
+        for row, word in enumerate(words):
+            values = word.__dict__
+            for name in INT_COLUMNS:
+                if values[name] is not None:
+                    ints[name][row] = values[name]
+            for name in STRING_COLUMNS:
+                if values[name] is not None:
+                    string_codes[name][row] = strings.code(values[name], values[name])
+            if word.upos is not None:
+                upos_codes[row] = upos.code(_upos_key(word.upos), word.upos)
+            if word.dependency_relation is not None:
+                deprel_codes[row] = deprels.code(
+                    _deprel_key(word.dependency_relation), word.dependency_relation
+                )
+            if word.features is not None:
+                feature_codes[row] = features.code(
+                    _features_key(word.features), word.features
+                )
+            if word.annotation_sources:
+                source_codes[row] = sources.code(
+                    tuple(word.annotation_sources.items()), word.annotation_sources
+                )
+            sparse: dict[str, Any] = {}
+            if embeddings is None and values["embedding"] is not None:
+                sparse["embedding"] = values["embedding"]
+            for name, value in values.items():
+                if name in _COLUMN_FIELDS or value is None:
+                    continue
+                if name in _EMPTY_DEFAULTS and value == _EMPTY_DEFAULTS[name]:
+                    continue
+                sparse[name] = value
+            if sparse:
+                extras[row] = sparse
+        return cls(
+            ints,
+            string_codes,
+            strings,
+            upos_codes,
+            upos,
+            deprel_codes,
+            deprels,
+            feature_codes,
+            features,
+            source_codes,
+            sources,
+            extras,
+            embeddings,
+        )
+
+    def to_state(self) -> dict[str, Any]:
+        """Return the table's columns and value tables, for serialization.
+
+        Arrays are returned as stored, not copied. ``from_state`` rebuilds
+        an equal table from the result.
+        """
+        return {
+            "ints": dict(self._ints),
+            "string_codes": dict(self._string_codes),
+            "strings": list(self._strings.values),
+            "upos_codes": self._upos_codes,
+            "upos": list(self._upos.values),
+            "deprel_codes": self._deprel_codes,
+            "deprels": list(self._deprels.values),
+            "feature_codes": self._feature_codes,
+            "features": list(self._features.values),
+            "source_codes": self._source_codes,
+            "sources": list(self._sources.values),
+            "extras": self._extras,
+            "embeddings": (
+                self._embeddings.values if self._embeddings is not None else None
+            ),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "TokenTable":
+        """Build a table from the output of ``to_state``.
+
+        The arrays are used as given, so read-only (e.g. memory-mapped)
+        arrays work; ``extras`` may be any mapping from row to field values.
+        """
+        strings: InternTable[str] = InternTable()
+        for value in state["strings"]:
+            strings.code(value, value)
+        upos: InternTable[UDPartOfSpeechTag] = InternTable()
+        for tag in state["upos"]:
+            upos.code(_upos_key(tag), tag)
+        deprels: InternTable[UDDeprelTag] = InternTable()
+        for tag in state["deprels"]:
+            deprels.code(_deprel_key(tag), tag)
+        features: InternTable[UDFeatureTagSet] = InternTable()
+        for tag_set in state["features"]:
+            features.code(_features_key(tag_set), tag_set)
+        sources: InternTable[dict[str, str]] = InternTable()
+        for mapping in state["sources"]:
+            sources.code(tuple(mapping.items()), mapping)
+        return cls(
+            dict(state["ints"]),
+            dict(state["string_codes"]),
+            strings,
+            state["upos_codes"],
+            upos,
+            state["deprel_codes"],
+            deprels,
+            state["feature_codes"],
+            features,
+            state["source_codes"],
+            sources,
+            state["extras"],
+            (
+                EmbeddingMatrix(state["embeddings"])
+                if state.get("embeddings") is not None
+                else None
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self._upos_codes)
+
+    @property
+    def embeddings(self) -> Optional[EmbeddingMatrix]:
+        """Word embeddings, one row per token, or None if no word has one."""
+        return self._embeddings
+
+    def __repr__(self) -> str:
+        return (
+            f"TokenTable(tokens={len(self)}, strings={len(self._strings)}, "
+            f"feature_bundles={len(self._features)})"
+        )
+
+    def ints(self, name: str) -> np.ndarray:
+        """Return the ``int64`` column ``name`` (``MISSING`` where unset).
+
+        Raises:
+            KeyError: If ``name`` is not one of ``INT_COLUMNS``.
+
+        """
+        return self._ints[name]
+
+    def strings(self, name: str) -> list[Optional[str]]:
+        """Return the decoded string column ``name`` (one of ``STRING_COLUMNS``)."""
+        values = self._strings.values
+        return [
+            values[code] if code != _NO_CODE else None
+            for code in self._string_codes[name].tolist()
+        ]
+
+    def upos_tags(self) -> list[Optional[str]]:
+        """Return the UPOS tag abbreviation of each token."""
+        tags = [tag.tag for tag in self._upos.values]
+        return [
+            tags[code] if code != _NO_CODE else None
+            for code in self._upos_codes.tolist()
+        ]
+
+    def upos_counts(self) -> Counter[str]:
+        """Count tokens per UPOS tag without building ``Word`` objects."""
+        codes = self._upos_codes[self._upos_codes != _NO_CODE]
+        counts = np.bincount(codes, minlength=len(self._upos))
+        counts_by_tag: Counter[str] = Counter()
+        for tag, count in zip(self._upos.values, counts.tolist()):
+            counts_by_tag[tag.tag] += count
+        return counts_by_tag
+
+    def word(self, row: int) -> "Word":
+        """Build the ``Word`` stored at ``row``."""
+        from cltk.core.data_types import Word
+
+        fields: dict[str, Any] = {}
+        for name in INT_COLUMNS:
+            value = int(self._ints[name][row])
+            fields[name] = None if value == MISSING else value
+        strings = self._strings.values
+        for name in STRING_COLUMNS:
+            code = int(self._string_codes[name][row])
+            fields[name] = None if code == _NO_CODE else strings[code]
+        code = int(self._upos_codes[row])
+        fields["upos"] = None if code == _NO_CODE else self._upos.values[code]
+        code = int(self._deprel_codes[row])
+        fields["dependency_relation"] = (
+            None if code == _NO_CODE else self._deprels.values[code]
+        )
+        code = int(self._feature_codes[row])
+        fields["features"] = None if code == _NO_CODE else self._features.values[code]
+        code = int(self._source_codes[row])
+        fields["annotation_sources"] = (
+            {} if code == _NO_CODE else dict(self._sources.values[code])
+        )
+        if self._embeddings is not None:
+            fields["embedding"] = self._embeddings.row(row)
+        # Only stored values count as set, as on the words the table was built from.
+        fields_set = {
+            name
+            for name, value in fields.items()
+            if value is not None and name != "annotation_sources"
+        }
+        if code != _NO_CODE:
+            fields_set.add("annotation_sources")
+        for name, value in self._extras.get(row, {}).items():
+            fields[name] = _copy_extra(value)
+            fields_set.add(name)
+        return construct_trusted(Word, fields, fields_set=fields_set)
+
+    def to_words(self) -> list["Word"]:
+        """Build every ``Word``, in order."""
+        return [self.word(row) for row in range(len(self))]
+
+
+class WordSequence(Sequence["Word"]):
+    """Read-only ``Doc.words`` replacement that builds words from a ``TokenTable``."""
+
+    __slots__ = ("table",)
+
+    def __init__(self, table: TokenTable) -> None:
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @overload
+    def __getitem__(self, index: int) -> "Word": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list["Word"]: ...
+
+    def __getitem__(self, index: "int | slice") -> "Word | list[Word]":
+        if isinstance(index, slice):
+            return [self.table.word(row) for row in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        return self.table.word(index)
+
+    def __iter__(self) -> Iterator["Word"]:
+        return (self.table.word(row) for row in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, WordSequence)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"WordSequence({self.table!r})"
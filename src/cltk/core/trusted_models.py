@@ -0,0 +1,78 @@
+"""Validation-free construction of pydantic models for internal producers.
+
+Pipeline processes build a ``Word`` and several tag models per token from
+values that are already known to be valid (tags resolved against the UD
+registries, indices computed by the process). ``construct_trusted`` skips
+validation as ``BaseModel.model_construct`` does, but without its per-call
+walk over the model's fields and default factories, which costs more than
+validating small models. User-facing code keeps the validating constructors.
+"""
+
+from functools import cache
+from typing import Any, Callable, Iterable, Optional, TypeVar, cast
+
+from pydantic import BaseModel
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+@cache
+def _field_defaults(
+    model: type[BaseModel],
+) -> tuple[dict[str, Any], dict[str, Callable[[], Any]], dict[str, Any]]:
+    """Return the plain defaults, default factories and private defaults of ``model``."""
+    defaults: dict[str, Any] = {}
+    factories: dict[str, Callable[[], Any]] = {}
+    for name, info in model.model_fields.items():
+        if info.default_factory is not None:
+            factories[name] = cast(Callable[[], Any], info.default_factory)
+        else:
+            defaults[name] = info.default
+    private = {
+        name: attr.get_default() for name, attr in model.__private_attributes__.items()
+    }
+    return defaults, factories, private
+
+
+def construct_trusted(
+    model: type[_M],
+    fields: dict[str, Any],
+    fields_set: Optional[Iterable[str]] = None,
+) -> _M:
+    """Build ``model`` from ``fields`` without validating them.
+
+    Fields missing from ``fields`` get their defaults, and only the given
+    fields count as set, exactly as with ``model.model_construct(**fields)``.
+    Callers must pass values of the declared types; nothing is checked.
+    When every field is given, ``fields`` itself becomes the instance's
+    ``__dict__``, so pass a dict that is not used afterwards.
+
+    Args:
+        model: Pydantic model class to instantiate.
+        fields: Field values, keyed by field name (not alias).
+        fields_set: Names to report as explicitly set, when copying a model
+            whose set fields differ from ``fields``.
+
+    Returns:
+        A new ``model`` instance.
+
+    """
+    defaults, factories, private = _field_defaults(model)
+    if len(fields) == len(defaults) + len(factories):
+        values = fields  # every field given, e.g. when copying a model
+    else:
+        values = dict(defaults)
+        for name, factory in factories.items():
+            if name not in fields:
+                values[name] = factory()
+        values.update(fields)
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(
+        instance,
+        "__pydantic_fields_set__",
+        set(fields if fields_set is None else fields_set),
+    )
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", dict(private) or None)
+    return instance
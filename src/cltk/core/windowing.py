@@ -0,0 +1,215 @@
+"""Offset remapping and merging for windowed analysis of large documents.
+
+``NLP.analyze_windowed()`` cuts a text into sentence-aligned windows (see
+``cltk.sentence.utils.sentence_window_spans``) and runs each window through
+the pipeline as its own ``Doc``. The helpers here move a window ``Doc`` into
+document coordinates and join the windows back into one ``Doc``.
+
+Sentence-keyed fields and ``Word.index_sentence`` are offset by the number of
+sentences in earlier windows, ``Word.index_token`` and idiom token indices by
+the number of earlier words, and ``Doc.sentence_boundaries`` by the length of
+the earlier windows' ``normalized_text``. Word character offsets are moved
+only for backends that report them relative to the document (Stanza). The
+GenAI backends report them relative to the sentence, so they stay valid.
+"""
+
+from array import array
+from typing import Any, Iterable, Optional
+
+from cltk.core.data_types import Doc
+from cltk.core.fault_tolerance import FAILED_SENTENCES_KEY
+from cltk.core.provenance import merge_provenance, remap_annotation_sources
+from cltk.text.utils import NormalizationOffsets
+
+#: Key under which each window ``Doc`` records its placement in ``metadata``.
+WINDOW_METADATA_KEY = "window"
+
+# Backends whose ``Word.index_char_start``/``stop`` index ``Doc.normalized_text``.
+_DOC_RELATIVE_CHAR_OFFSET_BACKENDS = frozenset({"stanza"})
+
+
+def count_sentences(doc: Doc) -> int:
+    """Return the number of sentences a window ``Doc`` occupies."""
+    count = len(doc.sentence_boundaries or [])
+    for word in doc.words or []:
+        if word.index_sentence is not None and word.index_sentence >= count:
+            count = word.index_sentence + 1
+    return count
+
+
+def _shift_keys(values: dict[int, Any], offset: int) -> dict[int, Any]:
+    """Return ``values`` with every integer key moved by ``offset``."""
+    return {key + offset: value for key, value in values.items()}
+
+
+def shift_window_doc(
+    doc: Doc,
+    *,
+    char_offset: int,
+    sentence_offset: int,
+    token_offset: int,
+) -> Doc:
+    """Move a window ``Doc`` into document coordinates, in place.
+
+    Args:
+        doc: ``Doc`` produced for a single window.
+        char_offset: Length of the normalized text of earlier windows.
+        sentence_offset: Number of sentences in earlier windows.
+        token_offset: Number of words in earlier windows.
+
+    Returns:
+        The same ``doc``.
+
+    """
+    shift_chars = doc.backend in _DOC_RELATIVE_CHAR_OFFSET_BACKENDS
+    for word in doc.words or []:
+        if word.index_token is not None:
+            word.index_token += token_offset
+        if word.index_sentence is not None:
+            word.index_sentence += sentence_offset
+        if shift_chars:
+            if word.index_char_start is not None:
+                word.index_char_start += char_offset
+            if word.index_char_stop is not None:
+                word.index_char_stop += char_offset
+    doc.invalidate_sentence_index()
+    doc.sentence_boundaries = [
+        (start + char_offset, stop + char_offset)
+        for start, stop in doc.sentence_boundaries or []
+    ]
+    doc.sentence_embeddings = _shift_keys(doc.sentence_embeddings, sentence_offset)
+    doc.sentence_embedding_matrix = None  # rows are by window sentence index
+    doc.sentence_translations = _shift_keys(doc.sentence_translations, sentence_offset)
+    doc.sentence_annotation_sources = _shift_keys(
+        doc.sentence_annotation_sources, sentence_offset
+    )
+    for span in doc.idiom_spans or []:
+        span.token_indices = [idx + token_offset for idx in span.token_indices]
+    failures = doc.metadata.get(FAILED_SENTENCES_KEY)
+    if isinstance(failures, dict):
+        doc.metadata[FAILED_SENTENCES_KEY] = {
+            stage: _shift_keys(stage_failures, sentence_offset)
+            for stage, stage_failures in failures.items()
+        }
+    return doc
+
+
+def _merge_genai_use(docs: Iterable[Doc]) -> list[dict[str, Any]]:
+    """Sum per-stage token usage across windows, keeping first-seen order."""
+    by_stage: dict[str, dict[str, Any]] = {}
+    other: list[dict[str, Any]] = []
+    for doc in docs:
+        for entry in doc.genai_use or []:
+            stage = entry.get("stage") if isinstance(entry, dict) else None
+            if not stage:
+                other.append(entry)
+                continue
+            total = by_stage.setdefault(str(stage), {"stage": stage})
+            for key, value in entry.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    total[key] = total.get(key, 0) + value
+    return [*by_stage.values(), *other]
+
+
+def _merge_offsets(docs: list[Doc]) -> Optional[NormalizationOffsets]:
+    """Chain the windows' normalized-to-raw offset maps, if every window has one."""
+    if any(doc.normalized_offsets is None for doc in docs):
+        return None
+    starts = array("q")
+    raw_offset = 0
+    for doc in docs:
+        assert doc.normalized_offsets is not None
+        window = doc.normalized_offsets.starts
+        starts.extend(raw_offset + start for start in window[:-1])
+        raw_offset += window[-1]
+    starts.append(raw_offset)
+    return NormalizationOffsets(starts)
+
+
+def _join_text(values: Iterable[Optional[str]]) -> Optional[str]:
+    """Join the non-empty strings with a space, or return None if none exist."""
+    parts = [value for value in values if value]
+    return " ".join(parts) if parts else None
+
+
+def merge_window_docs(docs: list[Doc], *, raw: Optional[str] = None) -> Doc:
+    """Join window ``Doc`` objects already moved by ``shift_window_doc``.
+
+    Args:
+        docs: Window documents in text order (at least one).
+        raw: The full input text; defaults to the concatenated window texts.
+
+    Returns:
+        A single ``Doc`` covering all windows. Its ``metadata`` is taken from
+        the first window, with failures merged across windows and the
+        placement of every window listed under ``"windows"``.
+
+    Raises:
+        ValueError: If ``docs`` is empty.
+
+    """
+    if not docs:
+        raise ValueError("At least one window Doc is required to merge.")
+    first = docs[0]
+    metadata = {
+        key: value
+        for key, value in first.metadata.items()
+        if key not in (FAILED_SENTENCES_KEY, WINDOW_METADATA_KEY)
+    }
+    failures: dict[str, dict[int, Any]] = {}
+    for doc in docs:
+        for stage, stage_failures in (
+            doc.metadata.get(FAILED_SENTENCES_KEY) or {}
+        ).items():
+            failures.setdefault(stage, {}).update(stage_failures)
+    if failures:
+        metadata[FAILED_SENTENCES_KEY] = failures
+    metadata["windows"] = [doc.metadata.get(WINDOW_METADATA_KEY) for doc in docs]
+    merged = Doc(
+        language=first.language,
+        dialect=first.dialect,
+        pipeline=first.pipeline,
+        backend=first.backend,
+        model=first.model,
+        embeddings_model=first.embeddings_model,
+        raw=raw if raw is not None else "".join(doc.raw or "" for doc in docs),
+        normalized_text=(
+            "".join(doc.normalized_text or "" for doc in docs)
+            if any(doc.normalized_text is not None for doc in docs)
+            else None
+        ),
+        normalized_offsets=_merge_offsets(docs),
+        words=[],
+        sentence_boundaries=[b for doc in docs for b in doc.sentence_boundaries or []],
+        sentence_embeddings={
+            k: v for doc in docs for k, v in doc.sentence_embeddings.items()
+        },
+        sentence_translations={
+            k: v for doc in docs for k, v in doc.sentence_translations.items()
+        },
+        translation=_join_text(doc.translation for doc in docs),
+        translations=[t for doc in docs for t in doc.translations or []],
+        summary=_join_text(doc.summary for doc in docs),
+        topic=_join_text(doc.topic for doc in docs),
+        discourse_relations=[r for doc in docs for r in doc.discourse_relations],
+        coreferences=[c for doc in docs for c in doc.coreferences],
+        idiom_spans=[s for doc in docs for s in doc.idiom_spans],
+        genai_use=_merge_genai_use(docs),
+        metadata=metadata,
+    )
+    # Windows number their provenance records independently; intern them.
+    for doc in docs:
+        remap = merge_provenance(merged, doc)
+        words = list(doc.words or [])
+        remap_annotation_sources(words, remap)
+        merged.words.extend(words)
+        for key, sources in doc.sentence_annotation_sources.items():
+            merged.sentence_annotation_sources[key] = {
+                field: remap.get(value, value) for field, value in sources.items()
+            }
+    for word in merged.words:
+        try:
+            word._doc = merged
+        except Exception:
+            pass
+    return merged
@@ -1,12 +1,13 @@
 """Processes of POS and feature tagging."""
 
 from collections.abc import Callable
-from copy import copy
 from functools import cached_property
 from typing import ClassVar, Optional
 
 from cltk.core.cltk_logger import bind_context
 from cltk.core.data_types import Doc, Process
+from cltk.core.fault_tolerance import failed_sentence_indices
+from cltk.core.lazy_classes import LazyClassTable, build_subclass
 from cltk.core.logging_utils import bind_from_doc
 from cltk.core.process_registry import register_process
 from cltk.dependency.utils import (
@@ -50,7 +51,20 @@ class GenAIDependencyProcess(DependencyProcess):
 
     def run(self, input_doc: Doc) -> Doc:
         """Run the configured GPT dependency parsing workflow."""
-        output_doc = copy(input_doc)
+        return self._annotate(input_doc)
+
+    def retry_failed(self, input_doc: Doc) -> Doc:
+        """Re-run dependency parsing only for sentences recorded as failed."""
+        indices = failed_sentence_indices(input_doc, "dep")
+        if not indices:
+            return input_doc
+        return self._annotate(input_doc, sentence_indices=indices)
+
+    def _annotate(
+        self, input_doc: Doc, sentence_indices: Optional[list[int]] = None
+    ) -> Doc:
+        """Parse all sentences, or only ``sentence_indices`` when given."""
+        output_doc = input_doc.fork()
         if not output_doc.normalized_text:
             msg: str = "Doc must have `normalized_text`."
             bind_from_doc(output_doc).error(msg)
@@ -108,861 +122,253 @@ class GenAIDependencyProcess(DependencyProcess):
             prompt_profile=self.prompt_profile,
             prompt_digest=prompt_digest,
             provenance_process=f"{self.process_id}:{self.__class__.__name__}",
+            sentence_indices=sentence_indices,
         )
         return output_doc
 
 
-class CuneiformLuwianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "cune1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Cuneiform Luwian language."
-    authorship_info: str = "CLTK"
-
-
-class HieroglyphicLuwianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hier1240"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Hieroglyphic Luwian language."
-    authorship_info: str = "CLTK"
-
-
-class OldPrussianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "prus1238"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Prussian language."
-    authorship_info: str = "CLTK"
-
-
-class LithuanianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lith1251"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Lithuanian language."
-    authorship_info: str = "CLTK"
-
-
-class LatvianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "latv1249"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Latvian language."
-    authorship_info: str = "CLTK"
-
-
-class AlbanianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "gheg1238"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Albanian language."
-    authorship_info: str = "CLTK"
-
-
-class AkkadianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "akka1240"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Akkadian language."
-    authorship_info: str = "CLTK"
-
-
-class AncientGreekGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "anci1242"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Ancient Greek language."
-    authorship_info: str = "CLTK"
-
-
-class BiblicalHebrewGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "anci1244"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Biblical Hebrew language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalArabicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1259"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Classical Arabic language."
-    authorship_info: str = "CLTK"
-
-
-class AvestanGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "aves1237"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Avestan language."
-    authorship_info: str = "CLTK"
-
-
-class BactrianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "bact1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Bactrian language."
-    authorship_info: str = "CLTK"
-
-
-class SogdianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sogd1245"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Sogdian language."
-    authorship_info: str = "CLTK"
-
-
-class BengaliGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "beng1280"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Bengali language."
-    authorship_info: str = "CLTK"
-
-
-class CarianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "cari1274"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Carian language."
-    authorship_info: str = "CLTK"
-
-
-class ChurchSlavicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "chur1257"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Church Slavic language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalArmenianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1256"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Classical Armenian language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalMandaicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1253"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Classical Mandaic language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalMongolianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mong1331"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Classical Mongolian language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalSyriacGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1252"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Classical Syriac language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalTibetanGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1254"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Classical Tibetan language."
-    authorship_info: str = "CLTK"
-
-
-class CopticGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "copt1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Coptic language."
-    authorship_info: str = "CLTK"
-
-
-class DemoticGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "demo1234"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Demotic language."
-    authorship_info: str = "CLTK"
-
-
-class EasternPanjabiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "panj1256"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Eastern Panjabi language."
-    authorship_info: str = "CLTK"
-
-
-class EdomiteGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "edom1234"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Edomite language."
-    authorship_info: str = "CLTK"
-
-
-class GeezGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "geez1241"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Geez language."
-    authorship_info: str = "CLTK"
-
-
-class GothicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "goth1244"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Gothic language."
-    authorship_info: str = "CLTK"
-
-
-class GujaratiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "guja1252"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Gujarati language."
-    authorship_info: str = "CLTK"
-
-
-class HindiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hind1269"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Hindi language."
-    authorship_info: str = "CLTK"
-
-
-class KhariBoliGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "khad1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Khari Boli dialect of Hindi."
-    authorship_info: str = "CLTK"
-
-
-class BrajGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "braj1242"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Braj Bhasha language."
-    authorship_info: str = "CLTK"
-
-
-class AwadhiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "awad1243"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Awadhi language."
-    authorship_info: str = "CLTK"
-
-
-class HittiteGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hitt1242"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Hittite language."
-    authorship_info: str = "CLTK"
-
-
-class KhotaneseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "khot1251"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Khotanese language."
-    authorship_info: str = "CLTK"
-
-
-class TumshuqeseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tums1237"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Tumshuqese language."
-    authorship_info: str = "CLTK"
-
-
-class LateEgyptianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "late1256"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Late Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class LatinGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lati1261"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Latin language."
-    authorship_info: str = "CLTK"
-
-
-class LiteraryChineseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lite1248"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Literary Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class LycianAGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lyci1241"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Lycian A language."
-    authorship_info: str = "CLTK"
-
-
-class LydianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lydi1241"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Lydian language."
-    authorship_info: str = "CLTK"
-
-
-class MaharastriPrakritGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "maha1305"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Maharastri Prakrit language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleArmenianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1364"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle Armenian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleBretonGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldb1244"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle Breton language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleChineseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1344"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleCornishGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "corn1251"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle Cornish language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleEgyptianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1369"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleEnglishGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1317"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle English language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleFrenchGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1316"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle French language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleHighGermanGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1343"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle High German language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleMongolGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mong1329"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle Mongol language."
-    authorship_info: str = "CLTK"
-
-
-class MoabiteGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "moab1234"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Moabite language."
-    authorship_info: str = "CLTK"
-
-
-class OdiaGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oriy1255"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Odia language."
-    authorship_info: str = "CLTK"
-
-
-class OfficialAramaicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "impe1235"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Official Aramaic (700-300 BCE) language."
-    authorship_info: str = "CLTK"
-
-
-class OldBurmeseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldb1235"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Burmese language."
-    authorship_info: str = "CLTK"
-
-
-class OldChineseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldc1244"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class BaihuaChineseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1255"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for Early Vernacular Chinese (Baihua)."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalBurmeseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "nucl1310"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Classical Burmese language."
-    authorship_info: str = "CLTK"
-
-
-class TangutGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tang1334"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Tangut (Xixia) language."
-    authorship_info: str = "CLTK"
-
-
-class NewarGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "newa1246"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Newar (Classical Nepal Bhasa) language."
-    authorship_info: str = "CLTK"
-
-
-class MeiteiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mani1292"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Meitei (Classical Manipuri) language."
-    authorship_info: str = "CLTK"
-
-
-class SgawKarenGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sgaw1245"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Sgaw Karen language."
-    authorship_info: str = "CLTK"
-
-
-class MogholiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mogh1245"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Mogholi (Moghol) language."
-    authorship_info: str = "CLTK"
-
-
-class NumidianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "numi1241"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Numidian (Ancient Berber) language."
-    authorship_info: str = "CLTK"
-
-
-class TaitaGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tait1247"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Cushitic Taita language."
-    authorship_info: str = "CLTK"
-
-
-class HausaGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "haus1257"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Hausa language."
-    authorship_info: str = "CLTK"
-
-
-class OldJurchenGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "jurc1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Jurchen language."
-    authorship_info: str = "CLTK"
-
-
-class OldJapaneseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "japo1237"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Japanese language."
-    authorship_info: str = "CLTK"
-
-
-class OldHungarianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldh1242"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Hungarian language."
-    authorship_info: str = "CLTK"
-
-
-class ChagataiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "chag1247"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Chagatai language."
-    authorship_info: str = "CLTK"
-
-
-class OldTurkicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldu1238"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Turkic language."
-    authorship_info: str = "CLTK"
-
-
-class OldTamilGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldt1248"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Tamil language."
-    authorship_info: str = "CLTK"
-
-
-class AmmoniteGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "ammo1234"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Ammonite language."
-    authorship_info: str = "CLTK"
-
-
-class OldAramaicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olda1246"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Aramaic (up to 700 BCE) language."
-    authorship_info: str = "CLTK"
-
-
-class OldAramaicSamalianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olda1245"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Aramaic–Samʾalian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleAramaicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1366"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle Aramaic language."
-    authorship_info: str = "CLTK"
-
-
-class HatranGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hatr1234"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Hatran language."
-    authorship_info: str = "CLTK"
-
-
-class JewishBabylonianAramaicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "jewi1240"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Jewish Babylonian Aramaic language."
-    authorship_info: str = "CLTK"
-
-
-class SamalianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sama1234"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Samʾalian language."
-    authorship_info: str = "CLTK"
-
-
-class OldEgyptianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olde1242"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class OldEnglishGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olde1238"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old English (ca. 450-1100) language."
-    authorship_info: str = "CLTK"
-
-
-class OldFrenchGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldf1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old French (842-ca. 1400) language."
-    authorship_info: str = "CLTK"
-
-
-class OldHighGermanGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldh1241"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old High German (ca. 750-1050) language."
-    authorship_info: str = "CLTK"
-
-
-class EarlyIrishGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldi1245"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Irish language."
-    authorship_info: str = "CLTK"
-
-
-class MarathiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mara1378"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Marathi language."
-    authorship_info: str = "CLTK"
-
-
-class OldNorseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldn1244"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Norse language."
-    authorship_info: str = "CLTK"
-
-
-class OldPersianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldp1254"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old Persian (ca. 600-400 B.C.) language."
-    authorship_info: str = "CLTK"
-
-
-class OldMiddleWelshGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldw1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Old-Middle Welsh language."
-    authorship_info: str = "CLTK"
-
-
-class ParthianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "part1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Parthian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddlePersianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pahl1241"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Middle Persian language."
-    authorship_info: str = "CLTK"
-
-
-class PalaicGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pala1331"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Palaic language."
-    authorship_info: str = "CLTK"
-
-
-class PaliGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pali1273"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Pali language."
-    authorship_info: str = "CLTK"
-
-
-class PhoenicianGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "phoe1239"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Phoenician language."
-    authorship_info: str = "CLTK"
-
-
-class PunjabiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "panj1256"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Punjabi language."
-    authorship_info: str = "CLTK"
-
-
-class AssameseGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "assa1263"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Assamese language."
-    authorship_info: str = "CLTK"
-
-
-class SinhalaGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sinh1246"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Sinhala language."
-    authorship_info: str = "CLTK"
-
-
-class SindhiGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sind1272"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Sindhi language."
-    authorship_info: str = "CLTK"
-
-
-class KashmiriGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "kash1277"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Kashmiri language."
-    authorship_info: str = "CLTK"
-
-
-class BagriGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "bagr1243"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Bagri (Rajasthani) language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalSanskritGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1258"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Classical Sanskrit language."
-    authorship_info: str = "CLTK"
-
-
-class VedicSanskritGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "vedi1234"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Vedic Sanskrit language."
-    authorship_info: str = "CLTK"
-
-
-class TokharianAGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "toch1238"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Tokharian A language."
-    authorship_info: str = "CLTK"
-
-
-class TokharianBGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "toch1237"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Tokharian B language."
-    authorship_info: str = "CLTK"
-
-
-class UgariticGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "ugar1238"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Ugaritic language."
-    authorship_info: str = "CLTK"
-
-
-class UrduGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "urdu1245"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Urdu language."
-    authorship_info: str = "CLTK"
-
-
-class SauraseniPrakritGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "saur1252"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Sauraseni Prakrit language."
-    authorship_info: str = "CLTK"
-
-
-class MagadhiPrakritGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
+# Per-language subclasses of ``GenAIDependencyProcess``: class name -> (glottolog_id,
+# language phrase used in ``description``). Classes are created on first
+# access through the module ``__getattr__``.
+_LANGUAGE_PROCESSES: dict[str, tuple[str, str]] = {
+    "CuneiformLuwianGenAIDependencyProcess": (
+        "cune1239",
+        "the Cuneiform Luwian language",
+    ),
+    "HieroglyphicLuwianGenAIDependencyProcess": (
+        "hier1240",
+        "the Hieroglyphic Luwian language",
+    ),
+    "OldPrussianGenAIDependencyProcess": ("prus1238", "the Old Prussian language"),
+    "LithuanianGenAIDependencyProcess": ("lith1251", "the Lithuanian language"),
+    "LatvianGenAIDependencyProcess": ("latv1249", "the Latvian language"),
+    "AlbanianGenAIDependencyProcess": ("gheg1238", "the Albanian language"),
+    "AkkadianGenAIDependencyProcess": ("akka1240", "the Akkadian language"),
+    "AncientGreekGenAIDependencyProcess": ("anci1242", "the Ancient Greek language"),
+    "BiblicalHebrewGenAIDependencyProcess": (
+        "anci1244",
+        "the Biblical Hebrew language",
+    ),
+    "ClassicalArabicGenAIDependencyProcess": (
+        "clas1259",
+        "the Classical Arabic language",
+    ),
+    "AvestanGenAIDependencyProcess": ("aves1237", "the Avestan language"),
+    "BactrianGenAIDependencyProcess": ("bact1239", "the Bactrian language"),
+    "SogdianGenAIDependencyProcess": ("sogd1245", "the Sogdian language"),
+    "BengaliGenAIDependencyProcess": ("beng1280", "the Bengali language"),
+    "CarianGenAIDependencyProcess": ("cari1274", "the Carian language"),
+    "ChurchSlavicGenAIDependencyProcess": ("chur1257", "the Church Slavic language"),
+    "ClassicalArmenianGenAIDependencyProcess": (
+        "clas1256",
+        "the Classical Armenian language",
+    ),
+    "ClassicalMandaicGenAIDependencyProcess": (
+        "clas1253",
+        "the Classical Mandaic language",
+    ),
+    "ClassicalMongolianGenAIDependencyProcess": (
+        "mong1331",
+        "the Classical Mongolian language",
+    ),
+    "ClassicalSyriacGenAIDependencyProcess": (
+        "clas1252",
+        "the Classical Syriac language",
+    ),
+    "ClassicalTibetanGenAIDependencyProcess": (
+        "clas1254",
+        "the Classical Tibetan language",
+    ),
+    "CopticGenAIDependencyProcess": ("copt1239", "the Coptic language"),
+    "DemoticGenAIDependencyProcess": ("demo1234", "the Demotic language"),
+    "EasternPanjabiGenAIDependencyProcess": (
+        "panj1256",
+        "the Eastern Panjabi language",
+    ),
+    "EdomiteGenAIDependencyProcess": ("edom1234", "the Edomite language"),
+    "GeezGenAIDependencyProcess": ("geez1241", "the Geez language"),
+    "GothicGenAIDependencyProcess": ("goth1244", "the Gothic language"),
+    "GujaratiGenAIDependencyProcess": ("guja1252", "the Gujarati language"),
+    "HindiGenAIDependencyProcess": ("hind1269", "the Hindi language"),
+    "KhariBoliGenAIDependencyProcess": ("khad1239", "the Khari Boli dialect of Hindi"),
+    "BrajGenAIDependencyProcess": ("braj1242", "the Braj Bhasha language"),
+    "AwadhiGenAIDependencyProcess": ("awad1243", "the Awadhi language"),
+    "HittiteGenAIDependencyProcess": ("hitt1242", "the Hittite language"),
+    "KhotaneseGenAIDependencyProcess": ("khot1251", "the Khotanese language"),
+    "TumshuqeseGenAIDependencyProcess": ("tums1237", "the Tumshuqese language"),
+    "LateEgyptianGenAIDependencyProcess": ("late1256", "the Late Egyptian language"),
+    "LatinGenAIDependencyProcess": ("lati1261", "the Latin language"),
+    "LiteraryChineseGenAIDependencyProcess": (
+        "lite1248",
+        "the Literary Chinese language",
+    ),
+    "LycianAGenAIDependencyProcess": ("lyci1241", "the Lycian A language"),
+    "LydianGenAIDependencyProcess": ("lydi1241", "the Lydian language"),
+    "MaharastriPrakritGenAIDependencyProcess": (
+        "maha1305",
+        "the Maharastri Prakrit language",
+    ),
+    "MiddleArmenianGenAIDependencyProcess": (
+        "midd1364",
+        "the Middle Armenian language",
+    ),
+    "MiddleBretonGenAIDependencyProcess": ("oldb1244", "the Middle Breton language"),
+    "MiddleChineseGenAIDependencyProcess": ("midd1344", "the Middle Chinese language"),
+    "MiddleCornishGenAIDependencyProcess": ("corn1251", "the Middle Cornish language"),
+    "MiddleEgyptianGenAIDependencyProcess": (
+        "midd1369",
+        "the Middle Egyptian language",
+    ),
+    "MiddleEnglishGenAIDependencyProcess": ("midd1317", "the Middle English language"),
+    "MiddleFrenchGenAIDependencyProcess": ("midd1316", "the Middle French language"),
+    "MiddleHighGermanGenAIDependencyProcess": (
+        "midd1343",
+        "the Middle High German language",
+    ),
+    "MiddleMongolGenAIDependencyProcess": ("mong1329", "the Middle Mongol language"),
+    "MoabiteGenAIDependencyProcess": ("moab1234", "the Moabite language"),
+    "OdiaGenAIDependencyProcess": ("oriy1255", "the Odia language"),
+    "OfficialAramaicGenAIDependencyProcess": (
+        "impe1235",
+        "the Official Aramaic (700-300 BCE) language",
+    ),
+    "OldBurmeseGenAIDependencyProcess": ("oldb1235", "the Old Burmese language"),
+    "OldChineseGenAIDependencyProcess": ("oldc1244", "the Old Chinese language"),
+    "BaihuaChineseGenAIDependencyProcess": (
+        "clas1255",
+        "Early Vernacular Chinese (Baihua)",
+    ),
+    "ClassicalBurmeseGenAIDependencyProcess": (
+        "nucl1310",
+        "the Classical Burmese language",
+    ),
+    "TangutGenAIDependencyProcess": ("tang1334", "the Tangut (Xixia) language"),
+    "NewarGenAIDependencyProcess": (
+        "newa1246",
+        "the Newar (Classical Nepal Bhasa) language",
+    ),
+    "MeiteiGenAIDependencyProcess": (
+        "mani1292",
+        "the Meitei (Classical Manipuri) language",
+    ),
+    "SgawKarenGenAIDependencyProcess": ("sgaw1245", "the Sgaw Karen language"),
+    "MogholiGenAIDependencyProcess": ("mogh1245", "the Mogholi (Moghol) language"),
+    "NumidianGenAIDependencyProcess": (
+        "numi1241",
+        "the Numidian (Ancient Berber) language",
+    ),
+    "TaitaGenAIDependencyProcess": ("tait1247", "the Cushitic Taita language"),
+    "HausaGenAIDependencyProcess": ("haus1257", "the Hausa language"),
+    "OldJurchenGenAIDependencyProcess": ("jurc1239", "the Old Jurchen language"),
+    "OldJapaneseGenAIDependencyProcess": ("japo1237", "the Old Japanese language"),
+    "OldHungarianGenAIDependencyProcess": ("oldh1242", "the Old Hungarian language"),
+    "ChagataiGenAIDependencyProcess": ("chag1247", "the Chagatai language"),
+    "OldTurkicGenAIDependencyProcess": ("oldu1238", "the Old Turkic language"),
+    "OldTamilGenAIDependencyProcess": ("oldt1248", "the Old Tamil language"),
+    "AmmoniteGenAIDependencyProcess": ("ammo1234", "the Ammonite language"),
+    "OldAramaicGenAIDependencyProcess": (
+        "olda1246",
+        "the Old Aramaic (up to 700 BCE) language",
+    ),
+    "OldAramaicSamalianGenAIDependencyProcess": (
+        "olda1245",
+        "the Old Aramaic–Samʾalian language",
+    ),
+    "MiddleAramaicGenAIDependencyProcess": ("midd1366", "the Middle Aramaic language"),
+    "HatranGenAIDependencyProcess": ("hatr1234", "the Hatran language"),
+    "JewishBabylonianAramaicGenAIDependencyProcess": (
+        "jewi1240",
+        "the Jewish Babylonian Aramaic language",
+    ),
+    "SamalianGenAIDependencyProcess": ("sama1234", "the Samʾalian language"),
+    "OldEgyptianGenAIDependencyProcess": ("olde1242", "the Old Egyptian language"),
+    "OldEnglishGenAIDependencyProcess": (
+        "olde1238",
+        "the Old English (ca. 450-1100) language",
+    ),
+    "OldFrenchGenAIDependencyProcess": (
+        "oldf1239",
+        "the Old French (842-ca. 1400) language",
+    ),
+    "OldHighGermanGenAIDependencyProcess": (
+        "oldh1241",
+        "the Old High German (ca. 750-1050) language",
+    ),
+    "EarlyIrishGenAIDependencyProcess": ("oldi1245", "the Old Irish language"),
+    "MarathiGenAIDependencyProcess": ("mara1378", "the Marathi language"),
+    "OldNorseGenAIDependencyProcess": ("oldn1244", "the Old Norse language"),
+    "OldPersianGenAIDependencyProcess": (
+        "oldp1254",
+        "the Old Persian (ca. 600-400 B.C.) language",
+    ),
+    "OldMiddleWelshGenAIDependencyProcess": (
+        "oldw1239",
+        "the Old-Middle Welsh language",
+    ),
+    "ParthianGenAIDependencyProcess": ("part1239", "the Parthian language"),
+    "MiddlePersianGenAIDependencyProcess": ("pahl1241", "the Middle Persian language"),
+    "PalaicGenAIDependencyProcess": ("pala1331", "the Palaic language"),
+    "PaliGenAIDependencyProcess": ("pali1273", "the Pali language"),
+    "PhoenicianGenAIDependencyProcess": ("phoe1239", "the Phoenician language"),
+    "PunjabiGenAIDependencyProcess": ("panj1256", "the Punjabi language"),
+    "AssameseGenAIDependencyProcess": ("assa1263", "the Assamese language"),
+    "SinhalaGenAIDependencyProcess": ("sinh1246", "the Sinhala language"),
+    "SindhiGenAIDependencyProcess": ("sind1272", "the Sindhi language"),
+    "KashmiriGenAIDependencyProcess": ("kash1277", "the Kashmiri language"),
+    "BagriGenAIDependencyProcess": ("bagr1243", "the Bagri (Rajasthani) language"),
+    "ClassicalSanskritGenAIDependencyProcess": (
+        "clas1258",
+        "the Classical Sanskrit language",
+    ),
+    "VedicSanskritGenAIDependencyProcess": ("vedi1234", "the Vedic Sanskrit language"),
+    "TokharianAGenAIDependencyProcess": ("toch1238", "the Tokharian A language"),
+    "TokharianBGenAIDependencyProcess": ("toch1237", "the Tokharian B language"),
+    "UgariticGenAIDependencyProcess": ("ugar1238", "the Ugaritic language"),
+    "UrduGenAIDependencyProcess": ("urdu1245", "the Urdu language"),
+    "SauraseniPrakritGenAIDependencyProcess": (
+        "saur1252",
+        "the Sauraseni Prakrit language",
+    ),
+    "MagadhiPrakritGenAIDependencyProcess": (
+        "maga1260",
+        "the Magadhi Prakrit language",
+    ),
+    "GandhariGenAIDependencyProcess": ("gand1259", "the Gandhari language"),
+}
+
+
+def _build_language_process(
+    name: str, row: tuple[str, str]
+) -> type[GenAIDependencyProcess]:
+    """Create the per-language ``GenAIDependencyProcess`` subclass for ``name``."""
+    glottolog_id, language = row
+    return build_subclass(
+        GenAIDependencyProcess,
+        name,
+        __name__,
+        "Language-specific dependency process using a generative GPT model.",
+        {
+            "glottolog_id": (Optional[str], glottolog_id),
+            "description": (
+                str,
+                "Default dependency syntax parsing process using a generative GPT model for "
+                f"{language}.",
+            ),
+            "authorship_info": (str, "CLTK"),
+        },
+    )
+
+
+_LANGUAGE_CLASSES = LazyClassTable(
+    globals(), _LANGUAGE_PROCESSES, _build_language_process
+)
 
-    glottolog_id: Optional[str] = "maga1260"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Magadhi Prakrit language."
-    authorship_info: str = "CLTK"
 
+def __getattr__(name: str) -> type[GenAIDependencyProcess]:
+    """Create per-language process classes on first access."""
+    return _LANGUAGE_CLASSES.resolve(name)
 
-class GandhariGenAIDependencyProcess(GenAIDependencyProcess):
-    """Language-specific dependency process using a generative GPT model."""
 
-    glottolog_id: Optional[str] = "gand1259"
-    description: str = "Default dependency syntax parsing process using a generative GPT model for the Gandhari language."
-    authorship_info: str = "CLTK"
+def __dir__() -> list[str]:
+    """List module attributes, including classes not yet created."""
+    return _LANGUAGE_CLASSES.dir()
@@ -2,7 +2,7 @@
 
 import asyncio
 import concurrent.futures
-from typing import Any, Callable, Optional, cast, get_args
+from typing import Any, Callable, Iterable, Optional, cast, get_args
 
 from colorama import Fore, Style
 from tqdm import tqdm
@@ -21,18 +21,29 @@ from cltk.core.data_types import (
     Word,
 )
 from cltk.core.exceptions import CLTKException
+from cltk.core.fault_tolerance import (
+    failed_sentence_indices,
+    is_fault_tolerant,
+    merge_sentence_words,
+    record_sentence_failure,
+)
 from cltk.core.logging_utils import bind_from_doc
 from cltk.core.provenance import (
     add_provenance_record,
     build_provenance_record,
     extract_doc_config,
+    merge_provenance,
+    remap_annotation_sources,
 )
 from cltk.genai.mistral import AsyncMistralConnection, MistralConnection
 from cltk.genai.ollama import AsyncOllamaConnection, OllamaConnection
 from cltk.genai.openai import AsyncOpenAIConnection, OpenAIConnection
 from cltk.genai.prompts import PromptInfo, _hash_prompt
 from cltk.morphosyntax.ud_deprels import UDDeprelTag, get_ud_deprel_tag
-from cltk.morphosyntax.utils import _update_doc_genai_stage
+from cltk.morphosyntax.utils import (
+    _collect_sentence_results,
+    _update_doc_genai_stage,
+)
 
 PromptBuilder = Callable[[str, str], PromptInfo] | PromptInfo | str
 
@@ -99,18 +110,7 @@ def _format_feats(feats: Optional[UDFeatureTagSet]) -> str:
 
     Returns "_" when no features are present.
     """
-    try:
-        if not feats or not getattr(feats, "features", None):
-            return "_"
-        items: list[str] = []
-        for f in feats.features:
-            key = getattr(f, "key", None)
-            val = getattr(f, "value", None)
-            if key and val:
-                items.append(f"{key}={val}")
-        return "|".join(items) if items else "_"
-    except Exception:  # pragma: no cover - defensive
-        return "_"
+    return feats.feats_string if feats is not None else "_"
 
 
 def generate_dependency_tree(
@@ -409,7 +409,7 @@ def generate_dependency_tree(
                 w.confidence["dependency_relation"] = deprel_conf
             words[i] = w
         else:
-            word = Word(
+            word = Word.trusted(
                 string=form_val,
                 index_token=i,
                 dependency_relation=tag,
@@ -461,6 +461,7 @@ def generate_dependency_tree(
     if sentence_idx is not None:
         for word in doc.words:
             word.index_sentence = sentence_idx
+        doc.invalidate_sentence_index()
         log.debug(
             f"[dep] Set sentence index {sentence_idx} for all words in input_doc.words."
         )
@@ -544,7 +545,7 @@ def generate_gpt_dependency(
             ]
             # shallow copy to avoid mutating the original prematurely
             tmp_doc.words = (
-                [Word(**w.model_dump()) for w in sent_words] if sent_words else []
+                [w.copy_for_edit() for w in sent_words] if sent_words else []
             )
         tmp_doc = generate_dependency_tree(
             doc=tmp_doc,
@@ -590,14 +591,8 @@ def generate_gpt_dependency(
     for k in combined_tokens:
         combined_tokens[k] += int(genai_total_tokens.get(k, 0))
     _update_doc_genai_stage(doc, stage="dep", stage_tokens=genai_total_tokens)
-    if not doc.provenance:
-        doc.provenance = {}
     for tmp_doc in tmp_docs:
-        for prov_id, record in (tmp_doc.provenance or {}).items():
-            if prov_id not in doc.provenance:
-                doc.provenance[prov_id] = record
-        if doc.default_provenance_id is None and tmp_doc.default_provenance_id:
-            doc.default_provenance_id = tmp_doc.default_provenance_id
+        remap_annotation_sources(tmp_doc.words, merge_provenance(doc, tmp_doc))
     log.debug(
         f"Combined {len(all_words)} words from all tmp_docs and updated token indices."
     )
@@ -621,6 +616,8 @@ async def generate_gpt_dependency_async(
     prompt_profile: Optional[str] = None,
     prompt_digest: Optional[str] = None,
     provenance_process: Optional[str] = None,
+    fault_tolerant: Optional[bool] = None,
+    sentence_indices: Optional[Iterable[int]] = None,
 ) -> Doc:
     """Async variant of ``generate_gpt_dependency`` with concurrency.
 
@@ -639,6 +636,13 @@ async def generate_gpt_dependency_async(
         prompt_profile: Optional prompt profile name for provenance.
         prompt_digest: Optional digest for the prompt template.
         provenance_process: Optional process name to store in provenance records.
+        fault_tolerant: When true, a failing sentence is recorded in
+            ``doc.metadata["failed_sentences"]["dep"]`` and keeps its existing
+            words instead of aborting the whole document. Sentences whose
+            morphosyntax failed are skipped and recorded as failed as well.
+            Defaults to the ``fault_tolerant`` flag stored in ``doc.metadata``.
+        sentence_indices: Optional subset of sentence indices to (re)parse.
+            Words of the other sentences are kept unchanged.
 
     Returns:
         The input ``doc`` enriched with ``words`` and aggregated generative
@@ -650,9 +654,30 @@ async def generate_gpt_dependency_async(
 
     """
     log = bind_from_doc(doc)
+    if fault_tolerant is None:
+        fault_tolerant = is_fault_tolerant(doc)
+    sentence_strings = doc.sentence_strings
+    selected = (
+        sorted({i for i in sentence_indices if 0 <= i < len(sentence_strings)})
+        if sentence_indices is not None
+        else list(range(len(sentence_strings)))
+    )
+    if fault_tolerant:
+        upstream_failed = set(failed_sentence_indices(doc, "pos"))
+        for i in selected:
+            if i in upstream_failed:
+                record_sentence_failure(
+                    doc,
+                    stage="dep",
+                    sentence_idx=i,
+                    error=CLTKException(
+                        "Skipped: morphosyntax failed for this sentence."
+                    ),
+                )
+        selected = [i for i in selected if i not in upstream_failed]
     log.info(
         "[async-dep] Starting dependency generation for %s sentences",
-        len(doc.sentence_strings),
+        len(selected),
     )
     if not doc.model:
         msg = "Document model is not set."
@@ -858,7 +883,7 @@ async def generate_gpt_dependency_async(
         # Parse TSV and update words in place if available
         parsed = _parse_dep_tsv_table(res.response)
         words: list[Word] = (
-            [Word(**w.model_dump()) for w in sentence_words] if sentence_words else []
+            [w.copy_for_edit() for w in sentence_words] if sentence_words else []
         )
         for word_idx, row in enumerate(parsed):
             form_val: Optional[str] = row.get("form")
@@ -906,7 +931,7 @@ async def generate_gpt_dependency_async(
                     w.confidence["dependency_relation"] = deprel_conf
                 words[word_idx] = w
             else:
-                word = Word(
+                word = Word.trusted(
                     string=form_val,
                     index_token=word_idx,
                     dependency_relation=tag,
@@ -942,48 +967,58 @@ async def generate_gpt_dependency_async(
         return i, tmp, res.usage
 
     # Prepare words per sentence from existing morphosyntax (if any)
-    sent_words_map = {
-        i: [w for w in (doc.words or []) if getattr(w, "index_sentence", None) == i]
-        for i in range(len(doc.sentence_strings))
-    }
+    selected_set = set(selected)
+    sent_words_map: dict[int, list[Word]] = {i: [] for i in selected}
+    for w in doc.words or []:
+        w_idx = getattr(w, "index_sentence", None)
+        if w_idx in selected_set:
+            sent_words_map[w_idx].append(w)
     tasks = [
-        process_one(i, s, sent_words_map.get(i, []))
-        for i, s in enumerate(doc.sentence_strings)
+        process_one(i, sentence_strings[i], sent_words_map.get(i, [])) for i in selected
     ]
     log.info(
         "[async] Dispatching %d tasks with max_concurrency=%d",
         len(tasks),
         max_concurrency,
     )
-    results = await asyncio.gather(*tasks)
-    results_sorted = sorted(results, key=lambda x: x[0])
+    results = await asyncio.gather(*tasks, return_exceptions=fault_tolerant)
+    results_sorted = _collect_sentence_results(
+        doc, stage="dep", indices=selected, results=results
+    )
 
-    # Flatten words, set global token indices
-    all_words: list[Word] = []
-    token_counter = 0
+    # Merge words per sentence, set global token indices
     aggregated_usage = {"input": 0, "output": 0, "total": 0}
+    replacements: dict[int, list[Word]] = {}
     for idx, tmp, usage in results_sorted:
         for k in aggregated_usage:
             aggregated_usage[k] += usage.get(k, 0)
-        for w in tmp.words:
-            w.index_token = token_counter
-            all_words.append(w)
-            token_counter += 1
+        # Sentence calls each made a record in their own Doc; intern them here.
+        remap_annotation_sources(tmp.words, merge_provenance(doc, tmp))
+        replacements[idx] = tmp.words
+    if sentence_indices is not None:
+        kept_words = list(doc.words or [])
+    else:
+        # Sentences that failed keep their morphosyntax-only words
+        kept_words = [
+            w
+            for w in doc.words or []
+            if w.index_sentence is not None
+            and w.index_sentence < len(sentence_strings)
+            and w.index_sentence not in replacements
+        ]
+    all_words = merge_sentence_words(kept_words, replacements)
 
     doc.words = all_words
-    _update_doc_genai_stage(doc, stage="dep", stage_tokens=aggregated_usage)
-    if not doc.provenance:
-        doc.provenance = {}
-    for _, tmp, _ in results_sorted:
-        for prov_id, record in (tmp.provenance or {}).items():
-            if prov_id not in doc.provenance:
-                doc.provenance[prov_id] = record
-        if doc.default_provenance_id is None and tmp.default_provenance_id:
-            doc.default_provenance_id = tmp.default_provenance_id
+    _update_doc_genai_stage(
+        doc,
+        stage="dep",
+        stage_tokens=aggregated_usage,
+        accumulate=sentence_indices is not None,
+    )
     log.info(
         "[async-dep] Completed dependency generation: %d tokens across %d sentences",
         len(all_words),
-        len(doc.sentence_strings),
+        len(results_sorted),
     )
     return doc
 
@@ -998,6 +1033,8 @@ def generate_gpt_dependency_concurrent(
     prompt_profile: Optional[str] = None,
     prompt_digest: Optional[str] = None,
     provenance_process: Optional[str] = None,
+    fault_tolerant: Optional[bool] = None,
+    sentence_indices: Optional[Iterable[int]] = None,
 ) -> Doc:
     """Run the async dependency generator safely but appears synchronous from the outside.
 
@@ -1020,6 +1057,9 @@ def generate_gpt_dependency_concurrent(
         prompt_profile: Optional prompt profile name for provenance.
         prompt_digest: Optional digest for the prompt template.
         provenance_process: Optional process name to store in provenance records.
+        fault_tolerant: Keep successful sentences when others fail (see the
+            async variant).
+        sentence_indices: Optional subset of sentence indices to (re)parse.
 
     Returns:
         The input ``Doc`` updated in place, same as the async variant.
@@ -1040,6 +1080,8 @@ def generate_gpt_dependency_concurrent(
                 prompt_profile=prompt_profile,
                 prompt_digest=prompt_digest,
                 provenance_process=provenance_process,
+                fault_tolerant=fault_tolerant,
+                sentence_indices=sentence_indices,
             )
         )
     else:
@@ -1059,6 +1101,8 @@ def generate_gpt_dependency_concurrent(
                     prompt_profile=prompt_profile,
                     prompt_digest=prompt_digest,
                     provenance_process=provenance_process,
+                    fault_tolerant=fault_tolerant,
+                    sentence_indices=sentence_indices,
                 )
             )
 
@@ -59,18 +59,7 @@ def _get_backend_config(doc: Doc) -> Optional[ModelConfig]:
 
 def _format_feats(feats: Optional[UDFeatureTagSet]) -> str:
     """Serialize UDFeatureTagSet into a UD FEATS string (e.g., Case=Nom|Number=Sing)."""
-    try:
-        if not feats or not getattr(feats, "features", None):
-            return "_"
-        items: list[str] = []
-        for f in feats.features:
-            key = getattr(f, "key", None)
-            val = getattr(f, "value", None)
-            if key and val:
-                items.append(f"{key}={val}")
-        return "|".join(items) if items else "_"
-    except Exception:  # pragma: no cover - defensive
-        return "_"
+    return feats.feats_string if feats is not None else "_"
 
 
 def _build_token_table(words: list[Word]) -> str:
@@ -0,0 +1,378 @@
+"""Benchmark end-to-end throughput and latency of a CLTK pipeline.
+
+Example:
+    >>> from cltk import NLP
+    >>> from cltk.evaluation.bench import load_corpus, run_benchmark
+    >>> nlp = NLP("lati1261", suppress_banner=True)
+    >>> report = run_benchmark(nlp, load_corpus("lati1261"), iterations=3)
+    >>> print(report["throughput"]["docs_per_s"])
+
+Report schema (high-level):
+    report = {
+        "meta": {
+            "language": str | None,
+            "backend": str | None,
+            "model": str | None,
+            "pipeline": str | None,
+            "iterations": int,
+            "warmup": int,
+            "documents": int,
+            "characters": int,
+            "timestamp": str,
+            "cltk_version": str | None,
+            "python": str,
+            "platform": str,
+        },
+        "throughput": {
+            "docs": int,
+            "tokens": int,
+            "wall_s": float,
+            "docs_per_s": float,
+            "tokens_per_s": float,
+        },
+        "latency_ms": {
+            "document": {"p50", "p95", "p99", "mean", "min", "max": float},
+            "stages": {stage: {"p50", "p95", "p99", "mean", "min", "max": float}},
+        },
+        "memory": {"peak_rss_mb": float | None},
+        "llm_tokens": {"input": int, "output": int, "total": int},
+    }
+
+Peak RSS is the high-water mark of the whole process (``getrusage``), so it
+includes imports and model loading; it is ``None`` where ``resource`` is
+unavailable (Windows).
+
+"""
+
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from cltk.core.data_types import Doc
+from cltk.languages.example_texts import get_example_text
+from cltk.nlp import NLP
+
+PERCENTILES: tuple[int, ...] = (50, 95, 99)
+
+
+def load_corpus(
+    language: str,
+    corpus_dir: Optional[str] = None,
+    pattern: str = "*.txt",
+) -> dict[str, str]:
+    """Return benchmark documents keyed by name.
+
+    Args:
+        language: Glottolog id used to pick the built-in example text.
+        corpus_dir: Optional directory of text files to use instead.
+        pattern: Glob pattern applied recursively under ``corpus_dir``.
+
+    Returns:
+        Mapping of document name to text, in a stable order.
+
+    Raises:
+        FileNotFoundError: If ``corpus_dir`` does not exist.
+        ValueError: If the directory contains no matching non-empty files.
+
+    """
+    if corpus_dir is None:
+        return {f"example:{language}": get_example_text(language)}
+    root = Path(corpus_dir)
+    if not root.is_dir():
+        raise FileNotFoundError(f"Corpus directory not found: {root}")
+    corpus: dict[str, str] = {}
+    for path in sorted(root.rglob(pattern)):
+        if not path.is_file():
+            continue
+        text = path.read_text(encoding="utf-8")
+        if text.strip():
+            corpus[str(path.relative_to(root))] = text
+    if not corpus:
+        raise ValueError(f"No non-empty files matching '{pattern}' in {root}")
+    return corpus
+
+
+def run_benchmark(
+    nlp: NLP,
+    corpus: dict[str, str],
+    *,
+    iterations: int = 3,
+    warmup: int = 1,
+) -> dict[str, Any]:
+    """Analyze every corpus document ``iterations`` times and collect metrics.
+
+    Warmup passes run the same documents first and are excluded from all
+    measurements, so one-time costs (model loading, caches) do not skew them.
+
+    Args:
+        nlp: Configured ``NLP`` instance to benchmark.
+        corpus: Documents keyed by name, e.g. from :func:`load_corpus`.
+        iterations: Number of measured passes over the corpus.
+        warmup: Number of unmeasured passes before measuring.
+
+    Returns:
+        A JSON-serializable benchmark report (see module docstring).
+
+    Raises:
+        ValueError: If ``iterations`` is not positive, ``warmup`` is negative,
+            or ``corpus`` is empty.
+
+    """
+    if iterations <= 0:
+        raise ValueError("iterations must be a positive integer.")
+    if warmup < 0:
+        raise ValueError("warmup must be zero or a positive integer.")
+    if not corpus:
+        raise ValueError("corpus must contain at least one document.")
+
+    for _ in range(warmup):
+        for text in corpus.values():
+            nlp.analyze(text)
+
+    doc_ms: list[float] = []
+    stage_ms: dict[str, list[float]] = {}
+    llm_tokens = {"input": 0, "output": 0, "total": 0}
+    total_tokens = 0
+    wall_start = time.perf_counter()
+    for _ in range(iterations):
+        for text in corpus.values():
+            started = time.perf_counter()
+            doc = nlp.analyze(text)
+            doc_ms.append((time.perf_counter() - started) * 1000.0)
+            for stage, seconds in nlp.stage_timings.items():
+                stage_ms.setdefault(stage, []).append(seconds * 1000.0)
+            total_tokens += len(doc.words or [])
+            for key, value in _doc_llm_tokens(doc).items():
+                llm_tokens[key] += value
+    wall_s = time.perf_counter() - wall_start
+
+    docs = len(doc_ms)
+    return {
+        "meta": _build_meta(nlp, corpus, iterations=iterations, warmup=warmup),
+        "throughput": {
+            "docs": docs,
+            "tokens": total_tokens,
+            "wall_s": round(wall_s, 6),
+            "docs_per_s": round(docs / wall_s, 3) if wall_s else 0.0,
+            "tokens_per_s": round(total_tokens / wall_s, 3) if wall_s else 0.0,
+        },
+        "latency_ms": {
+            "document": _summarize(doc_ms),
+            "stages": {stage: _summarize(vals) for stage, vals in stage_ms.items()},
+        },
+        "memory": {"peak_rss_mb": peak_rss_mb()},
+        "llm_tokens": llm_tokens,
+    }
+
+
+def check_regressions(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = 0.1,
+) -> list[str]:
+    """Compare a report against a baseline report.
+
+    Throughput may not drop, and p95 latency, peak RSS, and LLM token usage
+    may not grow, by more than ``tolerance`` (a fraction of the baseline).
+    Metrics missing from either report are skipped.
+
+    Args:
+        report: Report produced by :func:`run_benchmark`.
+        baseline: Earlier report to compare against.
+        tolerance: Allowed relative change before a metric counts as a regression.
+
+    Returns:
+        Human-readable regression messages; empty when within tolerance.
+
+    """
+    regressions: list[str] = []
+
+    def lower_is_worse(label: str, current: Any, previous: Any) -> None:
+        if _comparable(current, previous) and current < previous * (1 - tolerance):
+            regressions.append(f"{label}: {current:g} < baseline {previous:g}")
+
+    def higher_is_worse(label: str, current: Any, previous: Any) -> None:
+        if _comparable(current, previous) and current > previous * (1 + tolerance):
+            regressions.append(f"{label}: {current:g} > baseline {previous:g}")
+
+    cur_tp = report.get("throughput", {})
+    base_tp = baseline.get("throughput", {})
+    for key in ("docs_per_s", "tokens_per_s"):
+        lower_is_worse(f"throughput.{key}", cur_tp.get(key), base_tp.get(key))
+
+    cur_lat = report.get("latency_ms", {})
+    base_lat = baseline.get("latency_ms", {})
+    higher_is_worse(
+        "latency_ms.document.p95",
+        cur_lat.get("document", {}).get("p95"),
+        base_lat.get("document", {}).get("p95"),
+    )
+    base_stages = base_lat.get("stages", {})
+    for stage, stats in sorted(cur_lat.get("stages", {}).items()):
+        higher_is_worse(
+            f"latency_ms.stages.{stage}.p95",
+            stats.get("p95"),
+            base_stages.get(stage, {}).get("p95"),
+        )
+
+    higher_is_worse(
+        "memory.peak_rss_mb",
+        report.get("memory", {}).get("peak_rss_mb"),
+        baseline.get("memory", {}).get("peak_rss_mb"),
+    )
+    higher_is_worse(
+        "llm_tokens.total",
+        report.get("llm_tokens", {}).get("total"),
+        baseline.get("llm_tokens", {}).get("total"),
+    )
+    return regressions
+
+
+def report_to_markdown(
+    report: dict[str, Any], regressions: Optional[list[str]] = None
+) -> str:
+    """Render a benchmark report as Markdown."""
+    meta = report.get("meta", {})
+    tp = report.get("throughput", {})
+    lat = report.get("latency_ms", {})
+    lines: list[str] = [
+        "# CLTK Benchmark",
+        "",
+        f"- Language: {meta.get('language')}",
+        f"- Backend: {meta.get('backend')}"
+        + (f" ({meta['model']})" if meta.get("model") else ""),
+        f"- Pipeline: {meta.get('pipeline')}",
+        f"- Corpus: {meta.get('documents')} docs, {meta.get('characters')} chars",
+        f"- Iterations: {meta.get('iterations')} (warmup {meta.get('warmup')})",
+        f"- Timestamp: {meta.get('timestamp')}",
+        "",
+        "## Throughput",
+        "",
+        "| Docs | Tokens | Wall (s) | Docs/s | Tokens/s |",
+        "| --- | --- | --- | --- | --- |",
+        f"| {tp.get('docs')} | {tp.get('tokens')} | {tp.get('wall_s')} "
+        f"| {tp.get('docs_per_s')} | {tp.get('tokens_per_s')} |",
+        "",
+        "## Latency (ms)",
+        "",
+        "| Stage | p50 | p95 | p99 | Mean | Max |",
+        "| --- | --- | --- | --- | --- | --- |",
+    ]
+    rows = [("document", lat.get("document", {}))]
+    rows.extend(sorted(lat.get("stages", {}).items()))
+    for name, stats in rows:
+        lines.append(
+            f"| {name} | {stats.get('p50')} | {stats.get('p95')} | {stats.get('p99')} "
+            f"| {stats.get('mean')} | {stats.get('max')} |"
+        )
+    llm = report.get("llm_tokens", {})
+    lines.extend(
+        [
+            "",
+            "## Resources",
+            "",
+            f"- Peak RSS (MB): {report.get('memory', {}).get('peak_rss_mb')}",
+            f"- LLM tokens: {llm.get('total', 0)} "
+            f"(input {llm.get('input', 0)}, output {llm.get('output', 0)})",
+        ]
+    )
+    if regressions is not None:
+        lines.extend(["", "## Baseline comparison", ""])
+        if regressions:
+            lines.extend(f"- REGRESSION {msg}" for msg in regressions)
+        else:
+            lines.append("- No regressions.")
+    return "\n".join(lines) + "\n"
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the process peak resident set size in MB, if available."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB; macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``values`` by linear interpolation."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _summarize(values: list[float]) -> dict[str, float]:
+    """Summarize latency samples (ms) with percentiles, mean, min, and max."""
+    if not values:
+        return {}
+    summary = {f"p{pct}": round(_percentile(values, pct), 3) for pct in PERCENTILES}
+    summary["mean"] = round(sum(values) / len(values), 3)
+    summary["min"] = round(min(values), 3)
+    summary["max"] = round(max(values), 3)
+    return summary
+
+
+def _doc_llm_tokens(doc: Doc) -> dict[str, int]:
+    """Return LLM token usage recorded on ``doc``."""
+    entries = [e for e in doc.genai_use or [] if isinstance(e, dict)]
+    overall = [e for e in entries if str(e.get("stage", "")).lower() == "overall"]
+    totals = {"input": 0, "output": 0, "total": 0}
+    for entry in overall or entries:
+        for key in totals:
+            try:
+                totals[key] += int(entry.get(key, 0) or 0)
+            except (TypeError, ValueError):
+                continue
+    return totals
+
+
+def _comparable(current: Any, previous: Any) -> bool:
+    """Return True when both values are numbers and the baseline is positive."""
+    return (
+        isinstance(current, (int, float))
+        and isinstance(previous, (int, float))
+        and previous > 0
+    )
+
+
+def _build_meta(
+    nlp: NLP, corpus: dict[str, str], *, iterations: int, warmup: int
+) -> dict[str, Any]:
+    """Collect run metadata for the report."""
+    language = getattr(nlp, "language", None)
+    pipeline = getattr(nlp, "pipeline", None)
+    return {
+        "language": getattr(language, "glottolog_id", None),
+        "backend": getattr(nlp, "backend", None),
+        "model": getattr(nlp, "model", None),
+        "pipeline": pipeline.__class__.__name__ if pipeline is not None else None,
+        "iterations": iterations,
+        "warmup": warmup,
+        "documents": len(corpus),
+        "characters": sum(len(text) for text in corpus.values()),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "cltk_version": _cltk_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def _cltk_version() -> Optional[str]:
+    """Return the installed CLTK version, if available."""
+    try:
+        import cltk
+
+        return str(getattr(cltk, "__version__", None) or "") or None
+    except Exception:
+        return None
@@ -97,6 +97,7 @@ from cltk.core.data_types import (
     OllamaBackendConfig,
     OpenAIBackendConfig,
     StanzaBackendConfig,
+    UDFeatureTagSet,
     Word,
 )
 from cltk.sentence.utils import (
@@ -678,6 +679,8 @@ def _normalize_feats(value: Any) -> Optional[str]:
             return None
         dict_pairs.sort(key=lambda kv: (kv[0], kv[1]))
         return "|".join(f"{k}={v}" for k, v in dict_pairs)
+    if isinstance(value, UDFeatureTagSet):
+        return value.canonical_string or None
     tags = getattr(value, "features", None)
     if tags is None and isinstance(value, Iterable):
         tags = list(value)
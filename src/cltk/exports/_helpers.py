@@ -4,7 +4,7 @@ import html
 import re
 from typing import Iterable, Optional
 
-from cltk.core.data_types import Doc, Sentence, Word
+from cltk.core.data_types import Doc, Sentence, UDFeatureTagSet, Word
 
 _XML_ID_SAFE = re.compile(r"[^A-Za-z0-9_.:-]")
 
@@ -61,22 +61,17 @@ def get_upos_tag(word: Word) -> str:
 def get_feature_map(word: Word) -> dict[str, str]:
     """Return a flat feature map from UD features."""
     feats = getattr(word, "features", None)
-    feature_list = getattr(feats, "features", None)
-    if not feature_list:
+    if not isinstance(feats, UDFeatureTagSet):
         return {}
-    output: dict[str, str] = {}
-    for feat in feature_list:
-        key = getattr(feat, "key", None)
-        value = getattr(feat, "value", None)
-        if key and value:
-            output[str(key)] = str(value)
-    return output
+    return feats.as_dict()
 
 
 def format_features(word: Word) -> str:
     """Serialize UD features into a sorted Key=Val string."""
-    items = [f"{key}={val}" for key, val in sorted(get_feature_map(word).items())]
-    return "|".join(items)
+    feats = getattr(word, "features", None)
+    if not isinstance(feats, UDFeatureTagSet):
+        return ""
+    return feats.canonical_string
 
 
 def format_morph(word: Word) -> str:
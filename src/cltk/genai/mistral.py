@@ -21,6 +21,17 @@ from cltk.core.exceptions import CLTKException, MistralInferenceError
 from cltk.text.utils import cltk_normalize
 from cltk.utils.utils import load_env_file
 
+MISTRAL_SERVER_URL_ENV = "MISTRAL_SERVER_URL"
+
+
+def _client_kwargs(api_key: str) -> dict[str, Any]:
+    """Return Mistral client kwargs, honoring ``$MISTRAL_SERVER_URL`` if set."""
+    kwargs: dict[str, Any] = {"api_key": api_key}
+    server_url = os.environ.get(MISTRAL_SERVER_URL_ENV)
+    if server_url:
+        kwargs["server_url"] = server_url
+    return kwargs
+
 
 class _MistralErrorFallback(Exception):
     """Fallback error raised when the Mistral SDK is unavailable."""
@@ -87,7 +98,7 @@ class MistralConnection:
                     "Mistral client not installed. Install with: pip install 'cltk[mistral]'"
                 ) from e
             mistral_cls = runtime_mistral
-        self.client = mistral_cls(api_key=self.api_key)
+        self.client = mistral_cls(**_client_kwargs(self.api_key))
         # Structured logger bound with model identifier
         self.log = bind_context(model=str(self.model))
 
@@ -327,7 +338,7 @@ class AsyncMistralConnection:
                     "Mistral client not installed. Install with: pip install 'cltk[mistral]'"
                 ) from e
             async_mistral_cls = runtime_async_mistral
-        self.client = async_mistral_cls(api_key=self.api_key)
+        self.client = async_mistral_cls(**_client_kwargs(self.api_key))
         # Structured logger bound with model identifier
         self.log = bind_context(model=str(self.model))
 
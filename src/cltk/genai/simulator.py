@@ -0,0 +1,592 @@
+"""Local, deterministic simulator for the GenAI provider APIs used by CLTK.
+
+# Internal; no stability guarantees
+
+The simulator is a small stdlib HTTP server that speaks just enough of three
+provider APIs for CLTK's GenAI clients to run against it unchanged:
+
+- OpenAI Responses API: ``POST /v1/responses`` (point the SDK at it with
+  ``OPENAI_BASE_URL``).
+- Ollama: ``POST /api/generate`` plus ``/api/show`` and ``/api/pull`` (point
+  the client at it with ``OLLAMA_HOST``).
+- Mistral chat completions: ``POST /v1/chat/completions`` (point the client at
+  it with ``MISTRAL_SERVER_URL``).
+
+Responses are synthesized from the prompt itself: morphosyntax and dependency
+prompts yield schema-valid TSV tables built from the input tokens, and
+enrichment/translation prompts yield JSON payloads in the expected shape.
+Latency is drawn from a configurable, seeded distribution, and server errors
+and HTTP 429 rate limits can be injected at a fixed rate so that throughput,
+concurrency, and retry behavior can be measured offline.
+
+Example:
+    >>> import os
+    >>> from cltk import NLP
+    >>> from cltk.genai.simulator import LLMSimulator, SimulatorConfig
+    >>> with LLMSimulator(SimulatorConfig(seed=0)) as sim:  # doctest: +SKIP
+    ...     os.environ.update(sim.env())
+    ...     NLP("lati1261", backend="openai").analyze("Gallia est omnis divisa.")
+
+"""
+
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Literal, Optional, cast
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, Field
+
+from cltk.core.cltk_logger import logger
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_PUNCT_RE = re.compile(r"^[^\w\s]+$", re.UNICODE)
+
+# Deterministic (UPOS, FEATS) choices for non-punctuation tokens.
+_CONTENT_TAGS: tuple[tuple[str, str], ...] = (
+    ("NOUN", "Case=Nom|Gender=Fem|Number=Sing"),
+    ("VERB", "Mood=Ind|Number=Sing|Person=3|Tense=Pres|VerbForm=Fin|Voice=Act"),
+    ("ADJ", "Case=Nom|Gender=Fem|Number=Sing"),
+    ("ADV", "_"),
+)
+
+
+class LatencyProfile(BaseModel):
+    """Per-request latency distribution, in milliseconds.
+
+    Attributes:
+        distribution: One of ``fixed``, ``uniform``, ``normal``, ``lognormal``.
+        mean_ms: Mean latency (the constant value for ``fixed``).
+        stddev_ms: Standard deviation for ``normal`` and ``lognormal``.
+        min_ms: Lower bound; also the lower end of ``uniform``.
+        max_ms: Optional upper bound; the upper end of ``uniform``.
+
+    """
+
+    distribution: Literal["fixed", "uniform", "normal", "lognormal"] = "fixed"
+    mean_ms: float = Field(default=0.0, ge=0.0)
+    stddev_ms: float = Field(default=0.0, ge=0.0)
+    min_ms: float = Field(default=0.0, ge=0.0)
+    max_ms: Optional[float] = Field(default=None, ge=0.0)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency value in milliseconds."""
+        if self.distribution == "uniform":
+            upper = self.max_ms if self.max_ms is not None else self.mean_ms * 2
+            value = rng.uniform(self.min_ms, max(self.min_ms, upper))
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean_ms, self.stddev_ms)
+        elif self.distribution == "lognormal":
+            if self.mean_ms <= 0:
+                value = 0.0
+            else:
+                # Parameterize by the desired mean/stddev of the latency itself.
+                variance = self.stddev_ms**2
+                sigma2 = math.log(1 + variance / self.mean_ms**2)
+                mu = math.log(self.mean_ms) - sigma2 / 2
+                value = rng.lognormvariate(mu, math.sqrt(sigma2))
+        else:
+            value = self.mean_ms
+        value = max(self.min_ms, value)
+        if self.max_ms is not None:
+            value = min(self.max_ms, value)
+        return value
+
+
+class SimulatorConfig(BaseModel):
+    """Behavior of an ``LLMSimulator`` instance.
+
+    Attributes:
+        latency: Latency distribution applied before every completion.
+        error_rate: Fraction of completion requests answered with HTTP 500.
+        rate_limit_rate: Fraction of completion requests answered with HTTP 429.
+        retry_after_s: Value of the ``Retry-After`` header on 429 responses.
+        seed: Seed for latency and fault injection; ``None`` is non-deterministic.
+        chars_per_token: Characters per token used for token accounting.
+
+    """
+
+    latency: LatencyProfile = Field(default_factory=LatencyProfile)
+    error_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    rate_limit_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    retry_after_s: float = Field(default=0.0, ge=0.0)
+    seed: Optional[int] = None
+    chars_per_token: float = Field(default=4.0, gt=0.0)
+
+
+class SimulatorStats(BaseModel):
+    """Counters accumulated by a running simulator.
+
+    Attributes:
+        requests: Completion requests received, by endpoint.
+        completed: Completion requests answered successfully.
+        errors_injected: Requests answered with a simulated HTTP 500.
+        rate_limited: Requests answered with a simulated HTTP 429.
+        input_tokens: Prompt tokens reported across successful completions.
+        output_tokens: Completion tokens reported across successful completions.
+        latency_ms: Total simulated latency slept, in milliseconds.
+
+    """
+
+    requests: dict[str, int] = Field(default_factory=dict)
+    completed: int = 0
+    errors_injected: int = 0
+    rate_limited: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency_ms: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        """Sum of input and output tokens."""
+        return self.input_tokens + self.output_tokens
+
+
+def count_tokens(text: str, chars_per_token: float = 4.0) -> int:
+    """Approximate the token count of ``text`` (at least 1 for non-empty text)."""
+    if not text:
+        return 0
+    return max(1, math.ceil(len(text) / chars_per_token))
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into word and punctuation tokens."""
+    return _TOKEN_RE.findall(text)
+
+
+def _section(prompt: str, marker: str) -> str:
+    """Return the prompt section following ``marker`` up to the next blank line."""
+    _, _, tail = prompt.partition(marker)
+    return tail.split("\n\n", 1)[0].strip()
+
+
+def _table_forms(table: str) -> list[str]:
+    """Return the FORM column of a TSV table with an INDEX/FORM header."""
+    lines = [line for line in table.splitlines() if line.strip()]
+    if not lines:
+        return []
+    header = lines[0].split("\t")
+    if "FORM" not in header:
+        return _tokenize(table)
+    col = header.index("FORM")
+    forms: list[str] = []
+    for line in lines[1:]:
+        cells = line.split("\t")
+        if len(cells) > col and cells[col]:
+            forms.append(cells[col])
+    return forms
+
+
+def _tag_for(form: str) -> tuple[str, str]:
+    """Return a deterministic ``(UPOS, FEATS)`` pair for ``form``."""
+    if _PUNCT_RE.match(form):
+        return "PUNCT", "_"
+    return _CONTENT_TAGS[sum(ord(ch) for ch in form) % len(_CONTENT_TAGS)]
+
+
+def _morphosyntax_tsv(forms: list[str]) -> str:
+    """Build a morphosyntax TSV table for ``forms``."""
+    rows = ["FORM\tLEMMA\tUPOS\tFEATS\tLEMMA_CONF\tUPOS_CONF\tFEATS_CONF"]
+    for form in forms:
+        upos, feats = _tag_for(form)
+        rows.append(f"{form}\t{form.lower()}\t{upos}\t{feats}\t0.9\t0.9\t0.8")
+    return "\n".join(rows)
+
+
+def _dependency_tsv(forms: list[str]) -> str:
+    """Build a dependency TSV table attaching every token to the first one."""
+    rows = ["FORM\tHEAD\tDEPREL\tHEAD_CONF\tDEPREL_CONF"]
+    for idx, form in enumerate(forms, 1):
+        if idx == 1:
+            head, deprel = 0, "root"
+        else:
+            head, deprel = 1, "punct" if _PUNCT_RE.match(form) else "dep"
+        rows.append(f"{form}\t{head}\t{deprel}\t0.9\t0.8")
+    return "\n".join(rows)
+
+
+def _enrichment_json(forms: list[str]) -> str:
+    """Build an enrichment JSON payload for ``forms``."""
+    tokens = [
+        {
+            "index": idx,
+            "gloss": {"dictionary": form.lower(), "context": form.lower()},
+            "lemma_translations": [{"text": form.lower(), "probability": 0.9}],
+            "ipa": {"value": form.lower()},
+            "orthography": {"syllables": [form], "stress": "unstressed"},
+            "pedagogy": [],
+        }
+        for idx, form in enumerate(forms, 1)
+    ]
+    return json.dumps({"tokens": tokens, "idioms": []}, ensure_ascii=False)
+
+
+def _translation_json(context: str) -> str:
+    """Build a translation JSON payload from the translation context."""
+    _, _, tail = context.partition("Source sentence:\n")
+    source = tail.split("\n", 1)[0].strip() if tail else context.strip()
+    payload = {
+        "translation": f"[simulated] {source}",
+        "notes": "Generated by the CLTK GenAI simulator.",
+        "confidence": 0.5,
+    }
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def simulate_completion(prompt: str) -> str:
+    """Synthesize a fenced completion for a CLTK GenAI ``prompt``.
+
+    The prompt kind is recognized from the output format it requests, and the
+    response is built from the tokens the prompt contains, so the result
+    parses and validates like a real model answer.
+
+    Args:
+        prompt: Prompt text sent by a CLTK GenAI process.
+
+    Returns:
+        A Markdown code block containing TSV or JSON.
+
+    """
+    if "Translate the following" in prompt:
+        context = prompt.partition("Context:\n\n")[2]
+        return f"```json\n{_translation_json(context)}\n```"
+    if "`tokens` and `idioms`" in prompt:
+        forms = _table_forms(_section(prompt, "Tokens:\n\n"))
+        return f"```json\n{_enrichment_json(forms)}\n```"
+    if "FORM\tHEAD\tDEPREL" in prompt:
+        if "Tokens:\n\n" in prompt:
+            forms = _table_forms(_section(prompt, "Tokens:\n\n"))
+        else:
+            forms = _tokenize(_section(prompt, "Text:\n\n"))
+        return f"```tsv\n{_dependency_tsv(forms)}\n```"
+    if "Text:\n\n" in prompt:
+        forms = _tokenize(_section(prompt, "Text:\n\n"))
+        return f"```tsv\n{_morphosyntax_tsv(forms)}\n```"
+    return f"```\n{prompt.strip()}\n```"
+
+
+def _openai_payload(model: str, text: str, usage: dict[str, int]) -> dict[str, Any]:
+    """Shape a completion as an OpenAI Responses API object."""
+    return {
+        "id": f"resp_sim_{time.time_ns()}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": model,
+        "output": [
+            {
+                "id": f"msg_sim_{time.time_ns()}",
+                "type": "message",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": usage["input"],
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": usage["output"],
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": usage["total"],
+        },
+    }
+
+
+def _ollama_payload(model: str, text: str, usage: dict[str, int]) -> dict[str, Any]:
+    """Shape a completion as an Ollama ``/api/generate`` response."""
+    return {
+        "model": model,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "response": text,
+        "done": True,
+        "done_reason": "stop",
+        "prompt_eval_count": usage["input"],
+        "eval_count": usage["output"],
+    }
+
+
+def _chat_payload(model: str, text: str, usage: dict[str, int]) -> dict[str, Any]:
+    """Shape a completion as a Mistral chat completion."""
+    return {
+        "id": f"chatcmpl-sim-{time.time_ns()}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": usage["input"],
+            "completion_tokens": usage["output"],
+            "total_tokens": usage["total"],
+        },
+    }
+
+
+def _prompt_from_request(path: str, body: dict[str, Any]) -> str:
+    """Extract the prompt text from a provider request body."""
+    if path == "/api/generate":
+        return str(body.get("prompt") or "")
+    if path == "/v1/responses":
+        value = body.get("input")
+        if isinstance(value, str):
+            return value
+        body = {"messages": value or []}
+    parts: list[str] = []
+    for message in body.get("messages") or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            parts.extend(
+                str(chunk.get("text", ""))
+                for chunk in content
+                if isinstance(chunk, dict)
+            )
+    return "\n".join(parts)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler dispatching to the owning ``LLMSimulator``."""
+
+    server: "_SimulatorHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("[simulator] " + format, *args)
+
+    def _send_json(
+        self, status: int, payload: Any, headers: Optional[dict[str, str]] = None
+    ) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return {}
+        parsed = json.loads(raw.decode("utf-8"))
+        return parsed if isinstance(parsed, dict) else {}
+
+    def do_GET(self) -> None:  # noqa: N802
+        path = urlparse(self.path).path
+        if path == "/stats":
+            self._send_json(200, self.server.simulator.stats.model_dump())
+        elif path == "/api/tags":
+            self._send_json(200, {"models": []})
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {path}"}})
+
+    def do_POST(self) -> None:  # noqa: N802
+        path = urlparse(self.path).path
+        try:
+            body = self._read_json()
+        except ValueError as exc:
+            self._send_json(400, {"error": {"message": f"Invalid JSON: {exc}"}})
+            return
+        if path == "/api/show":
+            self._send_json(200, {"modelfile": "", "parameters": "", "details": {}})
+            return
+        if path == "/api/pull":
+            self._send_json(200, {"status": "success"})
+            return
+        shapers = {
+            "/v1/responses": _openai_payload,
+            "/api/generate": _ollama_payload,
+            "/v1/chat/completions": _chat_payload,
+        }
+        shaper = shapers.get(path)
+        if shaper is None:
+            self._send_json(404, {"error": {"message": f"Unknown path {path}"}})
+            return
+        status, payload, headers = self.server.simulator.complete(path, body, shaper)
+        self._send_json(status, payload, headers)
+
+
+class _SimulatorHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server carrying a back-reference to its simulator."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], simulator: "LLMSimulator"):
+        super().__init__(address, _Handler)
+        self.simulator = simulator
+
+
+class LLMSimulator:
+    """Run the simulator on a background thread.
+
+    Use as a context manager or call ``start()``/``stop()`` explicitly. The
+    server binds to an ephemeral port unless ``port`` is given.
+
+    Args:
+        config: Simulator behavior; defaults to zero latency and no faults.
+        host: Interface to bind.
+        port: Port to bind; ``0`` picks a free port.
+
+    """
+
+    def __init__(
+        self,
+        config: Optional[SimulatorConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.config: SimulatorConfig = config or SimulatorConfig()
+        self.stats: SimulatorStats = SimulatorStats()
+        self._host = host
+        self._port = port
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server: Optional[_SimulatorHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server, e.g. ``http://127.0.0.1:53211``."""
+        if self._server is None:
+            raise RuntimeError("Simulator is not running.")
+        host, port = cast(tuple[str, int], self._server.server_address[:2])
+        return f"http://{host}:{port}"
+
+    def env(self) -> dict[str, str]:
+        """Environment variables pointing the CLTK GenAI clients at this server."""
+        return {
+            "OPENAI_BASE_URL": f"{self.url}/v1",
+            "OPENAI_API_KEY": "sk-simulator",
+            "OLLAMA_HOST": self.url,
+            "MISTRAL_SERVER_URL": self.url,
+            "MISTRAL_API_KEY": "simulator",
+        }
+
+    def start(self) -> "LLMSimulator":
+        """Bind the server and start serving on a daemon thread."""
+        if self._server is not None:
+            return self
+        self._server = _SimulatorHTTPServer((self._host, self._port), self)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="cltk-llm-simulator", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"GenAI simulator listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Shut down the server and join its thread."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        self._server = _SimulatorHTTPServer((self._host, self._port), self)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+
+    def reset_stats(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self.stats = SimulatorStats()
+
+    def __enter__(self) -> "LLMSimulator":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _draw(self) -> tuple[float, float]:
+        """Draw a latency sample and a fault roll under the shared lock."""
+        with self._lock:
+            return self.config.latency.sample(self._rng), self._rng.random()
+
+    def complete(
+        self, path: str, body: dict[str, Any], shaper: Any
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        """Answer one completion request.
+
+        Args:
+            path: Request path, used for per-endpoint counters.
+            body: Decoded JSON request body.
+            shaper: Callable turning ``(model, text, usage)`` into a payload.
+
+        Returns:
+            HTTP status, JSON payload, and extra response headers.
+
+        """
+        latency_ms, roll = self._draw()
+        with self._lock:
+            self.stats.requests[path] = self.stats.requests.get(path, 0) + 1
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000.0)
+        cfg = self.config
+        if roll < cfg.rate_limit_rate:
+            with self._lock:
+                self.stats.rate_limited += 1
+                self.stats.latency_ms += latency_ms
+            return (
+                429,
+                {
+                    "error": {
+                        "message": "Simulated rate limit exceeded.",
+                        "type": "rate_limit_error",
+                        "code": "rate_limit_exceeded",
+                    }
+                },
+                {"Retry-After": f"{cfg.retry_after_s:g}"},
+            )
+        if roll < cfg.rate_limit_rate + cfg.error_rate:
+            with self._lock:
+                self.stats.errors_injected += 1
+                self.stats.latency_ms += latency_ms
+            return (
+                500,
+                {
+                    "error": {
+                        "message": "Simulated server error.",
+                        "type": "server_error",
+                    }
+                },
+                {},
+            )
+        prompt = _prompt_from_request(path, body)
+        text = simulate_completion(prompt)
+        input_tokens = count_tokens(prompt, cfg.chars_per_token)
+        output_tokens = count_tokens(text, cfg.chars_per_token)
+        usage = {
+            "input": input_tokens,
+            "output": output_tokens,
+            "total": input_tokens + output_tokens,
+        }
+        with self._lock:
+            self.stats.completed += 1
+            self.stats.input_tokens += input_tokens
+            self.stats.output_tokens += output_tokens
+            self.stats.latency_ms += latency_ms
+        model = str(body.get("model") or "simulator")
+        return 200, shaper(model, text, usage), {}
@@ -1,92 +1,71 @@
 """Utilities for resolving CLTK language data.
 
 This module resolves user-supplied keys (ISO codes, names, Glottolog IDs) into
-``(Language, Optional[Dialect])`` pairs using the curated language data in
-``languages.py``.
+``(Language, Optional[Dialect])`` pairs using the curated language data
+exposed by ``languages.py``.
 """
 
-from typing import Any, Literal, Optional
+import bisect
+import re
+import unicodedata
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Literal, Optional, cast
 
 from cltk.core.cltk_logger import logger
 from cltk.core.data_types import Dialect, Language
 from cltk.core.logging_utils import glog
 from cltk.languages.languages import LANGUAGES
+from cltk.languages.registry import LanguageSummary
 
 HISTORIC_CUTOFF_YEAR: int = 1700
-_HISTORIC_MODIFIERS: set[str] = {
-    "ancient",
-    "old",
-    "middle",
-    "classical",
-    "late",
-    "early",
-    "medieval",
-    "archaic",
-    "literary",
-    "demotic",
-}
-
-
-def _norm(s: str) -> str:
-    """Normalize whitespace and case for robust comparisons."""
-    return " ".join(s.lower().split())
-
-
-def _is_historic_like(L: Language, cutoff: int = HISTORIC_CUTOFF_YEAR) -> bool:
+
+
+def _summary_is_historic(
+    summary: LanguageSummary, cutoff: int = HISTORIC_CUTOFF_YEAR
+) -> bool:
     """Return True if a language looks historic/ancient per simple heuristics.
 
     Heuristics consider endangerment, explicit tokens like "ancient/old/middle",
     and an earliest timespan prior to ``cutoff``.
     """
-    try:
-        if getattr(L, "status", None) in {"extinct", "unattested"}:
-            return True
-    except Exception:
-        pass
-    ts = getattr(L, "timespan", None)
-    if ts:
-        years = [
-            v
-            for v in (getattr(ts, "start", None), getattr(ts, "end", None))
-            if isinstance(v, int)
-        ]
-        if years and min(years) <= cutoff:
-            return True
-    name_tokens = set(_norm(L.name).split())
-    if name_tokens & _HISTORIC_MODIFIERS:
+    if summary.status in {"extinct", "unattested"}:
         return True
-    for nv in getattr(L, "alt_names", []):
-        if set(_norm(nv.value).split()) & _HISTORIC_MODIFIERS:
-            return True
-    return False
+    if summary.years and min(summary.years) <= cutoff:
+        return True
+    return summary.historic_name or summary.historic_alt_name
 
 
-def _historic_rank(
-    L: Language, cutoff: int = HISTORIC_CUTOFF_YEAR
+def _summary_rank(
+    summary: LanguageSummary, cutoff: int = HISTORIC_CUTOFF_YEAR
 ) -> tuple[int, int, int]:
     """Return a tuple scoring how plausibly historic a language is.
 
     Higher tuples (by lexicographic order) indicate stronger historicity.
+    Reads only the precomputed ``LanguageSummary`` fields, so no ``Language``
+    is materialized and no name is re-normalized.
     """
-    is_hist = 1 if _is_historic_like(L, cutoff=cutoff) else 0
-    has_mod = 1 if (set(_norm(L.name).split()) & _HISTORIC_MODIFIERS) else 0
-    ts = getattr(L, "timespan", None)
-    years = [
-        v
-        for v in (getattr(ts, "start", None), getattr(ts, "end", None))
-        if isinstance(v, int)
-    ]
-    earliest = min(years) if years else 9999
+    is_hist = 1 if _summary_is_historic(summary, cutoff=cutoff) else 0
+    has_mod = 1 if summary.historic_name else 0
+    earliest = min(summary.years) if summary.years else 9999
     return (is_hist, has_mod, -earliest)
 
 
-def _build_indices() -> (
-    dict[
-        Literal["by_iso", "by_name_lang", "by_name_dialect", "by_dialect"],
-        dict[str, Any],
-    ]
-):
-    """Build lookup indices for languages and dialects from ``LANGUAGES``.
+_Indices = dict[
+    Literal["by_iso", "by_name_lang", "by_name_dialect", "by_dialect"],
+    dict[str, Any],
+]
+
+# (LANGUAGES.version, indices) for the most recently built indices.
+_INDEX_CACHE: Optional[tuple[int, _Indices]] = None
+
+
+def _build_indices() -> _Indices:
+    """Return lookup indices for languages and dialects from ``LANGUAGES``.
+
+    Indices are built once and reused until ``LANGUAGES`` is mutated (tracked
+    by ``LanguageRegistry.version``). Re-assign a language after editing its
+    names or dialects in place so the indices pick up the change.
 
     Indices built:
       - ``by_iso``: ISO -> language glottocode
@@ -94,33 +73,39 @@ def _build_indices() -> (
       - ``by_name_dialect``: lowercased dialect name -> [dialect glottocode]
       - ``by_dialect``: dialect glottocode -> parent language glottocode
     """
+    global _INDEX_CACHE
+    version = LANGUAGES.version
+    if _INDEX_CACHE is not None and _INDEX_CACHE[0] == version:
+        return _INDEX_CACHE[1]
     by_iso: dict[str, str] = {}
     by_name_lang: dict[str, list[str]] = {}
     by_name_dialect: dict[str, list[str]] = {}
     by_dialect: dict[str, str] = {}
-    for g, L in LANGUAGES.items():
-        if L.iso:
-            by_iso[L.iso.lower()] = g
-        by_name_lang.setdefault(L.name.lower(), []).append(g)
-        for nv in L.alt_names:
-            by_name_lang.setdefault(nv.value.lower(), []).append(g)
-        for d in L.dialects:
-            if not d.glottolog_id:
+    # Summaries carry the lookup fields, so no ``Language`` is materialized here.
+    for g, summary in LANGUAGES.summaries():
+        if summary.iso:
+            by_iso[summary.iso.lower()] = g
+        for name in summary.names:
+            by_name_lang.setdefault(name.lower(), []).append(g)
+        for dialect_id, dialect_name, _ in summary.dialects:
+            if not dialect_id:
                 continue
-            by_dialect[d.glottolog_id] = g
-            by_name_dialect.setdefault(d.name.lower(), []).append(d.glottolog_id)
+            by_dialect[dialect_id] = g
+            by_name_dialect.setdefault(dialect_name.lower(), []).append(dialect_id)
     logger.info(
         f"Built indices: by_iso={len(by_iso)} entries, "
         f"by_name_lang_keys={len(by_name_lang)}, "
         f"by_name_dialect_keys={len(by_name_dialect)}, "
         f"by_dialect={len(by_dialect)}"
     )
-    return {
+    indices: _Indices = {
         "by_iso": by_iso,
         "by_name_lang": by_name_lang,
         "by_name_dialect": by_name_dialect,
         "by_dialect": by_dialect,
     }
+    _INDEX_CACHE = (version, indices)
+    return indices
 
 
 def get_dialect(key: str) -> tuple[Language, Dialect]:
@@ -141,7 +126,7 @@ def get_dialect(key: str) -> tuple[Language, Dialect]:
 
     """
     logger.debug(f"Looking up dialect for key='{key}'")
-    langs: dict[str, Language] = LANGUAGES
+    langs = LANGUAGES
     idx = _build_indices()
 
     k = key.lower()
@@ -240,7 +225,7 @@ def get_language(lang_id: str) -> tuple[Language, Optional[Dialect]]:
     """
     logger.debug(f"Resolving languoid for key='{lang_id}'")
 
-    langs: dict[str, Language] = LANGUAGES
+    langs = LANGUAGES
     idx = _build_indices()
 
     k = lang_id.strip()
@@ -302,11 +287,11 @@ def get_language(lang_id: str) -> tuple[Language, Optional[Dialect]]:
                 f"Resolved language by name: '{k}' -> {L.name} (glottolog_id={g0})"
             )
             return L, None
-        cands = [langs[gx] for gx in hits_lang if gx in langs]
-        cands.sort(key=_historic_rank, reverse=True)
-        best = cands[0]
-        glog(best.glottolog_id).info(
-            f"Ambiguous language name '{k}' matched {len(cands)} entries; "
+        cand_ids = [gx for gx in hits_lang if gx in langs]
+        best_id = max(cand_ids, key=lambda gx: _summary_rank(langs.summary(gx)))
+        best = langs[best_id]
+        glog(best_id).info(
+            f"Ambiguous language name '{k}' matched {len(cand_ids)} entries; "
             f"selecting '{best.name}' (glottolog_id={best.glottolog_id}) by historic preference."
         )
         return best, None
@@ -349,3 +334,253 @@ def get_language(lang_id: str) -> tuple[Language, Optional[Dialect]]:
     msg = f"No language or dialect found for '{k}'"
     logger.error(msg)
     raise KeyError(msg)
+
+
+def get_languages(
+    lang_ids: Iterable[str],
+) -> dict[str, tuple[Language, Optional[Dialect]]]:
+    """Resolve many language or dialect keys with ``get_language``.
+
+    Args:
+      lang_ids: Language glottocodes/ISO codes/names or dialect glottocodes/names.
+        Duplicates are resolved once.
+
+    Returns:
+      Mapping of each input key to its ``(Language, Optional[Dialect])`` pair,
+      in input order.
+
+    Raises:
+      KeyError: If any key cannot be resolved; the message lists every failure.
+
+    """
+    resolved: dict[str, tuple[Language, Optional[Dialect]]] = {}
+    failures: dict[str, str] = {}
+    for lang_id in lang_ids:
+        if lang_id in resolved or lang_id in failures:
+            continue
+        try:
+            resolved[lang_id] = get_language(lang_id)
+        except KeyError as exc:
+            failures[lang_id] = str(exc.args[0]) if exc.args else lang_id
+    if failures:
+        details = "; ".join(f"{key!r}: {msg}" for key, msg in failures.items())
+        raise KeyError(f"Could not resolve {len(failures)} language key(s): {details}")
+    return resolved
+
+
+@dataclass(frozen=True)
+class LanguageMatch:
+    """Ranked candidate returned by ``search_languages``.
+
+    Attributes:
+      glottolog_id: Glottocode of the matching language.
+      name: Primary name of the matching language.
+      matched: The name, alt-name, or identifier that matched the query.
+      kind: ``"exact"``, ``"prefix"``, or ``"fuzzy"``.
+      score: Match quality in ``(0, 1]``; higher is better.
+      dialect_id: Dialect glottocode when the match came from a dialect.
+
+    """
+
+    glottolog_id: str
+    name: str
+    matched: str
+    kind: Literal["exact", "prefix", "fuzzy"]
+    score: float
+    dialect_id: Optional[str] = None
+
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _search_norm(s: str) -> str:
+    """Fold case, accents, and punctuation for search ("Greek, Ancient" -> "greek ancient")."""
+    decomposed = unicodedata.normalize("NFKD", s)
+    folded = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(_NON_WORD_RE.sub(" ", folded.casefold()).split())
+
+
+def _trigrams(term: str) -> set[str]:
+    padded = f"  {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+# Scores per match kind; prefix and fuzzy scores add a bonus for closeness.
+_EXACT_SCORE = 1.0
+_PREFIX_SCORE = 0.8
+_WORD_PREFIX_SCORE = 0.6
+_FUZZY_SCORE = 0.5
+_FUZZY_THRESHOLD = 0.4
+
+
+class _SearchIndex:
+    """Prefix and character-trigram index over language names and identifiers.
+
+    Every name, alt-name, glottocode, ISO code, dialect name, and dialect code
+    becomes a term. Prefix search bisects a sorted list of word-start keys (a
+    flat trie); fuzzy search counts shared trigrams through posting lists.
+    """
+
+    def __init__(self) -> None:
+        # term id -> (normalized term, original term, glottocode, dialect id)
+        self.terms: list[tuple[str, str, str, Optional[str]]] = []
+        self.token_keys: list[frozenset[str]] = []
+        self.sizes: list[int] = []
+        self.prefix_keys: list[tuple[str, int]] = []
+        self.postings: dict[str, list[int]] = {}
+        self.names: dict[str, str] = {}
+        self.ranks: dict[str, tuple[int, int, int]] = {}
+        seen: set[tuple[str, str, Optional[str]]] = set()
+        for g, summary in LANGUAGES.summaries():
+            self.names[g] = summary.names[0]
+            self._add(g, g, None, seen)
+            if summary.iso:
+                self._add(summary.iso, g, None, seen)
+            for name in summary.names:
+                self._add(name, g, None, seen)
+            for dialect_id, dialect_name, code in summary.dialects:
+                self._add(dialect_name, g, dialect_id, seen)
+                for ident in (dialect_id, code):
+                    if ident:
+                        self._add(ident, g, dialect_id, seen)
+        self.prefix_keys.sort()
+
+    def _add(
+        self,
+        term: str,
+        g: str,
+        dialect_id: Optional[str],
+        seen: set[tuple[str, str, Optional[str]]],
+    ) -> None:
+        norm = _search_norm(term)
+        if not norm or (norm, g, dialect_id) in seen:
+            return
+        seen.add((norm, g, dialect_id))
+        term_id = len(self.terms)
+        self.terms.append((norm, term, g, dialect_id))
+        self.token_keys.append(frozenset(norm.split()))
+        grams = _trigrams(norm)
+        self.sizes.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(term_id)
+        # Word-start suffixes so "greek" also reaches "ancient greek".
+        start = 0
+        for word in norm.split(" "):
+            self.prefix_keys.append((norm[start:], term_id))
+            start += len(word) + 1
+
+    def _with_prefix(self, prefix: str) -> Iterator[tuple[str, int]]:
+        """Yield ``(word-start key, term id)`` pairs whose key starts with ``prefix``."""
+        keys = self.prefix_keys
+        for i in range(bisect.bisect_left(keys, (prefix, -1)), len(keys)):
+            key, term_id = keys[i]
+            if not key.startswith(prefix):
+                break
+            yield key, term_id
+
+    def rank(self, g: str) -> tuple[int, int, int]:
+        """Return (and cache) ``_summary_rank`` for a language."""
+        cached = self.ranks.get(g)
+        if cached is None:
+            cached = self.ranks[g] = _summary_rank(LANGUAGES.summary(g))
+        return cached
+
+    def search(self, query: str, limit: int) -> list[LanguageMatch]:
+        q = _search_norm(query)
+        if not q:
+            return []
+        best: dict[str, tuple[float, str, int]] = {}  # g -> (score, kind, term id)
+
+        def offer(term_id: int, score: float, kind: str) -> None:
+            g = self.terms[term_id][2]
+            current = best.get(g)
+            if current is None or score > current[0]:
+                best[g] = (score, kind, term_id)
+
+        # Exact and prefix matches via the sorted word-start keys.
+        for key, term_id in self._with_prefix(q):
+            norm = self.terms[term_id][0]
+            closeness = len(q) / len(norm)
+            if norm == q:
+                offer(term_id, _EXACT_SCORE, "exact")
+            elif len(key) == len(norm):
+                offer(term_id, _PREFIX_SCORE + 0.1 * closeness, "prefix")
+            else:
+                offer(term_id, _WORD_PREFIX_SCORE + 0.1 * closeness, "prefix")
+        # Words in another order or abbreviated ("greek ancient", "anc gre").
+        q_words = q.split(" ")
+        if len(q_words) > 1:
+            for _, term_id in self._with_prefix(max(q_words, key=len)):
+                words = self.token_keys[term_id]
+                if words == frozenset(q_words):
+                    offer(term_id, _EXACT_SCORE, "exact")
+                elif all(any(w.startswith(qw) for w in words) for qw in q_words):
+                    closeness = len(q) / len(self.terms[term_id][0])
+                    offer(term_id, _WORD_PREFIX_SCORE + 0.1 * closeness, "prefix")
+        # Fuzzy matches by trigram overlap (Dice coefficient).
+        q_grams = _trigrams(q)
+        overlaps: dict[int, int] = {}
+        for gram in q_grams:
+            for term_id in self.postings.get(gram, ()):
+                overlaps[term_id] = overlaps.get(term_id, 0) + 1
+        for term_id, shared in overlaps.items():
+            dice = 2 * shared / (len(q_grams) + self.sizes[term_id])
+            if dice >= _FUZZY_THRESHOLD:
+                offer(term_id, _FUZZY_SCORE * dice, "fuzzy")
+
+        ordered = sorted(
+            best.items(),
+            key=lambda item: (item[1][0], self.rank(item[0])),
+            reverse=True,
+        )
+        matches: list[LanguageMatch] = []
+        for g, (score, kind, term_id) in ordered[:limit]:
+            _, original, _, dialect_id = self.terms[term_id]
+            matches.append(
+                LanguageMatch(
+                    glottolog_id=g,
+                    name=self.names[g],
+                    matched=original,
+                    kind=cast(Literal["exact", "prefix", "fuzzy"], kind),
+                    score=round(score, 4),
+                    dialect_id=dialect_id,
+                )
+            )
+        return matches
+
+
+# (LANGUAGES.version, index) for the most recently built search index.
+_SEARCH_CACHE: Optional[tuple[int, _SearchIndex]] = None
+
+
+def _search_index() -> _SearchIndex:
+    """Return the search index, rebuilding it after ``LANGUAGES`` changes."""
+    global _SEARCH_CACHE
+    version = LANGUAGES.version
+    if _SEARCH_CACHE is None or _SEARCH_CACHE[0] != version:
+        _SEARCH_CACHE = (version, _SearchIndex())
+    return _SEARCH_CACHE[1]
+
+
+def search_languages(query: str, limit: int = 10) -> list[LanguageMatch]:
+    """Return languages ranked by how well they match a free-form query.
+
+    Matches names, alt-names, glottocodes, ISO codes, and dialect names/codes,
+    ignoring case, accents, punctuation, and word order. Exact matches rank
+    above prefix matches, which rank above fuzzy (misspelled) matches; ties
+    prefer historic languages via ``_summary_rank``. Use ``get_language`` on
+    a result's ``glottolog_id`` (or ``dialect_id``) to load the full record.
+
+    Args:
+      query: Free-form text such as ``"ancient greek"``, ``"grc"``, or
+        ``"Greek, Ancient"``.
+      limit: Maximum number of candidates to return.
+
+    Returns:
+      Up to ``limit`` ``LanguageMatch`` candidates, best first; empty if
+      nothing matches.
+
+    """
+    if limit <= 0:
+        return []
+    return _search_index().search(query, limit)
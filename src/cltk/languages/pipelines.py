@@ -5,571 +5,33 @@ LLM‑backed via OpenAI or Ollama) and central mappings from Glottolog codes to
 default pipelines. Pipelines are lightweight containers that list a small
 sequence of processes such as normalization, sentence splitting, and
 generative annotation.
+
+Pipeline classes are described by the ``_STANZA_PIPELINES`` and
+``_GENAI_PIPELINES`` tables and created on first access, so importing this
+module neither defines them nor imports the process modules they use. Class
+names such as ``LatinGenAIPipeline`` (and the process classes previously
+re-exported here) remain importable from this module.
 """
 
-from typing import TYPE_CHECKING, Any, Optional
+import importlib
+from collections.abc import Iterator, Mapping, MutableMapping
+from functools import cache, partial
+from typing import Any, NamedTuple, Optional
 
 from pydantic import Field, model_validator
 
 from cltk.core.data_types import Pipeline
-from cltk.core.logging_utils import plog
-from cltk.dependency.processes import (
-    AkkadianGenAIDependencyProcess,
-    AlbanianGenAIDependencyProcess,
-    AmmoniteGenAIDependencyProcess,
-    AncientGreekGenAIDependencyProcess,
-    AssameseGenAIDependencyProcess,
-    AvestanGenAIDependencyProcess,
-    AwadhiGenAIDependencyProcess,
-    BactrianGenAIDependencyProcess,
-    BagriGenAIDependencyProcess,
-    BaihuaChineseGenAIDependencyProcess,
-    BengaliGenAIDependencyProcess,
-    BiblicalHebrewGenAIDependencyProcess,
-    BrajGenAIDependencyProcess,
-    CarianGenAIDependencyProcess,
-    ChagataiGenAIDependencyProcess,
-    ChurchSlavicGenAIDependencyProcess,
-    ClassicalArabicGenAIDependencyProcess,
-    ClassicalArmenianGenAIDependencyProcess,
-    ClassicalBurmeseGenAIDependencyProcess,
-    ClassicalMandaicGenAIDependencyProcess,
-    ClassicalMongolianGenAIDependencyProcess,
-    ClassicalSanskritGenAIDependencyProcess,
-    ClassicalSyriacGenAIDependencyProcess,
-    ClassicalTibetanGenAIDependencyProcess,
-    CopticGenAIDependencyProcess,
-    CuneiformLuwianGenAIDependencyProcess,
-    DemoticGenAIDependencyProcess,
-    EarlyIrishGenAIDependencyProcess,
-    EasternPanjabiGenAIDependencyProcess,
-    EdomiteGenAIDependencyProcess,
-    GandhariGenAIDependencyProcess,
-    GeezGenAIDependencyProcess,
-    GothicGenAIDependencyProcess,
-    GujaratiGenAIDependencyProcess,
-    HatranGenAIDependencyProcess,
-    HausaGenAIDependencyProcess,
-    HieroglyphicLuwianGenAIDependencyProcess,
-    HindiGenAIDependencyProcess,
-    HittiteGenAIDependencyProcess,
-    JewishBabylonianAramaicGenAIDependencyProcess,
-    KashmiriGenAIDependencyProcess,
-    KhariBoliGenAIDependencyProcess,
-    KhotaneseGenAIDependencyProcess,
-    LateEgyptianGenAIDependencyProcess,
-    LatinGenAIDependencyProcess,
-    LatvianGenAIDependencyProcess,
-    LiteraryChineseGenAIDependencyProcess,
-    LithuanianGenAIDependencyProcess,
-    LycianAGenAIDependencyProcess,
-    LydianGenAIDependencyProcess,
-    MagadhiPrakritGenAIDependencyProcess,
-    MaharastriPrakritGenAIDependencyProcess,
-    MarathiGenAIDependencyProcess,
-    MeiteiGenAIDependencyProcess,
-    MiddleAramaicGenAIDependencyProcess,
-    MiddleArmenianGenAIDependencyProcess,
-    MiddleBretonGenAIDependencyProcess,
-    MiddleChineseGenAIDependencyProcess,
-    MiddleCornishGenAIDependencyProcess,
-    MiddleEgyptianGenAIDependencyProcess,
-    MiddleEnglishGenAIDependencyProcess,
-    MiddleFrenchGenAIDependencyProcess,
-    MiddleHighGermanGenAIDependencyProcess,
-    MiddleMongolGenAIDependencyProcess,
-    MiddlePersianGenAIDependencyProcess,
-    MoabiteGenAIDependencyProcess,
-    MogholiGenAIDependencyProcess,
-    NewarGenAIDependencyProcess,
-    NumidianGenAIDependencyProcess,
-    OdiaGenAIDependencyProcess,
-    OfficialAramaicGenAIDependencyProcess,
-    OldAramaicGenAIDependencyProcess,
-    OldAramaicSamalianGenAIDependencyProcess,
-    OldBurmeseGenAIDependencyProcess,
-    OldChineseGenAIDependencyProcess,
-    OldEgyptianGenAIDependencyProcess,
-    OldEnglishGenAIDependencyProcess,
-    OldFrenchGenAIDependencyProcess,
-    OldHighGermanGenAIDependencyProcess,
-    OldHungarianGenAIDependencyProcess,
-    OldJapaneseGenAIDependencyProcess,
-    OldJurchenGenAIDependencyProcess,
-    OldMiddleWelshGenAIDependencyProcess,
-    OldNorseGenAIDependencyProcess,
-    OldPersianGenAIDependencyProcess,
-    OldPrussianGenAIDependencyProcess,
-    OldTamilGenAIDependencyProcess,
-    OldTurkicGenAIDependencyProcess,
-    PalaicGenAIDependencyProcess,
-    PaliGenAIDependencyProcess,
-    ParthianGenAIDependencyProcess,
-    PhoenicianGenAIDependencyProcess,
-    SamalianGenAIDependencyProcess,
-    SauraseniPrakritGenAIDependencyProcess,
-    SgawKarenGenAIDependencyProcess,
-    SindhiGenAIDependencyProcess,
-    SinhalaGenAIDependencyProcess,
-    SogdianGenAIDependencyProcess,
-    TaitaGenAIDependencyProcess,
-    TangutGenAIDependencyProcess,
-    TokharianAGenAIDependencyProcess,
-    TokharianBGenAIDependencyProcess,
-    TumshuqeseGenAIDependencyProcess,
-    UgariticGenAIDependencyProcess,
-    UrduGenAIDependencyProcess,
-    VedicSanskritGenAIDependencyProcess,
-)
-from cltk.enrichment.processes import (
-    AkkadianGenAIEnrichmentProcess,
-    AlbanianGenAIEnrichmentProcess,
-    AmmoniteGenAIEnrichmentProcess,
-    AncientGreekGenAIEnrichmentProcess,
-    AssameseGenAIEnrichmentProcess,
-    AvestanGenAIEnrichmentProcess,
-    AwadhiGenAIEnrichmentProcess,
-    BactrianGenAIEnrichmentProcess,
-    BagriGenAIEnrichmentProcess,
-    BaihuaChineseGenAIEnrichmentProcess,
-    BengaliGenAIEnrichmentProcess,
-    BiblicalHebrewGenAIEnrichmentProcess,
-    BrajGenAIEnrichmentProcess,
-    CarianGenAIEnrichmentProcess,
-    ChagataiGenAIEnrichmentProcess,
-    ChurchSlavicGenAIEnrichmentProcess,
-    ClassicalArabicGenAIEnrichmentProcess,
-    ClassicalArmenianGenAIEnrichmentProcess,
-    ClassicalBurmeseGenAIEnrichmentProcess,
-    ClassicalMandaicGenAIEnrichmentProcess,
-    ClassicalMongolianGenAIEnrichmentProcess,
-    ClassicalSanskritGenAIEnrichmentProcess,
-    ClassicalSyriacGenAIEnrichmentProcess,
-    ClassicalTibetanGenAIEnrichmentProcess,
-    CopticGenAIEnrichmentProcess,
-    CuneiformLuwianGenAIEnrichmentProcess,
-    DemoticGenAIEnrichmentProcess,
-    EarlyIrishGenAIEnrichmentProcess,
-    EasternPanjabiGenAIEnrichmentProcess,
-    EdomiteGenAIEnrichmentProcess,
-    GandhariGenAIEnrichmentProcess,
-    GeezGenAIEnrichmentProcess,
-    GothicGenAIEnrichmentProcess,
-    GujaratiGenAIEnrichmentProcess,
-    HatranGenAIEnrichmentProcess,
-    HausaGenAIEnrichmentProcess,
-    HieroglyphicLuwianGenAIEnrichmentProcess,
-    HindiGenAIEnrichmentProcess,
-    HittiteGenAIEnrichmentProcess,
-    JewishBabylonianAramaicGenAIEnrichmentProcess,
-    KashmiriGenAIEnrichmentProcess,
-    KhariBoliGenAIEnrichmentProcess,
-    KhotaneseGenAIEnrichmentProcess,
-    LateEgyptianGenAIEnrichmentProcess,
-    LatinGenAIEnrichmentProcess,
-    LatvianGenAIEnrichmentProcess,
-    LiteraryChineseGenAIEnrichmentProcess,
-    LithuanianGenAIEnrichmentProcess,
-    LycianAGenAIEnrichmentProcess,
-    LydianGenAIEnrichmentProcess,
-    MagadhiPrakritGenAIEnrichmentProcess,
-    MaharastriPrakritGenAIEnrichmentProcess,
-    MarathiGenAIEnrichmentProcess,
-    MeiteiGenAIEnrichmentProcess,
-    MiddleAramaicGenAIEnrichmentProcess,
-    MiddleArmenianGenAIEnrichmentProcess,
-    MiddleBretonGenAIEnrichmentProcess,
-    MiddleChineseGenAIEnrichmentProcess,
-    MiddleCornishGenAIEnrichmentProcess,
-    MiddleEgyptianGenAIEnrichmentProcess,
-    MiddleEnglishGenAIEnrichmentProcess,
-    MiddleFrenchGenAIEnrichmentProcess,
-    MiddleHighGermanGenAIEnrichmentProcess,
-    MiddleMongolGenAIEnrichmentProcess,
-    MiddlePersianGenAIEnrichmentProcess,
-    MoabiteGenAIEnrichmentProcess,
-    MogholiGenAIEnrichmentProcess,
-    NewarGenAIEnrichmentProcess,
-    NumidianGenAIEnrichmentProcess,
-    OdiaGenAIEnrichmentProcess,
-    OfficialAramaicGenAIEnrichmentProcess,
-    OldAramaicGenAIEnrichmentProcess,
-    OldAramaicSamalianGenAIEnrichmentProcess,
-    OldBurmeseGenAIEnrichmentProcess,
-    OldChineseGenAIEnrichmentProcess,
-    OldEgyptianGenAIEnrichmentProcess,
-    OldEnglishGenAIEnrichmentProcess,
-    OldFrenchGenAIEnrichmentProcess,
-    OldHighGermanGenAIEnrichmentProcess,
-    OldHungarianGenAIEnrichmentProcess,
-    OldJapaneseGenAIEnrichmentProcess,
-    OldJurchenGenAIEnrichmentProcess,
-    OldMiddleWelshGenAIEnrichmentProcess,
-    OldNorseGenAIEnrichmentProcess,
-    OldPersianGenAIEnrichmentProcess,
-    OldPrussianGenAIEnrichmentProcess,
-    OldTamilGenAIEnrichmentProcess,
-    OldTurkicGenAIEnrichmentProcess,
-    PalaicGenAIEnrichmentProcess,
-    PaliGenAIEnrichmentProcess,
-    ParthianGenAIEnrichmentProcess,
-    PhoenicianGenAIEnrichmentProcess,
-    SamalianGenAIEnrichmentProcess,
-    SauraseniPrakritGenAIEnrichmentProcess,
-    SgawKarenGenAIEnrichmentProcess,
-    SindhiGenAIEnrichmentProcess,
-    SinhalaGenAIEnrichmentProcess,
-    SogdianGenAIEnrichmentProcess,
-    TaitaGenAIEnrichmentProcess,
-    TangutGenAIEnrichmentProcess,
-    TokharianAGenAIEnrichmentProcess,
-    TokharianBGenAIEnrichmentProcess,
-    TumshuqeseGenAIEnrichmentProcess,
-    UgariticGenAIEnrichmentProcess,
-    UrduGenAIEnrichmentProcess,
-    VedicSanskritGenAIEnrichmentProcess,
-)
-from cltk.morphosyntax.processes import (
-    AkkadianGenAIMorphosyntaxProcess,
-    AlbanianGenAIMorphosyntaxProcess,
-    AmmoniteGenAIMorphosyntaxProcess,
-    AncientGreekGenAIMorphosyntaxProcess,
-    AssameseGenAIMorphosyntaxProcess,
-    AvestanGenAIMorphosyntaxProcess,
-    AwadhiGenAIMorphosyntaxProcess,
-    BactrianGenAIMorphosyntaxProcess,
-    BagriGenAIMorphosyntaxProcess,
-    BaihuaChineseGenAIMorphosyntaxProcess,
-    BengaliGenAIMorphosyntaxProcess,
-    BiblicalHebrewGenAIMorphosyntaxProcess,
-    BrajGenAIMorphosyntaxProcess,
-    CarianGenAIMorphosyntaxProcess,
-    ChagataiGenAIMorphosyntaxProcess,
-    ChurchSlavicGenAIMorphosyntaxProcess,
-    ClassicalArabicGenAIMorphosyntaxProcess,
-    ClassicalArmenianGenAIMorphosyntaxProcess,
-    ClassicalBurmeseGenAIMorphosyntaxProcess,
-    ClassicalMandaicGenAIMorphosyntaxProcess,
-    ClassicalMongolianGenAIMorphosyntaxProcess,
-    ClassicalSanskritGenAIMorphosyntaxProcess,
-    ClassicalSyriacGenAIMorphosyntaxProcess,
-    ClassicalTibetanGenAIMorphosyntaxProcess,
-    CopticGenAIMorphosyntaxProcess,
-    CuneiformLuwianGenAIMorphosyntaxProcess,
-    DemoticGenAIMorphosyntaxProcess,
-    EarlyIrishGenAIMorphosyntaxProcess,
-    EasternPanjabiGenAIMorphosyntaxProcess,
-    EdomiteGenAIMorphosyntaxProcess,
-    GandhariGenAIMorphosyntaxProcess,
-    GeezGenAIMorphosyntaxProcess,
-    GothicGenAIMorphosyntaxProcess,
-    GujaratiGenAIMorphosyntaxProcess,
-    HatranGenAIMorphosyntaxProcess,
-    HausaGenAIMorphosyntaxProcess,
-    HieroglyphicLuwianGenAIMorphosyntaxProcess,
-    HindiGenAIMorphosyntaxProcess,
-    HittiteGenAIMorphosyntaxProcess,
-    JewishBabylonianAramaicGenAIMorphosyntaxProcess,
-    KashmiriGenAIMorphosyntaxProcess,
-    KhariBoliGenAIMorphosyntaxProcess,
-    KhotaneseGenAIMorphosyntaxProcess,
-    LateEgyptianGenAIMorphosyntaxProcess,
-    LatinGenAIMorphosyntaxProcess,
-    LatvianGenAIMorphosyntaxProcess,
-    LiteraryChineseGenAIMorphosyntaxProcess,
-    LithuanianGenAIMorphosyntaxProcess,
-    LycianAGenAIMorphosyntaxProcess,
-    LydianGenAIMorphosyntaxProcess,
-    MagadhiPrakritGenAIMorphosyntaxProcess,
-    MaharastriPrakritGenAIMorphosyntaxProcess,
-    MarathiGenAIMorphosyntaxProcess,
-    MeiteiGenAIMorphosyntaxProcess,
-    MiddleAramaicGenAIMorphosyntaxProcess,
-    MiddleArmenianGenAIMorphosyntaxProcess,
-    MiddleBretonGenAIMorphosyntaxProcess,
-    MiddleChineseGenAIMorphosyntaxProcess,
-    MiddleCornishGenAIMorphosyntaxProcess,
-    MiddleEgyptianGenAIMorphosyntaxProcess,
-    MiddleEnglishGenAIMorphosyntaxProcess,
-    MiddleFrenchGenAIMorphosyntaxProcess,
-    MiddleHighGermanGenAIMorphosyntaxProcess,
-    MiddleMongolGenAIMorphosyntaxProcess,
-    MiddlePersianGenAIMorphosyntaxProcess,
-    MoabiteGenAIMorphosyntaxProcess,
-    MogholiGenAIMorphosyntaxProcess,
-    NewarGenAIMorphosyntaxProcess,
-    NumidianGenAIMorphosyntaxProcess,
-    OdiaGenAIMorphosyntaxProcess,
-    OfficialAramaicGenAIMorphosyntaxProcess,
-    OldAramaicGenAIMorphosyntaxProcess,
-    OldAramaicSamalianGenAIMorphosyntaxProcess,
-    OldBurmeseGenAIMorphosyntaxProcess,
-    OldChineseGenAIMorphosyntaxProcess,
-    OldEgyptianGenAIMorphosyntaxProcess,
-    OldEnglishGenAIMorphosyntaxProcess,
-    OldFrenchGenAIMorphosyntaxProcess,
-    OldHighGermanGenAIMorphosyntaxProcess,
-    OldHungarianGenAIMorphosyntaxProcess,
-    OldJapaneseGenAIMorphosyntaxProcess,
-    OldJurchenGenAIMorphosyntaxProcess,
-    OldMiddleWelshGenAIMorphosyntaxProcess,
-    OldNorseGenAIMorphosyntaxProcess,
-    OldPersianGenAIMorphosyntaxProcess,
-    OldPrussianGenAIMorphosyntaxProcess,
-    OldTamilGenAIMorphosyntaxProcess,
-    OldTurkicGenAIMorphosyntaxProcess,
-    PalaicGenAIMorphosyntaxProcess,
-    PaliGenAIMorphosyntaxProcess,
-    ParthianGenAIMorphosyntaxProcess,
-    PhoenicianGenAIMorphosyntaxProcess,
-    SamalianGenAIMorphosyntaxProcess,
-    SauraseniPrakritGenAIMorphosyntaxProcess,
-    SgawKarenGenAIMorphosyntaxProcess,
-    SindhiGenAIMorphosyntaxProcess,
-    SinhalaGenAIMorphosyntaxProcess,
-    SogdianGenAIMorphosyntaxProcess,
-    TaitaGenAIMorphosyntaxProcess,
-    TangutGenAIMorphosyntaxProcess,
-    TokharianAGenAIMorphosyntaxProcess,
-    TokharianBGenAIMorphosyntaxProcess,
-    TumshuqeseGenAIMorphosyntaxProcess,
-    UgariticGenAIMorphosyntaxProcess,
-    UrduGenAIMorphosyntaxProcess,
-    VedicSanskritGenAIMorphosyntaxProcess,
-)
-from cltk.sentence.processes import (
-    AkkadianSentenceSplittingProcess,
-    AlbanianSentenceSplittingProcess,
-    AmmoniteSentenceSplittingProcess,
-    AncientGreekSentenceSplittingProcess,
-    AncientHebrewSentenceSplittingProcess,
-    AssameseSentenceSplittingProcess,
-    AvestanSentenceSplittingProcess,
-    AwadhiSentenceSplittingProcess,
-    BactrianSentenceSplittingProcess,
-    BagriSentenceSplittingProcess,
-    BaihuaChineseSentenceSplittingProcess,
-    BengaliSentenceSplittingProcess,
-    BrajSentenceSplittingProcess,
-    CarianSentenceSplittingProcess,
-    ChagataiSentenceSplittingProcess,
-    ChurchSlavonicSentenceSplittingProcess,
-    ClassicalArabicSentenceSplittingProcess,
-    ClassicalArmenianSentenceSplittingProcess,
-    ClassicalBurmeseSentenceSplittingProcess,
-    ClassicalMandaicSentenceSplittingProcess,
-    ClassicalMongolianSentenceSplittingProcess,
-    ClassicalSanskritSentenceSplittingProcess,
-    ClassicalSyriacSentenceSplittingProcess,
-    ClassicalTibetanSentenceSplittingProcess,
-    CopticSentenceSplittingProcess,
-    CuneiformLuwianSentenceSplittingProcess,
-    DemoticSentenceSplittingProcess,
-    EarlyIrishSentenceSplittingProcess,
-    EdomiteSentenceSplittingProcess,
-    GandhariSentenceSplittingProcess,
-    GeezSentenceSplittingProcess,
-    GothicSentenceSplittingProcess,
-    GujaratiSentenceSplittingProcess,
-    HatranSentenceSplittingProcess,
-    HausaSentenceSplittingProcess,
-    HieroglyphicLuwianSentenceSplittingProcess,
-    HindiSentenceSplittingProcess,
-    HittiteSentenceSplittingProcess,
-    JewishBabylonianAramaicSentenceSplittingProcess,
-    KashmiriSentenceSplittingProcess,
-    KhariBoliSentenceSplittingProcess,
-    KhotaneseSentenceSplittingProcess,
-    LateEgyptianSentenceSplittingProcess,
-    LatinSentenceSplittingProcess,
-    LatvianSentenceSplittingProcess,
-    LiteraryChineseSentenceSplittingProcess,
-    LithuanianSentenceSplittingProcess,
-    LycianASentenceSplittingProcess,
-    LydianSentenceSplittingProcess,
-    MagadhiPrakritSentenceSplittingProcess,
-    MaharastriPrakritSentenceSplittingProcess,
-    MarathiSentenceSplittingProcess,
-    MeiteiSentenceSplittingProcess,
-    MiddleAramaicSentenceSplittingProcess,
-    MiddleArmenianSentenceSplittingProcess,
-    MiddleBretonSentenceSplittingProcess,
-    MiddleChineseSentenceSplittingProcess,
-    MiddleCornishSentenceSplittingProcess,
-    MiddleEgyptianSentenceSplittingProcess,
-    MiddleEnglishSentenceSplittingProcess,
-    MiddleFrenchSentenceSplittingProcess,
-    MiddleHighGermanSentenceSplittingProcess,
-    MiddleMongolSentenceSplittingProcess,
-    MiddlePersianSentenceSplittingProcess,
-    MoabiteSentenceSplittingProcess,
-    MogholiSentenceSplittingProcess,
-    NewarSentenceSplittingProcess,
-    NumidianSentenceSplittingProcess,
-    OdiaSentenceSplittingProcess,
-    OfficialAramaicSentenceSplittingProcess,
-    OldAramaicSamalianSentenceSplittingProcess,
-    OldAramaicSentenceSplittingProcess,
-    OldBurmeseSentenceSplittingProcess,
-    OldChineseSentenceSplittingProcess,
-    OldEgyptianSentenceSplittingProcess,
-    OldEnglishSentenceSplittingProcess,
-    OldFrenchSentenceSplittingProcess,
-    OldHighGermanSentenceSplittingProcess,
-    OldHungarianSentenceSplittingProcess,
-    OldJapaneseSentenceSplittingProcess,
-    OldJurchenSentenceSplittingProcess,
-    OldMiddleWelshSentenceSplittingProcess,
-    OldNorseSentenceSplittingProcess,
-    OldPersianSentenceSplittingProcess,
-    OldPrussianSentenceSplittingProcess,
-    OldTamilSentenceSplittingProcess,
-    OldTurkicSentenceSplittingProcess,
-    PalaicSentenceSplittingProcess,
-    PaliSentenceSplittingProcess,
-    PanjabiSentenceSplittingProcess,
-    ParthianSentenceSplittingProcess,
-    PhoenicianSentenceSplittingProcess,
-    SamalianSentenceSplittingProcess,
-    SauraseniPrakritSentenceSplittingProcess,
-    SgawKarenSentenceSplittingProcess,
-    SindhiSentenceSplittingProcess,
-    SinhalaSentenceSplittingProcess,
-    SogdianSentenceSplittingProcess,
-    TaitaSentenceSplittingProcess,
-    TangutSentenceSplittingProcess,
-    TocharianASentenceSplittingProcess,
-    TocharianBSentenceSplittingProcess,
-    TumshuqeseSentenceSplittingProcess,
-    UgariticSentenceSplittingProcess,
-    UrduSentenceSplittingProcess,
-    VedicSanskritSentenceSplittingProcess,
-)
-from cltk.text.processes import MultilingualNormalizeProcess
-from cltk.translation.processes import (
-    AkkadianGenAITranslationProcess,
-    AlbanianGenAITranslationProcess,
-    AmmoniteGenAITranslationProcess,
-    AncientGreekGenAITranslationProcess,
-    AssameseGenAITranslationProcess,
-    AvestanGenAITranslationProcess,
-    AwadhiGenAITranslationProcess,
-    BactrianGenAITranslationProcess,
-    BagriGenAITranslationProcess,
-    BaihuaChineseGenAITranslationProcess,
-    BengaliGenAITranslationProcess,
-    BiblicalHebrewGenAITranslationProcess,
-    BrajGenAITranslationProcess,
-    CarianGenAITranslationProcess,
-    ChagataiGenAITranslationProcess,
-    ChurchSlavicGenAITranslationProcess,
-    ClassicalArabicGenAITranslationProcess,
-    ClassicalArmenianGenAITranslationProcess,
-    ClassicalBurmeseGenAITranslationProcess,
-    ClassicalMandaicGenAITranslationProcess,
-    ClassicalMongolianGenAITranslationProcess,
-    ClassicalSanskritGenAITranslationProcess,
-    ClassicalSyriacGenAITranslationProcess,
-    ClassicalTibetanGenAITranslationProcess,
-    CopticGenAITranslationProcess,
-    CuneiformLuwianGenAITranslationProcess,
-    DemoticGenAITranslationProcess,
-    EarlyIrishGenAITranslationProcess,
-    EasternPanjabiGenAITranslationProcess,
-    EdomiteGenAITranslationProcess,
-    GandhariGenAITranslationProcess,
-    GeezGenAITranslationProcess,
-    GothicGenAITranslationProcess,
-    GujaratiGenAITranslationProcess,
-    HatranGenAITranslationProcess,
-    HausaGenAITranslationProcess,
-    HieroglyphicLuwianGenAITranslationProcess,
-    HindiGenAITranslationProcess,
-    HittiteGenAITranslationProcess,
-    JewishBabylonianAramaicGenAITranslationProcess,
-    KashmiriGenAITranslationProcess,
-    KhariBoliGenAITranslationProcess,
-    KhotaneseGenAITranslationProcess,
-    LateEgyptianGenAITranslationProcess,
-    LatinGenAITranslationProcess,
-    LatvianGenAITranslationProcess,
-    LiteraryChineseGenAITranslationProcess,
-    LithuanianGenAITranslationProcess,
-    LycianAGenAITranslationProcess,
-    LydianGenAITranslationProcess,
-    MagadhiPrakritGenAITranslationProcess,
-    MaharastriPrakritGenAITranslationProcess,
-    MarathiGenAITranslationProcess,
-    MeiteiGenAITranslationProcess,
-    MiddleAramaicGenAITranslationProcess,
-    MiddleArmenianGenAITranslationProcess,
-    MiddleBretonGenAITranslationProcess,
-    MiddleChineseGenAITranslationProcess,
-    MiddleCornishGenAITranslationProcess,
-    MiddleEgyptianGenAITranslationProcess,
-    MiddleEnglishGenAITranslationProcess,
-    MiddleFrenchGenAITranslationProcess,
-    MiddleHighGermanGenAITranslationProcess,
-    MiddleMongolGenAITranslationProcess,
-    MiddlePersianGenAITranslationProcess,
-    MoabiteGenAITranslationProcess,
-    MogholiGenAITranslationProcess,
-    NewarGenAITranslationProcess,
-    NumidianGenAITranslationProcess,
-    OdiaGenAITranslationProcess,
-    OfficialAramaicGenAITranslationProcess,
-    OldAramaicGenAITranslationProcess,
-    OldAramaicSamalianGenAITranslationProcess,
-    OldBurmeseGenAITranslationProcess,
-    OldChineseGenAITranslationProcess,
-    OldEgyptianGenAITranslationProcess,
-    OldEnglishGenAITranslationProcess,
-    OldFrenchGenAITranslationProcess,
-    OldHighGermanGenAITranslationProcess,
-    OldHungarianGenAITranslationProcess,
-    OldJapaneseGenAITranslationProcess,
-    OldJurchenGenAITranslationProcess,
-    OldMiddleWelshGenAITranslationProcess,
-    OldNorseGenAITranslationProcess,
-    OldPersianGenAITranslationProcess,
-    OldPrussianGenAITranslationProcess,
-    OldTamilGenAITranslationProcess,
-    OldTurkicGenAITranslationProcess,
-    PalaicGenAITranslationProcess,
-    PaliGenAITranslationProcess,
-    ParthianGenAITranslationProcess,
-    PhoenicianGenAITranslationProcess,
-    SamalianGenAITranslationProcess,
-    SauraseniPrakritGenAITranslationProcess,
-    SgawKarenGenAITranslationProcess,
-    SindhiGenAITranslationProcess,
-    SinhalaGenAITranslationProcess,
-    SogdianGenAITranslationProcess,
-    TaitaGenAITranslationProcess,
-    TangutGenAITranslationProcess,
-    TokharianAGenAITranslationProcess,
-    TokharianBGenAITranslationProcess,
-    TumshuqeseGenAITranslationProcess,
-    UgariticGenAITranslationProcess,
-    UrduGenAITranslationProcess,
-    VedicSanskritGenAITranslationProcess,
-)
+from cltk.core.lazy_classes import LazyClassTable, build_subclass
 
-if TYPE_CHECKING:  # for type checkers only
-    from cltk.stanza.processes import StanzaAnalyzeProcess as StanzaAnalyzeProcessType
-else:  # runtime resolution
-    StanzaAnalyzeProcessType = object  # sentinel
-
-RuntimeStanzaAnalyzeProcess: Any
-try:
-    from cltk.stanza.processes import (
-        StanzaAnalyzeProcess as RuntimeStanzaAnalyzeProcess,
-    )
 
-    _STANZA_AVAILABLE = True
-except Exception:  # pragma: no cover - stanza optional
-    RuntimeStanzaAnalyzeProcess = None
-    _STANZA_AVAILABLE = False
+@cache
+def _stanza_analyze_process() -> Any:
+    """Return ``StanzaAnalyzeProcess``, or ``None`` when stanza is not installed."""
+    try:
+        from cltk.stanza.processes import StanzaAnalyzeProcess
+    except Exception:  # pragma: no cover - stanza optional
+        return None
+    return StanzaAnalyzeProcess
 
 
 def ensure_stanza_available() -> None:
@@ -577,7 +39,7 @@ def ensure_stanza_available() -> None:
 
     # TODO: Consider moving to cltk.stanza.utils or removing all calls
     """
-    if not _STANZA_AVAILABLE or RuntimeStanzaAnalyzeProcess is None:
+    if _stanza_analyze_process() is None:
         msg = "Stanza backend requested but stanza is not installed. Install with: pip install 'cltk[stanza]'"
         raise ImportError(msg)
 
@@ -595,2761 +57,1074 @@ class StanzaPipeline(Pipeline):
         return self
 
 
-class LatinStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Latin."""
-
-    description: Optional[str] = "Stanza pipeline for the Latin language."
-    glottolog_id: Optional[str] = "lati1261"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LatinStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("LatinStanzaPipeline created.")
-
-
-class AncientGreekStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Ancient Greek."""
-
-    description: Optional[str] = "Stanza pipeline for the Ancient Greek language."
-    glottolog_id: Optional[str] = "anci1242"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing AncientGreekStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("AncientGreekStanzaPipeline created.")
-
-
-class AkkadianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Akkadian."""
-
-    description: Optional[str] = "Pipeline for the Akkadian language"
-    glottolog_id: Optional[str] = "akka1240"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            AkkadianSentenceSplittingProcess,
-            AkkadianGenAIMorphosyntaxProcess,
-            AkkadianGenAIDependencyProcess,
-            AkkadianGenAIEnrichmentProcess,
-            AkkadianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        assert self.language, "Language not found"
-        plog(self).debug(
-            f"Initializing AkkadianGenAIPipeline with language: {self.language.name}"
-        )
-        plog(self).info("AkkadianGenAIPipeline created.")
-
-
-class ClassicalArabicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Arabic."""
-
-    description: Optional[str] = "Pipeline for the Arabic language"
-    glottolog_id: Optional[str] = "clas1259"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ClassicalArabicSentenceSplittingProcess,
-            ClassicalArabicGenAIMorphosyntaxProcess,
-            ClassicalArabicGenAIDependencyProcess,
-            ClassicalArabicGenAIEnrichmentProcess,
-            ClassicalArabicGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing ArabicGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("ArabicGenAIPipeline created.")
-
-
-#
-class ClassicalSyriacGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Classical Syriac."""
-
-    description: Optional[str] = "Pipeline for the Classical Syriac language"
-    glottolog_id: Optional[str] = "clas1252"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ClassicalSyriacSentenceSplittingProcess,
-            ClassicalSyriacGenAIMorphosyntaxProcess,
-            ClassicalSyriacGenAIDependencyProcess,
-            ClassicalSyriacGenAIEnrichmentProcess,
-            ClassicalSyriacGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        assert self.language, "Language not found"
-        plog(self).debug(
-            f"Initializing ClassicalSyriacGenAIPipeline with language: {self.language.name}"
-        )
-        plog(self).info("ClassicalSyriacGenAIPipeline created.")
-
-
-# ClassicalTibetanPipeline
-class ClassicalTibetanPipeline(Pipeline):
-    """Default ``Pipeline`` for Classical Tibetan."""
-
-    description: Optional[str] = "Pipeline for the Classical Tibetan language"
-    glottolog_id: Optional[str] = "clas1254"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ClassicalTibetanSentenceSplittingProcess,
-            ClassicalTibetanGenAIMorphosyntaxProcess,
-            ClassicalTibetanGenAIDependencyProcess,
-            ClassicalTibetanGenAIEnrichmentProcess,
-            ClassicalTibetanGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        assert self.language, "Language not found"
-        plog(self).debug(
-            f"Initializing ClassicalTibetanGenAIPipeline with language: {self.language.name}"
-        )
-        plog(self).info("ClassicalTibetanGenAIPipeline created.")
-
-
-class CopticGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Coptic."""
-
-    description: Optional[str] = "OpenAI Pipeline for the Coptic language."
-    glottolog_id: Optional[str] = "copt1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            CopticSentenceSplittingProcess,
-            CopticGenAIMorphosyntaxProcess,
-            CopticGenAIDependencyProcess,
-            CopticGenAIEnrichmentProcess,
-            CopticGenAITranslationProcess,
-        ]
-    )
-
-
-class GothicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Gothic."""
-
-    description: Optional[str] = "Pipeline for the Gothic language"
-    glottolog_id: Optional[str] = "goth1244"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            GothicSentenceSplittingProcess,
-            GothicGenAIMorphosyntaxProcess,
-            GothicGenAIDependencyProcess,
-            GothicGenAIEnrichmentProcess,
-            GothicGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing GothicGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("GothicGenAIPipeline created.")
-
-
-class AncientGreekGenAIPipeline(Pipeline):
-    """Pipeline for Ancient Greek using normalization and OpenAI annotation only."""
-
-    description: Optional[str] = "Pipeline for Ancient Greek with OpenAI annotation"
-    glottolog_id: Optional[str] = "anci1242"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            # AncientGreekNormalizeProcess,
-            MultilingualNormalizeProcess,
-            AncientGreekSentenceSplittingProcess,
-            AncientGreekGenAIMorphosyntaxProcess,
-            AncientGreekGenAIDependencyProcess,
-            AncientGreekGenAIEnrichmentProcess,
-            AncientGreekGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing GreekGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("GreekGenAIPipeline created.")
-
-
-class BiblicalHebrewGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Ancient Hebrew."""
-
-    description: Optional[str] = "Pipeline for the Ancient Hebrew language."
-    glottolog_id: Optional[str] = "anci1244"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            AncientHebrewSentenceSplittingProcess,
-            BiblicalHebrewGenAIMorphosyntaxProcess,
-            BiblicalHebrewGenAIDependencyProcess,
-            BiblicalHebrewGenAIEnrichmentProcess,
-            BiblicalHebrewGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(f"Initializing LatinPipeline with language: {self.language}")
-        plog(self).info("LatinPipeline created.")
-
-
-class LatinGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Latin."""
-
-    description: Optional[str] = "OpenAI Pipeline for the Latin language."
-    glottolog_id: Optional[str] = "lati1261"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            # LatinNormalizeProcess,
-            MultilingualNormalizeProcess,
-            LatinSentenceSplittingProcess,
-            LatinGenAIMorphosyntaxProcess,
-            LatinGenAIDependencyProcess,
-            LatinGenAIEnrichmentProcess,
-            LatinGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(f"Initializing LatinPipeline with language: {self.language}")
-        plog(self).info("LatinPipeline created.")
-
-
-class MiddleEnglishGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle English."""
-
-    description: Optional[str] = "Pipeline for the Middle English language"
-    glottolog_id: Optional[str] = "midd1317"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleEnglishSentenceSplittingProcess,
-            MiddleEnglishGenAIMorphosyntaxProcess,
-            MiddleEnglishGenAIDependencyProcess,
-            MiddleEnglishGenAIEnrichmentProcess,
-            MiddleEnglishGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MiddleEnglishGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MiddleEnglishGenAIPipeline created.")
-
-
-class MiddleFrenchGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle French."""
-
-    description: Optional[str] = "Pipeline for the Middle French language"
-    glottolog_id: Optional[str] = "midd1316"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleFrenchSentenceSplittingProcess,
-            MiddleFrenchGenAIMorphosyntaxProcess,
-            MiddleFrenchGenAIDependencyProcess,
-            MiddleFrenchGenAIEnrichmentProcess,
-            MiddleFrenchGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MiddleFrenchGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MiddleFrenchGenAIPipeline created.")
-
-
-class MiddlePersianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle Persian (Pahlavi)."""
-
-    description: Optional[str] = "Pipeline for the Middle Persian (Pahlavi) language"
-    glottolog_id: Optional[str] = "pahl1241"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddlePersianSentenceSplittingProcess,
-            MiddlePersianGenAIMorphosyntaxProcess,
-            MiddlePersianGenAIDependencyProcess,
-            MiddlePersianGenAIEnrichmentProcess,
-            MiddlePersianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MiddlePersianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MiddlePersianGenAIPipeline created.")
-
-
-class ImperialAramaicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Official Aramaic."""
-
-    description: Optional[str] = "OpenAI Pipeline for the Official Aramaic language."
-    glottolog_id: Optional[str] = "impe1235"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OfficialAramaicSentenceSplittingProcess,
-            OfficialAramaicGenAIMorphosyntaxProcess,
-            OfficialAramaicGenAIDependencyProcess,
-            OfficialAramaicGenAIEnrichmentProcess,
-            OfficialAramaicGenAITranslationProcess,
-        ]
-    )
-
-
-class ChurchSlavonicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for (Old) Church Slavonic."""
-
-    description: Optional[str] = "Pipeline for the Church Slavonic language"
-    glottolog_id: Optional[str] = "chur1257"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ChurchSlavonicSentenceSplittingProcess,
-            ChurchSlavicGenAIMorphosyntaxProcess,
-            ChurchSlavicGenAIDependencyProcess,
-            ChurchSlavicGenAIEnrichmentProcess,
-            ChurchSlavicGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing ChurchSlavonicGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("ChurchSlavonicGenAIPipeline")
-
-
-class OldEnglishGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old English."""
-
-    description: Optional[str] = "Pipeline for the Old English language"
-    glottolog_id: Optional[str] = "olde1238"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldEnglishSentenceSplittingProcess,
-            OldEnglishGenAIMorphosyntaxProcess,
-            OldEnglishGenAIDependencyProcess,
-            OldEnglishGenAIEnrichmentProcess,
-            OldEnglishGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        assert self.language, "Language not found"
-        plog(self).debug(
-            f"Initializing OldEnglishGenAIPipeline with language: {self.language.name}"
-        )
-        plog(self).info("OldEnglishGenAIPipeline created.")
-
-
-class OldFrenchGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old French."""
-
-    description: Optional[str] = "Pipeline for the Old French language"
-    glottolog_id: Optional[str] = "oldf1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldFrenchSentenceSplittingProcess,
-            OldFrenchGenAIMorphosyntaxProcess,
-            OldFrenchGenAIDependencyProcess,
-            OldFrenchGenAIEnrichmentProcess,
-            OldFrenchGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldFrenchGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("OldFrenchGenAIPipeline created.")
-
-
-class OldNorseGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Norse."""
-
-    description: Optional[str] = "Pipeline for the Old Norse language"
-    glottolog_id: Optional[str] = "oldn1244"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldNorseSentenceSplittingProcess,
-            OldNorseGenAIMorphosyntaxProcess,
-            OldNorseGenAIDependencyProcess,
-            OldNorseGenAIEnrichmentProcess,
-            OldNorseGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldNorseGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("OldNorseGenAIPipeline created.")
-
-
-class PaliGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Pali."""
-
-    description: Optional[str] = "Pipeline for the Pali language"
-    glottolog_id: Optional[str] = "pali1273"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            PaliSentenceSplittingProcess,
-            PaliGenAIMorphosyntaxProcess,
-            PaliGenAIDependencyProcess,
-            PaliGenAIEnrichmentProcess,
-            PaliGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(f"Initializing PaliPipeline with language: {self.language}")
-        plog(self).info("PaliPipeline created.")
-
-
-class ClassicalSanskritGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Classical Sanskrit."""
-
-    description: Optional[str] = "Pipeline for the Classical Sanskrit language"
-    glottolog_id: Optional[str] = "vedi1234"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ClassicalSanskritSentenceSplittingProcess,
-            ClassicalSanskritGenAIMorphosyntaxProcess,
-            ClassicalSanskritGenAIDependencyProcess,
-            ClassicalSanskritGenAIEnrichmentProcess,
-            ClassicalSanskritGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing ClassicalSanskritGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("ClassicalSanskritGenAIPipeline created.")
-
-
-class VedicSanskritGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Vedic Sanskrit."""
-
-    description: Optional[str] = "Pipeline for the Vedic Sanskrit language"
-    glottolog_id: Optional[str] = "clas1258"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            VedicSanskritSentenceSplittingProcess,
-            VedicSanskritGenAIMorphosyntaxProcess,
-            VedicSanskritGenAIDependencyProcess,
-            VedicSanskritGenAIEnrichmentProcess,
-            VedicSanskritGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing VedicSanskritGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("VedicSanskritGenAIPipeline created.")
-
-
-class OldHighGermanGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old High German."""
-
-    description: Optional[str] = "Pipeline for the Old High German language"
-    glottolog_id: Optional[str] = "oldh1241"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            # MiddleHighGermanTokenizationProcess,  # Substitute with OldHighGermanTokenizationProcess if available
-            OldHighGermanSentenceSplittingProcess,
-            OldHighGermanGenAIMorphosyntaxProcess,
-            OldHighGermanGenAIDependencyProcess,
-            OldHighGermanGenAIEnrichmentProcess,
-            OldHighGermanGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldHighGermanGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("OldHighGermanGenAIPipeline created.")
-
-
-class MiddleHighGermanGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle High German."""
-
-    description: Optional[str] = "Pipeline for the Middle High German language"
-    glottolog_id: Optional[str] = "midd1343"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleHighGermanSentenceSplittingProcess,
-            MiddleHighGermanGenAIMorphosyntaxProcess,
-            MiddleHighGermanGenAIDependencyProcess,
-            MiddleHighGermanGenAIEnrichmentProcess,
-            MiddleHighGermanGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MiddleHighGermanGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MiddleHighGermanGenAIPipeline created.")
-
-
-class LiteraryChineseGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Literary (or Classical) Chinese."""
-
-    description: Optional[str] = (
-        "Pipeline for the Literary (or Classical) Chinese language"
-    )
-    glottolog_id: Optional[str] = "lite1248"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            LiteraryChineseSentenceSplittingProcess,
-            LiteraryChineseGenAIMorphosyntaxProcess,
-            LiteraryChineseGenAIDependencyProcess,
-            LiteraryChineseGenAIEnrichmentProcess,
-            LiteraryChineseGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LiteraryChineseGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("LiteraryChineseGenAIPipeline created.")
-
-
-class ChurchSlavonicStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Church Slavonic."""
-
-    description: Optional[str] = "Stanza pipeline for the Church Slavonic language."
-    glottolog_id: Optional[str] = "chur1257"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing ChurchSlavonicStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("ChurchSlavonicStanzaPipeline created.")
-
-
-class OldFrenchStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Old French."""
-
-    description: Optional[str] = "Stanza pipeline for the Old French language."
-    glottolog_id: Optional[str] = "oldf1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldFrenchStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("OldFrenchStanzaPipeline created.")
-
-
-class GothicStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Gothic."""
-
-    description: Optional[str] = "Stanza pipeline for the Gothic language."
-    glottolog_id: Optional[str] = "goth1244"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing GothicStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("GothicStanzaPipeline created.")
-
-
-class OldEnglishStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Old English."""
-
-    description: Optional[str] = "Stanza pipeline for the Old English language."
-    glottolog_id: Optional[str] = "olde1238"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldEnglishStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("OldEnglishStanzaPipeline created.")
-
-
-class LiteraryChineseStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Literary Chinese."""
-
-    description: Optional[str] = "Stanza pipeline for the Literary Chinese language."
-    glottolog_id: Optional[str] = "lite1248"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LiteraryChineseStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("LiteraryChineseStanzaPipeline created.")
-
-
-class OttomanTurkishStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Ottoman Turkish."""
-
-    description: Optional[str] = "Stanza pipeline for the Ottoman Turkish language."
-    glottolog_id: Optional[str] = "otto1234"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OttomanTurkishStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("OttomanTurkishStanzaPipeline created.")
-
-
-class ClassicalArmenianStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Classical Armenian."""
-
-    description: Optional[str] = "Stanza pipeline for the Classical Armenian language."
-    glottolog_id: Optional[str] = "clas1256"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing ClassicalArmenianStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("ClassicalArmenianStanzaPipeline created.")
-
-
-class CopticStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Coptic."""
-
-    description: Optional[str] = "Stanza pipeline for the Coptic language."
-    glottolog_id: Optional[str] = "copt1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            CopticSentenceSplittingProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing CopticStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("CopticStanzaPipeline created.")
-
-
-class OldRussianStanzaPipeline(StanzaPipeline):
-    """Stanza-backed pipeline for Old Russian (Old East Slavic)."""
-
-    description: Optional[str] = "Stanza pipeline for the Old Russian language."
-    glottolog_id: Optional[str] = "oldr1238"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            RuntimeStanzaAnalyzeProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldRussianStanzaPipeline with language: {self.language}"
-        )
-        plog(self).info("OldRussianStanzaPipeline created.")
-
-
-class DemoticGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Demotic Egyptian."""
-
-    description: Optional[str] = "Pipeline for the Demotic Egyptian language"
-    glottolog_id: Optional[str] = "demo1234"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            DemoticSentenceSplittingProcess,
-            DemoticGenAIMorphosyntaxProcess,
-            DemoticGenAIDependencyProcess,
-            DemoticGenAIEnrichmentProcess,
-            DemoticGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing DemoticGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("DemoticGenAIPipeline created.")
-
-
-class HittiteGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Hittite."""
-
-    description: Optional[str] = "Pipeline for the Hittite language"
-    glottolog_id: Optional[str] = "hitt1242"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            HittiteSentenceSplittingProcess,
-            HittiteGenAIMorphosyntaxProcess,
-            HittiteGenAIDependencyProcess,
-            HittiteGenAIEnrichmentProcess,
-            HittiteGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing HittiteGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("HittiteGenAIPipeline created.")
-
-
-class TocharianAGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Tocharian A."""
-
-    description: Optional[str] = "Pipeline for the Tocharian A language"
-    glottolog_id: Optional[str] = "toch1238"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            TocharianASentenceSplittingProcess,
-            TokharianAGenAIMorphosyntaxProcess,
-            TokharianAGenAIDependencyProcess,
-            TokharianAGenAIEnrichmentProcess,
-            TokharianAGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing TocharianAGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("TocharianAGenAIPipeline created.")
-
-
-class TocharianBGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Tocharian B."""
+class _PipelineRow(NamedTuple):
+    """Field defaults for one generated pipeline class."""
 
-    description: Optional[str] = "Pipeline for the Tocharian B language"
-    glottolog_id: Optional[str] = "toch1237"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            TocharianBSentenceSplittingProcess,
-            TokharianBGenAIMorphosyntaxProcess,
-            TokharianBGenAIDependencyProcess,
-            TokharianBGenAIEnrichmentProcess,
-            TokharianBGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing TocharianBGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("TocharianBGenAIPipeline created.")
-
-
-class AvestanGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Avestan."""
-
-    description: Optional[str] = "Pipeline for the Avestan language"
-    glottolog_id: Optional[str] = "aves1237"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            AvestanSentenceSplittingProcess,
-            AvestanGenAIMorphosyntaxProcess,
-            AvestanGenAIDependencyProcess,
-            AvestanGenAIEnrichmentProcess,
-            AvestanGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing AvestanGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("AvestanGenAIPipeline created.")
-
-
-class BactrianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Bactrian."""
-
-    description: Optional[str] = "Pipeline for the Bactrian language"
-    glottolog_id: Optional[str] = "bact1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            BactrianSentenceSplittingProcess,
-            BactrianGenAIMorphosyntaxProcess,
-            BactrianGenAIDependencyProcess,
-            BactrianGenAIEnrichmentProcess,
-            BactrianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing BactrianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("BactrianGenAIPipeline created.")
-
-
-class SogdianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Sogdian."""
-
-    description: Optional[str] = "Pipeline for the Sogdian language"
-    glottolog_id: Optional[str] = "sogd1245"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            SogdianSentenceSplittingProcess,
-            SogdianGenAIMorphosyntaxProcess,
-            SogdianGenAIDependencyProcess,
-            SogdianGenAIEnrichmentProcess,
-            SogdianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing SogdianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("SogdianGenAIPipeline created.")
-
-
-class KhotaneseGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Khotanese."""
-
-    description: Optional[str] = "Pipeline for the Khotanese language"
-    glottolog_id: Optional[str] = "khot1251"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            KhotaneseSentenceSplittingProcess,
-            KhotaneseGenAIMorphosyntaxProcess,
-            KhotaneseGenAIDependencyProcess,
-            KhotaneseGenAIEnrichmentProcess,
-            KhotaneseGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing KhotaneseGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("KhotaneseGenAIPipeline created.")
-
-
-class TumshuqeseGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Tumshuqese."""
-
-    description: Optional[str] = "Pipeline for the Tumshuqese language"
-    glottolog_id: Optional[str] = "tums1237"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            TumshuqeseSentenceSplittingProcess,
-            TumshuqeseGenAIMorphosyntaxProcess,
-            TumshuqeseGenAIDependencyProcess,
-            TumshuqeseGenAIEnrichmentProcess,
-            TumshuqeseGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing TumshuqeseGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("TumshuqeseGenAIPipeline created.")
-
-
-class OldPersianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Persian."""
-
-    description: Optional[str] = "Pipeline for the Old Persian language"
-    glottolog_id: Optional[str] = "oldp1254"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldPersianSentenceSplittingProcess,
-            OldPersianGenAIMorphosyntaxProcess,
-            OldPersianGenAIDependencyProcess,
-            OldPersianGenAIEnrichmentProcess,
-            OldPersianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldPersianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("OldPersianGenAIPipeline created.")
+    glottolog_id: str
+    description: str
+    doc: str
+    processes: tuple[str, ...]  # process class names, in run order
 
 
-class EarlyIrishGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Irish."""
-
-    description: Optional[str] = "Pipeline for the Old Irish language"
-    glottolog_id: Optional[str] = "oldi1245"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            EarlyIrishSentenceSplittingProcess,
-            EarlyIrishGenAIMorphosyntaxProcess,
-            EarlyIrishGenAIDependencyProcess,
-            EarlyIrishGenAIEnrichmentProcess,
-            EarlyIrishGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldIrishGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("OldIrishGenAIPipeline created.")
-
-
-class UgariticGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Ugaritic."""
-
-    description: Optional[str] = "Pipeline for the Ugaritic language"
-    glottolog_id: Optional[str] = "ugar1238"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            UgariticSentenceSplittingProcess,
-            UgariticGenAIMorphosyntaxProcess,
-            UgariticGenAIDependencyProcess,
-            UgariticGenAIEnrichmentProcess,
-            UgariticGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing UgariticGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("UgariticGenAIPipeline created.")
-
-
-class PhoenicianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Phoenician (Punic)."""
-
-    description: Optional[str] = "Pipeline for the Phoenician (Punic) language"
-    glottolog_id: Optional[str] = "phoe1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            PhoenicianSentenceSplittingProcess,
-            PhoenicianGenAIMorphosyntaxProcess,
-            PhoenicianGenAIDependencyProcess,
-            PhoenicianGenAIEnrichmentProcess,
-            PhoenicianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing PhoenicianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("PhoenicianGenAIPipeline created.")
-
-
-class GeezGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Geʿez (Classical Ethiopic)."""
-
-    description: Optional[str] = "Pipeline for the Geʿez (Classical Ethiopic) language"
-    glottolog_id: Optional[str] = "geez1241"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            GeezSentenceSplittingProcess,
-            GeezGenAIMorphosyntaxProcess,
-            GeezGenAIDependencyProcess,
-            GeezGenAIEnrichmentProcess,
-            GeezGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing GeezGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("GeezGenAIPipeline created.")
-
+_STANZA_PROCESSES: tuple[str, ...] = (
+    "MultilingualNormalizeProcess",
+    "StanzaAnalyzeProcess",
+)
 
-class MiddleEgyptianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle Egyptian."""
 
-    description: Optional[str] = "Pipeline for the Middle Egyptian language"
-    glottolog_id: Optional[str] = "midd1369"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleEgyptianSentenceSplittingProcess,
-            MiddleEgyptianGenAIMorphosyntaxProcess,
-            MiddleEgyptianGenAIDependencyProcess,
-            MiddleEgyptianGenAIEnrichmentProcess,
-            MiddleEgyptianGenAITranslationProcess,
-        ]
-    )
+def _genai_processes(stem: str, sentence_stem: Optional[str] = None) -> tuple[str, ...]:
+    """Return the standard generative stage names for a language class stem."""
+    return (
+        "MultilingualNormalizeProcess",
+        f"{sentence_stem or stem}SentenceSplittingProcess",
+        f"{stem}GenAIMorphosyntaxProcess",
+        f"{stem}GenAIDependencyProcess",
+        f"{stem}GenAIEnrichmentProcess",
+        f"{stem}GenAITranslationProcess",
+    )
+
+
+# Stanza-backed pipelines: class name -> row.
+_STANZA_PIPELINES: dict[str, _PipelineRow] = {
+    "LatinStanzaPipeline": _PipelineRow(
+        "lati1261",
+        "Stanza pipeline for the Latin language.",
+        "Stanza-backed pipeline for Latin.",
+        _STANZA_PROCESSES,
+    ),
+    "AncientGreekStanzaPipeline": _PipelineRow(
+        "anci1242",
+        "Stanza pipeline for the Ancient Greek language.",
+        "Stanza-backed pipeline for Ancient Greek.",
+        _STANZA_PROCESSES,
+    ),
+    "ChurchSlavonicStanzaPipeline": _PipelineRow(
+        "chur1257",
+        "Stanza pipeline for the Church Slavonic language.",
+        "Stanza-backed pipeline for Church Slavonic.",
+        _STANZA_PROCESSES,
+    ),
+    "OldFrenchStanzaPipeline": _PipelineRow(
+        "oldf1239",
+        "Stanza pipeline for the Old French language.",
+        "Stanza-backed pipeline for Old French.",
+        _STANZA_PROCESSES,
+    ),
+    "GothicStanzaPipeline": _PipelineRow(
+        "goth1244",
+        "Stanza pipeline for the Gothic language.",
+        "Stanza-backed pipeline for Gothic.",
+        _STANZA_PROCESSES,
+    ),
+    "OldEnglishStanzaPipeline": _PipelineRow(
+        "olde1238",
+        "Stanza pipeline for the Old English language.",
+        "Stanza-backed pipeline for Old English.",
+        _STANZA_PROCESSES,
+    ),
+    "LiteraryChineseStanzaPipeline": _PipelineRow(
+        "lite1248",
+        "Stanza pipeline for the Literary Chinese language.",
+        "Stanza-backed pipeline for Literary Chinese.",
+        _STANZA_PROCESSES,
+    ),
+    "OttomanTurkishStanzaPipeline": _PipelineRow(
+        "otto1234",
+        "Stanza pipeline for the Ottoman Turkish language.",
+        "Stanza-backed pipeline for Ottoman Turkish.",
+        _STANZA_PROCESSES,
+    ),
+    "ClassicalArmenianStanzaPipeline": _PipelineRow(
+        "clas1256",
+        "Stanza pipeline for the Classical Armenian language.",
+        "Stanza-backed pipeline for Classical Armenian.",
+        _STANZA_PROCESSES,
+    ),
+    "CopticStanzaPipeline": _PipelineRow(
+        "copt1239",
+        "Stanza pipeline for the Coptic language.",
+        "Stanza-backed pipeline for Coptic.",
+        (
+            "MultilingualNormalizeProcess",
+            "CopticSentenceSplittingProcess",
+            "StanzaAnalyzeProcess",
+        ),
+    ),
+    "OldRussianStanzaPipeline": _PipelineRow(
+        "oldr1238",
+        "Stanza pipeline for the Old Russian language.",
+        "Stanza-backed pipeline for Old Russian (Old East Slavic).",
+        _STANZA_PROCESSES,
+    ),
+}
 
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MiddleEgyptianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MiddleEgyptianGenAIPipeline created.")
+# Generative (LLM-backed) pipelines: class name -> row.
+_GENAI_PIPELINES: dict[str, _PipelineRow] = {
+    "AkkadianGenAIPipeline": _PipelineRow(
+        "akka1240",
+        "Pipeline for the Akkadian language",
+        "Default ``Pipeline`` for Akkadian.",
+        _genai_processes("Akkadian"),
+    ),
+    "ClassicalArabicGenAIPipeline": _PipelineRow(
+        "clas1259",
+        "Pipeline for the Arabic language",
+        "Default ``Pipeline`` for Arabic.",
+        _genai_processes("ClassicalArabic"),
+    ),
+    "ClassicalSyriacGenAIPipeline": _PipelineRow(
+        "clas1252",
+        "Pipeline for the Classical Syriac language",
+        "Default ``Pipeline`` for Classical Syriac.",
+        _genai_processes("ClassicalSyriac"),
+    ),
+    "ClassicalTibetanPipeline": _PipelineRow(
+        "clas1254",
+        "Pipeline for the Classical Tibetan language",
+        "Default ``Pipeline`` for Classical Tibetan.",
+        _genai_processes("ClassicalTibetan"),
+    ),
+    "CopticGenAIPipeline": _PipelineRow(
+        "copt1239",
+        "OpenAI Pipeline for the Coptic language.",
+        "Default ``Pipeline`` for Coptic.",
+        _genai_processes("Coptic"),
+    ),
+    "GothicGenAIPipeline": _PipelineRow(
+        "goth1244",
+        "Pipeline for the Gothic language",
+        "Default ``Pipeline`` for Gothic.",
+        _genai_processes("Gothic"),
+    ),
+    "AncientGreekGenAIPipeline": _PipelineRow(
+        "anci1242",
+        "Pipeline for Ancient Greek with OpenAI annotation",
+        "Pipeline for Ancient Greek using normalization and OpenAI annotation only.",
+        _genai_processes("AncientGreek"),
+    ),
+    "BiblicalHebrewGenAIPipeline": _PipelineRow(
+        "anci1244",
+        "Pipeline for the Ancient Hebrew language.",
+        "Default ``Pipeline`` for Ancient Hebrew.",
+        _genai_processes("BiblicalHebrew", sentence_stem="AncientHebrew"),
+    ),
+    "LatinGenAIPipeline": _PipelineRow(
+        "lati1261",
+        "OpenAI Pipeline for the Latin language.",
+        "Default ``Pipeline`` for Latin.",
+        _genai_processes("Latin"),
+    ),
+    "MiddleEnglishGenAIPipeline": _PipelineRow(
+        "midd1317",
+        "Pipeline for the Middle English language",
+        "Default ``Pipeline`` for Middle English.",
+        _genai_processes("MiddleEnglish"),
+    ),
+    "MiddleFrenchGenAIPipeline": _PipelineRow(
+        "midd1316",
+        "Pipeline for the Middle French language",
+        "Default ``Pipeline`` for Middle French.",
+        _genai_processes("MiddleFrench"),
+    ),
+    "MiddlePersianGenAIPipeline": _PipelineRow(
+        "pahl1241",
+        "Pipeline for the Middle Persian (Pahlavi) language",
+        "Default ``Pipeline`` for Middle Persian (Pahlavi).",
+        _genai_processes("MiddlePersian"),
+    ),
+    "ImperialAramaicGenAIPipeline": _PipelineRow(
+        "impe1235",
+        "OpenAI Pipeline for the Official Aramaic language.",
+        "Default ``Pipeline`` for Official Aramaic.",
+        _genai_processes("OfficialAramaic"),
+    ),
+    "ChurchSlavonicGenAIPipeline": _PipelineRow(
+        "chur1257",
+        "Pipeline for the Church Slavonic language",
+        "Default ``Pipeline`` for (Old) Church Slavonic.",
+        _genai_processes("ChurchSlavic", sentence_stem="ChurchSlavonic"),
+    ),
+    "OldEnglishGenAIPipeline": _PipelineRow(
+        "olde1238",
+        "Pipeline for the Old English language",
+        "Default ``Pipeline`` for Old English.",
+        _genai_processes("OldEnglish"),
+    ),
+    "OldFrenchGenAIPipeline": _PipelineRow(
+        "oldf1239",
+        "Pipeline for the Old French language",
+        "Default ``Pipeline`` for Old French.",
+        _genai_processes("OldFrench"),
+    ),
+    "OldNorseGenAIPipeline": _PipelineRow(
+        "oldn1244",
+        "Pipeline for the Old Norse language",
+        "Default ``Pipeline`` for Old Norse.",
+        _genai_processes("OldNorse"),
+    ),
+    "PaliGenAIPipeline": _PipelineRow(
+        "pali1273",
+        "Pipeline for the Pali language",
+        "Default ``Pipeline`` for Pali.",
+        _genai_processes("Pali"),
+    ),
+    "ClassicalSanskritGenAIPipeline": _PipelineRow(
+        "vedi1234",
+        "Pipeline for the Classical Sanskrit language",
+        "Default ``Pipeline`` for Classical Sanskrit.",
+        _genai_processes("ClassicalSanskrit"),
+    ),
+    "VedicSanskritGenAIPipeline": _PipelineRow(
+        "clas1258",
+        "Pipeline for the Vedic Sanskrit language",
+        "Default ``Pipeline`` for Vedic Sanskrit.",
+        _genai_processes("VedicSanskrit"),
+    ),
+    "OldHighGermanGenAIPipeline": _PipelineRow(
+        "oldh1241",
+        "Pipeline for the Old High German language",
+        "Default ``Pipeline`` for Old High German.",
+        _genai_processes("OldHighGerman"),
+    ),
+    "MiddleHighGermanGenAIPipeline": _PipelineRow(
+        "midd1343",
+        "Pipeline for the Middle High German language",
+        "Default ``Pipeline`` for Middle High German.",
+        _genai_processes("MiddleHighGerman"),
+    ),
+    "LiteraryChineseGenAIPipeline": _PipelineRow(
+        "lite1248",
+        "Pipeline for the Literary (or Classical) Chinese language",
+        "Default ``Pipeline`` for Literary (or Classical) Chinese.",
+        _genai_processes("LiteraryChinese"),
+    ),
+    "DemoticGenAIPipeline": _PipelineRow(
+        "demo1234",
+        "Pipeline for the Demotic Egyptian language",
+        "Default ``Pipeline`` for Demotic Egyptian.",
+        _genai_processes("Demotic"),
+    ),
+    "HittiteGenAIPipeline": _PipelineRow(
+        "hitt1242",
+        "Pipeline for the Hittite language",
+        "Default ``Pipeline`` for Hittite.",
+        _genai_processes("Hittite"),
+    ),
+    "TocharianAGenAIPipeline": _PipelineRow(
+        "toch1238",
+        "Pipeline for the Tocharian A language",
+        "Default ``Pipeline`` for Tocharian A.",
+        _genai_processes("TokharianA", sentence_stem="TocharianA"),
+    ),
+    "TocharianBGenAIPipeline": _PipelineRow(
+        "toch1237",
+        "Pipeline for the Tocharian B language",
+        "Default ``Pipeline`` for Tocharian B.",
+        _genai_processes("TokharianB", sentence_stem="TocharianB"),
+    ),
+    "AvestanGenAIPipeline": _PipelineRow(
+        "aves1237",
+        "Pipeline for the Avestan language",
+        "Default ``Pipeline`` for Avestan.",
+        _genai_processes("Avestan"),
+    ),
+    "BactrianGenAIPipeline": _PipelineRow(
+        "bact1239",
+        "Pipeline for the Bactrian language",
+        "Default ``Pipeline`` for Bactrian.",
+        _genai_processes("Bactrian"),
+    ),
+    "SogdianGenAIPipeline": _PipelineRow(
+        "sogd1245",
+        "Pipeline for the Sogdian language",
+        "Default ``Pipeline`` for Sogdian.",
+        _genai_processes("Sogdian"),
+    ),
+    "KhotaneseGenAIPipeline": _PipelineRow(
+        "khot1251",
+        "Pipeline for the Khotanese language",
+        "Default ``Pipeline`` for Khotanese.",
+        _genai_processes("Khotanese"),
+    ),
+    "TumshuqeseGenAIPipeline": _PipelineRow(
+        "tums1237",
+        "Pipeline for the Tumshuqese language",
+        "Default ``Pipeline`` for Tumshuqese.",
+        _genai_processes("Tumshuqese"),
+    ),
+    "OldPersianGenAIPipeline": _PipelineRow(
+        "oldp1254",
+        "Pipeline for the Old Persian language",
+        "Default ``Pipeline`` for Old Persian.",
+        _genai_processes("OldPersian"),
+    ),
+    "EarlyIrishGenAIPipeline": _PipelineRow(
+        "oldi1245",
+        "Pipeline for the Old Irish language",
+        "Default ``Pipeline`` for Old Irish.",
+        _genai_processes("EarlyIrish"),
+    ),
+    "UgariticGenAIPipeline": _PipelineRow(
+        "ugar1238",
+        "Pipeline for the Ugaritic language",
+        "Default ``Pipeline`` for Ugaritic.",
+        _genai_processes("Ugaritic"),
+    ),
+    "PhoenicianGenAIPipeline": _PipelineRow(
+        "phoe1239",
+        "Pipeline for the Phoenician (Punic) language",
+        "Default ``Pipeline`` for Phoenician (Punic).",
+        _genai_processes("Phoenician"),
+    ),
+    "GeezGenAIPipeline": _PipelineRow(
+        "geez1241",
+        "Pipeline for the Geʿez (Classical Ethiopic) language",
+        "Default ``Pipeline`` for Geʿez (Classical Ethiopic).",
+        _genai_processes("Geez"),
+    ),
+    "MiddleEgyptianGenAIPipeline": _PipelineRow(
+        "midd1369",
+        "Pipeline for the Middle Egyptian language",
+        "Default ``Pipeline`` for Middle Egyptian.",
+        _genai_processes("MiddleEgyptian"),
+    ),
+    "OldEgyptianGenAIPipeline": _PipelineRow(
+        "olde1242",
+        "Pipeline for the Old Egyptian language",
+        "Default ``Pipeline`` for Old Egyptian.",
+        _genai_processes("OldEgyptian"),
+    ),
+    "LateEgyptianGenAIPipeline": _PipelineRow(
+        "late1256",
+        "Pipeline for the Late Egyptian language",
+        "Default ``Pipeline`` for Late Egyptian.",
+        _genai_processes("LateEgyptian"),
+    ),
+    "ParthianGenAIPipeline": _PipelineRow(
+        "part1239",
+        "Pipeline for the Parthian language",
+        "Default ``Pipeline`` for Parthian.",
+        _genai_processes("Parthian"),
+    ),
+    "OldMiddleWelshGenAIPipeline": _PipelineRow(
+        "oldw1239",
+        "Pipeline for the Middle Welsh language",
+        "Default ``Pipeline`` for Middle Welsh.",
+        _genai_processes("OldMiddleWelsh"),
+    ),
+    "MiddleBretonGenAIPipeline": _PipelineRow(
+        "oldb1244",
+        "Pipeline for the Middle Breton language",
+        "Default ``Pipeline`` for Middle Breton.",
+        _genai_processes("MiddleBreton"),
+    ),
+    "MiddleCornishGenAIPipeline": _PipelineRow(
+        "corn1251",
+        "Pipeline for the Cornish language",
+        "Default ``Pipeline`` for Cornish.",
+        _genai_processes("MiddleCornish"),
+    ),
+    "OldPrussianGenAIPipeline": _PipelineRow(
+        "prus1238",
+        "Pipeline for the Old Prussian language",
+        "Default ``Pipeline`` for Old Prussian.",
+        _genai_processes("OldPrussian"),
+    ),
+    "LithuanianGenAIPipeline": _PipelineRow(
+        "lith1251",
+        "Pipeline for the Lithuanian language",
+        "Default ``Pipeline`` for Lithuanian.",
+        _genai_processes("Lithuanian"),
+    ),
+    "LatvianGenAIPipeline": _PipelineRow(
+        "latv1249",
+        "Pipeline for the Latvian language",
+        "Default ``Pipeline`` for Latvian.",
+        _genai_processes("Latvian"),
+    ),
+    "AlbanianGenAIPipeline": _PipelineRow(
+        "gheg1238",
+        "Pipeline for the Albanian language",
+        "Default ``Pipeline`` for Albanian.",
+        _genai_processes("Albanian"),
+    ),
+    "ClassicalArmenianGenAIPipeline": _PipelineRow(
+        "clas1256",
+        "Pipeline for the Classical Armenian language",
+        "Default ``Pipeline`` for Classical Armenian.",
+        _genai_processes("ClassicalArmenian"),
+    ),
+    "MiddleArmenianGenAIPipeline": _PipelineRow(
+        "midd1364",
+        "Pipeline for the Middle Armenian language",
+        "Default ``Pipeline`` for Middle Armenian.",
+        _genai_processes("MiddleArmenian"),
+    ),
+    "CuneiformLuwianGenAIPipeline": _PipelineRow(
+        "cune1239",
+        "Pipeline for the Cuneiform Luwian language",
+        "Default ``Pipeline`` for Cuneiform Luwian.",
+        _genai_processes("CuneiformLuwian"),
+    ),
+    "HieroglyphicLuwianGenAIPipeline": _PipelineRow(
+        "hier1240",
+        "Pipeline for the Hieroglyphic Luwian language",
+        "Default ``Pipeline`` for Hieroglyphic Luwian.",
+        _genai_processes("HieroglyphicLuwian"),
+    ),
+    "LycianAGenAIPipeline": _PipelineRow(
+        "lyci1241",
+        "Pipeline for the Lycian language",
+        "Default ``Pipeline`` for Lycian.",
+        _genai_processes("LycianA"),
+    ),
+    "LydianGenAIPipeline": _PipelineRow(
+        "lydi1241",
+        "Pipeline for the Lydian language",
+        "Default ``Pipeline`` for Lydian.",
+        _genai_processes("Lydian"),
+    ),
+    "PalaicGenAIPipeline": _PipelineRow(
+        "pala1331",
+        "Pipeline for the Palaic language",
+        "Default ``Pipeline`` for Palaic.",
+        _genai_processes("Palaic"),
+    ),
+    "CarianGenAIPipeline": _PipelineRow(
+        "cari1274",
+        "Pipeline for the Carian language",
+        "Default ``Pipeline`` for Carian.",
+        _genai_processes("Carian"),
+    ),
+    "SauraseniPrakritGenAIPipeline": _PipelineRow(
+        "saur1252",
+        "Pipeline for the Sauraseni Prakrit language",
+        "Default ``Pipeline`` for Sauraseni Prakrit.",
+        _genai_processes("SauraseniPrakrit"),
+    ),
+    "MaharastriPrakritGenAIPipeline": _PipelineRow(
+        "maha1305",
+        "Pipeline for the Maharastri Prakrit language",
+        "Default ``Pipeline`` for Maharastri Prakrit.",
+        _genai_processes("MaharastriPrakrit"),
+    ),
+    "MagadhiPrakritGenAIPipeline": _PipelineRow(
+        "maga1260",
+        "Pipeline for the Magadhi Prakrit language",
+        "Default ``Pipeline`` for Magadhi Prakrit.",
+        _genai_processes("MagadhiPrakrit"),
+    ),
+    "GandhariGenAIPipeline": _PipelineRow(
+        "gand1259",
+        "Pipeline for the Gandhari language",
+        "Default ``Pipeline`` for Gandhari.",
+        _genai_processes("Gandhari"),
+    ),
+    "HindiGenAIPipeline": _PipelineRow(
+        "hind1269",
+        "Pipeline for the Hindi language",
+        "Default ``Pipeline`` for Hindi (glottocode hind1269).",
+        _genai_processes("Hindi"),
+    ),
+    "KhariBoliGenAIPipeline": _PipelineRow(
+        "khad1239",
+        "Pipeline for the Khari Boli dialect of Hindi",
+        "Default ``Pipeline`` for Khari Boli (Hindi dialect).",
+        _genai_processes("KhariBoli"),
+    ),
+    "BrajGenAIPipeline": _PipelineRow(
+        "braj1242",
+        "Pipeline for the Braj Bhasha language",
+        "Default ``Pipeline`` for Braj Bhasha.",
+        _genai_processes("Braj"),
+    ),
+    "AwadhiGenAIPipeline": _PipelineRow(
+        "awad1243",
+        "Pipeline for the Awadhi language",
+        "Default ``Pipeline`` for Awadhi.",
+        _genai_processes("Awadhi"),
+    ),
+    "UrduGenAIPipeline": _PipelineRow(
+        "urdu1245",
+        "Pipeline for the Urdu language",
+        "Default ``Pipeline`` for Urdu.",
+        _genai_processes("Urdu"),
+    ),
+    "BengaliGenAIPipeline": _PipelineRow(
+        "beng1280",
+        "Pipeline for the Bengali language",
+        "Default ``Pipeline`` for Bengali.",
+        _genai_processes("Bengali"),
+    ),
+    "OdiaGenAIPipeline": _PipelineRow(
+        "oriy1255",
+        "Pipeline for the Odia language",
+        "Default ``Pipeline`` for Odia (Oriya).",
+        _genai_processes("Odia"),
+    ),
+    "AssameseGenAIPipeline": _PipelineRow(
+        "assa1263",
+        "Pipeline for the Assamese language",
+        "Default ``Pipeline`` for Assamese.",
+        _genai_processes("Assamese"),
+    ),
+    "GujaratiGenAIPipeline": _PipelineRow(
+        "guja1252",
+        "Pipeline for the Gujarati language",
+        "Default ``Pipeline`` for Gujarati.",
+        _genai_processes("Gujarati"),
+    ),
+    "MarathiGenAIPipeline": _PipelineRow(
+        "mara1378",
+        "Pipeline for the Marathi language",
+        "Default ``Pipeline`` for Marathi.",
+        _genai_processes("Marathi"),
+    ),
+    "SinhalaGenAIPipeline": _PipelineRow(
+        "sinh1246",
+        "Pipeline for the Sinhala language",
+        "Default ``Pipeline`` for Sinhala.",
+        _genai_processes("Sinhala"),
+    ),
+    "EasternPanjabiGenAIPipeline": _PipelineRow(
+        "panj1256",
+        "Pipeline for the Eastern Panjabi language",
+        "Default ``Pipeline`` for Eastern Panjabi.",
+        _genai_processes("EasternPanjabi", sentence_stem="Panjabi"),
+    ),
+    "SindhiGenAIPipeline": _PipelineRow(
+        "sind1272",
+        "Pipeline for the Sindhi language",
+        "Default ``Pipeline`` for Sindhi.",
+        _genai_processes("Sindhi"),
+    ),
+    "KashmiriGenAIPipeline": _PipelineRow(
+        "kash1277",
+        "Pipeline for the Kashmiri language",
+        "Default ``Pipeline`` for Kashmiri.",
+        _genai_processes("Kashmiri"),
+    ),
+    "OldChineseGenAIPipeline": _PipelineRow(
+        "oldc1244",
+        "Pipeline for Old Chinese",
+        "Pipeline for Old Chinese.",
+        _genai_processes("OldChinese"),
+    ),
+    "MiddleChineseGenAIPipeline": _PipelineRow(
+        "midd1344",
+        "Pipeline for Middle Chinese",
+        "Pipeline for Middle Chinese.",
+        _genai_processes("MiddleChinese"),
+    ),
+    "BaihuaChineseGenAIPipeline": _PipelineRow(
+        "clas1255",
+        "Pipeline for Early Vernacular Chinese (Baihua)",
+        "Pipeline for Early Vernacular Chinese (Baihua).",
+        _genai_processes("BaihuaChinese"),
+    ),
+    "OldBurmeseGenAIPipeline": _PipelineRow(
+        "oldb1235",
+        "Pipeline for Old Burmese",
+        "Pipeline for Old Burmese.",
+        _genai_processes("OldBurmese"),
+    ),
+    "ClassicalBurmeseGenAIPipeline": _PipelineRow(
+        "nucl1310",
+        "Pipeline for Classical Burmese",
+        "Pipeline for Classical/Nuclear Burmese.",
+        _genai_processes("ClassicalBurmese"),
+    ),
+    "TangutGenAIPipeline": _PipelineRow(
+        "tang1334",
+        "Pipeline for the Tangut language",
+        "Pipeline for Tangut (Xixia).",
+        _genai_processes("Tangut"),
+    ),
+    "NewarGenAIPipeline": _PipelineRow(
+        "newa1246",
+        "Pipeline for the Newar language",
+        "Pipeline for Newar (Classical Nepal Bhasa).",
+        _genai_processes("Newar"),
+    ),
+    "MeiteiGenAIPipeline": _PipelineRow(
+        "mani1292",
+        "Pipeline for the Meitei (Classical Manipuri) language",
+        "Pipeline for Meitei (Classical Manipuri).",
+        _genai_processes("Meitei"),
+    ),
+    "SgawKarenGenAIPipeline": _PipelineRow(
+        "sgaw1245",
+        "Pipeline for the Sgaw Karen language",
+        "Pipeline for Sgaw Karen.",
+        _genai_processes("SgawKaren"),
+    ),
+    "MiddleMongolGenAIPipeline": _PipelineRow(
+        "midd1351",
+        "Pipeline for the Middle Mongol language",
+        "Pipeline for Middle Mongol.",
+        _genai_processes("MiddleMongol"),
+    ),
+    "ClassicalMongolianGenAIPipeline": _PipelineRow(
+        "mong1331",
+        "Pipeline for the Classical Mongolian language",
+        "Pipeline for Classical Mongolian.",
+        _genai_processes("ClassicalMongolian"),
+    ),
+    "MogholiGenAIPipeline": _PipelineRow(
+        "mogh1245",
+        "Pipeline for the Mogholi (Moghol) language",
+        "Pipeline for Mogholi (Moghol).",
+        _genai_processes("Mogholi"),
+    ),
+    "BagriGenAIPipeline": _PipelineRow(
+        "bagr1243",
+        "Pipeline for the Bagri (Rajasthani) language",
+        "Default ``Pipeline`` for Bagri (Rajasthani).",
+        _genai_processes("Bagri"),
+    ),
+    "NumidianGenAIPipeline": _PipelineRow(
+        "numi1241",
+        "Pipeline for the Numidian (Ancient Berber) language",
+        "Default ``Pipeline`` for Numidian (Ancient Berber).",
+        _genai_processes("Numidian"),
+    ),
+    "TaitaGenAIPipeline": _PipelineRow(
+        "tait1247",
+        "Pipeline for the Cushitic Taita language",
+        "Default ``Pipeline`` for Taita (Cushitic).",
+        _genai_processes("Taita"),
+    ),
+    "HausaGenAIPipeline": _PipelineRow(
+        "haus1257",
+        "Pipeline for the Hausa language",
+        "Default ``Pipeline`` for Hausa.",
+        _genai_processes("Hausa"),
+    ),
+    "OldJurchenGenAIPipeline": _PipelineRow(
+        "jurc1239",
+        "Pipeline for the Old Jurchen language",
+        "Default ``Pipeline`` for Old Jurchen.",
+        _genai_processes("OldJurchen"),
+    ),
+    "OldJapaneseGenAIPipeline": _PipelineRow(
+        "japo1237",
+        "Pipeline for the Old Japanese language",
+        "Default ``Pipeline`` for Old Japanese.",
+        _genai_processes("OldJapanese"),
+    ),
+    "OldHungarianGenAIPipeline": _PipelineRow(
+        "oldh1242",
+        "Pipeline for the Old Hungarian language",
+        "Default ``Pipeline`` for Old Hungarian.",
+        _genai_processes("OldHungarian"),
+    ),
+    "ChagataiGenAIPipeline": _PipelineRow(
+        "chag1247",
+        "Pipeline for the Chagatai language",
+        "Default ``Pipeline`` for Chagatai.",
+        _genai_processes("Chagatai"),
+    ),
+    "OldTurkicGenAIPipeline": _PipelineRow(
+        "oldu1238",
+        "Pipeline for the Old Turkic language",
+        "Default ``Pipeline`` for Old Turkic.",
+        _genai_processes("OldTurkic"),
+    ),
+    "OldTamilGenAIPipeline": _PipelineRow(
+        "oldt1248",
+        "Pipeline for the Old Tamil language",
+        "Default ``Pipeline`` for Old Tamil.",
+        _genai_processes("OldTamil"),
+    ),
+    "MoabiteGenAIPipeline": _PipelineRow(
+        "moab1234",
+        "Pipeline for the Moabite language",
+        "Default ``Pipeline`` for Moabite.",
+        _genai_processes("Moabite"),
+    ),
+    "AmmoniteGenAIPipeline": _PipelineRow(
+        "ammo1234",
+        "Pipeline for the Ammonite language",
+        "Default ``Pipeline`` for Ammonite.",
+        _genai_processes("Ammonite"),
+    ),
+    "EdomiteGenAIPipeline": _PipelineRow(
+        "edom1234",
+        "Pipeline for the Edomite language",
+        "Default ``Pipeline`` for Edomite.",
+        _genai_processes("Edomite"),
+    ),
+    "OldAramaicGenAIPipeline": _PipelineRow(
+        "olda1246",
+        "Pipeline for Old Aramaic (up to 700 BCE)",
+        "Default ``Pipeline`` for Old Aramaic (up to 700 BCE).",
+        _genai_processes("OldAramaic"),
+    ),
+    "OldAramaicSamalianGenAIPipeline": _PipelineRow(
+        "olda1245",
+        "Pipeline for Old Aramaic–Samʾalian",
+        "Default ``Pipeline`` for Old Aramaic–Samʾalian.",
+        _genai_processes("OldAramaicSamalian"),
+    ),
+    "MiddleAramaicGenAIPipeline": _PipelineRow(
+        "midd1366",
+        "Pipeline for Middle Aramaic",
+        "Default ``Pipeline`` for Middle Aramaic.",
+        _genai_processes("MiddleAramaic"),
+    ),
+    "ClassicalMandaicGenAIPipeline": _PipelineRow(
+        "clas1253",
+        "Pipeline for Classical Mandaic",
+        "Default ``Pipeline`` for Classical Mandaic.",
+        _genai_processes("ClassicalMandaic"),
+    ),
+    "HatranGenAIPipeline": _PipelineRow(
+        "hatr1234",
+        "Pipeline for Hatran",
+        "Default ``Pipeline`` for Hatran.",
+        _genai_processes("Hatran"),
+    ),
+    "JewishBabylonianAramaicGenAIPipeline": _PipelineRow(
+        "jewi1240",
+        "Pipeline for Jewish Babylonian Aramaic",
+        "Default ``Pipeline`` for Jewish Babylonian Aramaic.",
+        _genai_processes("JewishBabylonianAramaic"),
+    ),
+    "SamalianGenAIPipeline": _PipelineRow(
+        "sama1234",
+        "Pipeline for Samʾalian",
+        "Default ``Pipeline`` for Samʾalian.",
+        _genai_processes("Samalian"),
+    ),
+}
 
+# Process class name suffix -> module defining (or generating) the class.
+_PROCESS_MODULES: tuple[tuple[str, str], ...] = (
+    ("SentenceSplittingProcess", "cltk.sentence.processes"),
+    ("GenAIMorphosyntaxProcess", "cltk.morphosyntax.processes"),
+    ("GenAIDependencyProcess", "cltk.dependency.processes"),
+    ("GenAIEnrichmentProcess", "cltk.enrichment.processes"),
+    ("GenAITranslationProcess", "cltk.translation.processes"),
+    ("NormalizeProcess", "cltk.text.processes"),
+)
 
-class OldEgyptianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Egyptian."""
 
-    description: Optional[str] = "Pipeline for the Old Egyptian language"
-    glottolog_id: Optional[str] = "olde1242"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldEgyptianSentenceSplittingProcess,
-            OldEgyptianGenAIMorphosyntaxProcess,
-            OldEgyptianGenAIDependencyProcess,
-            OldEgyptianGenAIEnrichmentProcess,
-            OldEgyptianGenAITranslationProcess,
-        ]
-    )
+def _resolve_process(name: str) -> Any:
+    """Import and return the process class called ``name``.
 
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldEgyptianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("OldEgyptianGenAIPipeline created.")
+    Raises:
+      AttributeError: If no process module defines ``name``.
 
+    """
+    if name == "StanzaAnalyzeProcess":
+        return _stanza_analyze_process()
+    for suffix, module_name in _PROCESS_MODULES:
+        if name.endswith(suffix):
+            return getattr(importlib.import_module(module_name), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _resolve_processes(names: tuple[str, ...]) -> list[Any]:
+    """Return the process classes for ``names`` (a pipeline default factory)."""
+    return [_resolve_process(name) for name in names]
+
+
+def _build_pipeline(name: str, row: _PipelineRow) -> type[Pipeline]:
+    """Create the pipeline class ``name`` from its table row."""
+    return build_subclass(
+        StanzaPipeline if name in _STANZA_PIPELINES else Pipeline,
+        name,
+        __name__,
+        row.doc,
+        {
+            "description": (Optional[str], row.description),
+            "glottolog_id": (Optional[str], row.glottolog_id),
+            "processes": (
+                Optional[list[Any]],
+                Field(default_factory=partial(_resolve_processes, row.processes)),
+            ),
+        },
+    )
+
+
+_PIPELINE_CLASSES = LazyClassTable(
+    globals(), {**_STANZA_PIPELINES, **_GENAI_PIPELINES}, _build_pipeline
+)
 
-class LateEgyptianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Late Egyptian."""
 
-    description: Optional[str] = "Pipeline for the Late Egyptian language"
-    glottolog_id: Optional[str] = "late1256"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            LateEgyptianSentenceSplittingProcess,
-            LateEgyptianGenAIMorphosyntaxProcess,
-            LateEgyptianGenAIDependencyProcess,
-            LateEgyptianGenAIEnrichmentProcess,
-            LateEgyptianGenAITranslationProcess,
-        ]
-    )
+def __getattr__(name: str) -> Any:
+    """Create pipeline classes, and import process classes, on first access."""
+    if name in _PIPELINE_CLASSES:
+        return _PIPELINE_CLASSES.resolve(name)
+    return _resolve_process(name)
 
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LateEgyptianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("LateEgyptianGenAIPipeline created.")
 
+def __dir__() -> list[str]:
+    """List module attributes, including pipeline classes not yet created."""
+    return _PIPELINE_CLASSES.dir()
 
-class ParthianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Parthian."""
 
-    description: Optional[str] = "Pipeline for the Parthian language"
-    glottolog_id: Optional[str] = "part1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ParthianSentenceSplittingProcess,
-            ParthianGenAIMorphosyntaxProcess,
-            ParthianGenAIDependencyProcess,
-            ParthianGenAIEnrichmentProcess,
-            ParthianGenAITranslationProcess,
-        ]
-    )
+class LazyPipelineMap(MutableMapping[str, type[Pipeline]]):
+    """Glottolog code -> pipeline class mapping that creates classes on lookup.
 
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LateEgyptianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("LateEgyptianGenAIPipeline created.")
+    Values may be pipeline classes or the names of classes in this module;
+    names are resolved (and the class created) the first time they are read.
+    """
 
+    def __init__(self, entries: Mapping[str, "type[Pipeline] | str"]) -> None:
+        self._entries: dict[str, type[Pipeline] | str] = dict(entries)
+
+    def __getitem__(self, key: str) -> type[Pipeline]:
+        value = self._entries[key]
+        if isinstance(value, str):
+            value = self._entries[key] = _PIPELINE_CLASSES.resolve(value)
+        return value
+
+    def __setitem__(self, key: str, value: type[Pipeline]) -> None:
+        self._entries[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        names = {
+            key: value if isinstance(value, str) else value.__name__
+            for key, value in self._entries.items()
+        }
+        return f"{type(self).__name__}({names!r})"
+
+    def class_name(self, key: str) -> str:
+        """Return the pipeline class name for ``key`` without creating it."""
+        value = self._entries[key]
+        return value if isinstance(value, str) else value.__name__
+
+
+MAP_LANGUAGE_CODE_TO_STANZA_PIPELINE: LazyPipelineMap = LazyPipelineMap(
+    {
+        # Seed a few languages where Stanza has robust models
+        "lati1261": "LatinStanzaPipeline",
+        "anci1242": "AncientGreekStanzaPipeline",
+        "chur1257": "ChurchSlavonicStanzaPipeline",
+        "oldf1239": "OldFrenchStanzaPipeline",
+        "goth1244": "GothicStanzaPipeline",
+        "lite1248": "LiteraryChineseStanzaPipeline",
+        "olde1238": "OldEnglishStanzaPipeline",
+        "otto1234": "OttomanTurkishStanzaPipeline",
+        "clas1256": "ClassicalArmenianStanzaPipeline",
+        "copt1239": "CopticStanzaPipeline",
+        "oldr1238": "OldRussianStanzaPipeline",  # Old East Slavic
+    }
+)
 
-class OldMiddleWelshGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle Welsh."""
 
-    description: Optional[str] = "Pipeline for the Middle Welsh language"
-    glottolog_id: Optional[str] = "oldw1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldMiddleWelshSentenceSplittingProcess,
-            OldMiddleWelshGenAIMorphosyntaxProcess,
-            OldMiddleWelshGenAIDependencyProcess,
-            OldMiddleWelshGenAIEnrichmentProcess,
-            OldMiddleWelshGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MiddleWelshGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MiddleWelshGenAIPipeline created.")
-
-
-class MiddleBretonGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle Breton."""
-
-    description: Optional[str] = "Pipeline for the Middle Breton language"
-    glottolog_id: Optional[str] = "oldb1244"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleBretonSentenceSplittingProcess,
-            MiddleBretonGenAIMorphosyntaxProcess,
-            MiddleBretonGenAIDependencyProcess,
-            MiddleBretonGenAIEnrichmentProcess,
-            MiddleBretonGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MiddleBretonGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MiddleBretonGenAIPipeline created.")
-
-
-class MiddleCornishGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Cornish."""
-
-    description: Optional[str] = "Pipeline for the Cornish language"
-    glottolog_id: Optional[str] = "corn1251"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleCornishSentenceSplittingProcess,
-            MiddleCornishGenAIMorphosyntaxProcess,
-            MiddleCornishGenAIDependencyProcess,
-            MiddleCornishGenAIEnrichmentProcess,
-            MiddleCornishGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing CornishGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("CornishGenAIPipeline created.")
-
-
-class OldPrussianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Prussian."""
-
-    description: Optional[str] = "Pipeline for the Old Prussian language"
-    glottolog_id: Optional[str] = "prus1238"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldPrussianSentenceSplittingProcess,
-            OldPrussianGenAIMorphosyntaxProcess,
-            OldPrussianGenAIDependencyProcess,
-            OldPrussianGenAIEnrichmentProcess,
-            OldPrussianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OldPrussianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("OldPrussianGenAIPipeline created.")
-
-
-class LithuanianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Lithuanian."""
-
-    description: Optional[str] = "Pipeline for the Lithuanian language"
-    glottolog_id: Optional[str] = "lith1251"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            LithuanianSentenceSplittingProcess,
-            LithuanianGenAIMorphosyntaxProcess,
-            LithuanianGenAIDependencyProcess,
-            LithuanianGenAIEnrichmentProcess,
-            LithuanianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LithuanianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("LithuanianGenAIPipeline created.")
-
-
-class LatvianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Latvian."""
-
-    description: Optional[str] = "Pipeline for the Latvian language"
-    glottolog_id: Optional[str] = "latv1249"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            LatvianSentenceSplittingProcess,
-            LatvianGenAIMorphosyntaxProcess,
-            LatvianGenAIDependencyProcess,
-            LatvianGenAIEnrichmentProcess,
-            LatvianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LatvianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("LatvianGenAIPipeline created.")
-
-
-class AlbanianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Albanian."""
-
-    description: Optional[str] = "Pipeline for the Albanian language"
-    glottolog_id: Optional[str] = "gheg1238"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            AlbanianSentenceSplittingProcess,
-            AlbanianGenAIMorphosyntaxProcess,
-            AlbanianGenAIDependencyProcess,
-            AlbanianGenAIEnrichmentProcess,
-            AlbanianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing AlbanianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("AlbanianGenAIPipeline created.")
-
-
-class ClassicalArmenianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Classical Armenian."""
-
-    description: Optional[str] = "Pipeline for the Classical Armenian language"
-    glottolog_id: Optional[str] = "clas1256"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ClassicalArmenianSentenceSplittingProcess,
-            ClassicalArmenianGenAIMorphosyntaxProcess,
-            ClassicalArmenianGenAIDependencyProcess,
-            ClassicalArmenianGenAIEnrichmentProcess,
-            ClassicalArmenianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing ClassicalArmenianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("ClassicalArmenianGenAIPipeline created.")
-
-
-class MiddleArmenianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle Armenian."""
-
-    description: Optional[str] = "Pipeline for the Middle Armenian language"
-    glottolog_id: Optional[str] = "midd1364"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleArmenianSentenceSplittingProcess,
-            MiddleArmenianGenAIMorphosyntaxProcess,
-            MiddleArmenianGenAIDependencyProcess,
-            MiddleArmenianGenAIEnrichmentProcess,
-            MiddleArmenianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MiddleArmenianGenAIPipeline with language: {self.language}"
-        )
-
-
-class CuneiformLuwianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Cuneiform Luwian."""
-
-    description: Optional[str] = "Pipeline for the Cuneiform Luwian language"
-    glottolog_id: Optional[str] = "cune1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            CuneiformLuwianSentenceSplittingProcess,
-            CuneiformLuwianGenAIMorphosyntaxProcess,
-            CuneiformLuwianGenAIDependencyProcess,
-            CuneiformLuwianGenAIEnrichmentProcess,
-            CuneiformLuwianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing CuneiformLuwianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("CuneiformLuwianGenAIPipeline created.")
-
-
-class HieroglyphicLuwianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Hieroglyphic Luwian."""
-
-    description: Optional[str] = "Pipeline for the Hieroglyphic Luwian language"
-    glottolog_id: Optional[str] = "hier1240"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            HieroglyphicLuwianSentenceSplittingProcess,
-            HieroglyphicLuwianGenAIMorphosyntaxProcess,
-            HieroglyphicLuwianGenAIDependencyProcess,
-            HieroglyphicLuwianGenAIEnrichmentProcess,
-            HieroglyphicLuwianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing HieroglyphicLuwianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("HieroglyphicLuwianGenAIPipeline created.")
-
-
-class LycianAGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Lycian."""
-
-    description: Optional[str] = "Pipeline for the Lycian language"
-    glottolog_id: Optional[str] = "lyci1241"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            LycianASentenceSplittingProcess,
-            LycianAGenAIMorphosyntaxProcess,
-            LycianAGenAIDependencyProcess,
-            LycianAGenAIEnrichmentProcess,
-            LycianAGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LycianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("LycianGenAIPipeline created.")
-
-
-class LydianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Lydian."""
-
-    description: Optional[str] = "Pipeline for the Lydian language"
-    glottolog_id: Optional[str] = "lydi1241"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            LydianSentenceSplittingProcess,
-            LydianGenAIMorphosyntaxProcess,
-            LydianGenAIDependencyProcess,
-            LydianGenAIEnrichmentProcess,
-            LydianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing LydianGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("LydianGenAIPipeline created.")
-
-
-class PalaicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Palaic."""
-
-    description: Optional[str] = "Pipeline for the Palaic language"
-    glottolog_id: Optional[str] = "pala1331"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            PalaicSentenceSplittingProcess,
-            PalaicGenAIMorphosyntaxProcess,
-            PalaicGenAIDependencyProcess,
-            PalaicGenAIEnrichmentProcess,
-            PalaicGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing PalaicGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("PalaicGenAIPipeline created.")
-
-
-class CarianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Carian."""
-
-    description: Optional[str] = "Pipeline for the Carian language"
-    glottolog_id: Optional[str] = "cari1274"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            CarianSentenceSplittingProcess,
-            CarianGenAIMorphosyntaxProcess,
-            CarianGenAIDependencyProcess,
-            CarianGenAIEnrichmentProcess,
-            CarianGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing CarianGenAIPipeline with language: {self.language}"
-        )
-
-
-class SauraseniPrakritGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Sauraseni Prakrit."""
-
-    description: Optional[str] = "Pipeline for the Sauraseni Prakrit language"
-    glottolog_id: Optional[str] = "saur1252"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            SauraseniPrakritSentenceSplittingProcess,
-            SauraseniPrakritGenAIMorphosyntaxProcess,
-            SauraseniPrakritGenAIDependencyProcess,
-            SauraseniPrakritGenAIEnrichmentProcess,
-            SauraseniPrakritGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing SauraseniPrakritGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("SauraseniPrakritGenAIPipeline created.")
-
-
-class MaharastriPrakritGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Maharastri Prakrit."""
-
-    description: Optional[str] = "Pipeline for the Maharastri Prakrit language"
-    glottolog_id: Optional[str] = "maha1305"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MaharastriPrakritSentenceSplittingProcess,
-            MaharastriPrakritGenAIMorphosyntaxProcess,
-            MaharastriPrakritGenAIDependencyProcess,
-            MaharastriPrakritGenAIEnrichmentProcess,
-            MaharastriPrakritGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MaharastriPrakritGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MaharastriPrakritGenAIPipeline created.")
-
-
-class MagadhiPrakritGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Magadhi Prakrit."""
-
-    description: Optional[str] = "Pipeline for the Magadhi Prakrit language"
-    glottolog_id: Optional[str] = "maga1260"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MagadhiPrakritSentenceSplittingProcess,
-            MagadhiPrakritGenAIMorphosyntaxProcess,
-            MagadhiPrakritGenAIDependencyProcess,
-            MagadhiPrakritGenAIEnrichmentProcess,
-            MagadhiPrakritGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MagadhiPrakritGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MagadhiPrakritGenAIPipeline created.")
-
-
-class GandhariGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Gandhari."""
-
-    description: Optional[str] = "Pipeline for the Gandhari language"
-    glottolog_id: Optional[str] = "gand1259"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            GandhariSentenceSplittingProcess,
-            GandhariGenAIMorphosyntaxProcess,
-            GandhariGenAIDependencyProcess,
-            GandhariGenAIEnrichmentProcess,
-            GandhariGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing GandhariGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("GandhariGenAIPipeline created.")
-
-
-# Hindi and closely related lects
-class HindiGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Hindi (glottocode hind1269)."""
-
-    description: Optional[str] = "Pipeline for the Hindi language"
-    glottolog_id: Optional[str] = "hind1269"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            HindiSentenceSplittingProcess,
-            HindiGenAIMorphosyntaxProcess,
-            HindiGenAIDependencyProcess,
-            HindiGenAIEnrichmentProcess,
-            HindiGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing HindiGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("HindiGenAIPipeline created.")
-
-
-class KhariBoliGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Khari Boli (Hindi dialect)."""
-
-    description: Optional[str] = "Pipeline for the Khari Boli dialect of Hindi"
-    glottolog_id: Optional[str] = "khad1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            KhariBoliSentenceSplittingProcess,
-            KhariBoliGenAIMorphosyntaxProcess,
-            KhariBoliGenAIDependencyProcess,
-            KhariBoliGenAIEnrichmentProcess,
-            KhariBoliGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing KhariBoliGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("KhariBoliGenAIPipeline created.")
-
-
-class BrajGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Braj Bhasha."""
-
-    description: Optional[str] = "Pipeline for the Braj Bhasha language"
-    glottolog_id: Optional[str] = "braj1242"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            BrajSentenceSplittingProcess,
-            BrajGenAIMorphosyntaxProcess,
-            BrajGenAIDependencyProcess,
-            BrajGenAIEnrichmentProcess,
-            BrajGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing BrajGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("BrajGenAIPipeline created.")
-
-
-class AwadhiGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Awadhi."""
-
-    description: Optional[str] = "Pipeline for the Awadhi language"
-    glottolog_id: Optional[str] = "awad1243"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            AwadhiSentenceSplittingProcess,
-            AwadhiGenAIMorphosyntaxProcess,
-            AwadhiGenAIDependencyProcess,
-            AwadhiGenAIEnrichmentProcess,
-            AwadhiGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing AwadhiGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("AwadhiGenAIPipeline created.")
-
-
-class UrduGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Urdu."""
-
-    description: Optional[str] = "Pipeline for the Urdu language"
-    glottolog_id: Optional[str] = "urdu1245"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            UrduSentenceSplittingProcess,
-            UrduGenAIMorphosyntaxProcess,
-            UrduGenAIDependencyProcess,
-            UrduGenAIEnrichmentProcess,
-            UrduGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing UrduGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("UrduGenAIPipeline created.")
-
-
-# Eastern Indo-Aryan and Western IA additions
-class BengaliGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Bengali."""
-
-    description: Optional[str] = "Pipeline for the Bengali language"
-    glottolog_id: Optional[str] = "beng1280"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            BengaliSentenceSplittingProcess,
-            BengaliGenAIMorphosyntaxProcess,
-            BengaliGenAIDependencyProcess,
-            BengaliGenAIEnrichmentProcess,
-            BengaliGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing BengaliGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("BengaliGenAIPipeline created.")
-
-
-class OdiaGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Odia (Oriya)."""
-
-    description: Optional[str] = "Pipeline for the Odia language"
-    glottolog_id: Optional[str] = "oriy1255"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OdiaSentenceSplittingProcess,
-            OdiaGenAIMorphosyntaxProcess,
-            OdiaGenAIDependencyProcess,
-            OdiaGenAIEnrichmentProcess,
-            OdiaGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing OdiaGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("OdiaGenAIPipeline created.")
-
-
-class AssameseGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Assamese."""
-
-    description: Optional[str] = "Pipeline for the Assamese language"
-    glottolog_id: Optional[str] = "assa1263"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            AssameseSentenceSplittingProcess,
-            AssameseGenAIMorphosyntaxProcess,
-            AssameseGenAIDependencyProcess,
-            AssameseGenAIEnrichmentProcess,
-            AssameseGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing AssameseGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("AssameseGenAIPipeline created.")
-
-
-class GujaratiGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Gujarati."""
-
-    description: Optional[str] = "Pipeline for the Gujarati language"
-    glottolog_id: Optional[str] = "guja1252"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            GujaratiSentenceSplittingProcess,
-            GujaratiGenAIMorphosyntaxProcess,
-            GujaratiGenAIDependencyProcess,
-            GujaratiGenAIEnrichmentProcess,
-            GujaratiGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing GujaratiGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("GujaratiGenAIPipeline created.")
-
-
-class MarathiGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Marathi."""
-
-    description: Optional[str] = "Pipeline for the Marathi language"
-    glottolog_id: Optional[str] = "mara1378"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MarathiSentenceSplittingProcess,
-            MarathiGenAIMorphosyntaxProcess,
-            MarathiGenAIDependencyProcess,
-            MarathiGenAIEnrichmentProcess,
-            MarathiGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing MarathiGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("MarathiGenAIPipeline created.")
-
-
-class SinhalaGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Sinhala."""
-
-    description: Optional[str] = "Pipeline for the Sinhala language"
-    glottolog_id: Optional[str] = "sinh1246"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            SinhalaSentenceSplittingProcess,
-            SinhalaGenAIMorphosyntaxProcess,
-            SinhalaGenAIDependencyProcess,
-            SinhalaGenAIEnrichmentProcess,
-            SinhalaGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing SinhalaGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("SinhalaGenAIPipeline created.")
-
-
-class EasternPanjabiGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Eastern Panjabi."""
-
-    description: Optional[str] = "Pipeline for the Eastern Panjabi language"
-    glottolog_id: Optional[str] = "panj1256"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            PanjabiSentenceSplittingProcess,
-            EasternPanjabiGenAIMorphosyntaxProcess,
-            EasternPanjabiGenAIDependencyProcess,
-            EasternPanjabiGenAIEnrichmentProcess,
-            EasternPanjabiGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing EasternPanjabiGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("EasternPanjabiGenAIPipeline created.")
-
-
-class SindhiGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Sindhi."""
-
-    description: Optional[str] = "Pipeline for the Sindhi language"
-    glottolog_id: Optional[str] = "sind1272"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            SindhiSentenceSplittingProcess,
-            SindhiGenAIMorphosyntaxProcess,
-            SindhiGenAIDependencyProcess,
-            SindhiGenAIEnrichmentProcess,
-            SindhiGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing SindhiGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("SindhiGenAIPipeline created.")
-
-
-class KashmiriGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Kashmiri."""
-
-    description: Optional[str] = "Pipeline for the Kashmiri language"
-    glottolog_id: Optional[str] = "kash1277"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            KashmiriSentenceSplittingProcess,
-            KashmiriGenAIMorphosyntaxProcess,
-            KashmiriGenAIDependencyProcess,
-            KashmiriGenAIEnrichmentProcess,
-            KashmiriGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing KashmiriGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("KashmiriGenAIPipeline created.")
-
-
-# Sino-Tibetan additions
-class OldChineseGenAIPipeline(Pipeline):
-    """Pipeline for Old Chinese."""
-
-    description: Optional[str] = "Pipeline for Old Chinese"
-    glottolog_id: Optional[str] = "oldc1244"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldChineseSentenceSplittingProcess,
-            OldChineseGenAIMorphosyntaxProcess,
-            OldChineseGenAIDependencyProcess,
-            OldChineseGenAIEnrichmentProcess,
-            OldChineseGenAITranslationProcess,
-        ]
-    )
-
-
-class MiddleChineseGenAIPipeline(Pipeline):
-    """Pipeline for Middle Chinese."""
-
-    description: Optional[str] = "Pipeline for Middle Chinese"
-    glottolog_id: Optional[str] = "midd1344"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleChineseSentenceSplittingProcess,
-            MiddleChineseGenAIMorphosyntaxProcess,
-            MiddleChineseGenAIDependencyProcess,
-            MiddleChineseGenAIEnrichmentProcess,
-            MiddleChineseGenAITranslationProcess,
-        ]
-    )
-
-
-class BaihuaChineseGenAIPipeline(Pipeline):
-    """Pipeline for Early Vernacular Chinese (Baihua)."""
-
-    description: Optional[str] = "Pipeline for Early Vernacular Chinese (Baihua)"
-    glottolog_id: Optional[str] = "clas1255"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            BaihuaChineseSentenceSplittingProcess,
-            BaihuaChineseGenAIMorphosyntaxProcess,
-            BaihuaChineseGenAIDependencyProcess,
-            BaihuaChineseGenAIEnrichmentProcess,
-            BaihuaChineseGenAITranslationProcess,
-        ]
-    )
-
-
-class OldBurmeseGenAIPipeline(Pipeline):
-    """Pipeline for Old Burmese."""
-
-    description: Optional[str] = "Pipeline for Old Burmese"
-    glottolog_id: Optional[str] = "oldb1235"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldBurmeseSentenceSplittingProcess,
-            OldBurmeseGenAIMorphosyntaxProcess,
-            OldBurmeseGenAIDependencyProcess,
-            OldBurmeseGenAIEnrichmentProcess,
-            OldBurmeseGenAITranslationProcess,
-        ]
-    )
-
-
-class ClassicalBurmeseGenAIPipeline(Pipeline):
-    """Pipeline for Classical/Nuclear Burmese."""
-
-    description: Optional[str] = "Pipeline for Classical Burmese"
-    glottolog_id: Optional[str] = "nucl1310"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ClassicalBurmeseSentenceSplittingProcess,
-            ClassicalBurmeseGenAIMorphosyntaxProcess,
-            ClassicalBurmeseGenAIDependencyProcess,
-            ClassicalBurmeseGenAIEnrichmentProcess,
-            ClassicalBurmeseGenAITranslationProcess,
-        ]
-    )
-
-
-class TangutGenAIPipeline(Pipeline):
-    """Pipeline for Tangut (Xixia)."""
-
-    description: Optional[str] = "Pipeline for the Tangut language"
-    glottolog_id: Optional[str] = "tang1334"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            TangutSentenceSplittingProcess,
-            TangutGenAIMorphosyntaxProcess,
-            TangutGenAIDependencyProcess,
-            TangutGenAIEnrichmentProcess,
-            TangutGenAITranslationProcess,
-        ]
-    )
-
-
-class NewarGenAIPipeline(Pipeline):
-    """Pipeline for Newar (Classical Nepal Bhasa)."""
-
-    description: Optional[str] = "Pipeline for the Newar language"
-    glottolog_id: Optional[str] = "newa1246"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            NewarSentenceSplittingProcess,
-            NewarGenAIMorphosyntaxProcess,
-            NewarGenAIDependencyProcess,
-            NewarGenAIEnrichmentProcess,
-            NewarGenAITranslationProcess,
-        ]
-    )
-
-
-class MeiteiGenAIPipeline(Pipeline):
-    """Pipeline for Meitei (Classical Manipuri)."""
-
-    description: Optional[str] = "Pipeline for the Meitei (Classical Manipuri) language"
-    glottolog_id: Optional[str] = "mani1292"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MeiteiSentenceSplittingProcess,
-            MeiteiGenAIMorphosyntaxProcess,
-            MeiteiGenAIDependencyProcess,
-            MeiteiGenAIEnrichmentProcess,
-            MeiteiGenAITranslationProcess,
-        ]
-    )
-
-
-class SgawKarenGenAIPipeline(Pipeline):
-    """Pipeline for Sgaw Karen."""
-
-    description: Optional[str] = "Pipeline for the Sgaw Karen language"
-    glottolog_id: Optional[str] = "sgaw1245"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            SgawKarenSentenceSplittingProcess,
-            SgawKarenGenAIMorphosyntaxProcess,
-            SgawKarenGenAIDependencyProcess,
-            SgawKarenGenAIEnrichmentProcess,
-            SgawKarenGenAITranslationProcess,
-        ]
-    )
-
-
-class MiddleMongolGenAIPipeline(Pipeline):
-    """Pipeline for Middle Mongol."""
-
-    description: Optional[str] = "Pipeline for the Middle Mongol language"
-    glottolog_id: Optional[str] = "midd1351"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleMongolSentenceSplittingProcess,
-            MiddleMongolGenAIMorphosyntaxProcess,
-            MiddleMongolGenAIDependencyProcess,
-            MiddleMongolGenAIEnrichmentProcess,
-            MiddleMongolGenAITranslationProcess,
-        ]
-    )
-
-
-class ClassicalMongolianGenAIPipeline(Pipeline):
-    """Pipeline for Classical Mongolian."""
-
-    description: Optional[str] = "Pipeline for the Classical Mongolian language"
-    glottolog_id: Optional[str] = "mong1331"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ClassicalMongolianSentenceSplittingProcess,
-            ClassicalMongolianGenAIMorphosyntaxProcess,
-            ClassicalMongolianGenAIDependencyProcess,
-            ClassicalMongolianGenAIEnrichmentProcess,
-            ClassicalMongolianGenAITranslationProcess,
-        ]
-    )
-
-
-class MogholiGenAIPipeline(Pipeline):
-    """Pipeline for Mogholi (Moghol)."""
-
-    description: Optional[str] = "Pipeline for the Mogholi (Moghol) language"
-    glottolog_id: Optional[str] = "mogh1245"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MogholiSentenceSplittingProcess,
-            MogholiGenAIMorphosyntaxProcess,
-            MogholiGenAIDependencyProcess,
-            MogholiGenAIEnrichmentProcess,
-            MogholiGenAITranslationProcess,
-        ]
-    )
-
-
-class BagriGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Bagri (Rajasthani)."""
-
-    description: Optional[str] = "Pipeline for the Bagri (Rajasthani) language"
-    glottolog_id: Optional[str] = "bagr1243"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            BagriSentenceSplittingProcess,
-            BagriGenAIMorphosyntaxProcess,
-            BagriGenAIDependencyProcess,
-            BagriGenAIEnrichmentProcess,
-            BagriGenAITranslationProcess,
-        ]
-    )
-
-    def __post_init__(self) -> None:
-        """Log pipeline initialization details."""
-        plog(self).debug(
-            f"Initializing BagriGenAIPipeline with language: {self.language}"
-        )
-        plog(self).info("BagriGenAIPipeline created.")
-
-
-# Additional Afroasiatic, Altaic-adjacent, Uralic, Turkic, Dravidian pipelines
-class NumidianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Numidian (Ancient Berber)."""
-
-    description: Optional[str] = "Pipeline for the Numidian (Ancient Berber) language"
-    glottolog_id: Optional[str] = "numi1241"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            NumidianSentenceSplittingProcess,
-            NumidianGenAIMorphosyntaxProcess,
-            NumidianGenAIDependencyProcess,
-            NumidianGenAIEnrichmentProcess,
-            NumidianGenAITranslationProcess,
-        ]
-    )
-
-
-class TaitaGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Taita (Cushitic)."""
-
-    description: Optional[str] = "Pipeline for the Cushitic Taita language"
-    glottolog_id: Optional[str] = "tait1247"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            TaitaSentenceSplittingProcess,
-            TaitaGenAIMorphosyntaxProcess,
-            TaitaGenAIDependencyProcess,
-            TaitaGenAIEnrichmentProcess,
-            TaitaGenAITranslationProcess,
-        ]
-    )
-
-
-class HausaGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Hausa."""
-
-    description: Optional[str] = "Pipeline for the Hausa language"
-    glottolog_id: Optional[str] = "haus1257"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            HausaSentenceSplittingProcess,
-            HausaGenAIMorphosyntaxProcess,
-            HausaGenAIDependencyProcess,
-            HausaGenAIEnrichmentProcess,
-            HausaGenAITranslationProcess,
-        ]
-    )
-
-
-class OldJurchenGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Jurchen."""
-
-    description: Optional[str] = "Pipeline for the Old Jurchen language"
-    glottolog_id: Optional[str] = "jurc1239"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldJurchenSentenceSplittingProcess,
-            OldJurchenGenAIMorphosyntaxProcess,
-            OldJurchenGenAIDependencyProcess,
-            OldJurchenGenAIEnrichmentProcess,
-            OldJurchenGenAITranslationProcess,
-        ]
-    )
-
-
-class OldJapaneseGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Japanese."""
-
-    description: Optional[str] = "Pipeline for the Old Japanese language"
-    glottolog_id: Optional[str] = "japo1237"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldJapaneseSentenceSplittingProcess,
-            OldJapaneseGenAIMorphosyntaxProcess,
-            OldJapaneseGenAIDependencyProcess,
-            OldJapaneseGenAIEnrichmentProcess,
-            OldJapaneseGenAITranslationProcess,
-        ]
-    )
-
-
-class OldHungarianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Hungarian."""
-
-    description: Optional[str] = "Pipeline for the Old Hungarian language"
-    glottolog_id: Optional[str] = "oldh1242"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldHungarianSentenceSplittingProcess,
-            OldHungarianGenAIMorphosyntaxProcess,
-            OldHungarianGenAIDependencyProcess,
-            OldHungarianGenAIEnrichmentProcess,
-            OldHungarianGenAITranslationProcess,
-        ]
-    )
-
-
-class ChagataiGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Chagatai."""
-
-    description: Optional[str] = "Pipeline for the Chagatai language"
-    glottolog_id: Optional[str] = "chag1247"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ChagataiSentenceSplittingProcess,
-            ChagataiGenAIMorphosyntaxProcess,
-            ChagataiGenAIDependencyProcess,
-            ChagataiGenAIEnrichmentProcess,
-            ChagataiGenAITranslationProcess,
-        ]
-    )
-
-
-class OldTurkicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Turkic."""
-
-    description: Optional[str] = "Pipeline for the Old Turkic language"
-    glottolog_id: Optional[str] = "oldu1238"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldTurkicSentenceSplittingProcess,
-            OldTurkicGenAIMorphosyntaxProcess,
-            OldTurkicGenAIDependencyProcess,
-            OldTurkicGenAIEnrichmentProcess,
-            OldTurkicGenAITranslationProcess,
-        ]
-    )
-
-
-class OldTamilGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Tamil."""
-
-    description: Optional[str] = "Pipeline for the Old Tamil language"
-    glottolog_id: Optional[str] = "oldt1248"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldTamilSentenceSplittingProcess,
-            OldTamilGenAIMorphosyntaxProcess,
-            OldTamilGenAIDependencyProcess,
-            OldTamilGenAIEnrichmentProcess,
-            OldTamilGenAITranslationProcess,
-        ]
-    )
-
-
-# Northwest Semitic and Aramaic additions
-class MoabiteGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Moabite."""
-
-    description: Optional[str] = "Pipeline for the Moabite language"
-    glottolog_id: Optional[str] = "moab1234"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MoabiteSentenceSplittingProcess,
-            MoabiteGenAIMorphosyntaxProcess,
-            MoabiteGenAIDependencyProcess,
-            MoabiteGenAIEnrichmentProcess,
-            MoabiteGenAITranslationProcess,
-        ]
-    )
-
-
-class AmmoniteGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Ammonite."""
-
-    description: Optional[str] = "Pipeline for the Ammonite language"
-    glottolog_id: Optional[str] = "ammo1234"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            AmmoniteSentenceSplittingProcess,
-            AmmoniteGenAIMorphosyntaxProcess,
-            AmmoniteGenAIDependencyProcess,
-            AmmoniteGenAIEnrichmentProcess,
-            AmmoniteGenAITranslationProcess,
-        ]
-    )
-
-
-class EdomiteGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Edomite."""
-
-    description: Optional[str] = "Pipeline for the Edomite language"
-    glottolog_id: Optional[str] = "edom1234"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            EdomiteSentenceSplittingProcess,
-            EdomiteGenAIMorphosyntaxProcess,
-            EdomiteGenAIDependencyProcess,
-            EdomiteGenAIEnrichmentProcess,
-            EdomiteGenAITranslationProcess,
-        ]
-    )
-
-
-class OldAramaicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Aramaic (up to 700 BCE)."""
-
-    description: Optional[str] = "Pipeline for Old Aramaic (up to 700 BCE)"
-    glottolog_id: Optional[str] = "olda1246"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldAramaicSentenceSplittingProcess,
-            OldAramaicGenAIMorphosyntaxProcess,
-            OldAramaicGenAIDependencyProcess,
-            OldAramaicGenAIEnrichmentProcess,
-            OldAramaicGenAITranslationProcess,
-        ]
-    )
-
-
-class OldAramaicSamalianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Old Aramaic–Samʾalian."""
-
-    description: Optional[str] = "Pipeline for Old Aramaic–Samʾalian"
-    glottolog_id: Optional[str] = "olda1245"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            OldAramaicSamalianSentenceSplittingProcess,
-            OldAramaicSamalianGenAIMorphosyntaxProcess,
-            OldAramaicSamalianGenAIDependencyProcess,
-            OldAramaicSamalianGenAIEnrichmentProcess,
-            OldAramaicSamalianGenAITranslationProcess,
-        ]
-    )
-
-
-class MiddleAramaicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Middle Aramaic."""
-
-    description: Optional[str] = "Pipeline for Middle Aramaic"
-    glottolog_id: Optional[str] = "midd1366"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            MiddleAramaicSentenceSplittingProcess,
-            MiddleAramaicGenAIMorphosyntaxProcess,
-            MiddleAramaicGenAIDependencyProcess,
-            MiddleAramaicGenAIEnrichmentProcess,
-            MiddleAramaicGenAITranslationProcess,
-        ]
-    )
-
-
-class ClassicalMandaicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Classical Mandaic."""
-
-    description: Optional[str] = "Pipeline for Classical Mandaic"
-    glottolog_id: Optional[str] = "clas1253"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            ClassicalMandaicSentenceSplittingProcess,
-            ClassicalMandaicGenAIMorphosyntaxProcess,
-            ClassicalMandaicGenAIDependencyProcess,
-            ClassicalMandaicGenAIEnrichmentProcess,
-            ClassicalMandaicGenAITranslationProcess,
-        ]
-    )
-
-
-class HatranGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Hatran."""
-
-    description: Optional[str] = "Pipeline for Hatran"
-    glottolog_id: Optional[str] = "hatr1234"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            HatranSentenceSplittingProcess,
-            HatranGenAIMorphosyntaxProcess,
-            HatranGenAIDependencyProcess,
-            HatranGenAIEnrichmentProcess,
-            HatranGenAITranslationProcess,
-        ]
-    )
-
-
-class JewishBabylonianAramaicGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Jewish Babylonian Aramaic."""
-
-    description: Optional[str] = "Pipeline for Jewish Babylonian Aramaic"
-    glottolog_id: Optional[str] = "jewi1240"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            JewishBabylonianAramaicSentenceSplittingProcess,
-            JewishBabylonianAramaicGenAIMorphosyntaxProcess,
-            JewishBabylonianAramaicGenAIDependencyProcess,
-            JewishBabylonianAramaicGenAIEnrichmentProcess,
-            JewishBabylonianAramaicGenAITranslationProcess,
-        ]
-    )
-
-
-class SamalianGenAIPipeline(Pipeline):
-    """Default ``Pipeline`` for Samʾalian."""
-
-    description: Optional[str] = "Pipeline for Samʾalian"
-    glottolog_id: Optional[str] = "sama1234"
-    processes: Optional[list[Any]] = Field(
-        default_factory=lambda: [
-            MultilingualNormalizeProcess,
-            SamalianSentenceSplittingProcess,
-            SamalianGenAIMorphosyntaxProcess,
-            SamalianGenAIDependencyProcess,
-            SamalianGenAIEnrichmentProcess,
-            SamalianGenAITranslationProcess,
-        ]
-    )
-
-
-MAP_LANGUAGE_CODE_TO_STANZA_PIPELINE: dict[str, type[Pipeline]] = {
-    # Seed a few languages where Stanza has robust models
-    "lati1261": LatinStanzaPipeline,
-    "anci1242": AncientGreekStanzaPipeline,
-    "chur1257": ChurchSlavonicStanzaPipeline,
-    "oldf1239": OldFrenchStanzaPipeline,
-    "goth1244": GothicStanzaPipeline,
-    "lite1248": LiteraryChineseStanzaPipeline,
-    "olde1238": OldEnglishStanzaPipeline,
-    "otto1234": OttomanTurkishStanzaPipeline,
-    "clas1256": ClassicalArmenianStanzaPipeline,
-    "copt1239": CopticStanzaPipeline,
-    "oldr1238": OldRussianStanzaPipeline,  # Old East Slavic
-}
-
-
-MAP_LANGUAGE_CODE_TO_SPACY_PIPELINE: dict[str, type[Pipeline]] = dict()
-
-
-MAP_LANGUAGE_CODE_TO_GENERATIVE_PIPELINE: dict[str, type[Pipeline]] = {
-    # Indo-European family
-    ## Italic
-    "lati1261": LatinGenAIPipeline,
-    "oldf1239": OldFrenchGenAIPipeline,
-    "midd1316": MiddleFrenchGenAIPipeline,
-    # Other Romance languages
-    ## Hellenic
-    "anci1242": AncientGreekGenAIPipeline,
-    # Mycenaean Greek (Linear B tablets, ca. 1400–1200 BCE).
-    # Medieval/Byzantine Greek
-    "oldi1245": EarlyIrishGenAIPipeline,
-    "oldw1239": OldMiddleWelshGenAIPipeline,
-    "bret1244": MiddleBretonGenAIPipeline,
-    "corn1251": MiddleCornishGenAIPipeline,
-    ## Germanic
-    # Proto-Norse
-    "goth1244": GothicGenAIPipeline,
-    "oldh1241": OldHighGermanGenAIPipeline,
-    "midd1343": MiddleHighGermanGenAIPipeline,
-    "oldn1244": OldNorseGenAIPipeline,
-    "olde1238": OldEnglishGenAIPipeline,
-    "midd1317": MiddleEnglishGenAIPipeline,
-    ## Balto-Slavic
-    "chur1257": ChurchSlavonicGenAIPipeline,
-    "prus1238": OldPrussianGenAIPipeline,
-    "lith1251": LithuanianGenAIPipeline,
-    "latv1249": LatvianGenAIPipeline,
-    "gheg1238": AlbanianGenAIPipeline,
-    ## Armenian, Earliest texts: 5th c. CE (Bible translation by Mesrop Mashtots, who created the script)
-    "clas1256": ClassicalArmenianGenAIPipeline,
-    "midd1364": MiddleArmenianGenAIPipeline,
-    # Note this is only a parent, not true languoid
-    ## Anatolian
-    "hitt1242": HittiteGenAIPipeline,
-    "cune1239": CuneiformLuwianGenAIPipeline,
-    "hier1240": HieroglyphicLuwianGenAIPipeline,
-    "lyci1241": LycianAGenAIPipeline,
-    "lydi1241": LydianGenAIPipeline,
-    "pala1331": PalaicGenAIPipeline,
-    "cari1274": CarianGenAIPipeline,
-    ## Tocharian
-    "tokh1242": TocharianAGenAIPipeline,
-    "tokh1243": TocharianBGenAIPipeline,
-    ## Indo-Iranian
-    ## Iranian languages
-    ### SW Iranian
-    "oldp1254": OldPersianGenAIPipeline,
-    "pahl1241": MiddlePersianGenAIPipeline,
-    ### NW Iranian
-    "part1239": ParthianGenAIPipeline,
-    ### E Iranian
-    "aves1237": AvestanGenAIPipeline,
-    "bact1239": BactrianGenAIPipeline,
-    "sogd1245": SogdianGenAIPipeline,
-    "khot1251": KhotaneseGenAIPipeline,
-    "tums1237": TumshuqeseGenAIPipeline,
-    # Indo-Aryan (Indic): Sanskrit (Vedic & Classical), Prakrits, Pali, later medieval languages (Hindi, Bengali, etc.)
-    ## Old Indo-Aryan
-    "vedi1234": VedicSanskritGenAIPipeline,
-    "clas1258": ClassicalSanskritGenAIPipeline,
-    # Prakrits (Middle Indo-Aryan, ca. 500 BCE–500 CE)
-    "pali1273": PaliGenAIPipeline,
-    # Ardhamāgadhī, Śaurasenī, Mahārāṣṭrī, etc. — languages of Jain/Buddhist texts and early drama.
-    # ? Glotto says alt_name for Pali; Ardhamāgadhī, literary language associated with Magadha (eastern India); Jain canonical texts (the Āgamas) are written primarily in Ardhamāgadhī
-    "saur1252": SauraseniPrakritGenAIPipeline,
-    "maha1305": MaharastriPrakritGenAIPipeline,
-    "maga1260": MagadhiPrakritGenAIPipeline,
-    "gand1259": GandhariGenAIPipeline,  ## Middle Indo-Aryan
-    # "Maithili": "mait1250"; Apabhraṃśa; "Apabhramsa" is alt_name; (500–1200 CE); Bridges Prakrits → New Indo-Aryan
-    ## New Indo-Aryan
-    ## Medieval languages (~1200 CE onward):
-    # Early forms of Hindi, Bengali, Gujarati, Marathi, Punjabi, Oriya, Sinhala, etc
-    # North-Western / Hindi Belt
-    "hind1269": HindiGenAIPipeline,
-    "khad1239": KhariBoliGenAIPipeline,
-    "braj1242": BrajGenAIPipeline,
-    "awad1243": AwadhiGenAIPipeline,
-    "urdu1245": UrduGenAIPipeline,
-    # Eastern Indo-Aryan
-    "beng1280": BengaliGenAIPipeline,
-    "oriy1255": OdiaGenAIPipeline,
-    "assa1263": AssameseGenAIPipeline,
-    # Western Indo-Aryan
-    "guja1252": GujaratiGenAIPipeline,
-    "mara1378": MarathiGenAIPipeline,
-    # Southern Indo-Aryan / adjacency
-    "sinh1246": SinhalaGenAIPipeline,
-    # Northwestern frontier
-    "panj1256": EasternPanjabiGenAIPipeline,
-    "sind1272": SindhiGenAIPipeline,
-    "kash1277": KashmiriGenAIPipeline,
-    "bagr1243": BagriGenAIPipeline,
-    # Afroasiatic family
-    ## Semitic languages
-    ### East Semitic
-    "akka1240": AkkadianGenAIPipeline,
-    # Eblaite
-    ### West Semitic
-    "ugar1238": UgariticGenAIPipeline,
-    "phoe1239": PhoenicianGenAIPipeline,
-    "moab1234": MoabiteGenAIPipeline,
-    "ammo1234": AmmoniteGenAIPipeline,
-    "edom1234": EdomiteGenAIPipeline,
-    "anci1244": BiblicalHebrewGenAIPipeline,
-    # Medieval Hebrew: No Glottolog
-    # "moab1234": Moabite
-    # "ammo1234": Ammonite
-    # "edom1234": Edomite
-    # Old Aramaic (ca. 1000–700 BCE, inscriptions).
-    # "olda1246": "Old Aramaic (up to 700 BCE)",
-    # "Old Aramaic-Sam'alian": "olda1245"
-    "impe1235": ImperialAramaicGenAIPipeline,
-    "olda1246": OldAramaicGenAIPipeline,
-    "olda1245": OldAramaicSamalianGenAIPipeline,
-    "midd1366": MiddleAramaicGenAIPipeline,
-    "clas1253": ClassicalMandaicGenAIPipeline,
-    "hatr1234": HatranGenAIPipeline,
-    "jewi1240": JewishBabylonianAramaicGenAIPipeline,
-    "sama1234": SamalianGenAIPipeline,
-    # "midd1366": Middle Aramaic (200 BCE – 700 CE), includes Biblical Aramaic, Palmyrene, Nabataean, Targumic Aramaic.
-    # Eastern Middle Aramaic
-    ##  Classical Mandaic, Hatran, Jewish Babylonian Aramaic dialects, and Classical Syriac
-    "clas1252": ClassicalSyriacGenAIPipeline,
-    ### NW Semitic
-    ## South Semitic
-    # Old South Arabian (OSA)
-    "geez1241": GeezGenAIPipeline,
-    ### Central Semitic (bridge between NW and South)
-    # Pre-Islamic Arabic
-    "clas1259": ClassicalArabicGenAIPipeline,  # Dialect
-    # Glotto doesn't have medieval arabic; Medieval Arabic: scientific, philosophical, historical works dominate much of the Islamic Golden Age corpus.
-    ## Egyptian languages
-    "olde1242": OldEgyptianGenAIPipeline,
-    "midd1369": MiddleEgyptianGenAIPipeline,
-    "late1256": LateEgyptianGenAIPipeline,
-    "demo1234": DemoticGenAIPipeline,
-    "copt1239": CopticGenAIPipeline,
-    ## Berber
-    "numi1241": NumidianGenAIPipeline,
-    "tait1247": TaitaGenAIPipeline,
-    ## Chadic
-    # ; "haus1257": "Hausa"; Hausa; Essentially oral until medieval period, when Hausa is written in Ajami (Arabic script).
-    "haus1257": HausaGenAIPipeline,
-    "lite1248": LiteraryChineseGenAIPipeline,
-    "clas1254": ClassicalTibetanPipeline,
-    # Sino-Tibetan family
-    # | **Early Vernacular Chinese (Baihua)**   | ca. 10th – 18th c. CE | *(under `clas1255`)* |
-    # | **Old Tibetan**                         | 7th – 10th c. CE     | *(not separately coded)* |
-    "oldc1244": OldChineseGenAIPipeline,
-    "midd1344": MiddleChineseGenAIPipeline,
-    "clas1255": BaihuaChineseGenAIPipeline,
-    "oldb1235": OldBurmeseGenAIPipeline,
-    "nucl1310": ClassicalBurmeseGenAIPipeline,
-    "tang1334": TangutGenAIPipeline,
-    "newa1246": NewarGenAIPipeline,
-    "mani1292": MeiteiGenAIPipeline,
-    "sgaw1245": SgawKarenGenAIPipeline,
-    # Mongolic family
-    "mong1329": MiddleMongolGenAIPipeline,
-    "mong1331": ClassicalMongolianGenAIPipeline,  #  TODO: No glottolog broken
-    "mogh1245": MogholiGenAIPipeline,
-    # Altaic-Adj.
-    "jurc1239": OldJurchenGenAIPipeline,
-    # Japonic
-    "japo1237": OldJapaneseGenAIPipeline,
-    # Uralic
-    "oldh1242": OldHungarianGenAIPipeline,
-    # Turkic
-    "chag1247": ChagataiGenAIPipeline,
-    "oldu1238": OldTurkicGenAIPipeline,
-    # TODO: Make pipeline for Ottoman Turkish
-    # "otto1234": OttomanTurkishGenAIPipeline,
-    # Dravidian
-    "oldt1248": OldTamilGenAIPipeline,
-    # Pre-Modern Literate Language Families (Non-Euro/Afroasiatic/Sino-Tibetan/Mongolic)
-    # | Family         | Language / Stage           | Approx. Period      | Glottocode     |
-    # |----------------|-----------------------------|----------------------|----------------|
-    # | Dravidian      | Old Tamil                   | ca. 300 BCE–300 CE   | `oldt1248`     |
-    # |                | Middle Tamil                | medieval             | *(not coded)*  |
-    # |                | Old Kannada                 | from 5th c. CE       | *(not coded)*  |
-    # |                | Old Telugu                  | from 6th c. CE       | *(not coded)*  |
-    # |                | Old Malayalam               | from 13th c. CE      | *(not coded)*  |
-    # | Turkic         | Old Turkic                  | 8th–10th c. CE       | `oldu1238`     |
-    # |                | Chagatai                    | 15th–18th c. CE      | `chag1247`     |
-    # | Uralic         | Old Hungarian               | 12th–13th c. CE      | `oldh1242`     |
-    # | Koreanic       | Old Korean                  | 7th–10th c. CE       | *(not coded)*  |
-    # |                | Middle Korean               | 15th c. onward       | *(not coded)*  |
-    # | Japonic        | Old Japanese                | 8th c. CE            | `japo1237`     |
-    # | Altaic-Adj.    | Old Jurchen                 | 12th–13th c. CE      | *`jurc1239`*  |
-    # |                | Manchu                      | 17th–18th c. CE      | *(not coded)*  |
-    # | Austroasiatic  | Old Mon                     | from 6th c. CE       | *(not coded)*  |
-    # |                | Old Khmer                   | from 7th c. CE       | *(not coded)*  |
-    # | Austronesian   | Old Javanese (Kawi)         | from 8th c. CE       | *(not coded)*  |
-    # |                | Classical Malay             | from 7th c. CE onward| *(not coded)*  |
-    # | Tai–Kadai      | Old Thai                    | from 13th c. CE      | *(not coded)*  |
-}
+MAP_LANGUAGE_CODE_TO_SPACY_PIPELINE: LazyPipelineMap = LazyPipelineMap({})
+
+
+MAP_LANGUAGE_CODE_TO_GENERATIVE_PIPELINE: LazyPipelineMap = LazyPipelineMap(
+    {
+        # Indo-European family
+        ## Italic
+        "lati1261": "LatinGenAIPipeline",
+        "oldf1239": "OldFrenchGenAIPipeline",
+        "midd1316": "MiddleFrenchGenAIPipeline",
+        # Other Romance languages
+        ## Hellenic
+        "anci1242": "AncientGreekGenAIPipeline",
+        # Mycenaean Greek (Linear B tablets, ca. 1400–1200 BCE).
+        # Medieval/Byzantine Greek
+        "oldi1245": "EarlyIrishGenAIPipeline",
+        "oldw1239": "OldMiddleWelshGenAIPipeline",
+        "bret1244": "MiddleBretonGenAIPipeline",
+        "corn1251": "MiddleCornishGenAIPipeline",
+        ## Germanic
+        # Proto-Norse
+        "goth1244": "GothicGenAIPipeline",
+        "oldh1241": "OldHighGermanGenAIPipeline",
+        "midd1343": "MiddleHighGermanGenAIPipeline",
+        "oldn1244": "OldNorseGenAIPipeline",
+        "olde1238": "OldEnglishGenAIPipeline",
+        "midd1317": "MiddleEnglishGenAIPipeline",
+        ## Balto-Slavic
+        "chur1257": "ChurchSlavonicGenAIPipeline",
+        "prus1238": "OldPrussianGenAIPipeline",
+        "lith1251": "LithuanianGenAIPipeline",
+        "latv1249": "LatvianGenAIPipeline",
+        "gheg1238": "AlbanianGenAIPipeline",
+        ## Armenian, Earliest texts: 5th c. CE (Bible translation by Mesrop Mashtots, who created the script)
+        "clas1256": "ClassicalArmenianGenAIPipeline",
+        "midd1364": "MiddleArmenianGenAIPipeline",
+        # Note this is only a parent, not true languoid
+        ## Anatolian
+        "hitt1242": "HittiteGenAIPipeline",
+        "cune1239": "CuneiformLuwianGenAIPipeline",
+        "hier1240": "HieroglyphicLuwianGenAIPipeline",
+        "lyci1241": "LycianAGenAIPipeline",
+        "lydi1241": "LydianGenAIPipeline",
+        "pala1331": "PalaicGenAIPipeline",
+        "cari1274": "CarianGenAIPipeline",
+        ## Tocharian
+        "tokh1242": "TocharianAGenAIPipeline",
+        "tokh1243": "TocharianBGenAIPipeline",
+        ## Indo-Iranian
+        ## Iranian languages
+        ### SW Iranian
+        "oldp1254": "OldPersianGenAIPipeline",
+        "pahl1241": "MiddlePersianGenAIPipeline",
+        ### NW Iranian
+        "part1239": "ParthianGenAIPipeline",
+        ### E Iranian
+        "aves1237": "AvestanGenAIPipeline",
+        "bact1239": "BactrianGenAIPipeline",
+        "sogd1245": "SogdianGenAIPipeline",
+        "khot1251": "KhotaneseGenAIPipeline",
+        "tums1237": "TumshuqeseGenAIPipeline",
+        # Indo-Aryan (Indic): Sanskrit (Vedic & Classical), Prakrits, Pali, later medieval languages (Hindi, Bengali, etc.)
+        ## Old Indo-Aryan
+        "vedi1234": "VedicSanskritGenAIPipeline",
+        "clas1258": "ClassicalSanskritGenAIPipeline",
+        # Prakrits (Middle Indo-Aryan, ca. 500 BCE–500 CE)
+        "pali1273": "PaliGenAIPipeline",
+        # Ardhamāgadhī, Śaurasenī, Mahārāṣṭrī, etc. — languages of Jain/Buddhist texts and early drama.
+        # ? Glotto says alt_name for Pali; Ardhamāgadhī, literary language associated with Magadha (eastern India); Jain canonical texts (the Āgamas) are written primarily in Ardhamāgadhī
+        "saur1252": "SauraseniPrakritGenAIPipeline",
+        "maha1305": "MaharastriPrakritGenAIPipeline",
+        "maga1260": "MagadhiPrakritGenAIPipeline",
+        "gand1259": "GandhariGenAIPipeline",  ## Middle Indo-Aryan
+        # "Maithili": "mait1250"; Apabhraṃśa; "Apabhramsa" is alt_name; (500–1200 CE); Bridges Prakrits → New Indo-Aryan
+        ## New Indo-Aryan
+        ## Medieval languages (~1200 CE onward):
+        # Early forms of Hindi, Bengali, Gujarati, Marathi, Punjabi, Oriya, Sinhala, etc
+        # North-Western / Hindi Belt
+        "hind1269": "HindiGenAIPipeline",
+        "khad1239": "KhariBoliGenAIPipeline",
+        "braj1242": "BrajGenAIPipeline",
+        "awad1243": "AwadhiGenAIPipeline",
+        "urdu1245": "UrduGenAIPipeline",
+        # Eastern Indo-Aryan
+        "beng1280": "BengaliGenAIPipeline",
+        "oriy1255": "OdiaGenAIPipeline",
+        "assa1263": "AssameseGenAIPipeline",
+        # Western Indo-Aryan
+        "guja1252": "GujaratiGenAIPipeline",
+        "mara1378": "MarathiGenAIPipeline",
+        # Southern Indo-Aryan / adjacency
+        "sinh1246": "SinhalaGenAIPipeline",
+        # Northwestern frontier
+        "panj1256": "EasternPanjabiGenAIPipeline",
+        "sind1272": "SindhiGenAIPipeline",
+        "kash1277": "KashmiriGenAIPipeline",
+        "bagr1243": "BagriGenAIPipeline",
+        # Afroasiatic family
+        ## Semitic languages
+        ### East Semitic
+        "akka1240": "AkkadianGenAIPipeline",
+        # Eblaite
+        ### West Semitic
+        "ugar1238": "UgariticGenAIPipeline",
+        "phoe1239": "PhoenicianGenAIPipeline",
+        "moab1234": "MoabiteGenAIPipeline",
+        "ammo1234": "AmmoniteGenAIPipeline",
+        "edom1234": "EdomiteGenAIPipeline",
+        "anci1244": "BiblicalHebrewGenAIPipeline",
+        # Medieval Hebrew: No Glottolog
+        # "moab1234": Moabite
+        # "ammo1234": Ammonite
+        # "edom1234": Edomite
+        # Old Aramaic (ca. 1000–700 BCE, inscriptions).
+        # "olda1246": "Old Aramaic (up to 700 BCE)",
+        # "Old Aramaic-Sam'alian": "olda1245"
+        "impe1235": "ImperialAramaicGenAIPipeline",
+        "olda1246": "OldAramaicGenAIPipeline",
+        "olda1245": "OldAramaicSamalianGenAIPipeline",
+        "midd1366": "MiddleAramaicGenAIPipeline",
+        "clas1253": "ClassicalMandaicGenAIPipeline",
+        "hatr1234": "HatranGenAIPipeline",
+        "jewi1240": "JewishBabylonianAramaicGenAIPipeline",
+        "sama1234": "SamalianGenAIPipeline",
+        # "midd1366": Middle Aramaic (200 BCE – 700 CE), includes Biblical Aramaic, Palmyrene, Nabataean, Targumic Aramaic.
+        # Eastern Middle Aramaic
+        ##  Classical Mandaic, Hatran, Jewish Babylonian Aramaic dialects, and Classical Syriac
+        "clas1252": "ClassicalSyriacGenAIPipeline",
+        ### NW Semitic
+        ## South Semitic
+        # Old South Arabian (OSA)
+        "geez1241": "GeezGenAIPipeline",
+        ### Central Semitic (bridge between NW and South)
+        # Pre-Islamic Arabic
+        "clas1259": "ClassicalArabicGenAIPipeline",  # Dialect
+        # Glotto doesn't have medieval arabic; Medieval Arabic: scientific, philosophical, historical works dominate much of the Islamic Golden Age corpus.
+        ## Egyptian languages
+        "olde1242": "OldEgyptianGenAIPipeline",
+        "midd1369": "MiddleEgyptianGenAIPipeline",
+        "late1256": "LateEgyptianGenAIPipeline",
+        "demo1234": "DemoticGenAIPipeline",
+        "copt1239": "CopticGenAIPipeline",
+        ## Berber
+        "numi1241": "NumidianGenAIPipeline",
+        "tait1247": "TaitaGenAIPipeline",
+        ## Chadic
+        # ; "haus1257": "Hausa"; Hausa; Essentially oral until medieval period, when Hausa is written in Ajami (Arabic script).
+        "haus1257": "HausaGenAIPipeline",
+        "lite1248": "LiteraryChineseGenAIPipeline",
+        "clas1254": "ClassicalTibetanPipeline",
+        # Sino-Tibetan family
+        # | **Early Vernacular Chinese (Baihua)**   | ca. 10th – 18th c. CE | *(under `clas1255`)* |
+        # | **Old Tibetan**                         | 7th – 10th c. CE     | *(not separately coded)* |
+        "oldc1244": "OldChineseGenAIPipeline",
+        "midd1344": "MiddleChineseGenAIPipeline",
+        "clas1255": "BaihuaChineseGenAIPipeline",
+        "oldb1235": "OldBurmeseGenAIPipeline",
+        "nucl1310": "ClassicalBurmeseGenAIPipeline",
+        "tang1334": "TangutGenAIPipeline",
+        "newa1246": "NewarGenAIPipeline",
+        "mani1292": "MeiteiGenAIPipeline",
+        "sgaw1245": "SgawKarenGenAIPipeline",
+        # Mongolic family
+        "mong1329": "MiddleMongolGenAIPipeline",
+        "mong1331": "ClassicalMongolianGenAIPipeline",  #  TODO: No glottolog broken
+        "mogh1245": "MogholiGenAIPipeline",
+        # Altaic-Adj.
+        "jurc1239": "OldJurchenGenAIPipeline",
+        # Japonic
+        "japo1237": "OldJapaneseGenAIPipeline",
+        # Uralic
+        "oldh1242": "OldHungarianGenAIPipeline",
+        # Turkic
+        "chag1247": "ChagataiGenAIPipeline",
+        "oldu1238": "OldTurkicGenAIPipeline",
+        # TODO: Make pipeline for Ottoman Turkish
+        # "otto1234": OttomanTurkishGenAIPipeline,
+        # Dravidian
+        "oldt1248": "OldTamilGenAIPipeline",
+        # Pre-Modern Literate Language Families (Non-Euro/Afroasiatic/Sino-Tibetan/Mongolic)
+        # | Family         | Language / Stage           | Approx. Period      | Glottocode     |
+        # |----------------|-----------------------------|----------------------|----------------|
+        # | Dravidian      | Old Tamil                   | ca. 300 BCE–300 CE   | `oldt1248`     |
+        # |                | Middle Tamil                | medieval             | *(not coded)*  |
+        # |                | Old Kannada                 | from 5th c. CE       | *(not coded)*  |
+        # |                | Old Telugu                  | from 6th c. CE       | *(not coded)*  |
+        # |                | Old Malayalam               | from 13th c. CE      | *(not coded)*  |
+        # | Turkic         | Old Turkic                  | 8th–10th c. CE       | `oldu1238`     |
+        # |                | Chagatai                    | 15th–18th c. CE      | `chag1247`     |
+        # | Uralic         | Old Hungarian               | 12th–13th c. CE      | `oldh1242`     |
+        # | Koreanic       | Old Korean                  | 7th–10th c. CE       | *(not coded)*  |
+        # |                | Middle Korean               | 15th c. onward       | *(not coded)*  |
+        # | Japonic        | Old Japanese                | 8th c. CE            | `japo1237`     |
+        # | Altaic-Adj.    | Old Jurchen                 | 12th–13th c. CE      | *`jurc1239`*  |
+        # |                | Manchu                      | 17th–18th c. CE      | *(not coded)*  |
+        # | Austroasiatic  | Old Mon                     | from 6th c. CE       | *(not coded)*  |
+        # |                | Old Khmer                   | from 7th c. CE       | *(not coded)*  |
+        # | Austronesian   | Old Javanese (Kawi)         | from 8th c. CE       | *(not coded)*  |
+        # |                | Classical Malay             | from 7th c. CE onward| *(not coded)*  |
+        # | Tai–Kadai      | Old Thai                    | from 13th c. CE      | *(not coded)*  |
+    }
+)
@@ -0,0 +1,271 @@
+"""Lazily materialized registry of curated ``Language`` records.
+
+The curated language data ships as a compact JSON Lines artifact rather than a
+Python literal, so importing CLTK no longer builds thousands of nested pydantic
+objects up front. The first line of the artifact is a header with an offset
+index; every following line holds one ``Language`` dumped with
+``model_dump(mode="json", exclude_defaults=True)``::
+
+    {"format": "cltk-languages", "version": 1, "entries": {
+        "<glottocode>": {"offset": 0, "length": 1234, "iso": "lat",
+                         "names": ["Latin", ...],
+                         "dialects": [["<glottocode>", "<name>", "<code>"], ...],
+                         "status": "extinct", "years": [-75, 200],
+                         "historic_name": true, "historic_alt_name": true},
+        ...}}
+    {"name": "Latin", "glottolog_id": "lati1261", ...}
+    ...
+
+Offsets are byte positions relative to the first record line. The ``iso``,
+``names``, and ``dialects`` fields carry just enough to build the lookup indices
+in ``glottolog.py`` without materializing any ``Language``; ``status`` and
+``years`` (the timespan start and end) and the ``historic_name`` and
+``historic_alt_name`` flags (a name contains one of
+``HISTORIC_NAME_MODIFIERS``) let search rank matches the same way.
+
+``LanguageRegistry`` behaves like the ``dict`` it replaces: it supports item
+assignment and deletion so user-defined languages can still be registered with
+``LANGUAGES[glottocode] = language``.
+"""
+
+import json
+from collections.abc import Iterator, Mapping, MutableMapping
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from cltk.core.data_types import Language
+
+ARTIFACT_FORMAT = "cltk-languages"
+ARTIFACT_VERSION = 1
+
+#: Name tokens marking a historic variety ("Old English", "Ancient Greek").
+HISTORIC_NAME_MODIFIERS: frozenset[str] = frozenset(
+    {
+        "ancient",
+        "old",
+        "middle",
+        "classical",
+        "late",
+        "early",
+        "medieval",
+        "archaic",
+        "literary",
+        "demotic",
+    }
+)
+
+
+class LanguageSummary(NamedTuple):
+    """Lookup fields of a ``Language`` available without materializing it."""
+
+    iso: Optional[str]
+    names: tuple[str, ...]  # primary name first, then alt-name values
+    dialects: tuple[tuple[Optional[str], str, Optional[str]], ...]
+    # (glottolog_id, name, language_code) per dialect
+    status: Optional[str] = None
+    years: tuple[int, ...] = ()  # timespan start and/or end
+    historic_name: bool = False  # primary name has a historic modifier
+    historic_alt_name: bool = False  # some alt-name has one
+
+
+def _has_historic_modifier(name: str) -> bool:
+    return not HISTORIC_NAME_MODIFIERS.isdisjoint(name.lower().split())
+
+
+def summarize_language(language: Language) -> LanguageSummary:
+    """Return the ``LanguageSummary`` for a materialized ``Language``."""
+    return LanguageSummary(
+        iso=language.iso,
+        names=(language.name, *(nv.value for nv in language.alt_names)),
+        dialects=tuple(
+            (d.glottolog_id, d.name, d.language_code) for d in language.dialects
+        ),
+        status=language.status,
+        years=tuple(
+            year
+            for year in (
+                (language.timespan.start, language.timespan.end)
+                if language.timespan
+                else ()
+            )
+            if isinstance(year, int)
+        ),
+        historic_name=_has_historic_modifier(language.name),
+        historic_alt_name=any(
+            _has_historic_modifier(nv.value) for nv in language.alt_names
+        ),
+    )
+
+
+class LanguageRegistry(MutableMapping[str, Language]):
+    """Mapping of glottocode to ``Language`` backed by a compiled artifact.
+
+    The artifact is read on first use and each ``Language`` is validated only
+    when it is first looked up; later lookups return the same object. Keys keep
+    the artifact order, with languages added at runtime appended.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._data: Optional[bytes] = None
+        self._body_start = 0
+        self._spans: dict[str, tuple[int, int]] = {}
+        self._summaries: dict[str, LanguageSummary] = {}
+        self._materialized: dict[str, Language] = {}
+        self._keys: dict[str, None] = {}
+        self._loaded = False
+        self._version = 0
+
+    @property
+    def path(self) -> Path:
+        """Location of the backing artifact."""
+        return self._path
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every assignment or deletion."""
+        return self._version
+
+    def _load(self) -> None:
+        """Read the artifact and parse its header index."""
+        if self._loaded:
+            return
+        data = self._path.read_bytes()
+        newline = data.index(b"\n")
+        header = json.loads(data[:newline])
+        if header.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"{self._path} is not a CLTK language artifact.")
+        if header.get("version") != ARTIFACT_VERSION:
+            raise ValueError(
+                f"Unsupported language artifact version {header.get('version')!r} "
+                f"in {self._path}; expected {ARTIFACT_VERSION}."
+            )
+        keys: dict[str, None] = {}
+        for key, entry in header["entries"].items():
+            self._spans[key] = (entry["offset"], entry["length"])
+            self._summaries[key] = LanguageSummary(
+                iso=entry.get("iso"),
+                names=tuple(entry["names"]),
+                dialects=tuple((d[0], d[1], d[2]) for d in entry.get("dialects", [])),
+                status=entry.get("status"),
+                years=tuple(entry.get("years", ())),
+                historic_name=entry.get("historic_name", False),
+                historic_alt_name=entry.get("historic_alt_name", False),
+            )
+            keys[key] = None
+        self._keys = keys
+        self._data = data
+        self._body_start = newline + 1
+        self._loaded = True
+
+    def __getitem__(self, key: str) -> Language:
+        cached = self._materialized.get(key)
+        if cached is not None:
+            return cached
+        self._load()
+        span = self._spans.get(key)
+        if span is None or key not in self._keys:
+            raise KeyError(key)
+        assert self._data is not None
+        start = self._body_start + span[0]
+        record = json.loads(self._data[start : start + span[1]])
+        language = Language.model_validate(record)
+        self._materialized[key] = language
+        return language
+
+    def __setitem__(self, key: str, value: Language) -> None:
+        self._load()
+        self._materialized[key] = value
+        self._summaries[key] = summarize_language(value)
+        self._spans.pop(key, None)
+        self._keys[key] = None
+        self._version += 1
+
+    def __delitem__(self, key: str) -> None:
+        self._load()
+        if key not in self._keys:
+            raise KeyError(key)
+        del self._keys[key]
+        self._materialized.pop(key, None)
+        self._summaries.pop(key, None)
+        self._spans.pop(key, None)
+        self._version += 1
+
+    def __contains__(self, key: object) -> bool:
+        self._load()
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        self._load()
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        self._load()
+        return (
+            f"{type(self).__name__}({len(self._keys)} languages, "
+            f"{len(self._materialized)} materialized)"
+        )
+
+    def is_materialized(self, key: str) -> bool:
+        """Return True if ``key`` has already been built as a ``Language``."""
+        return key in self._materialized
+
+    def summary(self, key: str) -> LanguageSummary:
+        """Return lookup fields for ``key`` without materializing it."""
+        self._load()
+        if key not in self._keys:
+            raise KeyError(key)
+        return self._summaries[key]
+
+    def summaries(self) -> Iterator[tuple[str, LanguageSummary]]:
+        """Yield ``(glottocode, LanguageSummary)`` pairs in registry order."""
+        self._load()
+        for key in list(self._keys):
+            yield key, self._summaries[key]
+
+
+def write_language_artifact(languages: Mapping[str, Language], path: Path) -> None:
+    """Serialize ``languages`` to the compiled artifact format read by ``LanguageRegistry``.
+
+    Args:
+      languages: Mapping of glottocode to ``Language``, in the desired order.
+      path: Destination file.
+
+    """
+    records: list[bytes] = []
+    entries: dict[str, dict[str, Any]] = {}
+    offset = 0
+    for key, language in languages.items():
+        record = json.dumps(
+            language.model_dump(mode="json", exclude_defaults=True),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        summary = summarize_language(language)
+        entry: dict[str, Any] = {"offset": offset, "length": len(record)}
+        if summary.iso:
+            entry["iso"] = summary.iso
+        entry["names"] = list(summary.names)
+        if summary.dialects:
+            entry["dialects"] = [list(d) for d in summary.dialects]
+        if summary.status:
+            entry["status"] = summary.status
+        if summary.years:
+            entry["years"] = list(summary.years)
+        if summary.historic_name:
+            entry["historic_name"] = True
+        if summary.historic_alt_name:
+            entry["historic_alt_name"] = True
+        entries[key] = entry
+        records.append(record)
+        offset += len(record) + 1
+    header = json.dumps(
+        {"format": ARTIFACT_FORMAT, "version": ARTIFACT_VERSION, "entries": entries},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    path.write_bytes(b"\n".join([header, *records]) + b"\n")
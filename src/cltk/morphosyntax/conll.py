@@ -285,7 +285,7 @@ def conllu_to_words(conllu: str) -> list[Word]:
         upos_obj: Optional[UDPartOfSpeechTag] = None
         if upos_raw and upos_raw != "_":
             try:
-                upos_obj = UDPartOfSpeechTag(tag=upos_raw)
+                upos_obj = UDPartOfSpeechTag.trusted(upos_raw)
             except Exception as e:
                 logger.debug("Could not build UDPartOfSpeechTag(%r): %s", upos_raw, e)
                 upos_obj = None
@@ -302,30 +302,6 @@ def conllu_to_words(conllu: str) -> list[Word]:
             except Exception as e:
                 logger.debug("Could not parse FEATS %r: %s", feats_raw, e)
 
-        # Build Word (index_token 0-based)
-        try:
-            w = Word(
-                string=None if form == "_" else form,
-                index_token=tid_i - 1,
-                lemma=None if lemma == "_" else lemma,
-                upos=upos_obj,
-            )
-        except Exception:
-            # Fallback minimal constructor
-            w = Word(string=None if form == "_" else form, index_token=tid_i - 1)
-            # Try to assign upos if dataclass allows attribute setting
-            try:
-                setattr(w, "upos", upos_obj)
-            except Exception:
-                pass
-
-        # Assign features if possible
-        try:
-            setattr(w, "features", feats_obj)
-        except Exception:
-            pass
-
-        # Optional dependency info
         # HEAD
         head_val: Optional[int] = None
         if head_raw and head_raw != "_":
@@ -333,19 +309,16 @@ def conllu_to_words(conllu: str) -> list[Word]:
                 head_val = int(head_raw)
             except Exception:
                 head_val = None
-        for cand in ("head", "head_index", "governor", "head_id"):
-            try:
-                setattr(w, cand, head_val)
-                break
-            except Exception:
-                continue
-        # DEPREL
-        if deprel_raw and deprel_raw != "_":
-            try:
-                setattr(w, "deprel", deprel_raw)
-            except Exception:
-                pass
 
+        # Build Word (index_token 0-based) from the values checked above
+        w = Word.trusted(
+            string=None if form == "_" else form,
+            index_token=tid_i - 1,
+            lemma=None if lemma == "_" else lemma,
+            upos=upos_obj,
+            features=feats_obj,
+            governor=head_val,
+        )
         out.append(w)
 
     remap_report.log_summary(label="Unmapped UD feature pairs from CoNLL-U")
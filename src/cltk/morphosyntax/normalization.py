@@ -2,10 +2,12 @@
 
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from cltk.core.cltk_logger import logger
 from cltk.core.data_types import UDFeatureTag, UDFeatureTagSet
+from cltk.core.trusted_models import construct_trusted
 
 
 @dataclass
@@ -467,6 +469,9 @@ def convert_pos_features_to_ud(
     ``"Case=Nom|Number=Sing|Gender=Masc"``. Unknown or unmappable pairs are
     skipped and optionally recorded in ``remap_report``.
 
+    Parsing is memoized by ``feats_raw``: repeated strings return the same
+    immutable ``UDFeatureTagSet``. Skipped pairs are reported on every call.
+
     Args:
         feats_raw: Raw feature string containing ``key=value`` pairs separated by
             ``|``.
@@ -478,7 +483,26 @@ def convert_pos_features_to_ud(
         A ``UDFeatureTagSet`` containing validated features (possibly empty).
 
     """
-    features_tag_set = UDFeatureTagSet()
+    tag_set, invalid_pairs = _parse_feats(feats_raw)
+    for raw_feature_key, raw_feature_value in invalid_pairs:
+        if remap_report is not None:
+            remap_report.record(
+                raw_feature_key, raw_feature_value, source_word=source_word
+            )
+        else:
+            logger.warning(
+                f"Skipping invalid feature: {raw_feature_key}={raw_feature_value}"
+            )
+    return tag_set
+
+
+@lru_cache(maxsize=8192)
+def _parse_feats(
+    feats_raw: str,
+) -> tuple[UDFeatureTagSet, tuple[tuple[str, str], ...]]:
+    """Return the shared tag set for ``feats_raw`` and the pairs it skipped."""
+    features: list[UDFeatureTag] = []
+    invalid_pairs: list[tuple[str, str]] = []
     raw_features_pairs: list[tuple[str, str]] = [
         tup
         for tup in (
@@ -488,23 +512,13 @@ def convert_pos_features_to_ud(
         )
         if len(tup) == 2
     ]
-    logger.debug(f"raw_features_pairs: {raw_features_pairs}")
+    logger.debug("raw_features_pairs: %s", raw_features_pairs)
     for raw_feature_key, raw_feature_value in raw_features_pairs:
         try:
-            feature_tag = UDFeatureTag(
-                key=raw_feature_key,
-                value=raw_feature_value,
-            )
-            features_tag_set.features.append(feature_tag)
-            logger.debug(f"feature_tag: {feature_tag}")
+            feature_tag = UDFeatureTag.trusted(raw_feature_key, raw_feature_value)
+            features.append(feature_tag)
+            logger.debug("feature_tag: %s", feature_tag)
         except ValueError:
-            if remap_report is not None:
-                remap_report.record(
-                    raw_feature_key, raw_feature_value, source_word=source_word
-                )
-            else:
-                logger.warning(
-                    f"Skipping invalid feature: {raw_feature_key}={raw_feature_value}"
-                )
-            continue  # Skip this feature and move on
-    return features_tag_set
+            invalid_pairs.append((raw_feature_key, raw_feature_value))
+    tag_set = construct_trusted(UDFeatureTagSet, {"features": tuple(features)})
+    return tag_set, tuple(invalid_pairs)
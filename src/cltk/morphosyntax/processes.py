@@ -1,12 +1,13 @@
 """Processes of POS and feature tagging."""
 
 from collections.abc import Callable
-from copy import copy
 from functools import cached_property
 from typing import ClassVar, Optional
 
 from cltk.core.cltk_logger import bind_context
 from cltk.core.data_types import Doc, Process
+from cltk.core.fault_tolerance import failed_sentence_indices
+from cltk.core.lazy_classes import LazyClassTable, build_subclass
 from cltk.core.logging_utils import bind_from_doc
 from cltk.core.process_registry import register_process
 from cltk.genai.prompt_registry import (
@@ -49,7 +50,20 @@ class GenAIMorphosyntaxProcess(MorphosyntaxProcess):
 
     def run(self, input_doc: Doc) -> Doc:
         """Run the configured GPT morphosyntax tagging workflow."""
-        output_doc = copy(input_doc)
+        return self._annotate(input_doc)
+
+    def retry_failed(self, input_doc: Doc) -> Doc:
+        """Re-run morphosyntax only for sentences recorded as failed."""
+        indices = failed_sentence_indices(input_doc, "pos")
+        if not indices:
+            return input_doc
+        return self._annotate(input_doc, sentence_indices=indices)
+
+    def _annotate(
+        self, input_doc: Doc, sentence_indices: Optional[list[int]] = None
+    ) -> Doc:
+        """Tag all sentences, or only ``sentence_indices`` when given."""
+        output_doc = input_doc.fork()
         if not output_doc.normalized_text:
             msg: str = "Doc must have `normalized_text`."
             bind_from_doc(output_doc).error(msg)
@@ -81,861 +95,274 @@ class GenAIMorphosyntaxProcess(MorphosyntaxProcess):
             prompt_profile=self.prompt_profile,
             prompt_digest=prompt_digest,
             provenance_process=f"{self.process_id}:{self.__class__.__name__}",
+            sentence_indices=sentence_indices,
         )
         return output_doc
 
 
-class CuneiformLuwianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "cune1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Cuneiform Luwian language."
-    authorship_info: str = "CLTK"
-
-
-class HieroglyphicLuwianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hier1240"
-    description: str = "Default morphology tagging process using a generative GPT model for the Hieroglyphic Luwian language."
-    authorship_info: str = "CLTK"
-
-
-class OldPrussianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "prus1238"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Prussian language."
-    authorship_info: str = "CLTK"
-
-
-class LithuanianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lith1251"
-    description: str = "Default morphology tagging process using a generative GPT model for the Lithuanian language."
-    authorship_info: str = "CLTK"
-
-
-class LatvianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "latv1249"
-    description: str = "Default morphology tagging process using a generative GPT model for the Latvian language."
-    authorship_info: str = "CLTK"
-
-
-class AlbanianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "gheg1238"
-    description: str = "Default morphology tagging process using a generative GPT model for the Albanian language."
-    authorship_info: str = "CLTK"
-
-
-class AkkadianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "akka1240"
-    description: str = "Default morphology tagging process using a generative GPT model for the Akkadian language."
-    authorship_info: str = "CLTK"
-
-
-class AncientGreekGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "anci1242"
-    description: str = "Default morphology tagging process using a generative GPT model for the Ancient Greek language."
-    authorship_info: str = "CLTK"
-
-
-class BiblicalHebrewGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "anci1244"
-    description: str = "Default morphology tagging process using a generative GPT model for the Biblical Hebrew language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalArabicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1259"
-    description: str = "Default morphology tagging process using a generative GPT model for the Classical Arabic language."
-    authorship_info: str = "CLTK"
-
-
-class AvestanGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "aves1237"
-    description: str = "Default morphology tagging process using a generative GPT model for the Avestan language."
-    authorship_info: str = "CLTK"
-
-
-class BactrianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "bact1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Bactrian language."
-    authorship_info: str = "CLTK"
-
-
-class SogdianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sogd1245"
-    description: str = "Default morphology tagging process using a generative GPT model for the Sogdian language."
-    authorship_info: str = "CLTK"
-
-
-class BengaliGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "beng1280"
-    description: str = "Default morphology tagging process using a generative GPT model for the Bengali language."
-    authorship_info: str = "CLTK"
-
-
-class CarianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "cari1274"
-    description: str = "Default morphology tagging process using a generative GPT model for the Carian language."
-    authorship_info: str = "CLTK"
-
-
-class ChurchSlavicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "chur1257"
-    description: str = "Default morphology tagging process using a generative GPT model for the Church Slavic language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalArmenianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1256"
-    description: str = "Default morphology tagging process using a generative GPT model for the Classical Armenian language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalMandaicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1253"
-    description: str = "Default morphology tagging process using a generative GPT model for the Classical Mandaic language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalMongolianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mong1331"
-    description: str = "Default morphology tagging process using a generative GPT model for the Classical Mongolian language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalSyriacGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1252"
-    description: str = "Default morphology tagging process using a generative GPT model for the Classical Syriac language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalTibetanGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1254"
-    description: str = "Default morphology tagging process using a generative GPT model for the Classical Tibetan language."
-    authorship_info: str = "CLTK"
-
-
-class CopticGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "copt1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Coptic language."
-    authorship_info: str = "CLTK"
-
-
-class DemoticGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "demo1234"
-    description: str = "Default morphology tagging process using a generative GPT model for the Demotic language."
-    authorship_info: str = "CLTK"
-
-
-class EasternPanjabiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "panj1256"
-    description: str = "Default morphology tagging process using a generative GPT model for the Eastern Panjabi language."
-    authorship_info: str = "CLTK"
-
-
-class EdomiteGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "edom1234"
-    description: str = "Default morphology tagging process using a generative GPT model for the Edomite language."
-    authorship_info: str = "CLTK"
-
-
-class GeezGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "geez1241"
-    description: str = "Default morphology tagging process using a generative GPT model for the Geez language."
-    authorship_info: str = "CLTK"
-
-
-class GothicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "goth1244"
-    description: str = "Default morphology tagging process using a generative GPT model for the Gothic language."
-    authorship_info: str = "CLTK"
-
-
-class GujaratiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "guja1252"
-    description: str = "Default morphology tagging process using a generative GPT model for the Gujarati language."
-    authorship_info: str = "CLTK"
-
-
-class HindiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hind1269"
-    description: str = "Default morphology tagging process using a generative GPT model for the Hindi language."
-    authorship_info: str = "CLTK"
-
-
-class KhariBoliGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "khad1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Khari Boli dialect of Hindi."
-    authorship_info: str = "CLTK"
-
-
-class BrajGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "braj1242"
-    description: str = "Default morphology tagging process using a generative GPT model for the Braj Bhasha language."
-    authorship_info: str = "CLTK"
-
-
-class AwadhiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "awad1243"
-    description: str = "Default morphology tagging process using a generative GPT model for the Awadhi language."
-    authorship_info: str = "CLTK"
-
-
-class HittiteGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hitt1242"
-    description: str = "Default morphology tagging process using a generative GPT model for the Hittite language."
-    authorship_info: str = "CLTK"
-
-
-class KhotaneseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "khot1251"
-    description: str = "Default morphology tagging process using a generative GPT model for the Khotanese language."
-    authorship_info: str = "CLTK"
-
-
-class TumshuqeseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tums1237"
-    description: str = "Default morphology tagging process using a generative GPT model for the Tumshuqese language."
-    authorship_info: str = "CLTK"
-
-
-class LateEgyptianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "late1256"
-    description: str = "Default morphology tagging process using a generative GPT model for the Late Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class LatinGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lati1261"
-    description: str = "Default morphology tagging process using a generative GPT model for the Latin language."
-    authorship_info: str = "CLTK"
-
-
-class LiteraryChineseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lite1248"
-    description: str = "Default morphology tagging process using a generative GPT model for the Literary Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class LycianAGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lyci1241"
-    description: str = "Default morphology tagging process using a generative GPT model for the Lycian A language."
-    authorship_info: str = "CLTK"
-
-
-class LydianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lydi1241"
-    description: str = "Default morphology tagging process using a generative GPT model for the Lydian language."
-    authorship_info: str = "CLTK"
-
-
-class MaharastriPrakritGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "maha1305"
-    description: str = "Default morphology tagging process using a generative GPT model for the Maharastri Prakrit language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleArmenianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1364"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle Armenian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleBretonGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldb1244"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle Breton language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleChineseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1344"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleCornishGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "corn1251"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle Cornish language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleEgyptianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1369"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleEnglishGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1317"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle English language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleFrenchGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1316"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle French language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleHighGermanGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1343"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle High German language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleMongolGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mong1329"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle Mongol language."
-    authorship_info: str = "CLTK"
-
-
-class MoabiteGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "moab1234"
-    description: str = "Default morphology tagging process using a generative GPT model for the Moabite language."
-    authorship_info: str = "CLTK"
-
-
-class OdiaGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oriy1255"
-    description: str = "Default morphology tagging process using a generative GPT model for the Odia language."
-    authorship_info: str = "CLTK"
-
-
-class OfficialAramaicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "impe1235"
-    description: str = "Default morphology tagging process using a generative GPT model for the Official Aramaic (700-300 BCE) language."
-    authorship_info: str = "CLTK"
-
-
-class OldBurmeseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldb1235"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Burmese language."
-    authorship_info: str = "CLTK"
-
-
-class OldChineseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldc1244"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class BaihuaChineseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1255"
-    description: str = "Default morphology tagging process using a generative GPT model for Early Vernacular Chinese (Baihua)."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalBurmeseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "nucl1310"
-    description: str = "Default morphology tagging process using a generative GPT model for the Classical Burmese language."
-    authorship_info: str = "CLTK"
-
-
-class TangutGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tang1334"
-    description: str = "Default morphology tagging process using a generative GPT model for the Tangut (Xixia) language."
-    authorship_info: str = "CLTK"
-
-
-class NewarGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "newa1246"
-    description: str = "Default morphology tagging process using a generative GPT model for the Newar (Classical Nepal Bhasa) language."
-    authorship_info: str = "CLTK"
-
-
-class MeiteiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mani1292"
-    description: str = "Default morphology tagging process using a generative GPT model for the Meitei (Classical Manipuri) language."
-    authorship_info: str = "CLTK"
-
-
-class SgawKarenGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sgaw1245"
-    description: str = "Default morphology tagging process using a generative GPT model for the Sgaw Karen language."
-    authorship_info: str = "CLTK"
-
-
-class MogholiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mogh1245"
-    description: str = "Default morphology tagging process using a generative GPT model for the Mogholi (Moghol) language."
-    authorship_info: str = "CLTK"
-
-
-class NumidianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "numi1241"
-    description: str = "Default morphology tagging process using a generative GPT model for the Numidian (Ancient Berber) language."
-    authorship_info: str = "CLTK"
-
-
-class TaitaGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tait1247"
-    description: str = "Default morphology tagging process using a generative GPT model for the Cushitic Taita language."
-    authorship_info: str = "CLTK"
-
-
-class HausaGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "haus1257"
-    description: str = "Default morphology tagging process using a generative GPT model for the Hausa language."
-    authorship_info: str = "CLTK"
-
-
-class OldJurchenGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "jurc1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Jurchen language."
-    authorship_info: str = "CLTK"
-
-
-class OldJapaneseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "japo1237"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Japanese language."
-    authorship_info: str = "CLTK"
-
-
-class OldHungarianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldh1242"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Hungarian language."
-    authorship_info: str = "CLTK"
-
-
-class ChagataiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "chag1247"
-    description: str = "Default morphology tagging process using a generative GPT model for the Chagatai language."
-    authorship_info: str = "CLTK"
-
-
-class OldTurkicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldu1238"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Turkic language."
-    authorship_info: str = "CLTK"
-
-
-class OldTamilGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldt1248"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Tamil language."
-    authorship_info: str = "CLTK"
-
-
-class AmmoniteGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "ammo1234"
-    description: str = "Default morphology tagging process using a generative GPT model for the Ammonite language."
-    authorship_info: str = "CLTK"
-
-
-class OldAramaicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olda1246"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Aramaic (up to 700 BCE) language."
-    authorship_info: str = "CLTK"
-
-
-class OldAramaicSamalianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olda1245"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Aramaic–Samʾalian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleAramaicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1366"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle Aramaic language."
-    authorship_info: str = "CLTK"
-
-
-class HatranGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hatr1234"
-    description: str = "Default morphology tagging process using a generative GPT model for the Hatran language."
-    authorship_info: str = "CLTK"
-
-
-class JewishBabylonianAramaicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "jewi1240"
-    description: str = "Default morphology tagging process using a generative GPT model for the Jewish Babylonian Aramaic language."
-    authorship_info: str = "CLTK"
-
-
-class SamalianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sama1234"
-    description: str = "Default morphology tagging process using a generative GPT model for the Samʾalian language."
-    authorship_info: str = "CLTK"
-
-
-class OldEgyptianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olde1242"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class OldEnglishGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olde1238"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old English (ca. 450-1100) language."
-    authorship_info: str = "CLTK"
-
-
-class OldFrenchGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldf1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old French (842-ca. 1400) language."
-    authorship_info: str = "CLTK"
-
-
-class OldHighGermanGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldh1241"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old High German (ca. 750-1050) language."
-    authorship_info: str = "CLTK"
-
-
-class EarlyIrishGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldi1245"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Irish language."
-    authorship_info: str = "CLTK"
-
-
-class MarathiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mara1378"
-    description: str = "Default morphology tagging process using a generative GPT model for the Marathi language."
-    authorship_info: str = "CLTK"
-
-
-class OldNorseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldn1244"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Norse language."
-    authorship_info: str = "CLTK"
-
-
-class OldPersianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldp1254"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old Persian (ca. 600-400 B.C.) language."
-    authorship_info: str = "CLTK"
-
-
-class OldMiddleWelshGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldw1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Old-Middle Welsh language."
-    authorship_info: str = "CLTK"
-
-
-class ParthianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "part1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Parthian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddlePersianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pahl1241"
-    description: str = "Default morphology tagging process using a generative GPT model for the Middle Persian language."
-    authorship_info: str = "CLTK"
-
-
-class PalaicGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pala1331"
-    description: str = "Default morphology tagging process using a generative GPT model for the Palaic language."
-    authorship_info: str = "CLTK"
-
-
-class PaliGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pali1273"
-    description: str = "Default morphology tagging process using a generative GPT model for the Pali language."
-    authorship_info: str = "CLTK"
-
-
-class PhoenicianGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "phoe1239"
-    description: str = "Default morphology tagging process using a generative GPT model for the Phoenician language."
-    authorship_info: str = "CLTK"
-
-
-class PunjabiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "panj1256"
-    description: str = "Default morphology tagging process using a generative GPT model for the Punjabi language."
-    authorship_info: str = "CLTK"
-
-
-class AssameseGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "assa1263"
-    description: str = "Default morphology tagging process using a generative GPT model for the Assamese language."
-    authorship_info: str = "CLTK"
-
-
-class SinhalaGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sinh1246"
-    description: str = "Default morphology tagging process using a generative GPT model for the Sinhala language."
-    authorship_info: str = "CLTK"
-
-
-class SindhiGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sind1272"
-    description: str = "Default morphology tagging process using a generative GPT model for the Sindhi language."
-    authorship_info: str = "CLTK"
-
-
-class KashmiriGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "kash1277"
-    description: str = "Default morphology tagging process using a generative GPT model for the Kashmiri language."
-    authorship_info: str = "CLTK"
-
-
-class BagriGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "bagr1243"
-    description: str = "Default morphology tagging process using a generative GPT model for the Bagri (Rajasthani) language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalSanskritGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1258"
-    description: str = "Default morphology tagging process using a generative GPT model for the Classical Sanskrit language."
-    authorship_info: str = "CLTK"
-
-
-class VedicSanskritGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "vedi1234"
-    description: str = "Default morphology tagging process using a generative GPT model for the Vedic Sanskrit language."
-    authorship_info: str = "CLTK"
-
-
-class TokharianAGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "toch1238"
-    description: str = "Default morphology tagging process using a generative GPT model for the Tokharian A language."
-    authorship_info: str = "CLTK"
-
-
-class TokharianBGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "toch1237"
-    description: str = "Default morphology tagging process using a generative GPT model for the Tokharian B language."
-    authorship_info: str = "CLTK"
-
-
-class UgariticGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "ugar1238"
-    description: str = "Default morphology tagging process using a generative GPT model for the Ugaritic language."
-    authorship_info: str = "CLTK"
-
-
-class UrduGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "urdu1245"
-    description: str = "Default morphology tagging process using a generative GPT model for the Urdu language."
-    authorship_info: str = "CLTK"
-
-
-class SauraseniPrakritGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "saur1252"
-    description: str = "Default morphology tagging process using a generative GPT model for the Sauraseni Prakrit language."
-    authorship_info: str = "CLTK"
-
-
-class MagadhiPrakritGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
+# Per-language subclasses of ``GenAIMorphosyntaxProcess``: class name -> (glottolog_id,
+# language phrase used in ``description``). Classes are created on first
+# access through the module ``__getattr__``.
+_LANGUAGE_PROCESSES: dict[str, tuple[str, str]] = {
+    "CuneiformLuwianGenAIMorphosyntaxProcess": (
+        "cune1239",
+        "the Cuneiform Luwian language",
+    ),
+    "HieroglyphicLuwianGenAIMorphosyntaxProcess": (
+        "hier1240",
+        "the Hieroglyphic Luwian language",
+    ),
+    "OldPrussianGenAIMorphosyntaxProcess": ("prus1238", "the Old Prussian language"),
+    "LithuanianGenAIMorphosyntaxProcess": ("lith1251", "the Lithuanian language"),
+    "LatvianGenAIMorphosyntaxProcess": ("latv1249", "the Latvian language"),
+    "AlbanianGenAIMorphosyntaxProcess": ("gheg1238", "the Albanian language"),
+    "AkkadianGenAIMorphosyntaxProcess": ("akka1240", "the Akkadian language"),
+    "AncientGreekGenAIMorphosyntaxProcess": ("anci1242", "the Ancient Greek language"),
+    "BiblicalHebrewGenAIMorphosyntaxProcess": (
+        "anci1244",
+        "the Biblical Hebrew language",
+    ),
+    "ClassicalArabicGenAIMorphosyntaxProcess": (
+        "clas1259",
+        "the Classical Arabic language",
+    ),
+    "AvestanGenAIMorphosyntaxProcess": ("aves1237", "the Avestan language"),
+    "BactrianGenAIMorphosyntaxProcess": ("bact1239", "the Bactrian language"),
+    "SogdianGenAIMorphosyntaxProcess": ("sogd1245", "the Sogdian language"),
+    "BengaliGenAIMorphosyntaxProcess": ("beng1280", "the Bengali language"),
+    "CarianGenAIMorphosyntaxProcess": ("cari1274", "the Carian language"),
+    "ChurchSlavicGenAIMorphosyntaxProcess": ("chur1257", "the Church Slavic language"),
+    "ClassicalArmenianGenAIMorphosyntaxProcess": (
+        "clas1256",
+        "the Classical Armenian language",
+    ),
+    "ClassicalMandaicGenAIMorphosyntaxProcess": (
+        "clas1253",
+        "the Classical Mandaic language",
+    ),
+    "ClassicalMongolianGenAIMorphosyntaxProcess": (
+        "mong1331",
+        "the Classical Mongolian language",
+    ),
+    "ClassicalSyriacGenAIMorphosyntaxProcess": (
+        "clas1252",
+        "the Classical Syriac language",
+    ),
+    "ClassicalTibetanGenAIMorphosyntaxProcess": (
+        "clas1254",
+        "the Classical Tibetan language",
+    ),
+    "CopticGenAIMorphosyntaxProcess": ("copt1239", "the Coptic language"),
+    "DemoticGenAIMorphosyntaxProcess": ("demo1234", "the Demotic language"),
+    "EasternPanjabiGenAIMorphosyntaxProcess": (
+        "panj1256",
+        "the Eastern Panjabi language",
+    ),
+    "EdomiteGenAIMorphosyntaxProcess": ("edom1234", "the Edomite language"),
+    "GeezGenAIMorphosyntaxProcess": ("geez1241", "the Geez language"),
+    "GothicGenAIMorphosyntaxProcess": ("goth1244", "the Gothic language"),
+    "GujaratiGenAIMorphosyntaxProcess": ("guja1252", "the Gujarati language"),
+    "HindiGenAIMorphosyntaxProcess": ("hind1269", "the Hindi language"),
+    "KhariBoliGenAIMorphosyntaxProcess": (
+        "khad1239",
+        "the Khari Boli dialect of Hindi",
+    ),
+    "BrajGenAIMorphosyntaxProcess": ("braj1242", "the Braj Bhasha language"),
+    "AwadhiGenAIMorphosyntaxProcess": ("awad1243", "the Awadhi language"),
+    "HittiteGenAIMorphosyntaxProcess": ("hitt1242", "the Hittite language"),
+    "KhotaneseGenAIMorphosyntaxProcess": ("khot1251", "the Khotanese language"),
+    "TumshuqeseGenAIMorphosyntaxProcess": ("tums1237", "the Tumshuqese language"),
+    "LateEgyptianGenAIMorphosyntaxProcess": ("late1256", "the Late Egyptian language"),
+    "LatinGenAIMorphosyntaxProcess": ("lati1261", "the Latin language"),
+    "LiteraryChineseGenAIMorphosyntaxProcess": (
+        "lite1248",
+        "the Literary Chinese language",
+    ),
+    "LycianAGenAIMorphosyntaxProcess": ("lyci1241", "the Lycian A language"),
+    "LydianGenAIMorphosyntaxProcess": ("lydi1241", "the Lydian language"),
+    "MaharastriPrakritGenAIMorphosyntaxProcess": (
+        "maha1305",
+        "the Maharastri Prakrit language",
+    ),
+    "MiddleArmenianGenAIMorphosyntaxProcess": (
+        "midd1364",
+        "the Middle Armenian language",
+    ),
+    "MiddleBretonGenAIMorphosyntaxProcess": ("oldb1244", "the Middle Breton language"),
+    "MiddleChineseGenAIMorphosyntaxProcess": (
+        "midd1344",
+        "the Middle Chinese language",
+    ),
+    "MiddleCornishGenAIMorphosyntaxProcess": (
+        "corn1251",
+        "the Middle Cornish language",
+    ),
+    "MiddleEgyptianGenAIMorphosyntaxProcess": (
+        "midd1369",
+        "the Middle Egyptian language",
+    ),
+    "MiddleEnglishGenAIMorphosyntaxProcess": (
+        "midd1317",
+        "the Middle English language",
+    ),
+    "MiddleFrenchGenAIMorphosyntaxProcess": ("midd1316", "the Middle French language"),
+    "MiddleHighGermanGenAIMorphosyntaxProcess": (
+        "midd1343",
+        "the Middle High German language",
+    ),
+    "MiddleMongolGenAIMorphosyntaxProcess": ("mong1329", "the Middle Mongol language"),
+    "MoabiteGenAIMorphosyntaxProcess": ("moab1234", "the Moabite language"),
+    "OdiaGenAIMorphosyntaxProcess": ("oriy1255", "the Odia language"),
+    "OfficialAramaicGenAIMorphosyntaxProcess": (
+        "impe1235",
+        "the Official Aramaic (700-300 BCE) language",
+    ),
+    "OldBurmeseGenAIMorphosyntaxProcess": ("oldb1235", "the Old Burmese language"),
+    "OldChineseGenAIMorphosyntaxProcess": ("oldc1244", "the Old Chinese language"),
+    "BaihuaChineseGenAIMorphosyntaxProcess": (
+        "clas1255",
+        "Early Vernacular Chinese (Baihua)",
+    ),
+    "ClassicalBurmeseGenAIMorphosyntaxProcess": (
+        "nucl1310",
+        "the Classical Burmese language",
+    ),
+    "TangutGenAIMorphosyntaxProcess": ("tang1334", "the Tangut (Xixia) language"),
+    "NewarGenAIMorphosyntaxProcess": (
+        "newa1246",
+        "the Newar (Classical Nepal Bhasa) language",
+    ),
+    "MeiteiGenAIMorphosyntaxProcess": (
+        "mani1292",
+        "the Meitei (Classical Manipuri) language",
+    ),
+    "SgawKarenGenAIMorphosyntaxProcess": ("sgaw1245", "the Sgaw Karen language"),
+    "MogholiGenAIMorphosyntaxProcess": ("mogh1245", "the Mogholi (Moghol) language"),
+    "NumidianGenAIMorphosyntaxProcess": (
+        "numi1241",
+        "the Numidian (Ancient Berber) language",
+    ),
+    "TaitaGenAIMorphosyntaxProcess": ("tait1247", "the Cushitic Taita language"),
+    "HausaGenAIMorphosyntaxProcess": ("haus1257", "the Hausa language"),
+    "OldJurchenGenAIMorphosyntaxProcess": ("jurc1239", "the Old Jurchen language"),
+    "OldJapaneseGenAIMorphosyntaxProcess": ("japo1237", "the Old Japanese language"),
+    "OldHungarianGenAIMorphosyntaxProcess": ("oldh1242", "the Old Hungarian language"),
+    "ChagataiGenAIMorphosyntaxProcess": ("chag1247", "the Chagatai language"),
+    "OldTurkicGenAIMorphosyntaxProcess": ("oldu1238", "the Old Turkic language"),
+    "OldTamilGenAIMorphosyntaxProcess": ("oldt1248", "the Old Tamil language"),
+    "AmmoniteGenAIMorphosyntaxProcess": ("ammo1234", "the Ammonite language"),
+    "OldAramaicGenAIMorphosyntaxProcess": (
+        "olda1246",
+        "the Old Aramaic (up to 700 BCE) language",
+    ),
+    "OldAramaicSamalianGenAIMorphosyntaxProcess": (
+        "olda1245",
+        "the Old Aramaic–Samʾalian language",
+    ),
+    "MiddleAramaicGenAIMorphosyntaxProcess": (
+        "midd1366",
+        "the Middle Aramaic language",
+    ),
+    "HatranGenAIMorphosyntaxProcess": ("hatr1234", "the Hatran language"),
+    "JewishBabylonianAramaicGenAIMorphosyntaxProcess": (
+        "jewi1240",
+        "the Jewish Babylonian Aramaic language",
+    ),
+    "SamalianGenAIMorphosyntaxProcess": ("sama1234", "the Samʾalian language"),
+    "OldEgyptianGenAIMorphosyntaxProcess": ("olde1242", "the Old Egyptian language"),
+    "OldEnglishGenAIMorphosyntaxProcess": (
+        "olde1238",
+        "the Old English (ca. 450-1100) language",
+    ),
+    "OldFrenchGenAIMorphosyntaxProcess": (
+        "oldf1239",
+        "the Old French (842-ca. 1400) language",
+    ),
+    "OldHighGermanGenAIMorphosyntaxProcess": (
+        "oldh1241",
+        "the Old High German (ca. 750-1050) language",
+    ),
+    "EarlyIrishGenAIMorphosyntaxProcess": ("oldi1245", "the Old Irish language"),
+    "MarathiGenAIMorphosyntaxProcess": ("mara1378", "the Marathi language"),
+    "OldNorseGenAIMorphosyntaxProcess": ("oldn1244", "the Old Norse language"),
+    "OldPersianGenAIMorphosyntaxProcess": (
+        "oldp1254",
+        "the Old Persian (ca. 600-400 B.C.) language",
+    ),
+    "OldMiddleWelshGenAIMorphosyntaxProcess": (
+        "oldw1239",
+        "the Old-Middle Welsh language",
+    ),
+    "ParthianGenAIMorphosyntaxProcess": ("part1239", "the Parthian language"),
+    "MiddlePersianGenAIMorphosyntaxProcess": (
+        "pahl1241",
+        "the Middle Persian language",
+    ),
+    "PalaicGenAIMorphosyntaxProcess": ("pala1331", "the Palaic language"),
+    "PaliGenAIMorphosyntaxProcess": ("pali1273", "the Pali language"),
+    "PhoenicianGenAIMorphosyntaxProcess": ("phoe1239", "the Phoenician language"),
+    "PunjabiGenAIMorphosyntaxProcess": ("panj1256", "the Punjabi language"),
+    "AssameseGenAIMorphosyntaxProcess": ("assa1263", "the Assamese language"),
+    "SinhalaGenAIMorphosyntaxProcess": ("sinh1246", "the Sinhala language"),
+    "SindhiGenAIMorphosyntaxProcess": ("sind1272", "the Sindhi language"),
+    "KashmiriGenAIMorphosyntaxProcess": ("kash1277", "the Kashmiri language"),
+    "BagriGenAIMorphosyntaxProcess": ("bagr1243", "the Bagri (Rajasthani) language"),
+    "ClassicalSanskritGenAIMorphosyntaxProcess": (
+        "clas1258",
+        "the Classical Sanskrit language",
+    ),
+    "VedicSanskritGenAIMorphosyntaxProcess": (
+        "vedi1234",
+        "the Vedic Sanskrit language",
+    ),
+    "TokharianAGenAIMorphosyntaxProcess": ("toch1238", "the Tokharian A language"),
+    "TokharianBGenAIMorphosyntaxProcess": ("toch1237", "the Tokharian B language"),
+    "UgariticGenAIMorphosyntaxProcess": ("ugar1238", "the Ugaritic language"),
+    "UrduGenAIMorphosyntaxProcess": ("urdu1245", "the Urdu language"),
+    "SauraseniPrakritGenAIMorphosyntaxProcess": (
+        "saur1252",
+        "the Sauraseni Prakrit language",
+    ),
+    "MagadhiPrakritGenAIMorphosyntaxProcess": (
+        "maga1260",
+        "the Magadhi Prakrit language",
+    ),
+    "GandhariGenAIMorphosyntaxProcess": ("gand1259", "the Gandhari language"),
+}
+
+
+def _build_language_process(
+    name: str, row: tuple[str, str]
+) -> type[GenAIMorphosyntaxProcess]:
+    """Create the per-language ``GenAIMorphosyntaxProcess`` subclass for ``name``."""
+    glottolog_id, language = row
+    return build_subclass(
+        GenAIMorphosyntaxProcess,
+        name,
+        __name__,
+        "Language-specific morphosyntax process using a generative GPT model.",
+        {
+            "glottolog_id": (Optional[str], glottolog_id),
+            "description": (
+                str,
+                "Default morphology tagging process using a generative GPT model for "
+                f"{language}.",
+            ),
+            "authorship_info": (str, "CLTK"),
+        },
+    )
+
+
+_LANGUAGE_CLASSES = LazyClassTable(
+    globals(), _LANGUAGE_PROCESSES, _build_language_process
+)
 
-    glottolog_id: Optional[str] = "maga1260"
-    description: str = "Default morphology tagging process using a generative GPT model for the Magadhi Prakrit language."
-    authorship_info: str = "CLTK"
 
+def __getattr__(name: str) -> type[GenAIMorphosyntaxProcess]:
+    """Create per-language process classes on first access."""
+    return _LANGUAGE_CLASSES.resolve(name)
 
-class GandhariGenAIMorphosyntaxProcess(GenAIMorphosyntaxProcess):
-    """Language-specific morphosyntax process using a generative GPT model."""
 
-    glottolog_id: Optional[str] = "gand1259"
-    description: str = "Default morphology tagging process using a generative GPT model for the Gandhari language."
-    authorship_info: str = "CLTK"
+def __dir__() -> list[str]:
+    """List module attributes, including classes not yet created."""
+    return _LANGUAGE_CLASSES.dir()
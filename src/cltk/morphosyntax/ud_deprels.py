@@ -15,6 +15,7 @@ from typing import Literal, Optional
 from pydantic import BaseModel, ValidationInfo, field_validator, model_validator
 
 from cltk.core.cltk_logger import logger
+from cltk.core.trusted_models import construct_trusted
 
 # TODO: This can probably be removed; was used to validate UDDeprel instances
 VALID_DEPREL_CATEGORIES: dict[str, tuple[str, Optional[str]]] = {
@@ -133,8 +134,12 @@ class UDDeprelTag(BaseModel):
         name: Human-readable name for display.
         subtype: Optional UD subtype (e.g., ``"outer"``, ``"pass"``).
 
+    Tags are immutable; ``get_ud_deprel_tag`` hands out shared instances.
+
     """
 
+    model_config = {"frozen": True}
+
     code: str  # e.g., "nsubj"
     name: str  # Human-readable name
     subtype: Optional[str] = None  # e.g., "outer", "pass"
@@ -543,23 +548,35 @@ def get_ud_deprel_tag(
         subtype: Optional UD subtype to attach to the tag.
 
     Returns:
-        A validated ``UDDeprelTag`` for the given ``code``, or ``None`` if the
-        code is unknown.
+        The shared (immutable) ``UDDeprelTag`` for the given ``code`` and
+        normalized ``subtype``, or ``None`` if the code is unknown.
 
     """
+    tag = _INTERNED_DEPREL_TAGS.get((code, subtype))
+    if tag is not None:
+        return tag
     deprel = UD_DEPRELS.get(code)
     if not deprel:
         logger.warning(f"Unknown UD DepRel code '{code}'.")
         return None
     norm_code, norm_subtype = normalize_deprel(code, subtype)
-    tag: UDDeprelTag = UDDeprelTag(
-        code=deprel.code,
-        name=deprel.name,
-        subtype=norm_subtype,
-    )
+    tag = _INTERNED_DEPREL_TAGS.get((deprel.code, norm_subtype))
+    if tag is None:
+        # ``code`` comes from the registry and ``normalize_deprel`` only keeps
+        # declared subtypes, so the field validators cannot fail here.
+        tag = construct_trusted(
+            UDDeprelTag,
+            {"code": deprel.code, "name": deprel.name, "subtype": norm_subtype},
+        )
+        _INTERNED_DEPREL_TAGS[(deprel.code, norm_subtype)] = tag
+    _INTERNED_DEPREL_TAGS[(code, subtype)] = tag
     return tag
 
 
+# Interned tags by requested and normalized ``(code, subtype)``.
+_INTERNED_DEPREL_TAGS: dict[tuple[str, Optional[str]], UDDeprelTag] = {}
+
+
 if __name__ == "__main__":
     # Example usage
     tag = get_ud_deprel_tag("nsubj")
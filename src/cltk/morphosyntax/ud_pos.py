@@ -50,8 +50,13 @@ class UDPartOfSpeechTag(BaseModel):
         name: Auto‑filled human‑readable name once validated.
         open_class: Auto‑filled open/closed class flag once validated.
 
+    Tags are immutable; ``UDPartOfSpeechTag.trusted`` hands out shared
+    instances.
+
     """
 
+    model_config = {"frozen": True}
+
     # Use this when instantiating a tagged word
     tag: str  # UD abbreviation, e.g., "ADJ"
     name: Optional[str] = None  # Human-readable name (auto-filled)
@@ -143,6 +148,21 @@ class UDPartOfSpeechTag(BaseModel):
             object.__setattr__(self, "open_class", pos.open_class)
         return self
 
+    @classmethod
+    def trusted(cls, tag: str) -> "UDPartOfSpeechTag":
+        """Build a tag, running the validation above once per distinct ``tag``.
+
+        Tags are immutable, so every spelling that normalizes to the same tag
+        gets the same instance and later calls are a dict lookup. Invalid tags
+        raise exactly as the constructor does.
+        """
+        interned = _TRUSTED_POS_TAGS.get(tag)
+        if interned is None:
+            validated = cls(tag=tag)
+            interned = _TRUSTED_POS_TAGS.setdefault(validated.tag, validated)
+            _TRUSTED_POS_TAGS[tag] = interned
+        return interned
+
     def __str__(self) -> str:
         """Return a concise, human‑readable representation of the tag."""
         return f'UDPartOfSpeechTag(tag="{self.tag}", name="{self.name}")'
@@ -152,6 +172,9 @@ class UDPartOfSpeechTag(BaseModel):
         return self.__str__()
 
 
+# Interned ``UDPartOfSpeechTag`` by raw and canonical tag string.
+_TRUSTED_POS_TAGS: dict[str, UDPartOfSpeechTag] = {}
+
 # UD POS Registry
 UD_POS_TAGS: dict[str, UDPartOfSpeech] = {
     "ADJ": UDPartOfSpeech(
@@ -6,7 +6,7 @@
 import asyncio
 import concurrent.futures
 import hashlib
-from typing import Any, Callable, Optional, cast, get_args
+from typing import Any, Callable, Iterable, Optional, cast, get_args
 
 from colorama import Fore, Style
 from pydantic import ValidationError as PydanticValidationError
@@ -26,11 +26,19 @@ from cltk.core.data_types import (
     Word,
 )
 from cltk.core.exceptions import CLTKException
+from cltk.core.fault_tolerance import (
+    clear_sentence_failure,
+    is_fault_tolerant,
+    merge_sentence_words,
+    record_sentence_failure,
+)
 from cltk.core.logging_utils import bind_from_doc
 from cltk.core.provenance import (
     add_provenance_record,
     build_provenance_record,
     extract_doc_config,
+    merge_provenance,
+    remap_annotation_sources,
 )
 from cltk.genai.mistral import AsyncMistralConnection, MistralConnection
 from cltk.genai.ollama import AsyncOllamaConnection, OllamaConnection
@@ -321,7 +329,7 @@ def generate_pos(
         if upos_val_raw:
             # TODO: Do check if tag is valid or try to correct if this raises error
             try:
-                udpos = UDPartOfSpeechTag(tag=upos_val_raw)
+                udpos = UDPartOfSpeechTag.trusted(upos_val_raw)
             except PydanticValidationError as e:
                 log.error(
                     f"{pos_dict['form']}: Invalid 'upos' field in POS dict: {pos_dict}, `upos_val_raw`='{upos_val_raw}'. Error: {e}"
@@ -329,7 +337,7 @@ def generate_pos(
         else:
             log.error(f"Missing 'upos' field in POS dict: {pos_dict}.")
             log.error(f"`code_block` from LLM: {openai_res}")
-        word: Word = Word(
+        word: Word = Word.trusted(
             string=pos_dict.get("form", None),
             index_token=word_idx,
             lemma=pos_dict.get("lemma", None),
@@ -437,6 +445,7 @@ def generate_pos(
     if sentence_idx is not None:
         for word in doc.words:
             word.index_sentence = sentence_idx
+        doc.invalidate_sentence_index()
         log.debug(
             f"Set sentence index {sentence_idx} for all words in input_doc.words."
         )
@@ -543,14 +552,8 @@ def generate_gpt_morphosyntax(
             log.error(msg_bad_tokens)
             raise CLTKException(msg_bad_tokens)
     _update_doc_genai_stage(doc, stage="pos", stage_tokens=genai_total_tokens)
-    if not doc.provenance:
-        doc.provenance = {}
     for tmp_doc in tmp_docs:
-        for prov_id, record in (tmp_doc.provenance or {}).items():
-            if prov_id not in doc.provenance:
-                doc.provenance[prov_id] = record
-        if doc.default_provenance_id is None and tmp_doc.default_provenance_id:
-            doc.default_provenance_id = tmp_doc.default_provenance_id
+        remap_annotation_sources(tmp_doc.words, merge_provenance(doc, tmp_doc))
     log.debug(
         f"Combined {len(all_words)} words from all tmp_docs and updated token indices."
     )
@@ -574,6 +577,8 @@ async def generate_gpt_morphosyntax_async(
     prompt_profile: Optional[str] = None,
     prompt_digest: Optional[str] = None,
     provenance_process: Optional[str] = None,
+    fault_tolerant: Optional[bool] = None,
+    sentence_indices: Optional[Iterable[int]] = None,
 ) -> Doc:
     """Async variant of ``generate_gpt_morphosyntax`` with concurrency.
 
@@ -591,6 +596,12 @@ async def generate_gpt_morphosyntax_async(
         prompt_profile: Optional prompt profile name for provenance.
         prompt_digest: Optional digest for the prompt template.
         provenance_process: Optional process name to store in provenance records.
+        fault_tolerant: When true, a failing sentence is recorded in
+            ``doc.metadata["failed_sentences"]["pos"]`` instead of aborting the
+            whole document. Defaults to the ``fault_tolerant`` flag stored in
+            ``doc.metadata``.
+        sentence_indices: Optional subset of sentence indices to (re)annotate.
+            Words of the other sentences are kept unchanged.
 
     Returns:
         The input ``doc`` enriched with ``words`` and aggregated generative
@@ -602,9 +613,17 @@ async def generate_gpt_morphosyntax_async(
 
     """
     log = bind_from_doc(doc)
+    if fault_tolerant is None:
+        fault_tolerant = is_fault_tolerant(doc)
+    sentence_strings = doc.sentence_strings
+    selected = (
+        sorted({i for i in sentence_indices if 0 <= i < len(sentence_strings)})
+        if sentence_indices is not None
+        else list(range(len(sentence_strings)))
+    )
     log.info(
         "[async] Starting morphosyntax generation for %s sentences",
-        len(doc.sentence_strings),
+        len(selected),
     )
     if not doc.model:
         msg = "Document model is not set."
@@ -748,7 +767,7 @@ async def generate_gpt_morphosyntax_async(
             udpos = None
             if upos_val:
                 try:
-                    udpos = UDPartOfSpeechTag(tag=upos_val)
+                    udpos = UDPartOfSpeechTag.trusted(upos_val)
                 except PydanticValidationError as e:  # pragma: no cover - defensive
                     log_i.error(
                         "[async] %s: Invalid 'upos' in POS dict: %s (error: %s)",
@@ -758,7 +777,7 @@ async def generate_gpt_morphosyntax_async(
                     )
             else:
                 log_i.error("[async] Missing 'upos' in POS dict: %s", pos_dict)
-            word = Word(
+            word = Word.trusted(
                 string=pos_dict.get("form"),
                 index_token=word_idx,
                 lemma=pos_dict.get("lemma"),
@@ -812,41 +831,41 @@ async def generate_gpt_morphosyntax_async(
         # Track usage per sentence for aggregation later
         return i, tmp, res.usage
 
-    tasks = [process_one(i, s) for i, s in enumerate(doc.sentence_strings)]
+    tasks = [process_one(i, sentence_strings[i]) for i in selected]
     log.info(
         "[async] Dispatching %d tasks with max_concurrency=%d",
         len(tasks),
         max_concurrency,
     )
-    results = await asyncio.gather(*tasks)
-    results_sorted = sorted(results, key=lambda x: x[0])
+    results = await asyncio.gather(*tasks, return_exceptions=fault_tolerant)
+    results_sorted = _collect_sentence_results(
+        doc, stage="pos", indices=selected, results=results
+    )
 
-    # Flatten words, set global token indices
-    all_words: list[Word] = []
-    token_counter = 0
+    # Merge words per sentence, set global token indices
     aggregated_usage = {"input": 0, "output": 0, "total": 0}
+    replacements: dict[int, list[Word]] = {}
     for idx, tmp, usage in results_sorted:
         for k in aggregated_usage:
             aggregated_usage[k] += usage.get(k, 0)
-        for w in tmp.words:
-            w.index_token = token_counter
-            all_words.append(w)
-            token_counter += 1
+        # Sentence calls each made a record in their own Doc; intern them here.
+        remap_annotation_sources(tmp.words, merge_provenance(doc, tmp))
+        replacements[idx] = tmp.words
+    all_words = merge_sentence_words(
+        doc.words if sentence_indices is not None else [], replacements
+    )
 
     doc.words = all_words
-    _update_doc_genai_stage(doc, stage="pos", stage_tokens=aggregated_usage)
-    if not doc.provenance:
-        doc.provenance = {}
-    for _, tmp, _ in results_sorted:
-        for prov_id, record in (tmp.provenance or {}).items():
-            if prov_id not in doc.provenance:
-                doc.provenance[prov_id] = record
-        if doc.default_provenance_id is None and tmp.default_provenance_id:
-            doc.default_provenance_id = tmp.default_provenance_id
+    _update_doc_genai_stage(
+        doc,
+        stage="pos",
+        stage_tokens=aggregated_usage,
+        accumulate=sentence_indices is not None,
+    )
     log.info(
         "[async] Completed morphosyntax generation: %d tokens across %d sentences",
         len(all_words),
-        len(doc.sentence_strings),
+        len(results_sorted),
     )
     remap_report.log_summary(label="Unmapped UD feature pairs from async morphosyntax")
     return doc
@@ -861,6 +880,8 @@ def generate_gpt_morphosyntax_concurrent(
     prompt_profile: Optional[str] = None,
     prompt_digest: Optional[str] = None,
     provenance_process: Optional[str] = None,
+    fault_tolerant: Optional[bool] = None,
+    sentence_indices: Optional[Iterable[int]] = None,
 ) -> Doc:
     """Run the async morphosyntax generator safely but appears synchronous from the outside.
 
@@ -882,6 +903,9 @@ def generate_gpt_morphosyntax_concurrent(
         prompt_profile: Optional prompt profile name for provenance.
         prompt_digest: Optional digest for the prompt template.
         provenance_process: Optional process name to store in provenance records.
+        fault_tolerant: Keep successful sentences when others fail (see the
+            async variant).
+        sentence_indices: Optional subset of sentence indices to (re)annotate.
 
     Returns:
         The input ``Doc`` updated in place, same as the async variant.
@@ -901,6 +925,8 @@ def generate_gpt_morphosyntax_concurrent(
                 prompt_profile=prompt_profile,
                 prompt_digest=prompt_digest,
                 provenance_process=provenance_process,
+                fault_tolerant=fault_tolerant,
+                sentence_indices=sentence_indices,
             )
         )
     else:
@@ -919,6 +945,8 @@ def generate_gpt_morphosyntax_concurrent(
                     prompt_profile=prompt_profile,
                     prompt_digest=prompt_digest,
                     provenance_process=provenance_process,
+                    fault_tolerant=fault_tolerant,
+                    sentence_indices=sentence_indices,
                 )
             )
 
@@ -930,11 +958,13 @@ def generate_gpt_morphosyntax_concurrent(
 
 
 def _update_doc_genai_stage(
-    doc: Doc, *, stage: str, stage_tokens: dict[str, int]
+    doc: Doc, *, stage: str, stage_tokens: dict[str, int], accumulate: bool = False
 ) -> None:
     """Update doc.genai_use with stage-specific and overall totals.
 
     Keeps one entry per stage (e.g., "pos", "dep") and a single "overall" sum.
+    With ``accumulate``, the new counts are added to an existing stage entry
+    (used when re-running a subset of sentences) instead of replacing it.
     """
     stage_norm = stage.strip().lower()
     in_tokens = int(stage_tokens.get("input", 0))
@@ -945,6 +975,13 @@ def _update_doc_genai_stage(
     for e in doc.genai_use or []:
         if isinstance(e, dict):
             s = str(e.get("stage", "")).lower()
+            if s == stage_norm and accumulate:
+                try:
+                    in_tokens += int(e.get("input", 0))
+                    out_tokens += int(e.get("output", 0))
+                    tot_tokens += int(e.get("total", 0))
+                except Exception:
+                    pass
             if s and s not in {stage_norm, "overall"}:
                 entries.append(e)
     # Add/replace this stage
@@ -972,6 +1009,34 @@ def _update_doc_genai_stage(
     doc.genai_use = entries
 
 
+def _collect_sentence_results(
+    doc: Doc,
+    *,
+    stage: str,
+    indices: list[int],
+    results: list[Any],
+) -> list[tuple[int, Doc, dict[str, int]]]:
+    """Split gathered per-sentence results into successes and recorded failures.
+
+    Exceptions returned by ``asyncio.gather(..., return_exceptions=True)`` are
+    stored on ``doc`` via :func:`record_sentence_failure`; successful sentences
+    clear any earlier failure for the same stage.
+    """
+    successes: list[tuple[int, Doc, dict[str, int]]] = []
+    for idx, result in zip(indices, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            bind_from_doc(doc, sentence_idx=idx).error(
+                "[async] %s failed for sentence #%s: %s", stage, idx, result
+            )
+            record_sentence_failure(doc, stage=stage, sentence_idx=idx, error=result)
+            continue
+        clear_sentence_failure(doc, stage=stage, sentence_idx=idx)
+        successes.append(result)
+    return sorted(successes, key=lambda x: x[0])
+
+
 def _resolve_morph_prompt(
     *,
     lang_or_dialect_name: str,
@@ -2,7 +2,11 @@
 
 import os
 import shutil
-from typing import Any, Optional, Union, cast
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional, TypeVar, Union, cast
 
 from colorama import Fore, Style
 
@@ -21,25 +25,47 @@ from cltk.core.data_types import (
     StanzaBackendConfig,
 )
 from cltk.core.exceptions import UnimplementedAlgorithmError
+from cltk.core.fault_tolerance import FAULT_TOLERANT_KEY, get_failed_sentences
 from cltk.core.logging_utils import bind_from_doc
 from cltk.core.provenance import (
     add_provenance_record,
     build_provenance_record,
     extract_doc_config,
 )
-from cltk.enrichment.processes import GenAIEnrichmentProcess
-from cltk.languages.glottolog import get_language
-from cltk.languages.pipelines import (  # MAP_LANGUAGE_CODE_TO_GENERATIVE_PIPELINE_LOCAL,
-    MAP_LANGUAGE_CODE_TO_GENERATIVE_PIPELINE,
-    MAP_LANGUAGE_CODE_TO_SPACY_PIPELINE,
-    MAP_LANGUAGE_CODE_TO_STANZA_PIPELINE,
-    ensure_stanza_available,
-)
 from cltk.utils.utils import load_env_file
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+#: Default window length, in characters, for :meth:`NLP.analyze_windowed`.
+DEFAULT_WINDOW_SIZE = 20_000
+
+# Language metadata, pipeline definitions, and process modules are imported
+# inside the methods that need them: they dominate ``import cltk.nlp`` time
+# and most of them are irrelevant to any single run (see
+# tests/test_import_time.py for the enforced budget).
+
 # from cltk.languages.utils import get_lang
 
 
+def _ordered_map(
+    func: Callable[[_T], _R], items: Sequence[_T], max_workers: int
+) -> Iterator[_R]:
+    """Yield ``func(item)`` in order, running up to ``max_workers`` at a time."""
+    if max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending: deque[Future[_R]] = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) > max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 class NLP:
     """Convenience facade for running CLTK pipelines.
 
@@ -56,6 +82,14 @@ class NLP:
       suppress_banner: If true, suppresses informational console output.
       cltk_config: Optional :class:`~cltk.core.data_types.CLTKConfig` bundle.
         When provided, its values override the other constructor arguments.
+      fault_tolerant: If true, per-sentence GenAI failures do not abort
+        ``analyze()``. Successfully annotated sentences are kept and failures
+        are recorded in ``doc.metadata["failed_sentences"]``; use
+        :meth:`retry_failed` to re-run only those sentences.
+
+    Attributes:
+      stage_timings: Wall-clock seconds spent in each process during the most
+        recent :meth:`analyze` call, keyed by process class name.
 
     Notes:
       - When ``backend == "openai"`` and no ``model`` is provided, defaults to
@@ -76,8 +110,11 @@ class NLP:
         custom_pipeline: Optional[Pipeline] = None,
         suppress_banner: bool = False,
         cltk_config: Optional["CLTKConfig"] = None,
+        fault_tolerant: bool = False,
     ) -> None:
         self.cltk_config: Optional[CLTKConfig] = cltk_config
+        self.fault_tolerant: bool = fault_tolerant
+        self.stage_timings: dict[str, float] = {}
         backend_config: Optional[ModelConfig] = (
             cltk_config.active_backend_config if cltk_config else None
         )
@@ -122,6 +159,8 @@ class NLP:
                 raise ValueError(
                     "language_code is required when no CLTKConfig is provided."
                 )
+            from cltk.languages.glottolog import get_language
+
             self.language, self.dialect = get_language(lang_id=language_code)
         self.language_code: str
         resolved_code: Optional[str]
@@ -168,6 +207,8 @@ class NLP:
             self.model = self.model or getattr(backend_config, "model", None)
             self.model = self.model or "llama3.1:8b"
         elif self.backend == "stanza":
+            from cltk.languages.pipelines import ensure_stanza_available
+
             try:
                 ensure_stanza_available()
             except ImportError as e:
@@ -225,6 +266,15 @@ class NLP:
         if not text or not isinstance(text, str):
             logger.error("Input text must be a non-empty string.")
             raise ValueError("Input text must be a non-empty string.")
+        self.stage_timings = {}
+        return self._analyze(
+            text, stage_timings=self.stage_timings, announce=not self.suppress_banner
+        )
+
+    def _analyze(
+        self, text: str, *, stage_timings: dict[str, float], announce: bool
+    ) -> Doc:
+        """Run every pipeline process over ``text``, accumulating ``stage_timings``."""
         doc: Doc = Doc(language=self.language, raw=text)
         doc.backend = self.backend
         doc.model = getattr(self, "model", None)
@@ -233,6 +283,8 @@ class NLP:
             doc.metadata["backend_config"] = self._backend_config
         if self._stanza_model_override:
             doc.metadata["stanza_package"] = self._stanza_model_override
+        if self.fault_tolerant:
+            doc.metadata[FAULT_TOLERANT_KEY] = True
         lang_id = None
         try:
             if doc.dialect and doc.dialect.glottolog_id:
@@ -271,9 +323,10 @@ class NLP:
                 if isinstance(process, type)
                 else process.__class__.__name__
             )
-            if not self.suppress_banner:
+            if announce:
                 print(Fore.CYAN + f"⸖ Running {process_name} ..." + Style.RESET_ALL)
             process_obj: Process = self._get_process_object(process_object=process)
+            started = time.perf_counter()
             try:
                 log.debug(f"Running process: {process_obj.__class__.__name__}")
                 doc = process_obj.run(doc)
@@ -282,6 +335,10 @@ class NLP:
                 raise RuntimeError(
                     f"Process '{process_obj.__class__.__name__}' failed: {e}"
                 ) from e
+            stage = process_obj.__class__.__name__
+            stage_timings[stage] = stage_timings.get(stage, 0.0) + (
+                time.perf_counter() - started
+            )
         if doc.words is None or not isinstance(doc.words, list):
             msg = "Pipeline did not produce any words. Check your pipeline configuration and input text."
             log.warning(msg)
@@ -290,9 +347,205 @@ class NLP:
                 word._doc = doc
             except Exception:
                 pass
+        failures = get_failed_sentences(doc)
+        if failures:
+            log.warning(
+                "NLP analysis completed with failed sentences: %s",
+                {stage: sorted(idxs) for stage, idxs in failures.items()},
+            )
         log.info("NLP analysis complete.")
         return doc
 
+    def iter_windows(
+        self,
+        text: str,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        max_workers: int = 1,
+    ) -> Iterator[Doc]:
+        """Analyze ``text`` in sentence-aligned windows, yielding one ``Doc`` each.
+
+        Each window (at most ``window_size`` characters of whole sentences)
+        runs through the full pipeline on its own, so backend memory is
+        bounded by the window rather than the document. Yielded documents are
+        already in document coordinates: ``Word.index_token``,
+        ``Word.index_sentence``, sentence-keyed fields, and sentence
+        boundaries continue from the previous window. Each records its
+        placement under ``doc.metadata["window"]``.
+
+        Args:
+          text: Raw text to analyze.
+          window_size: Target maximum window length in characters.
+          max_workers: Windows analyzed concurrently in worker threads. Useful
+            for the network-bound GenAI backends; results are still yielded in
+            text order, and at most about ``max_workers`` finished windows are
+            held in memory.
+
+        Yields:
+          One analyzed :class:`~cltk.core.data_types.Doc` per window.
+
+        Raises:
+          ValueError: If ``text`` is empty, or ``window_size`` or
+            ``max_workers`` is not positive.
+          RuntimeError: If any process fails during execution.
+
+        """
+        from cltk.core.windowing import (
+            WINDOW_METADATA_KEY,
+            count_sentences,
+            shift_window_doc,
+        )
+        from cltk.sentence.utils import sentence_window_spans
+
+        if not text or not isinstance(text, str):
+            logger.error("Input text must be a non-empty string.")
+            raise ValueError("Input text must be a non-empty string.")
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+        spans = sentence_window_spans(text, self.language_code, window_size)
+        logger.info(
+            "Analyzing text in %d window(s) of up to %d characters.",
+            len(spans),
+            window_size,
+        )
+        self.stage_timings = {}
+
+        def run_window(span: tuple[int, int]) -> tuple[Doc, dict[str, float]]:
+            timings: dict[str, float] = {}
+            window_doc = self._analyze(
+                text[span[0] : span[1]], stage_timings=timings, announce=False
+            )
+            return window_doc, timings
+
+        char_offset = sentence_offset = token_offset = 0
+        results = _ordered_map(run_window, spans, max_workers)
+        for index, (span, (doc, timings)) in enumerate(zip(spans, results)):
+            if not self.suppress_banner:
+                print(
+                    Fore.CYAN
+                    + f"⸖ Analyzed window {index + 1}/{len(spans)}"
+                    + Style.RESET_ALL
+                )
+            for stage, seconds in timings.items():
+                self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + seconds
+            n_chars = len(
+                doc.normalized_text
+                if doc.normalized_text is not None
+                else doc.raw or ""
+            )
+            n_sentences = count_sentences(doc)
+            n_tokens = len(doc.words or [])
+            shift_window_doc(
+                doc,
+                char_offset=char_offset,
+                sentence_offset=sentence_offset,
+                token_offset=token_offset,
+            )
+            doc.metadata[WINDOW_METADATA_KEY] = {
+                "index": index,
+                "raw_span": span,
+                "char_offset": char_offset,
+                "sentence_offset": sentence_offset,
+                "token_offset": token_offset,
+            }
+            char_offset += n_chars
+            sentence_offset += n_sentences
+            token_offset += n_tokens
+            yield doc
+
+    def analyze_windowed(
+        self,
+        text: str,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        max_workers: int = 1,
+    ) -> Doc:
+        """Analyze a large text window by window and merge the results.
+
+        Equivalent to :meth:`analyze` for texts shorter than ``window_size``.
+        Longer texts are processed by :meth:`iter_windows` and merged into one
+        ``Doc`` whose ``normalized_text`` is the concatenation of the windows'
+        normalized text, with global token, sentence, and character offsets.
+
+        Args:
+          text: Raw text to analyze.
+          window_size: Target maximum window length in characters.
+          max_workers: Windows analyzed concurrently in worker threads.
+
+        Returns:
+          The merged :class:`~cltk.core.data_types.Doc`.
+
+        Raises:
+          ValueError: If ``text`` is empty, or ``window_size`` or
+            ``max_workers`` is not positive.
+          RuntimeError: If any process fails during execution.
+
+        """
+        from cltk.core.windowing import merge_window_docs
+
+        docs = list(self.iter_windows(text, window_size, max_workers))
+        doc = merge_window_docs(docs, raw=text)
+        failures = get_failed_sentences(doc)
+        if failures:
+            bind_from_doc(doc).warning(
+                "NLP analysis completed with failed sentences: %s",
+                {stage: sorted(idxs) for stage, idxs in failures.items()},
+            )
+        return doc
+
+    def retry_failed(self, doc: Doc) -> Doc:
+        """Re-run only the sentences recorded as failed in ``doc.metadata``.
+
+        Each process in the pipeline that exposes ``retry_failed()`` (the GenAI
+        morphosyntax and dependency processes) is given the document in
+        pipeline order, so a sentence whose morphosyntax failed is tagged
+        before its dependency parse is retried. Sentences that succeed are
+        removed from ``doc.metadata["failed_sentences"]``.
+
+        Args:
+          doc: A document returned by :meth:`analyze` in fault-tolerant mode.
+
+        Returns:
+          The updated document.
+
+        Raises:
+          RuntimeError: If a process fails outright during the retry.
+
+        """
+        log = bind_from_doc(doc)
+        if not get_failed_sentences(doc):
+            log.info("No failed sentences to retry.")
+            return doc
+        processes = cast(
+            list[Any],
+            self.pipeline.processes if self.pipeline.processes is not None else [],
+        )
+        for process in processes:
+            process_obj: Process = self._get_process_object(process_object=process)
+            retry = getattr(process_obj, "retry_failed", None)
+            if not callable(retry):
+                continue
+            try:
+                log.debug(
+                    f"Retrying failed sentences with: {process_obj.__class__.__name__}"
+                )
+                doc = retry(doc)
+            except Exception as e:
+                log.error(f"Process '{process_obj.__class__.__name__}' failed: {e}")
+                raise RuntimeError(
+                    f"Process '{process_obj.__class__.__name__}' failed: {e}"
+                ) from e
+        for word in doc.words or []:
+            try:
+                word._doc = doc
+            except Exception:
+                pass
+        remaining = get_failed_sentences(doc)
+        if remaining:
+            log.warning(
+                "Sentences still failing after retry: %s",
+                {stage: sorted(idxs) for stage, idxs in remaining.items()},
+            )
+        return doc
+
     def _print_cltk_info(self) -> None:
         """Print CLTK version and citation information."""
         ltr_mark: str = "\u200e"
@@ -383,6 +636,8 @@ class NLP:
         """Append GenAI enrichment to generative pipelines if missing."""
         if self.backend not in ("openai", "ollama", "ollama-cloud", "mistral"):
             return
+        from cltk.enrichment.processes import GenAIEnrichmentProcess
+
         try:
             processes = (
                 self.pipeline.processes if self.pipeline.processes is not None else []
@@ -465,6 +720,12 @@ class NLP:
             ```
 
         """
+        from cltk.languages.pipelines import (
+            MAP_LANGUAGE_CODE_TO_GENERATIVE_PIPELINE,
+            MAP_LANGUAGE_CODE_TO_SPACY_PIPELINE,
+            MAP_LANGUAGE_CODE_TO_STANZA_PIPELINE,
+        )
+
         if self.backend == "stanza":
             mapping = MAP_LANGUAGE_CODE_TO_STANZA_PIPELINE
         elif self.backend == "spacy":
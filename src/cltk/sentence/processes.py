@@ -6,16 +6,21 @@ It defines a generic ``SentenceSplittingProcess`` and many concrete
 subclasses, one per language or stage.
 """
 
-from copy import copy
+from collections.abc import Iterable, Iterator
 from functools import cached_property
-from typing import Callable, ClassVar, Optional
+from typing import Callable, ClassVar, Optional, TextIO, Union
 
 from cltk.core.cltk_logger import bind_context
 from cltk.core.data_types import Doc, Process
+from cltk.core.lazy_classes import LazyClassTable, build_subclass
 from cltk.core.logging_utils import bind_from_doc
 from cltk.core.process_registry import register_process
 from cltk.core.provenance import add_provenance_record, build_provenance_record
-from cltk.sentence.utils import split_sentences_multilang
+from cltk.sentence.utils import (
+    DEFAULT_STREAM_CHUNK_SIZE,
+    iter_sentences,
+    split_sentences_multilang,
+)
 
 __author__ = ["Clément Besnier <clem@clementbesnier.fr>"]
 
@@ -189,15 +194,16 @@ class SentenceSplittingProcess(Process):
           input_doc: Document whose ``normalized_text`` will be segmented.
 
         Returns:
-          A shallow copy of ``input_doc`` with ``sentence_boundaries`` set to
-          a list of ``(start, stop)`` character indices.
+          A fork (see ``Doc.fork``) of ``input_doc`` with
+          ``sentence_boundaries`` set to a list of ``(start, stop)`` character
+          indices.
 
         Raises:
           ValueError: If ``normalized_text`` is missing or if ``glottolog_id``
             is not set on the process.
 
         """
-        output_doc = copy(input_doc)
+        output_doc = input_doc.fork()
         log = bind_from_doc(output_doc)
         if not output_doc.normalized_text:
             msg: str = "Doc must have `normalized_text`."
@@ -239,643 +245,492 @@ class SentenceSplittingProcess(Process):
             if not output_doc.sentence_annotation_sources:
                 output_doc.sentence_annotation_sources = {}
             for idx in range(len(output_doc.sentence_boundaries)):
+                # Inner dicts are shared with the input doc after ``fork()``.
                 entry = output_doc.sentence_annotation_sources.get(idx, {})
-                entry["span"] = prov_id
-                output_doc.sentence_annotation_sources[idx] = entry
+                output_doc.sentence_annotation_sources[idx] = {**entry, "span": prov_id}
         return output_doc
 
+    def stream(
+        self,
+        source: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[tuple[int, int, str]]:
+        """Yield sentences from a file handle or text chunks without loading it all.
 
-class LycianASentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Lycian."""
+        Offsets match what ``run`` would produce on the concatenated text. Pass
+        normalized chunks to split normalized text.
 
-    glottolog_id: Optional[str] = "lyci1241"
-
-
-class LydianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Lydian."""
-
-    glottolog_id: Optional[str] = "lydi1241"
-
-
-class PalaicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Palaic."""
-
-    glottolog_id: Optional[str] = "pala1331"
-
-
-class CarianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Carian."""
-
-    glottolog_id: Optional[str] = "cari1274"
-
-
-class CuneiformLuwianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Cuneiform Luwian."""
-
-    glottolog_id: Optional[str] = "cune1239"
-
-
-class HieroglyphicLuwianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Hieroglyphic Luwian."""
-
-    glottolog_id: Optional[str] = "hier1240"
-
-
-class ClassicalArmenianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Armenian."""
-
-    glottolog_id: Optional[str] = "clas1256"
-
-
-class MiddleArmenianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle Armenian."""
-
-    glottolog_id: Optional[str] = "midd1364"
-
-
-class AkkadianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Akkadian."""
-
-    glottolog_id: Optional[str] = "akka1240"
-
-
-class AncientGreekSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Ancient Greek."""
-
-    glottolog_id: Optional[str] = "anci1242"
-
-
-class AncientHebrewSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Ancient Hebrew."""
-
-    glottolog_id: Optional[str] = "anci1244"
-
-
-class ClassicalSyriacSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Syriac."""
-
-    glottolog_id: Optional[str] = "clas1252"
-
-
-class ClassicalTibetanSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Tibetan."""
-
-    glottolog_id: Optional[str] = "clas1254"
-
-
-class CopticSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Coptic."""
-
-    glottolog_id: Optional[str] = "copt1239"
-
-
-class LatinSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Latin."""
-
-    glottolog_id: Optional[str] = "lati1261"
-
-
-class OfficialAramaicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Official Aramaic."""
-
-    glottolog_id: Optional[str] = "impe1235"
-
-
-class OldEnglishSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old English."""
-
-    glottolog_id: Optional[str] = "olde1238"
-
-
-class OldNorseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Norse."""
-
-    glottolog_id: Optional[str] = "oldn1244"
-
-
-class PaliSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Pali."""
-
-    glottolog_id: Optional[str] = "pali1273"
-
-
-class ClassicalSanskritSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Sanskrit."""
-
-    glottolog_id: Optional[str] = "clas1258"
-
-
-class VedicSanskritSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Vedic Sanskrit."""
-
-    glottolog_id: Optional[str] = "vedi1234"
-
-
-class ClassicalArabicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Arabic."""
-
-    glottolog_id: Optional[str] = "clas1259"
-
-
-class ChurchSlavonicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Church Slavonic."""
-
-    glottolog_id: Optional[str] = "chur1257"
-
-
-class MiddleEnglishSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle English."""
-
-    glottolog_id: Optional[str] = "midd1317"
-
-
-class MiddleFrenchSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle French."""
-
-    glottolog_id: Optional[str] = "midd1316"
-
-
-class MiddlePersianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle Persian."""
-
-    glottolog_id: Optional[str] = "pahl1241"
-
-
-class OldFrenchSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old French."""
-
-    glottolog_id: Optional[str] = "oldf1239"
-
-
-class MiddleHighGermanSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle High German."""
-
-    glottolog_id: Optional[str] = "midd1343"
-
-
-class OldHighGermanSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old High German."""
-
-    glottolog_id: Optional[str] = "oldh1241"
-
-
-class GothicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Gothic."""
-
-    glottolog_id: Optional[str] = "goth1244"
-
-
-class HindiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Hindi."""
-
-    glottolog_id: Optional[str] = "hind1269"
-
-
-class KhariBoliSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Khari Boli (Hindi dialect)."""
-
-    glottolog_id: Optional[str] = "khad1239"
-
-
-class BrajSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Braj Bhasha."""
-
-    glottolog_id: Optional[str] = "braj1242"
-
-
-class AwadhiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Awadhi."""
-
-    glottolog_id: Optional[str] = "awad1243"
-
-
-class UrduSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Urdu."""
-
-    glottolog_id: Optional[str] = "urdu1245"
-
-
-class LiteraryChineseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Chinese."""
-
-    glottolog_id: Optional[str] = "lite1248"
-
-
-class OldChineseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Chinese."""
-
-    glottolog_id: Optional[str] = "oldc1244"
-
-
-class MiddleChineseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle Chinese."""
-
-    glottolog_id: Optional[str] = "midd1344"
-
-
-class BaihuaChineseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Early Vernacular Chinese (Baihua)."""
-
-    glottolog_id: Optional[str] = "clas1255"
-
-
-class PanjabiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Panjabi."""
-
-    glottolog_id: Optional[str] = "panj1256"
-
-
-class ParthianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Parthian."""
-
-    glottolog_id: Optional[str] = "part1239"
-
-
-class DemoticSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Egyptian."""
-
-    glottolog_id: Optional[str] = "demo1234"
-
-
-class BengaliSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Bengali."""
-
-    glottolog_id: Optional[str] = "beng1280"
-
-
-class OdiaSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Odia (Oriya)."""
-
-    glottolog_id: Optional[str] = "oriy1255"
-
-
-class AssameseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Assamese."""
-
-    glottolog_id: Optional[str] = "assa1263"
-
-
-class GujaratiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Gujarati."""
-
-    glottolog_id: Optional[str] = "guja1252"
-
-
-class MarathiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Marathi."""
-
-    glottolog_id: Optional[str] = "mara1378"
-
-
-class BagriSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Bagri (Rajasthani)."""
-
-    glottolog_id: Optional[str] = "bagr1243"
-
-
-class SinhalaSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Sinhala."""
-
-    glottolog_id: Optional[str] = "sinh1246"
-
-
-class SindhiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Sindhi."""
-
-    glottolog_id: Optional[str] = "sind1272"
-
-
-class KashmiriSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Kashmiri."""
-
-    glottolog_id: Optional[str] = "kash1277"
-
-
-class OldBurmeseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Burmese."""
-
-    glottolog_id: Optional[str] = "oldb1235"
-
-
-class ClassicalBurmeseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Burmese."""
-
-    glottolog_id: Optional[str] = "nucl1310"
-
-
-class TangutSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Tangut."""
-
-    glottolog_id: Optional[str] = "tang1334"
-
-
-class NewarSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Newar (Classical Nepal Bhasa)."""
-
-    glottolog_id: Optional[str] = "newa1246"
-
-
-class MeiteiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Meitei (Classical Manipuri)."""
-
-    glottolog_id: Optional[str] = "mani1292"
-
-
-class SgawKarenSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Sgaw Karen."""
-
-    glottolog_id: Optional[str] = "sgaw1245"
-
-
-class MiddleMongolSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle Mongol."""
-
-    glottolog_id: Optional[str] = "mong1329"
-
-
-class ClassicalMongolianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Mongolian."""
-
-    glottolog_id: Optional[str] = "mong1331"
-
-
-class MogholiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Mogholi (Moghol)."""
-
-    glottolog_id: Optional[str] = "mogh1245"
-
-
-class NumidianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Numidian (Ancient Berber)."""
-
-    glottolog_id: Optional[str] = "numi1241"
-
-
-class TaitaSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Cushitic Taita."""
-
-    glottolog_id: Optional[str] = "tait1247"
-
-
-class HausaSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Hausa."""
-
-    glottolog_id: Optional[str] = "haus1257"
-
-
-class OldJurchenSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Jurchen."""
-
-    glottolog_id: Optional[str] = "jurc1239"
-
-
-class OldJapaneseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Japanese."""
-
-    glottolog_id: Optional[str] = "japo1237"
-
-
-class OldHungarianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Hungarian."""
-
-    glottolog_id: Optional[str] = "oldh1242"
-
-
-class ChagataiSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Chagatai."""
-
-    glottolog_id: Optional[str] = "chag1247"
-
-
-class OldTurkicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Turkic."""
-
-    glottolog_id: Optional[str] = "oldu1238"
-
-
-class OldTamilSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Tamil."""
-
-    glottolog_id: Optional[str] = "oldt1248"
-
-
-class HittiteSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Hittite (hit1242)."""
-
-    glottolog_id: Optional[str] = "hitt1242"
-
-
-class TocharianASentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Tocharian A (toch1238)."""
-
-    glottolog_id: Optional[str] = "toch1238"
-
-
-class TocharianBSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Tocharian B (toch1237)."""
-
-    glottolog_id: Optional[str] = "toch1237"
-
-
-class AvestanSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Avestan (aves1237)."""
-
-    glottolog_id: Optional[str] = "aves1237"
-
-
-class BactrianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Bactrian (bact1239)."""
-
-    glottolog_id: Optional[str] = "bact1239"
-
-
-class SogdianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Sogdian (sogd1245)."""
-
-    glottolog_id: Optional[str] = "sogd1245"
-
-
-class KhotaneseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Khotanese (khot1251)."""
-
-    glottolog_id: Optional[str] = "khot1251"
-
-
-class TumshuqeseSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Tumshuqese (tums1237)."""
-
-    glottolog_id: Optional[str] = "tums1237"
-
-
-class OldPersianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Old Persian (oldp1254)."""
-
-    glottolog_id: Optional[str] = "oldp1254"
-
-
-class EarlyIrishSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Old Irish (oldi1245)."""
-
-    glottolog_id: Optional[str] = "oldi1245"
-
-
-class UgariticSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Ugaritic (ugar1238)."""
-
-    glottolog_id: Optional[str] = "ugar1238"
-
-
-class PhoenicianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Phoenician (phoe1239)."""
-
-    glottolog_id: Optional[str] = "phoe1239"
-
-
-class GeezSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Geez (geez1241)."""
-
-    glottolog_id: Optional[str] = "geez1241"
-
-
-class MiddleEgyptianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Middle Egyptian (midd1369)."""
-
-    glottolog_id: Optional[str] = "midd1369"
-
-
-class OldEgyptianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Old Egyptian (olde1242)."""
-
-    glottolog_id: Optional[str] = "olde1242"
-
-
-class LateEgyptianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitter for Late Egyptian (late1256)."""
-
-    glottolog_id: Optional[str] = "late1256"
-
-
-class OldMiddleWelshSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle Welsh."""
-
-    glottolog_id: Optional[str] = "midd1254"
-
-
-class MiddleBretonSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle Breton."""
-
-    glottolog_id: Optional[str] = "midb1244"
-
-
-class MiddleCornishSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Cornish."""
-
-    glottolog_id: Optional[str] = "corn1251"
-
-
-class OldPrussianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Prussian."""
-
-    glottolog_id: Optional[str] = "prus1238"
-
-
-class LithuanianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Lithuanian."""
-
-    glottolog_id: Optional[str] = "lith1251"
-
-
-class LatvianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Latvian."""
-
-    glottolog_id: Optional[str] = "latv1249"
-
-
-class AlbanianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Albanian."""
-
-    glottolog_id: Optional[str] = "gheg1238"
-
-
-class SauraseniPrakritSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Sauraseni Prakrit."""
-
-    glottolog_id: Optional[str] = "saur1252"
-
-
-class MaharastriPrakritSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Maharastri Prakrit."""
-
-    glottolog_id: Optional[str] = "maha1305"
-
-
-class MagadhiPrakritSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Magadhi Prakrit."""
-
-    glottolog_id: Optional[str] = "maga1260"
-
-
-class GandhariSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Gandhari."""
-
-    glottolog_id: Optional[str] = "gand1259"
-
-
-class MoabiteSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Moabite."""
-
-    glottolog_id: Optional[str] = "moab1234"
-
-
-class AmmoniteSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Ammonite."""
-
-    glottolog_id: Optional[str] = "ammo1234"
-
-
-class EdomiteSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Edomite."""
-
-    glottolog_id: Optional[str] = "edom1234"
-
-
-class OldAramaicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Aramaic (up to 700 BCE)."""
-
-    glottolog_id: Optional[str] = "olda1246"
-
-
-class OldAramaicSamalianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Old Aramaic–Samʾalian."""
-
-    glottolog_id: Optional[str] = "olda1245"
-
-
-class MiddleAramaicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Middle Aramaic."""
-
-    glottolog_id: Optional[str] = "midd1366"
-
-
-class ClassicalMandaicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Classical Mandaic."""
-
-    glottolog_id: Optional[str] = "clas1253"
-
-
-class HatranSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Hatran."""
-
-    glottolog_id: Optional[str] = "hatr1234"
-
-
-class JewishBabylonianAramaicSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Jewish Babylonian Aramaic."""
-
-    glottolog_id: Optional[str] = "jewi1240"
+        Args:
+          source: Text-mode file handle, string, or iterable of text chunks.
+          chunk_size: Characters per read when ``source`` is a file handle.
 
+        Yields:
+          ``(start, stop, sentence)`` with absolute character offsets.
 
-class SamalianSentenceSplittingProcess(SentenceSplittingProcess):
-    """Sentence splitting process for Samʾalian."""
+        Raises:
+          ValueError: If ``glottolog_id`` is not set or not supported.
 
-    glottolog_id: Optional[str] = "sama1234"
+        """
+        if self.glottolog_id is None:
+            raise ValueError("glottolog_id must be set for sentence splitting")
+        return iter_sentences(source, self.glottolog_id, chunk_size)
+
+
+# Per-language subclasses of ``SentenceSplittingProcess``: class name ->
+# (glottolog_id, docstring). Classes are created on
+# first access through the module ``__getattr__``.
+_LANGUAGE_PROCESSES: dict[str, tuple[str, str]] = {
+    "LycianASentenceSplittingProcess": (
+        "lyci1241",
+        "Sentence splitting process for Lycian.",
+    ),
+    "LydianSentenceSplittingProcess": (
+        "lydi1241",
+        "Sentence splitting process for Lydian.",
+    ),
+    "PalaicSentenceSplittingProcess": (
+        "pala1331",
+        "Sentence splitting process for Palaic.",
+    ),
+    "CarianSentenceSplittingProcess": (
+        "cari1274",
+        "Sentence splitting process for Carian.",
+    ),
+    "CuneiformLuwianSentenceSplittingProcess": (
+        "cune1239",
+        "Sentence splitting process for Cuneiform Luwian.",
+    ),
+    "HieroglyphicLuwianSentenceSplittingProcess": (
+        "hier1240",
+        "Sentence splitting process for Hieroglyphic Luwian.",
+    ),
+    "ClassicalArmenianSentenceSplittingProcess": (
+        "clas1256",
+        "Sentence splitting process for Classical Armenian.",
+    ),
+    "MiddleArmenianSentenceSplittingProcess": (
+        "midd1364",
+        "Sentence splitting process for Middle Armenian.",
+    ),
+    "AkkadianSentenceSplittingProcess": (
+        "akka1240",
+        "Sentence splitting process for Akkadian.",
+    ),
+    "AncientGreekSentenceSplittingProcess": (
+        "anci1242",
+        "Sentence splitting process for Ancient Greek.",
+    ),
+    "AncientHebrewSentenceSplittingProcess": (
+        "anci1244",
+        "Sentence splitting process for Ancient Hebrew.",
+    ),
+    "ClassicalSyriacSentenceSplittingProcess": (
+        "clas1252",
+        "Sentence splitting process for Classical Syriac.",
+    ),
+    "ClassicalTibetanSentenceSplittingProcess": (
+        "clas1254",
+        "Sentence splitting process for Classical Tibetan.",
+    ),
+    "CopticSentenceSplittingProcess": (
+        "copt1239",
+        "Sentence splitting process for Coptic.",
+    ),
+    "LatinSentenceSplittingProcess": (
+        "lati1261",
+        "Sentence splitting process for Latin.",
+    ),
+    "OfficialAramaicSentenceSplittingProcess": (
+        "impe1235",
+        "Sentence splitting process for Official Aramaic.",
+    ),
+    "OldEnglishSentenceSplittingProcess": (
+        "olde1238",
+        "Sentence splitting process for Old English.",
+    ),
+    "OldNorseSentenceSplittingProcess": (
+        "oldn1244",
+        "Sentence splitting process for Old Norse.",
+    ),
+    "PaliSentenceSplittingProcess": (
+        "pali1273",
+        "Sentence splitting process for Pali.",
+    ),
+    "ClassicalSanskritSentenceSplittingProcess": (
+        "clas1258",
+        "Sentence splitting process for Classical Sanskrit.",
+    ),
+    "VedicSanskritSentenceSplittingProcess": (
+        "vedi1234",
+        "Sentence splitting process for Vedic Sanskrit.",
+    ),
+    "ClassicalArabicSentenceSplittingProcess": (
+        "clas1259",
+        "Sentence splitting process for Classical Arabic.",
+    ),
+    "ChurchSlavonicSentenceSplittingProcess": (
+        "chur1257",
+        "Sentence splitting process for Old Church Slavonic.",
+    ),
+    "MiddleEnglishSentenceSplittingProcess": (
+        "midd1317",
+        "Sentence splitting process for Middle English.",
+    ),
+    "MiddleFrenchSentenceSplittingProcess": (
+        "midd1316",
+        "Sentence splitting process for Middle French.",
+    ),
+    "MiddlePersianSentenceSplittingProcess": (
+        "pahl1241",
+        "Sentence splitting process for Middle Persian.",
+    ),
+    "OldFrenchSentenceSplittingProcess": (
+        "oldf1239",
+        "Sentence splitting process for Old French.",
+    ),
+    "MiddleHighGermanSentenceSplittingProcess": (
+        "midd1343",
+        "Sentence splitting process for Middle High German.",
+    ),
+    "OldHighGermanSentenceSplittingProcess": (
+        "oldh1241",
+        "Sentence splitting process for Old High German.",
+    ),
+    "GothicSentenceSplittingProcess": (
+        "goth1244",
+        "Sentence splitting process for Gothic.",
+    ),
+    "HindiSentenceSplittingProcess": (
+        "hind1269",
+        "Sentence splitting process for Hindi.",
+    ),
+    "KhariBoliSentenceSplittingProcess": (
+        "khad1239",
+        "Sentence splitting process for Khari Boli (Hindi dialect).",
+    ),
+    "BrajSentenceSplittingProcess": (
+        "braj1242",
+        "Sentence splitting process for Braj Bhasha.",
+    ),
+    "AwadhiSentenceSplittingProcess": (
+        "awad1243",
+        "Sentence splitting process for Awadhi.",
+    ),
+    "UrduSentenceSplittingProcess": (
+        "urdu1245",
+        "Sentence splitting process for Urdu.",
+    ),
+    "LiteraryChineseSentenceSplittingProcess": (
+        "lite1248",
+        "Sentence splitting process for Classical Chinese.",
+    ),
+    "OldChineseSentenceSplittingProcess": (
+        "oldc1244",
+        "Sentence splitting process for Old Chinese.",
+    ),
+    "MiddleChineseSentenceSplittingProcess": (
+        "midd1344",
+        "Sentence splitting process for Middle Chinese.",
+    ),
+    "BaihuaChineseSentenceSplittingProcess": (
+        "clas1255",
+        "Sentence splitting process for Early Vernacular Chinese (Baihua).",
+    ),
+    "PanjabiSentenceSplittingProcess": (
+        "panj1256",
+        "Sentence splitting process for Panjabi.",
+    ),
+    "ParthianSentenceSplittingProcess": (
+        "part1239",
+        "Sentence splitting process for Parthian.",
+    ),
+    "DemoticSentenceSplittingProcess": (
+        "demo1234",
+        "Sentence splitting process for Egyptian.",
+    ),
+    "BengaliSentenceSplittingProcess": (
+        "beng1280",
+        "Sentence splitting process for Bengali.",
+    ),
+    "OdiaSentenceSplittingProcess": (
+        "oriy1255",
+        "Sentence splitting process for Odia (Oriya).",
+    ),
+    "AssameseSentenceSplittingProcess": (
+        "assa1263",
+        "Sentence splitting process for Assamese.",
+    ),
+    "GujaratiSentenceSplittingProcess": (
+        "guja1252",
+        "Sentence splitting process for Gujarati.",
+    ),
+    "MarathiSentenceSplittingProcess": (
+        "mara1378",
+        "Sentence splitting process for Marathi.",
+    ),
+    "BagriSentenceSplittingProcess": (
+        "bagr1243",
+        "Sentence splitting process for Bagri (Rajasthani).",
+    ),
+    "SinhalaSentenceSplittingProcess": (
+        "sinh1246",
+        "Sentence splitting process for Sinhala.",
+    ),
+    "SindhiSentenceSplittingProcess": (
+        "sind1272",
+        "Sentence splitting process for Sindhi.",
+    ),
+    "KashmiriSentenceSplittingProcess": (
+        "kash1277",
+        "Sentence splitting process for Kashmiri.",
+    ),
+    "OldBurmeseSentenceSplittingProcess": (
+        "oldb1235",
+        "Sentence splitting process for Old Burmese.",
+    ),
+    "ClassicalBurmeseSentenceSplittingProcess": (
+        "nucl1310",
+        "Sentence splitting process for Classical Burmese.",
+    ),
+    "TangutSentenceSplittingProcess": (
+        "tang1334",
+        "Sentence splitting process for Tangut.",
+    ),
+    "NewarSentenceSplittingProcess": (
+        "newa1246",
+        "Sentence splitting process for Newar (Classical Nepal Bhasa).",
+    ),
+    "MeiteiSentenceSplittingProcess": (
+        "mani1292",
+        "Sentence splitting process for Meitei (Classical Manipuri).",
+    ),
+    "SgawKarenSentenceSplittingProcess": (
+        "sgaw1245",
+        "Sentence splitting process for Sgaw Karen.",
+    ),
+    "MiddleMongolSentenceSplittingProcess": (
+        "mong1329",
+        "Sentence splitting process for Middle Mongol.",
+    ),
+    "ClassicalMongolianSentenceSplittingProcess": (
+        "mong1331",
+        "Sentence splitting process for Classical Mongolian.",
+    ),
+    "MogholiSentenceSplittingProcess": (
+        "mogh1245",
+        "Sentence splitting process for Mogholi (Moghol).",
+    ),
+    "NumidianSentenceSplittingProcess": (
+        "numi1241",
+        "Sentence splitting process for Numidian (Ancient Berber).",
+    ),
+    "TaitaSentenceSplittingProcess": (
+        "tait1247",
+        "Sentence splitting process for Cushitic Taita.",
+    ),
+    "HausaSentenceSplittingProcess": (
+        "haus1257",
+        "Sentence splitting process for Hausa.",
+    ),
+    "OldJurchenSentenceSplittingProcess": (
+        "jurc1239",
+        "Sentence splitting process for Old Jurchen.",
+    ),
+    "OldJapaneseSentenceSplittingProcess": (
+        "japo1237",
+        "Sentence splitting process for Old Japanese.",
+    ),
+    "OldHungarianSentenceSplittingProcess": (
+        "oldh1242",
+        "Sentence splitting process for Old Hungarian.",
+    ),
+    "ChagataiSentenceSplittingProcess": (
+        "chag1247",
+        "Sentence splitting process for Chagatai.",
+    ),
+    "OldTurkicSentenceSplittingProcess": (
+        "oldu1238",
+        "Sentence splitting process for Old Turkic.",
+    ),
+    "OldTamilSentenceSplittingProcess": (
+        "oldt1248",
+        "Sentence splitting process for Old Tamil.",
+    ),
+    "HittiteSentenceSplittingProcess": (
+        "hitt1242",
+        "Sentence splitter for Hittite (hit1242).",
+    ),
+    "TocharianASentenceSplittingProcess": (
+        "toch1238",
+        "Sentence splitter for Tocharian A (toch1238).",
+    ),
+    "TocharianBSentenceSplittingProcess": (
+        "toch1237",
+        "Sentence splitter for Tocharian B (toch1237).",
+    ),
+    "AvestanSentenceSplittingProcess": (
+        "aves1237",
+        "Sentence splitter for Avestan (aves1237).",
+    ),
+    "BactrianSentenceSplittingProcess": (
+        "bact1239",
+        "Sentence splitter for Bactrian (bact1239).",
+    ),
+    "SogdianSentenceSplittingProcess": (
+        "sogd1245",
+        "Sentence splitter for Sogdian (sogd1245).",
+    ),
+    "KhotaneseSentenceSplittingProcess": (
+        "khot1251",
+        "Sentence splitter for Khotanese (khot1251).",
+    ),
+    "TumshuqeseSentenceSplittingProcess": (
+        "tums1237",
+        "Sentence splitter for Tumshuqese (tums1237).",
+    ),
+    "OldPersianSentenceSplittingProcess": (
+        "oldp1254",
+        "Sentence splitter for Old Persian (oldp1254).",
+    ),
+    "EarlyIrishSentenceSplittingProcess": (
+        "oldi1245",
+        "Sentence splitter for Old Irish (oldi1245).",
+    ),
+    "UgariticSentenceSplittingProcess": (
+        "ugar1238",
+        "Sentence splitter for Ugaritic (ugar1238).",
+    ),
+    "PhoenicianSentenceSplittingProcess": (
+        "phoe1239",
+        "Sentence splitter for Phoenician (phoe1239).",
+    ),
+    "GeezSentenceSplittingProcess": (
+        "geez1241",
+        "Sentence splitter for Geez (geez1241).",
+    ),
+    "MiddleEgyptianSentenceSplittingProcess": (
+        "midd1369",
+        "Sentence splitter for Middle Egyptian (midd1369).",
+    ),
+    "OldEgyptianSentenceSplittingProcess": (
+        "olde1242",
+        "Sentence splitter for Old Egyptian (olde1242).",
+    ),
+    "LateEgyptianSentenceSplittingProcess": (
+        "late1256",
+        "Sentence splitter for Late Egyptian (late1256).",
+    ),
+    "OldMiddleWelshSentenceSplittingProcess": (
+        "midd1254",
+        "Sentence splitting process for Middle Welsh.",
+    ),
+    "MiddleBretonSentenceSplittingProcess": (
+        "midb1244",
+        "Sentence splitting process for Middle Breton.",
+    ),
+    "MiddleCornishSentenceSplittingProcess": (
+        "corn1251",
+        "Sentence splitting process for Cornish.",
+    ),
+    "OldPrussianSentenceSplittingProcess": (
+        "prus1238",
+        "Sentence splitting process for Old Prussian.",
+    ),
+    "LithuanianSentenceSplittingProcess": (
+        "lith1251",
+        "Sentence splitting process for Lithuanian.",
+    ),
+    "LatvianSentenceSplittingProcess": (
+        "latv1249",
+        "Sentence splitting process for Latvian.",
+    ),
+    "AlbanianSentenceSplittingProcess": (
+        "gheg1238",
+        "Sentence splitting process for Albanian.",
+    ),
+    "SauraseniPrakritSentenceSplittingProcess": (
+        "saur1252",
+        "Sentence splitting process for Sauraseni Prakrit.",
+    ),
+    "MaharastriPrakritSentenceSplittingProcess": (
+        "maha1305",
+        "Sentence splitting process for Maharastri Prakrit.",
+    ),
+    "MagadhiPrakritSentenceSplittingProcess": (
+        "maga1260",
+        "Sentence splitting process for Magadhi Prakrit.",
+    ),
+    "GandhariSentenceSplittingProcess": (
+        "gand1259",
+        "Sentence splitting process for Gandhari.",
+    ),
+    "MoabiteSentenceSplittingProcess": (
+        "moab1234",
+        "Sentence splitting process for Moabite.",
+    ),
+    "AmmoniteSentenceSplittingProcess": (
+        "ammo1234",
+        "Sentence splitting process for Ammonite.",
+    ),
+    "EdomiteSentenceSplittingProcess": (
+        "edom1234",
+        "Sentence splitting process for Edomite.",
+    ),
+    "OldAramaicSentenceSplittingProcess": (
+        "olda1246",
+        "Sentence splitting process for Old Aramaic (up to 700 BCE).",
+    ),
+    "OldAramaicSamalianSentenceSplittingProcess": (
+        "olda1245",
+        "Sentence splitting process for Old Aramaic–Samʾalian.",
+    ),
+    "MiddleAramaicSentenceSplittingProcess": (
+        "midd1366",
+        "Sentence splitting process for Middle Aramaic.",
+    ),
+    "ClassicalMandaicSentenceSplittingProcess": (
+        "clas1253",
+        "Sentence splitting process for Classical Mandaic.",
+    ),
+    "HatranSentenceSplittingProcess": (
+        "hatr1234",
+        "Sentence splitting process for Hatran.",
+    ),
+    "JewishBabylonianAramaicSentenceSplittingProcess": (
+        "jewi1240",
+        "Sentence splitting process for Jewish Babylonian Aramaic.",
+    ),
+    "SamalianSentenceSplittingProcess": (
+        "sama1234",
+        "Sentence splitting process for Samʾalian.",
+    ),
+}
+
+
+def _build_language_process(
+    name: str, row: tuple[str, str]
+) -> type[SentenceSplittingProcess]:
+    """Create the per-language ``SentenceSplittingProcess`` subclass for ``name``."""
+    glottolog_id, doc = row
+    return build_subclass(
+        SentenceSplittingProcess,
+        name,
+        __name__,
+        doc,
+        {"glottolog_id": (Optional[str], glottolog_id)},
+    )
+
+
+_LANGUAGE_CLASSES = LazyClassTable(
+    globals(), _LANGUAGE_PROCESSES, _build_language_process
+)
+
+
+def __getattr__(name: str) -> type[SentenceSplittingProcess]:
+    """Create per-language process classes on first access."""
+    return _LANGUAGE_CLASSES.resolve(name)
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including classes not yet created."""
+    return _LANGUAGE_CLASSES.dir()
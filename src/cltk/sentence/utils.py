@@ -1,6 +1,143 @@
 """Helpers for dealing with sentences."""
 
 import re
+from collections.abc import Iterable, Iterator
+from typing import TextIO, Union
+
+from cltk.text.utils import DEFAULT_STREAM_CHUNK_SIZE, read_text_chunks
+
+# Language-specific sentence-ending regex patterns, keyed by Glottolog code.
+_SENTENCE_ENDINGS: dict[str, str] = {
+    "anci1242": r"([;;·.·:])",  # Ancient Greek
+    "lati1261": r"([.!?])",
+    "vedi1234": r"([।॥.!?])",  # Vedic Sanskrit: danda, double danda, period, exclamation, question
+    "clas1258": r"([।॥.!?])",  # Classical Sanskrit: danda, double danda, period, exclamation, question
+    "pali1273": r"([।॥!?])",  # Pali: danda, period, exclamation, question
+    "anci1244": r"([׃.])",  # Biblical Hebrew: sof pasuq, full stop
+    # Aramaic continuum
+    "olda1246": r"([׃.?!])",  # Old Aramaic (up to 700 BCE)
+    "olda1245": r"([𐤟.?!])",  # Old Aramaic–Samʾalian (allow Phoenician divider)
+    "midd1366": r"([׃.?!])",  # Middle Aramaic
+    "clas1253": r"([.!?])",  # Classical Mandaic
+    "hatr1234": r"([.!?])",  # Hatran
+    "jewi1240": r"([׃.?!])",  # Jewish Babylonian Aramaic
+    "impe1235": r"([׃.?!])",  # Aramaic: sof pasuq (U+05C3), period, question, exclamation
+    "copt1239": r"([⳹.!?])",  # Coptic: punctuation marks
+    "oldn1244": r"([.:;!?])",  # Old Norse: period, colon, semicolon, exclamation, question
+    "olde1238": r"([.!?])",  # Old English: period, exclamation, question
+    "akka1240": r"([\.!?𒑰])",  # Akkadian: period, exclamation, question, and double wedge (𒑰, U+12370)
+    "clas1259": r"([.!\u061F\u06D4])",  # Arabic: period, exclamation, Arabic question mark (؟), Arabic full stop (۔)
+    "chur1257": r"([.!?])",  # Old Church Slavonic: period, exclamation, question
+    "midd1317": r"([.!?])",  # Middle English: period, exclamation, question
+    "midd1316": r"([.!?])",  # Middle French: period, exclamation, question
+    "oldf1239": r"([.!?])",  # Old French: period, exclamation, question
+    "midd1343": r"([.!?])",  # Middle High German: period, exclamation, question
+    "oldh1241": r"([.!?])",  # Old High German: period, exclamation, question
+    "goth1244": r"([.!?])",  # Gothic: period, exclamation, question
+    # Hindi and related lects (Devanāgarī-domain): danda, double danda, period, exclamation, question
+    "hind1269": r"([।॥.!?])",  # Hindi (glottocode)
+    "khad1239": r"([।॥.!?])",  # Khari Boli (Hindi dialect)
+    "braj1242": r"([।॥.!?])",  # Braj Bhasha
+    "awad1243": r"([।॥.!?])",  # Awadhi
+    "urdu1245": r"([.!\u061F\u06D4])",  # Urdu: period, Arabic question mark (؟), Urdu full stop (۔)
+    "lite1248": r"([。！？])",  # Literary Chinese: full stop (。), exclamation (！), question (？)
+    # Sinitic stages
+    "oldc1244": r"([。！？])",  # Old Chinese
+    "midd1344": r"([。！？])",  # Middle Chinese
+    "clas1255": r"([。！？])",  # Early Vernacular Chinese (Baihua)
+    # Eastern Panjabi glottocode
+    "panj1256": r"([।॥.!?])",  # Eastern Panjabi (Gurmukhi): danda, double danda, etc.
+    # Eastern Indo-Aryan
+    "beng1280": r"([।॥.!?])",  # Bengali
+    "oriy1255": r"([।॥.!?])",  # Odia (Oriya)
+    "assa1263": r"([।॥.!?])",  # Assamese
+    # Western Indo-Aryan
+    "guja1252": r"([।॥.!?])",  # Gujarati
+    "mara1378": r"([।॥.!?])",  # Marathi
+    "bagr1243": r"([।॥.!?])",  # Bagri (Rajasthani)
+    "demo1234": r"([.!?])",  # Demotic Egyptian: period, exclamation, question (adjust if you have more info)
+    # Classical Syriac: explicit punctuation marks; remove stray literal 'r'
+    "clas1252": r"([܀܁܂܃܄܆܇·])",
+    "hitt1242": r"([\.!?𒑰])",  # Hittite: generic (Akkadian-like) punctuation + 𒑰
+    "toch1238": r"([।॥.!?])",  # Tocharian A: Brahmi danda family
+    "toch1237": r"([।॥.!?])",  # Tocharian B: Brahmi danda family
+    "oldp1254": r"([.!?])",  # Old Persian: generic punctuation
+    "oldi1245": r"([.!?])",  # Early Irish: Latin punctuation
+    "ugar1238": r"([𒑰])",  # Ugaritic: generic punctuation
+    "phoe1239": r"([𐤟])",  # Phoenician: generic punctuation
+    "moab1234": r"([𐤟])",  # Moabite (Phoenician-family divider)
+    "ammo1234": r"([𐤟])",  # Ammonite
+    "edom1234": r"([𐤟])",  # Edomite
+    "sama1234": r"([𐤟])",  # Samʾalian
+    "geez1241": r"([፡።፨])",  # Geez: generic punctuation
+    "midd1369": r"([𓏛])",  # Middle Egyptian: generic punctuation
+    "olde1242": r"([𓏛])",  # Old Egyptian: generic punctuation
+    "late1256": r"([𓏛])",  # Late Egyptian: generic punctuation
+    "clas1254": r"([།༎༏])",  # Classical Tibetan: shad, nyis shad, tsheg shad
+    "pahl1241": r"([:⁘·.;:])",  # Middle Persian
+    "part1239": r"([·:⁘.;:])",  # Parthian
+    "aves1237": r"([·:⁘.;:])",  # Avestan
+    "bact1239": r"([·:⁘.;:])",  # Bactrian
+    "sogd1245": r"([·:܃⁘.;:])",  # Sogdian
+    "khot1251": r"([।॥.])",  # Khotanese
+    "tums1237": r"([।॥.])",  # Tumshuqese
+    # Burmese/Myanmar-script languages
+    "oldb1235": r"([။!?])",  # Old Burmese
+    "nucl1310": r"([။!?])",  # Classical/Nuclear Burmese
+    "sgaw1245": r"([။!?])",  # Sgaw Karen
+    # Tibeto-Burman
+    "tang1334": r"([。！？])",  # Tangut (modern editions with CJK punctuation)
+    "newa1246": r"([।॥.!?])",  # Newar (Devanāgarī punctuation)
+    "mani1292": r"([꯫।.!?])",  # Meitei: Cheikhei (꯫) and danda
+    # Mongolic family
+    "mong1329": r"([᠃.!?])",  # Middle Mongol: include Mongolian full stop ᠃
+    "mong1331": r"([᠃.!?])",  # Classical Mongolian
+    "mogh1245": r"([.!\u061F\u06D4])",  # Mogholi (Perso-Arabic punctuation)
+    # Afroasiatic (Berber/Cushitic/Chadic)
+    "numi1241": r"([·:;.!?])",  # Numidian (Libyco-Berber separators)
+    "tait1247": r"([.!?])",  # Cushitic Taita
+    "haus1257": r"([.!?\u061F\u06D4])",  # Hausa (Latin/Ajami)
+    # Altaic-Adj / Tungusic
+    "jurc1239": r"([。！？])",  # Old Jurchen (CJK-style punctuation in editions)
+    # Japonic
+    "japo1237": r"([。！？])",  # Old Japanese
+    # Uralic
+    "oldh1242": r"([.!?])",  # Old Hungarian
+    # Turkic
+    "chag1247": r"([.!?\u061F\u06D4])",  # Chagatai (Arabic-script)
+    "oldu1238": r"([·:;.!?])",  # Old Turkic (Orkhon separators)
+    # Dravidian
+    "oldt1248": r"([.!?])",  # Old Tamil
+    # South Asian – additional
+    "sinh1246": r"([.!?෴])",  # Sinhala: period/exclam/question; kunddaliya (෴) historical
+    "sind1272": r"([.!\u061F\u06D4])",  # Sindhi (Arabic script): period, Arabic ?, Urdu full stop
+    "kash1277": r"([।॥.!?\u061F\u06D4])",  # Kashmiri: allow both Devanagari and Arabic script punctuation
+    "oldw1239": r"([·.!?])",  # Old Welsh
+    "bret1244": r"([∴.!?])",  # Old-Middle Breton
+    "corn1251": r"([:.!?])",  # Cornish
+    "prus1238": r"([.!?·:;])",  # Old Prussian: period, exclamation, question, middle dot, colon, semicolon
+    "lith1251": r"([.!?])",  # Lithuanian: period, exclamation, question
+    "latv1249": r"([.!?])",  # Latvian: period, exclamation, question
+    "gheg1238": r"([.!?])",  # Albanian: period, exclamation, question
+    "clas1256": r"([։՞,!;])",  # Classical Armenian: period, exclamation, question
+    "midd1364": r"([։՞,!;])",  # Middle Armenian: period, exclamation, question
+    # Luwian family: match any of . ; : ? or the double ruler '||', or section mark/newlines
+    "cune1239": r"([.;:?]|\|\||§|\n+)",
+    # Hieroglyphic Luwian: include mid-dot/bullet variants
+    "hier1240": r"([.;:?]|\|\||•|·|\n+)",
+    "lyci1241": r"([.:;·:])",  # Lycian A
+    "lydi1241": r"([.:;?·:])",  # Lydian
+    "pala1331": r"([.;:?]|\|\||§|\r?\n+)",  # Palaic
+    "cari1274": r"([.?!:;⸱·⁚⁝])",  # Carian
+    "saur1252": r"([।॥.!?])",  # Sauraseni Prakrit: danda, double danda, period, exclamation, question
+    "maha1305": r"([।॥.!?])",  # Maharastri Prakrit: same as above
+    "maga1260": r"([।॥.!?])",  # Magadhi Prakrit: same as above
+    "gand1259": r"([।॥.!?])",  # Gandhari: same as above (adjust if Kharoṣṭhī punctuation is needed)
+}
+
+# Compiled ``_SENTENCE_ENDINGS`` entries, filled on first use of each language
+# so importing this module does not compile patterns for every language.
+_COMPILED_ENDINGS: dict[str, re.Pattern[str]] = {}
 
 
 def extract_sentences_from_boundaries(
@@ -10,6 +147,50 @@ def extract_sentences_from_boundaries(
     return [text[start:stop] for start, stop in boundaries]
 
 
+def _split_with_pattern(text: str, pattern: re.Pattern[str]) -> list[tuple[int, int]]:
+    """Split ``text`` in one pass over the segments produced by ``pattern``.
+
+    A sentence is the whitespace-stripped segment before an ending plus the
+    ending itself. Its start is found by skipping whitespace from the stop of
+    the previous sentence, and its stop is ``start`` plus the sentence length.
+    """
+    parts = pattern.split(text)
+    boundaries: list[tuple[int, int]] = []
+    append = boundaries.append
+    size = len(text)
+    idx = 0
+    pairs = iter(parts)
+    for segment, ending in zip(pairs, pairs):
+        length = len(segment.strip()) + len(ending)
+        if length:
+            while idx < size and text[idx].isspace():
+                idx += 1
+            append((idx, idx + length))
+            idx += length
+    # Handle possible trailing text
+    length = len(parts[-1].strip())
+    if length:
+        while idx < size and text[idx].isspace():
+            idx += 1
+        append((idx, idx + length))
+    return boundaries
+
+
+def _sentence_ending_pattern(glottolog_id: str) -> re.Pattern[str]:
+    """Return the compiled sentence-ending pattern for ``glottolog_id``.
+
+    Each pattern has exactly one capturing group around the sentence ending.
+    """
+    pattern = _COMPILED_ENDINGS.get(glottolog_id)
+    if pattern is None:
+        try:
+            source = _SENTENCE_ENDINGS[glottolog_id]
+        except KeyError:
+            raise ValueError(f"Unsupported language code: {glottolog_id}") from None
+        pattern = _COMPILED_ENDINGS[glottolog_id] = re.compile(source)
+    return pattern
+
+
 def split_sentences_multilang(
     text: str,
     glottolog_id: str,
@@ -26,160 +207,158 @@ def split_sentences_multilang(
         list[tuple[int, int]]: List of (start, stop) indices for each sentence.
 
     """
-    # Define language-specific sentence-ending regex patterns
-    lang_sentence_endings = {
-        "anci1242": r"([;;·.·:])",  # Ancient Greek
-        "lati1261": r"([.!?])",
-        "vedi1234": r"([।॥.!?])",  # Vedic Sanskrit: danda, double danda, period, exclamation, question
-        "clas1258": r"([।॥.!?])",  # Classical Sanskrit: danda, double danda, period, exclamation, question
-        "pali1273": r"([।॥!?])",  # Pali: danda, period, exclamation, question
-        "anci1244": r"([׃.])",  # Biblical Hebrew: sof pasuq, full stop
-        # Aramaic continuum
-        "olda1246": r"([׃.?!])",  # Old Aramaic (up to 700 BCE)
-        "olda1245": r"([𐤟.?!])",  # Old Aramaic–Samʾalian (allow Phoenician divider)
-        "midd1366": r"([׃.?!])",  # Middle Aramaic
-        "clas1253": r"([.!?])",  # Classical Mandaic
-        "hatr1234": r"([.!?])",  # Hatran
-        "jewi1240": r"([׃.?!])",  # Jewish Babylonian Aramaic
-        "impe1235": r"([׃.?!])",  # Aramaic: sof pasuq (U+05C3), period, question, exclamation
-        "copt1239": r"([⳹.!?])",  # Coptic: punctuation marks
-        "oldn1244": r"([.:;!?])",  # Old Norse: period, colon, semicolon, exclamation, question
-        "olde1238": r"([.!?])",  # Old English: period, exclamation, question
-        "akka1240": r"([\.!?𒑰])",  # Akkadian: period, exclamation, question, and double wedge (𒑰, U+12370)
-        "clas1259": r"([.!\u061F\u06D4])",  # Arabic: period, exclamation, Arabic question mark (؟), Arabic full stop (۔)
-        "chur1257": r"([.!?])",  # Old Church Slavonic: period, exclamation, question
-        "midd1317": r"([.!?])",  # Middle English: period, exclamation, question
-        "midd1316": r"([.!?])",  # Middle French: period, exclamation, question
-        "oldf1239": r"([.!?])",  # Old French: period, exclamation, question
-        "midd1343": r"([.!?])",  # Middle High German: period, exclamation, question
-        "oldh1241": r"([.!?])",  # Old High German: period, exclamation, question
-        "goth1244": r"([.!?])",  # Gothic: period, exclamation, question
-        # Hindi and related lects (Devanāgarī-domain): danda, double danda, period, exclamation, question
-        "hind1269": r"([।॥.!?])",  # Hindi (glottocode)
-        "khad1239": r"([।॥.!?])",  # Khari Boli (Hindi dialect)
-        "braj1242": r"([।॥.!?])",  # Braj Bhasha
-        "awad1243": r"([।॥.!?])",  # Awadhi
-        "urdu1245": r"([.!\u061F\u06D4])",  # Urdu: period, Arabic question mark (؟), Urdu full stop (۔)
-        "lite1248": r"([。！？])",  # Literary Chinese: full stop (。), exclamation (！), question (？)
-        # Sinitic stages
-        "oldc1244": r"([。！？])",  # Old Chinese
-        "midd1344": r"([。！？])",  # Middle Chinese
-        "clas1255": r"([。！？])",  # Early Vernacular Chinese (Baihua)
-        # Eastern Panjabi glottocode
-        "panj1256": r"([।॥.!?])",  # Eastern Panjabi (Gurmukhi): danda, double danda, etc.
-        # Eastern Indo-Aryan
-        "beng1280": r"([।॥.!?])",  # Bengali
-        "oriy1255": r"([।॥.!?])",  # Odia (Oriya)
-        "assa1263": r"([।॥.!?])",  # Assamese
-        # Western Indo-Aryan
-        "guja1252": r"([।॥.!?])",  # Gujarati
-        "mara1378": r"([।॥.!?])",  # Marathi
-        "bagr1243": r"([।॥.!?])",  # Bagri (Rajasthani)
-        "demo1234": r"([.!?])",  # Demotic Egyptian: period, exclamation, question (adjust if you have more info)
-        # Classical Syriac: explicit punctuation marks; remove stray literal 'r'
-        "clas1252": r"([܀܁܂܃܄܆܇·])",
-        "hitt1242": r"([\.!?𒑰])",  # Hittite: generic (Akkadian-like) punctuation + 𒑰
-        "toch1238": r"([।॥.!?])",  # Tocharian A: Brahmi danda family
-        "toch1237": r"([।॥.!?])",  # Tocharian B: Brahmi danda family
-        "oldp1254": r"([.!?])",  # Old Persian: generic punctuation
-        "oldi1245": r"([.!?])",  # Early Irish: Latin punctuation
-        "ugar1238": r"([𒑰])",  # Ugaritic: generic punctuation
-        "phoe1239": r"([𐤟])",  # Phoenician: generic punctuation
-        "moab1234": r"([𐤟])",  # Moabite (Phoenician-family divider)
-        "ammo1234": r"([𐤟])",  # Ammonite
-        "edom1234": r"([𐤟])",  # Edomite
-        "sama1234": r"([𐤟])",  # Samʾalian
-        "geez1241": r"([፡።፨])",  # Geez: generic punctuation
-        "midd1369": r"([𓏛])",  # Middle Egyptian: generic punctuation
-        "olde1242": r"([𓏛])",  # Old Egyptian: generic punctuation
-        "late1256": r"([𓏛])",  # Late Egyptian: generic punctuation
-        "clas1254": r"([།༎༏])",  # Classical Tibetan: shad, nyis shad, tsheg shad
-        "pahl1241": r"([:⁘·.;:])",  # Middle Persian
-        "part1239": r"([·:⁘.;:])",  # Parthian
-        "aves1237": r"([·:⁘.;:])",  # Avestan
-        "bact1239": r"([·:⁘.;:])",  # Bactrian
-        "sogd1245": r"([·:܃⁘.;:])",  # Sogdian
-        "khot1251": r"([।॥.])",  # Khotanese
-        "tums1237": r"([।॥.])",  # Tumshuqese
-        # Burmese/Myanmar-script languages
-        "oldb1235": r"([။!?])",  # Old Burmese
-        "nucl1310": r"([။!?])",  # Classical/Nuclear Burmese
-        "sgaw1245": r"([။!?])",  # Sgaw Karen
-        # Tibeto-Burman
-        "tang1334": r"([。！？])",  # Tangut (modern editions with CJK punctuation)
-        "newa1246": r"([।॥.!?])",  # Newar (Devanāgarī punctuation)
-        "mani1292": r"([꯫।.!?])",  # Meitei: Cheikhei (꯫) and danda
-        # Mongolic family
-        "mong1329": r"([᠃.!?])",  # Middle Mongol: include Mongolian full stop ᠃
-        "mong1331": r"([᠃.!?])",  # Classical Mongolian
-        "mogh1245": r"([.!\u061F\u06D4])",  # Mogholi (Perso-Arabic punctuation)
-        # Afroasiatic (Berber/Cushitic/Chadic)
-        "numi1241": r"([·:;.!?])",  # Numidian (Libyco-Berber separators)
-        "tait1247": r"([.!?])",  # Cushitic Taita
-        "haus1257": r"([.!?\u061F\u06D4])",  # Hausa (Latin/Ajami)
-        # Altaic-Adj / Tungusic
-        "jurc1239": r"([。！？])",  # Old Jurchen (CJK-style punctuation in editions)
-        # Japonic
-        "japo1237": r"([。！？])",  # Old Japanese
-        # Uralic
-        "oldh1242": r"([.!?])",  # Old Hungarian
-        # Turkic
-        "chag1247": r"([.!?\u061F\u06D4])",  # Chagatai (Arabic-script)
-        "oldu1238": r"([·:;.!?])",  # Old Turkic (Orkhon separators)
-        # Dravidian
-        "oldt1248": r"([.!?])",  # Old Tamil
-        # South Asian – additional
-        "sinh1246": r"([.!?෴])",  # Sinhala: period/exclam/question; kunddaliya (෴) historical
-        "sind1272": r"([.!\u061F\u06D4])",  # Sindhi (Arabic script): period, Arabic ?, Urdu full stop
-        "kash1277": r"([।॥.!?\u061F\u06D4])",  # Kashmiri: allow both Devanagari and Arabic script punctuation
-        "oldw1239": r"([·.!?])",  # Old Welsh
-        "bret1244": r"([∴.!?])",  # Old-Middle Breton
-        "corn1251": r"([:.!?])",  # Cornish
-        "prus1238": r"([.!?·:;])",  # Old Prussian: period, exclamation, question, middle dot, colon, semicolon
-        "lith1251": r"([.!?])",  # Lithuanian: period, exclamation, question
-        "latv1249": r"([.!?])",  # Latvian: period, exclamation, question
-        "gheg1238": r"([.!?])",  # Albanian: period, exclamation, question
-        "clas1256": r"([։՞,!;])",  # Classical Armenian: period, exclamation, question
-        "midd1364": r"([։՞,!;])",  # Middle Armenian: period, exclamation, question
-        # Luwian family: match any of . ; : ? or the double ruler '||', or section mark/newlines
-        "cune1239": r"([.;:?]|\|\||§|\n+)",
-        # Hieroglyphic Luwian: include mid-dot/bullet variants
-        "hier1240": r"([.;:?]|\|\||•|·|\n+)",
-        "lyci1241": r"([.:;·:])",  # Lycian A
-        "lydi1241": r"([.:;?·:])",  # Lydian
-        "pala1331": r"([.;:?]|\|\||§|\r?\n+)",  # Palaic
-        "cari1274": r"([.?!:;⸱·⁚⁝])",  # Carian
-        "saur1252": r"([।॥.!?])",  # Sauraseni Prakrit: danda, double danda, period, exclamation, question
-        "maha1305": r"([।॥.!?])",  # Maharastri Prakrit: same as above
-        "maga1260": r"([।॥.!?])",  # Magadhi Prakrit: same as above
-        "gand1259": r"([।॥.!?])",  # Gandhari: same as above (adjust if Kharoṣṭhī punctuation is needed)
-    }
-    if glottolog_id not in lang_sentence_endings:
-        raise ValueError(f"Unsupported language code: {glottolog_id}")
-
-    sentence_endings: str = lang_sentence_endings[glottolog_id]
-    parts: list[str] = re.split(sentence_endings, text)
+    return _split_with_pattern(text, _sentence_ending_pattern(glottolog_id))
 
-    boundaries: list[tuple[int, int]] = []
-    idx: int = 0
-    for i in range(0, len(parts) - 1, 2):
-        sentence = parts[i].strip() + parts[i + 1]
-        if sentence:
-            # Find start index (skip leading whitespace)
-            while idx < len(text) and text[idx].isspace():
-                idx += 1
-            start = idx
-            stop = start + len(sentence)
-            boundaries.append((start, stop))
-            idx = stop
-    # Handle possible trailing text
-    if len(parts) % 2 != 0 and parts[-1].strip():
-        sentence = parts[-1].strip()
-        if sentence:
-            while idx < len(text) and text[idx].isspace():
-                idx += 1
-            start = idx
-            stop = start + len(sentence)
-            boundaries.append((start, stop))
-            idx = stop
-    return boundaries
+
+def split_sentences_multilang_batch(
+    texts: Iterable[str],
+    glottolog_id: str,
+) -> list[list[tuple[int, int]]]:
+    """Split many texts of one language into sentences.
+
+    Args:
+        texts (Iterable[str]): The input texts.
+        glottolog_id (str): Glottolog languoid code shared by all texts.
+
+    Returns:
+        list[list[tuple[int, int]]]: Per-text (start, stop) indices, in input order.
+
+    """
+    pattern = _sentence_ending_pattern(glottolog_id)
+    return [_split_with_pattern(text, pattern) for text in texts]
+
+
+_LINE_BREAKS = re.compile(r"\n+")
+_SPACE_RUN = re.compile(r"\s*")
+
+
+def sentence_window_spans(
+    text: str,
+    glottolog_id: str,
+    window_size: int,
+) -> list[tuple[int, int]]:
+    """Cut ``text`` into contiguous, sentence-aligned windows.
+
+    Windows end right after a sentence ending and the whitespace that follows
+    it, so together they cover ``text`` exactly. Each window holds as many
+    whole sentences as fit in ``window_size`` characters; a single sentence
+    longer than that becomes a window of its own. Languages without a
+    sentence-ending pattern are cut at line breaks instead.
+
+    Args:
+        text (str): The input text.
+        glottolog_id (str): Glottolog languoid code for the language.
+        window_size (int): Target maximum window length in characters.
+
+    Returns:
+        list[tuple[int, int]]: (start, stop) indices of each window.
+
+    Raises:
+        ValueError: If ``window_size`` is not positive.
+
+    """
+    if window_size <= 0:
+        raise ValueError("window_size must be a positive integer.")
+    try:
+        pattern = _sentence_ending_pattern(glottolog_id)
+    except ValueError:
+        pattern = _LINE_BREAKS
+    spans: list[tuple[int, int]] = []
+    start = 0
+    last_cut = 0
+    for match in pattern.finditer(text):
+        cut = _SPACE_RUN.match(text, match.end()).end()  # type: ignore[union-attr]
+        if cut - start > window_size and last_cut > start:
+            spans.append((start, last_cut))
+            start = last_cut
+        last_cut = cut
+    if len(text) - start > window_size and start < last_cut < len(text):
+        spans.append((start, last_cut))
+        start = last_cut
+    if start < len(text):
+        spans.append((start, len(text)))
+    return spans
+
+
+def iter_sentences(
+    source: Union[TextIO, Iterable[str]],
+    glottolog_id: str,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Iterator[tuple[int, int, str]]:
+    """Stream sentences from a file handle or an iterable of text chunks.
+
+    Input is consumed chunk by chunk; text after the last complete sentence
+    ending is carried into the next chunk. Offsets are absolute positions in
+    the concatenated input and equal those of ``split_sentences_multilang`` on
+    the whole text, so memory stays bounded by the longest sentence rather
+    than the document.
+
+    Args:
+        source: A text-mode file handle (read ``chunk_size`` characters at a
+            time), a string, or any iterable of strings, e.g. a generator of
+            normalized chunks.
+        glottolog_id (str): Glottolog languoid code for the language.
+        chunk_size (int): Characters per read when ``source`` is a file handle.
+
+    Yields:
+        tuple[int, int, str]: ``(start, stop, sentence)`` for each sentence.
+
+    Raises:
+        ValueError: If ``glottolog_id`` is not supported.
+
+    """
+    pattern = _sentence_ending_pattern(glottolog_id)
+    buffer = ""
+    base = 0  # absolute offset of ``buffer[0]``
+    scan = 0  # buffer offset of the first segment not yet split
+    idx = 0  # absolute offset from which the next sentence start is sought
+    chunks = read_text_chunks(source, chunk_size)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        if chunk is None:
+            final = True
+        elif not chunk:
+            continue
+        else:
+            buffer += chunk
+        size = len(buffer)
+        for match in pattern.finditer(buffer, scan):
+            # An ending that touches the end of the buffer may still grow.
+            if not final and match.end() >= size:
+                break
+            length = len(buffer[scan : match.start()].strip()) + (
+                match.end() - match.start()
+            )
+            start = idx - base
+            while start < size and buffer[start].isspace():
+                start += 1
+            if not final and start + length >= size:
+                break  # the start or the sentence itself depends on later input
+            scan = match.end()
+            if length:
+                yield (
+                    base + start,
+                    base + start + length,
+                    buffer[start : start + length],
+                )
+                idx = base + start + length
+        if final:
+            # Handle possible trailing text
+            length = len(buffer[scan:].strip())
+            if length:
+                start = idx - base
+                while start < size and buffer[start].isspace():
+                    start += 1
+                yield (
+                    base + start,
+                    base + start + length,
+                    buffer[start : start + length],
+                )
+            return
+        # Drop text that no later sentence can start in or refer to.
+        keep = max(0, min(idx - base, scan))
+        if keep:
+            buffer = buffer[keep:]
+            base += keep
+            scan -= keep
@@ -79,7 +79,7 @@ class StanzaAnalyzeProcess(Process):
 
     def run(self, input_doc: Doc) -> Doc:
         """Run a Stanza pipeline and populate the Doc with UD annotations."""
-        output_doc = Doc(**input_doc.model_dump())
+        output_doc = input_doc.fork()
         log = bind_context(
             glottolog_id=getattr(self, "glottolog_id", None), model="stanza"
         )
@@ -174,7 +174,7 @@ class StanzaAnalyzeProcess(Process):
                 upos_obj: Optional[UDPartOfSpeechTag] = None
                 if isinstance(upos_s, str) and upos_s:
                     try:
-                        upos_obj = UDPartOfSpeechTag(tag=upos_s)
+                        upos_obj = UDPartOfSpeechTag.trusted(upos_s)
                     except Exception:
                         upos_obj = None
 
@@ -213,7 +213,7 @@ class StanzaAnalyzeProcess(Process):
                 start_char = getattr(w, "start_char", None)
                 end_char = getattr(w, "end_char", None)
 
-                word = Word(
+                word = Word.trusted(
                     string=form,
                     index_token=token_counter,
                     index_sentence=s_idx,
@@ -244,9 +244,9 @@ class StanzaAnalyzeProcess(Process):
             if not output_doc.sentence_annotation_sources:
                 output_doc.sentence_annotation_sources = {}
             for idx in range(len(sent_bounds)):
+                # Inner dicts are shared with the input doc after ``fork()``.
                 entry = output_doc.sentence_annotation_sources.get(idx, {})
-                entry["span"] = prov_id
-                output_doc.sentence_annotation_sources[idx] = entry
+                output_doc.sentence_annotation_sources[idx] = {**entry, "span": prov_id}
         log.info(
             "Stanza annotated %d sentences and %d tokens", len(sent_bounds), len(words)
         )
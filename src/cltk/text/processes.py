@@ -10,15 +10,22 @@ from cltk.core.cltk_logger import bind_context, logger
 from cltk.core.data_types import Doc, Process
 from cltk.core.logging_utils import bind_from_doc
 from cltk.core.process_registry import register_process
-from cltk.text.utils import cltk_normalize
+from cltk.text.utils import cltk_normalize, normalize_with_offsets
 
 
 @register_process
 class NormalizeProcess(Process):
-    """Generic process for text normalization."""
+    """Generic process for text normalization.
+
+    Set ``track_offsets`` to also store a normalized-to-raw offset map in
+    ``Doc.normalized_offsets``. Offsets can only be tracked for the default
+    ``cltk_normalize`` algorithm; subclasses that override ``algorithm``
+    raise ``ValueError`` when ``track_offsets`` is set.
+    """
 
     process_id: ClassVar[str] = "normalize"
     language_code: Optional[str] = None
+    track_offsets: bool = False
 
     @cached_property
     def algorithm(self) -> Callable[[str], str]:
@@ -43,7 +50,18 @@ class NormalizeProcess(Process):
         if input_doc.raw is None:
             log.error("input_doc.raw must not be None")
             raise ValueError("input_doc.raw must not be None")
-        normalized_text = self.algorithm(input_doc.raw)
+        if self.track_offsets:
+            if self.algorithm is not cltk_normalize:
+                # Offsets are computed by replaying ``cltk_normalize`` only.
+                log.error("track_offsets requires the cltk_normalize algorithm")
+                raise ValueError(
+                    "track_offsets is only supported with the default "
+                    f"cltk_normalize algorithm, not {self.algorithm!r}."
+                )
+            normalized_text, offsets = normalize_with_offsets(input_doc.raw)
+            input_doc.normalized_offsets = offsets
+        else:
+            normalized_text = self.algorithm(input_doc.raw)
         input_doc.normalized_text = normalized_text
         log.info(
             f"Normalized text: {input_doc.normalized_text[:50]}..."
@@ -1,12 +1,12 @@
 """Process for GenAI-driven translation."""
 
 from collections.abc import Callable
-from copy import copy
 from functools import cached_property
 from typing import ClassVar, Optional
 
 from cltk.core.cltk_logger import bind_context
 from cltk.core.data_types import Doc, Process
+from cltk.core.lazy_classes import LazyClassTable, build_subclass
 from cltk.core.logging_utils import bind_from_doc
 from cltk.core.process_registry import register_process
 from cltk.genai.prompt_registry import (
@@ -43,7 +43,7 @@ class GenAITranslationProcess(Process):
 
     def run(self, input_doc: Doc) -> Doc:
         """Run the configured GPT translation workflow."""
-        output_doc: Doc = copy(input_doc)
+        output_doc: Doc = input_doc.fork()
         if not output_doc.words:
             msg = "Doc must have `words` with prior annotations before translation."
             bind_from_doc(output_doc).error(msg)
@@ -96,849 +96,247 @@ class GenAITranslationProcess(Process):
         return output_doc
 
 
-class CuneiformLuwianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "cune1239"
-    description: str = "Default textual translation process using a generative GPT model for the Cuneiform Luwian language."
-    authorship_info: str = "CLTK"
-
-
-class HieroglyphicLuwianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hier1240"
-    description: str = "Default textual translation process using a generative GPT model for the Hieroglyphic Luwian language."
-    authorship_info: str = "CLTK"
-
-
-class OldPrussianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "prus1238"
-    description: str = "Default textual translation process using a generative GPT model for the Old Prussian language."
-    authorship_info: str = "CLTK"
-
-
-class LithuanianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lith1251"
-    description: str = "Default textual translation process using a generative GPT model for the Lithuanian language."
-    authorship_info: str = "CLTK"
-
-
-class LatvianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "latv1249"
-    description: str = "Default textual translation process using a generative GPT model for the Latvian language."
-    authorship_info: str = "CLTK"
-
-
-class AlbanianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "gheg1238"
-    description: str = "Default textual translation process using a generative GPT model for the Albanian language."
-    authorship_info: str = "CLTK"
-
-
-class AkkadianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "akka1240"
-    description: str = "Default textual translation process using a generative GPT model for the Akkadian language."
-    authorship_info: str = "CLTK"
-
-
-class AncientGreekGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "anci1242"
-    description: str = "Default textual translation process using a generative GPT model for the Ancient Greek language."
-    authorship_info: str = "CLTK"
-
-
-class BiblicalHebrewGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "anci1244"
-    description: str = "Default textual translation process using a generative GPT model for the Biblical Hebrew language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalArabicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1259"
-    description: str = "Default textual translation process using a generative GPT model for the Classical Arabic language."
-    authorship_info: str = "CLTK"
-
-
-class AvestanGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "aves1237"
-    description: str = "Default textual translation process using a generative GPT model for the Avestan language."
-    authorship_info: str = "CLTK"
-
-
-class BactrianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "bact1239"
-    description: str = "Default textual translation process using a generative GPT model for the Bactrian language."
-    authorship_info: str = "CLTK"
-
-
-class SogdianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sogd1245"
-    description: str = "Default textual translation process using a generative GPT model for the Sogdian language."
-    authorship_info: str = "CLTK"
-
-
-class BengaliGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "beng1280"
-    description: str = "Default textual translation process using a generative GPT model for the Bengali language."
-    authorship_info: str = "CLTK"
-
-
-class CarianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "cari1274"
-    description: str = "Default textual translation process using a generative GPT model for the Carian language."
-    authorship_info: str = "CLTK"
-
-
-class ChurchSlavicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "chur1257"
-    description: str = "Default textual translation process using a generative GPT model for the Church Slavic language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalArmenianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1256"
-    description: str = "Default textual translation process using a generative GPT model for the Classical Armenian language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalMandaicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1253"
-    description: str = "Default textual translation process using a generative GPT model for the Classical Mandaic language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalMongolianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mong1331"
-    description: str = "Default textual translation process using a generative GPT model for the Classical Mongolian language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalSyriacGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1252"
-    description: str = "Default textual translation process using a generative GPT model for the Classical Syriac language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalTibetanGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1254"
-    description: str = "Default textual translation process using a generative GPT model for the Classical Tibetan language."
-    authorship_info: str = "CLTK"
-
-
-class CopticGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "copt1239"
-    description: str = "Default textual translation process using a generative GPT model for the Coptic language."
-    authorship_info: str = "CLTK"
-
-
-class DemoticGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "demo1234"
-    description: str = "Default textual translation process using a generative GPT model for the Demotic language."
-    authorship_info: str = "CLTK"
-
-
-class EasternPanjabiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "panj1256"
-    description: str = "Default textual translation process using a generative GPT model for the Eastern Panjabi language."
-    authorship_info: str = "CLTK"
-
-
-class EdomiteGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "edom1234"
-    description: str = "Default textual translation process using a generative GPT model for the Edomite language."
-    authorship_info: str = "CLTK"
-
-
-class GeezGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "geez1241"
-    description: str = "Default textual translation process using a generative GPT model for the Geez language."
-    authorship_info: str = "CLTK"
-
-
-class GothicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "goth1244"
-    description: str = "Default textual translation process using a generative GPT model for the Gothic language."
-    authorship_info: str = "CLTK"
-
-
-class GujaratiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "guja1252"
-    description: str = "Default textual translation process using a generative GPT model for the Gujarati language."
-    authorship_info: str = "CLTK"
-
-
-class HindiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hind1269"
-    description: str = "Default textual translation process using a generative GPT model for the Hindi language."
-    authorship_info: str = "CLTK"
-
-
-class KhariBoliGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "khad1239"
-    description: str = "Default textual translation process using a generative GPT model for the Khari Boli dialect of Hindi."
-    authorship_info: str = "CLTK"
-
-
-class BrajGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "braj1242"
-    description: str = "Default textual translation process using a generative GPT model for the Braj Bhasha language."
-    authorship_info: str = "CLTK"
-
-
-class AwadhiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "awad1243"
-    description: str = "Default textual translation process using a generative GPT model for the Awadhi language."
-    authorship_info: str = "CLTK"
-
-
-class HittiteGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hitt1242"
-    description: str = "Default textual translation process using a generative GPT model for the Hittite language."
-    authorship_info: str = "CLTK"
-
-
-class KhotaneseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "khot1251"
-    description: str = "Default textual translation process using a generative GPT model for the Khotanese language."
-    authorship_info: str = "CLTK"
-
-
-class TumshuqeseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tums1237"
-    description: str = "Default textual translation process using a generative GPT model for the Tumshuqese language."
-    authorship_info: str = "CLTK"
-
-
-class LateEgyptianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "late1256"
-    description: str = "Default textual translation process using a generative GPT model for the Late Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class LatinGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lati1261"
-    description: str = "Default textual translation process using a generative GPT model for the Latin language."
-    authorship_info: str = "CLTK"
-
-
-class LiteraryChineseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lite1248"
-    description: str = "Default textual translation process using a generative GPT model for the Literary Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class LycianAGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lyci1241"
-    description: str = "Default textual translation process using a generative GPT model for the Lycian A language."
-    authorship_info: str = "CLTK"
-
-
-class LydianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "lydi1241"
-    description: str = "Default textual translation process using a generative GPT model for the Lydian language."
-    authorship_info: str = "CLTK"
-
-
-class MaharastriPrakritGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "maha1305"
-    description: str = "Default textual translation process using a generative GPT model for the Maharastri Prakrit language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleArmenianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1364"
-    description: str = "Default textual translation process using a generative GPT model for the Middle Armenian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleBretonGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldb1244"
-    description: str = "Default textual translation process using a generative GPT model for the Middle Breton language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleChineseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1344"
-    description: str = "Default textual translation process using a generative GPT model for the Middle Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleCornishGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "corn1251"
-    description: str = "Default textual translation process using a generative GPT model for the Middle Cornish language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleEgyptianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1369"
-    description: str = "Default textual translation process using a generative GPT model for the Middle Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleEnglishGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1317"
-    description: str = "Default textual translation process using a generative GPT model for the Middle English language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleFrenchGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1316"
-    description: str = "Default textual translation process using a generative GPT model for the Middle French language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleHighGermanGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1343"
-    description: str = "Default textual translation process using a generative GPT model for the Middle High German language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleMongolGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mong1329"
-    description: str = "Default textual translation process using a generative GPT model for the Middle Mongol language."
-    authorship_info: str = "CLTK"
-
-
-class MoabiteGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "moab1234"
-    description: str = "Default textual translation process using a generative GPT model for the Moabite language."
-    authorship_info: str = "CLTK"
-
-
-class OdiaGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oriy1255"
-    description: str = "Default textual translation process using a generative GPT model for the Odia language."
-    authorship_info: str = "CLTK"
-
-
-class OfficialAramaicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "impe1235"
-    description: str = "Default textual translation process using a generative GPT model for the Official Aramaic (700-300 BCE) language."
-    authorship_info: str = "CLTK"
-
-
-class OldBurmeseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldb1235"
-    description: str = "Default textual translation process using a generative GPT model for the Old Burmese language."
-    authorship_info: str = "CLTK"
-
-
-class OldChineseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldc1244"
-    description: str = "Default textual translation process using a generative GPT model for the Old Chinese language."
-    authorship_info: str = "CLTK"
-
-
-class BaihuaChineseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1255"
-    description: str = "Default textual translation process using a generative GPT model for Early Vernacular Chinese (Baihua)."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalBurmeseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "nucl1310"
-    description: str = "Default textual translation process using a generative GPT model for the Classical Burmese language."
-    authorship_info: str = "CLTK"
-
-
-class TangutGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tang1334"
-    description: str = "Default textual translation process using a generative GPT model for the Tangut (Xixia) language."
-    authorship_info: str = "CLTK"
-
-
-class NewarGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "newa1246"
-    description: str = "Default textual translation process using a generative GPT model for the Newar (Classical Nepal Bhasa) language."
-    authorship_info: str = "CLTK"
-
-
-class MeiteiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mani1292"
-    description: str = "Default textual translation process using a generative GPT model for the Meitei (Classical Manipuri) language."
-    authorship_info: str = "CLTK"
-
-
-class SgawKarenGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sgaw1245"
-    description: str = "Default textual translation process using a generative GPT model for the Sgaw Karen language."
-    authorship_info: str = "CLTK"
-
-
-class MogholiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mogh1245"
-    description: str = "Default textual translation process using a generative GPT model for the Mogholi (Moghol) language."
-    authorship_info: str = "CLTK"
-
-
-class NumidianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "numi1241"
-    description: str = "Default textual translation process using a generative GPT model for the Numidian (Ancient Berber) language."
-    authorship_info: str = "CLTK"
-
-
-class TaitaGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "tait1247"
-    description: str = "Default textual translation process using a generative GPT model for the Cushitic Taita language."
-    authorship_info: str = "CLTK"
-
-
-class HausaGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "haus1257"
-    description: str = "Default textual translation process using a generative GPT model for the Hausa language."
-    authorship_info: str = "CLTK"
-
-
-class OldJurchenGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "jurc1239"
-    description: str = "Default textual translation process using a generative GPT model for the Old Jurchen language."
-    authorship_info: str = "CLTK"
-
-
-class OldJapaneseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "japo1237"
-    description: str = "Default textual translation process using a generative GPT model for the Old Japanese language."
-    authorship_info: str = "CLTK"
-
-
-class OldHungarianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldh1242"
-    description: str = "Default textual translation process using a generative GPT model for the Old Hungarian language."
-    authorship_info: str = "CLTK"
-
-
-class ChagataiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "chag1247"
-    description: str = "Default textual translation process using a generative GPT model for the Chagatai language."
-    authorship_info: str = "CLTK"
-
-
-class OldTurkicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldu1238"
-    description: str = "Default textual translation process using a generative GPT model for the Old Turkic language."
-    authorship_info: str = "CLTK"
-
-
-class OldTamilGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldt1248"
-    description: str = "Default textual translation process using a generative GPT model for the Old Tamil language."
-    authorship_info: str = "CLTK"
-
-
-class AmmoniteGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "ammo1234"
-    description: str = "Default textual translation process using a generative GPT model for the Ammonite language."
-    authorship_info: str = "CLTK"
-
-
-class OldAramaicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olda1246"
-    description: str = "Default textual translation process using a generative GPT model for the Old Aramaic (up to 700 BCE) language."
-    authorship_info: str = "CLTK"
-
-
-class OldAramaicSamalianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olda1245"
-    description: str = "Default textual translation process using a generative GPT model for the Old Aramaic–Samʾalian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddleAramaicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "midd1366"
-    description: str = "Default textual translation process using a generative GPT model for the Middle Aramaic language."
-    authorship_info: str = "CLTK"
-
-
-class HatranGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "hatr1234"
-    description: str = "Default textual translation process using a generative GPT model for the Hatran language."
-    authorship_info: str = "CLTK"
-
-
-class JewishBabylonianAramaicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "jewi1240"
-    description: str = "Default textual translation process using a generative GPT model for the Jewish Babylonian Aramaic language."
-    authorship_info: str = "CLTK"
-
-
-class SamalianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sama1234"
-    description: str = "Default textual translation process using a generative GPT model for the Samʾalian language."
-    authorship_info: str = "CLTK"
-
-
-class OldEgyptianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olde1242"
-    description: str = "Default textual translation process using a generative GPT model for the Old Egyptian language."
-    authorship_info: str = "CLTK"
-
-
-class OldEnglishGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "olde1238"
-    description: str = "Default textual translation process using a generative GPT model for the Old English (ca. 450-1100) language."
-    authorship_info: str = "CLTK"
-
-
-class OldFrenchGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldf1239"
-    description: str = "Default textual translation process using a generative GPT model for the Old French (842-ca. 1400) language."
-    authorship_info: str = "CLTK"
-
-
-class OldHighGermanGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldh1241"
-    description: str = "Default textual translation process using a generative GPT model for the Old High German (ca. 750-1050) language."
-    authorship_info: str = "CLTK"
-
-
-class EarlyIrishGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldi1245"
-    description: str = "Default textual translation process using a generative GPT model for the Old Irish language."
-    authorship_info: str = "CLTK"
-
-
-class MarathiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "mara1378"
-    description: str = "Default textual translation process using a generative GPT model for the Marathi language."
-    authorship_info: str = "CLTK"
-
-
-class OldNorseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldn1244"
-    description: str = "Default textual translation process using a generative GPT model for the Old Norse language."
-    authorship_info: str = "CLTK"
-
-
-class OldPersianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldp1254"
-    description: str = "Default textual translation process using a generative GPT model for the Old Persian (ca. 600-400 B.C.) language."
-    authorship_info: str = "CLTK"
-
-
-class OldMiddleWelshGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "oldw1239"
-    description: str = "Default textual translation process using a generative GPT model for the Old-Middle Welsh language."
-    authorship_info: str = "CLTK"
-
-
-class ParthianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "part1239"
-    description: str = "Default textual translation process using a generative GPT model for the Parthian language."
-    authorship_info: str = "CLTK"
-
-
-class MiddlePersianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pahl1241"
-    description: str = "Default textual translation process using a generative GPT model for the Middle Persian language."
-    authorship_info: str = "CLTK"
-
-
-class PalaicGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pala1331"
-    description: str = "Default textual translation process using a generative GPT model for the Palaic language."
-    authorship_info: str = "CLTK"
-
-
-class PaliGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "pali1273"
-    description: str = "Default textual translation process using a generative GPT model for the Pali language."
-    authorship_info: str = "CLTK"
-
-
-class PhoenicianGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "phoe1239"
-    description: str = "Default textual translation process using a generative GPT model for the Phoenician language."
-    authorship_info: str = "CLTK"
-
-
-class AssameseGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "assa1263"
-    description: str = "Default textual translation process using a generative GPT model for the Assamese language."
-    authorship_info: str = "CLTK"
-
-
-class SinhalaGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sinh1246"
-    description: str = "Default textual translation process using a generative GPT model for the Sinhala language."
-    authorship_info: str = "CLTK"
-
-
-class SindhiGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "sind1272"
-    description: str = "Default textual translation process using a generative GPT model for the Sindhi language."
-    authorship_info: str = "CLTK"
-
-
-class KashmiriGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "kash1277"
-    description: str = "Default textual translation process using a generative GPT model for the Kashmiri language."
-    authorship_info: str = "CLTK"
-
-
-class BagriGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "bagr1243"
-    description: str = "Default textual translation process using a generative GPT model for the Bagri (Rajasthani) language."
-    authorship_info: str = "CLTK"
-
-
-class ClassicalSanskritGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "clas1258"
-    description: str = "Default textual translation process using a generative GPT model for the Classical Sanskrit language."
-    authorship_info: str = "CLTK"
-
-
-class VedicSanskritGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "vedi1234"
-    description: str = "Default textual translation process using a generative GPT model for the Vedic Sanskrit language."
-    authorship_info: str = "CLTK"
-
-
-class TokharianAGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "toch1238"
-    description: str = "Default textual translation process using a generative GPT model for the Tokharian A language."
-    authorship_info: str = "CLTK"
-
-
-class TokharianBGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "toch1237"
-    description: str = "Default textual translation process using a generative GPT model for the Tokharian B language."
-    authorship_info: str = "CLTK"
-
-
-class UgariticGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "ugar1238"
-    description: str = "Default textual translation process using a generative GPT model for the Ugaritic language."
-    authorship_info: str = "CLTK"
-
-
-class UrduGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "urdu1245"
-    description: str = "Default textual translation process using a generative GPT model for the Urdu language."
-    authorship_info: str = "CLTK"
-
-
-class SauraseniPrakritGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
-
-    glottolog_id: Optional[str] = "saur1252"
-    description: str = "Default textual translation process using a generative GPT model for the Sauraseni Prakrit language."
-    authorship_info: str = "CLTK"
-
-
-class MagadhiPrakritGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
+# Per-language subclasses of ``GenAITranslationProcess``: class name -> (glottolog_id,
+# language phrase used in ``description``). Classes are created on first
+# access through the module ``__getattr__``.
+_LANGUAGE_PROCESSES: dict[str, tuple[str, str]] = {
+    "CuneiformLuwianGenAITranslationProcess": (
+        "cune1239",
+        "the Cuneiform Luwian language",
+    ),
+    "HieroglyphicLuwianGenAITranslationProcess": (
+        "hier1240",
+        "the Hieroglyphic Luwian language",
+    ),
+    "OldPrussianGenAITranslationProcess": ("prus1238", "the Old Prussian language"),
+    "LithuanianGenAITranslationProcess": ("lith1251", "the Lithuanian language"),
+    "LatvianGenAITranslationProcess": ("latv1249", "the Latvian language"),
+    "AlbanianGenAITranslationProcess": ("gheg1238", "the Albanian language"),
+    "AkkadianGenAITranslationProcess": ("akka1240", "the Akkadian language"),
+    "AncientGreekGenAITranslationProcess": ("anci1242", "the Ancient Greek language"),
+    "BiblicalHebrewGenAITranslationProcess": (
+        "anci1244",
+        "the Biblical Hebrew language",
+    ),
+    "ClassicalArabicGenAITranslationProcess": (
+        "clas1259",
+        "the Classical Arabic language",
+    ),
+    "AvestanGenAITranslationProcess": ("aves1237", "the Avestan language"),
+    "BactrianGenAITranslationProcess": ("bact1239", "the Bactrian language"),
+    "SogdianGenAITranslationProcess": ("sogd1245", "the Sogdian language"),
+    "BengaliGenAITranslationProcess": ("beng1280", "the Bengali language"),
+    "CarianGenAITranslationProcess": ("cari1274", "the Carian language"),
+    "ChurchSlavicGenAITranslationProcess": ("chur1257", "the Church Slavic language"),
+    "ClassicalArmenianGenAITranslationProcess": (
+        "clas1256",
+        "the Classical Armenian language",
+    ),
+    "ClassicalMandaicGenAITranslationProcess": (
+        "clas1253",
+        "the Classical Mandaic language",
+    ),
+    "ClassicalMongolianGenAITranslationProcess": (
+        "mong1331",
+        "the Classical Mongolian language",
+    ),
+    "ClassicalSyriacGenAITranslationProcess": (
+        "clas1252",
+        "the Classical Syriac language",
+    ),
+    "ClassicalTibetanGenAITranslationProcess": (
+        "clas1254",
+        "the Classical Tibetan language",
+    ),
+    "CopticGenAITranslationProcess": ("copt1239", "the Coptic language"),
+    "DemoticGenAITranslationProcess": ("demo1234", "the Demotic language"),
+    "EasternPanjabiGenAITranslationProcess": (
+        "panj1256",
+        "the Eastern Panjabi language",
+    ),
+    "EdomiteGenAITranslationProcess": ("edom1234", "the Edomite language"),
+    "GeezGenAITranslationProcess": ("geez1241", "the Geez language"),
+    "GothicGenAITranslationProcess": ("goth1244", "the Gothic language"),
+    "GujaratiGenAITranslationProcess": ("guja1252", "the Gujarati language"),
+    "HindiGenAITranslationProcess": ("hind1269", "the Hindi language"),
+    "KhariBoliGenAITranslationProcess": ("khad1239", "the Khari Boli dialect of Hindi"),
+    "BrajGenAITranslationProcess": ("braj1242", "the Braj Bhasha language"),
+    "AwadhiGenAITranslationProcess": ("awad1243", "the Awadhi language"),
+    "HittiteGenAITranslationProcess": ("hitt1242", "the Hittite language"),
+    "KhotaneseGenAITranslationProcess": ("khot1251", "the Khotanese language"),
+    "TumshuqeseGenAITranslationProcess": ("tums1237", "the Tumshuqese language"),
+    "LateEgyptianGenAITranslationProcess": ("late1256", "the Late Egyptian language"),
+    "LatinGenAITranslationProcess": ("lati1261", "the Latin language"),
+    "LiteraryChineseGenAITranslationProcess": (
+        "lite1248",
+        "the Literary Chinese language",
+    ),
+    "LycianAGenAITranslationProcess": ("lyci1241", "the Lycian A language"),
+    "LydianGenAITranslationProcess": ("lydi1241", "the Lydian language"),
+    "MaharastriPrakritGenAITranslationProcess": (
+        "maha1305",
+        "the Maharastri Prakrit language",
+    ),
+    "MiddleArmenianGenAITranslationProcess": (
+        "midd1364",
+        "the Middle Armenian language",
+    ),
+    "MiddleBretonGenAITranslationProcess": ("oldb1244", "the Middle Breton language"),
+    "MiddleChineseGenAITranslationProcess": ("midd1344", "the Middle Chinese language"),
+    "MiddleCornishGenAITranslationProcess": ("corn1251", "the Middle Cornish language"),
+    "MiddleEgyptianGenAITranslationProcess": (
+        "midd1369",
+        "the Middle Egyptian language",
+    ),
+    "MiddleEnglishGenAITranslationProcess": ("midd1317", "the Middle English language"),
+    "MiddleFrenchGenAITranslationProcess": ("midd1316", "the Middle French language"),
+    "MiddleHighGermanGenAITranslationProcess": (
+        "midd1343",
+        "the Middle High German language",
+    ),
+    "MiddleMongolGenAITranslationProcess": ("mong1329", "the Middle Mongol language"),
+    "MoabiteGenAITranslationProcess": ("moab1234", "the Moabite language"),
+    "OdiaGenAITranslationProcess": ("oriy1255", "the Odia language"),
+    "OfficialAramaicGenAITranslationProcess": (
+        "impe1235",
+        "the Official Aramaic (700-300 BCE) language",
+    ),
+    "OldBurmeseGenAITranslationProcess": ("oldb1235", "the Old Burmese language"),
+    "OldChineseGenAITranslationProcess": ("oldc1244", "the Old Chinese language"),
+    "BaihuaChineseGenAITranslationProcess": (
+        "clas1255",
+        "Early Vernacular Chinese (Baihua)",
+    ),
+    "ClassicalBurmeseGenAITranslationProcess": (
+        "nucl1310",
+        "the Classical Burmese language",
+    ),
+    "TangutGenAITranslationProcess": ("tang1334", "the Tangut (Xixia) language"),
+    "NewarGenAITranslationProcess": (
+        "newa1246",
+        "the Newar (Classical Nepal Bhasa) language",
+    ),
+    "MeiteiGenAITranslationProcess": (
+        "mani1292",
+        "the Meitei (Classical Manipuri) language",
+    ),
+    "SgawKarenGenAITranslationProcess": ("sgaw1245", "the Sgaw Karen language"),
+    "MogholiGenAITranslationProcess": ("mogh1245", "the Mogholi (Moghol) language"),
+    "NumidianGenAITranslationProcess": (
+        "numi1241",
+        "the Numidian (Ancient Berber) language",
+    ),
+    "TaitaGenAITranslationProcess": ("tait1247", "the Cushitic Taita language"),
+    "HausaGenAITranslationProcess": ("haus1257", "the Hausa language"),
+    "OldJurchenGenAITranslationProcess": ("jurc1239", "the Old Jurchen language"),
+    "OldJapaneseGenAITranslationProcess": ("japo1237", "the Old Japanese language"),
+    "OldHungarianGenAITranslationProcess": ("oldh1242", "the Old Hungarian language"),
+    "ChagataiGenAITranslationProcess": ("chag1247", "the Chagatai language"),
+    "OldTurkicGenAITranslationProcess": ("oldu1238", "the Old Turkic language"),
+    "OldTamilGenAITranslationProcess": ("oldt1248", "the Old Tamil language"),
+    "AmmoniteGenAITranslationProcess": ("ammo1234", "the Ammonite language"),
+    "OldAramaicGenAITranslationProcess": (
+        "olda1246",
+        "the Old Aramaic (up to 700 BCE) language",
+    ),
+    "OldAramaicSamalianGenAITranslationProcess": (
+        "olda1245",
+        "the Old Aramaic–Samʾalian language",
+    ),
+    "MiddleAramaicGenAITranslationProcess": ("midd1366", "the Middle Aramaic language"),
+    "HatranGenAITranslationProcess": ("hatr1234", "the Hatran language"),
+    "JewishBabylonianAramaicGenAITranslationProcess": (
+        "jewi1240",
+        "the Jewish Babylonian Aramaic language",
+    ),
+    "SamalianGenAITranslationProcess": ("sama1234", "the Samʾalian language"),
+    "OldEgyptianGenAITranslationProcess": ("olde1242", "the Old Egyptian language"),
+    "OldEnglishGenAITranslationProcess": (
+        "olde1238",
+        "the Old English (ca. 450-1100) language",
+    ),
+    "OldFrenchGenAITranslationProcess": (
+        "oldf1239",
+        "the Old French (842-ca. 1400) language",
+    ),
+    "OldHighGermanGenAITranslationProcess": (
+        "oldh1241",
+        "the Old High German (ca. 750-1050) language",
+    ),
+    "EarlyIrishGenAITranslationProcess": ("oldi1245", "the Old Irish language"),
+    "MarathiGenAITranslationProcess": ("mara1378", "the Marathi language"),
+    "OldNorseGenAITranslationProcess": ("oldn1244", "the Old Norse language"),
+    "OldPersianGenAITranslationProcess": (
+        "oldp1254",
+        "the Old Persian (ca. 600-400 B.C.) language",
+    ),
+    "OldMiddleWelshGenAITranslationProcess": (
+        "oldw1239",
+        "the Old-Middle Welsh language",
+    ),
+    "ParthianGenAITranslationProcess": ("part1239", "the Parthian language"),
+    "MiddlePersianGenAITranslationProcess": ("pahl1241", "the Middle Persian language"),
+    "PalaicGenAITranslationProcess": ("pala1331", "the Palaic language"),
+    "PaliGenAITranslationProcess": ("pali1273", "the Pali language"),
+    "PhoenicianGenAITranslationProcess": ("phoe1239", "the Phoenician language"),
+    "AssameseGenAITranslationProcess": ("assa1263", "the Assamese language"),
+    "SinhalaGenAITranslationProcess": ("sinh1246", "the Sinhala language"),
+    "SindhiGenAITranslationProcess": ("sind1272", "the Sindhi language"),
+    "KashmiriGenAITranslationProcess": ("kash1277", "the Kashmiri language"),
+    "BagriGenAITranslationProcess": ("bagr1243", "the Bagri (Rajasthani) language"),
+    "ClassicalSanskritGenAITranslationProcess": (
+        "clas1258",
+        "the Classical Sanskrit language",
+    ),
+    "VedicSanskritGenAITranslationProcess": ("vedi1234", "the Vedic Sanskrit language"),
+    "TokharianAGenAITranslationProcess": ("toch1238", "the Tokharian A language"),
+    "TokharianBGenAITranslationProcess": ("toch1237", "the Tokharian B language"),
+    "UgariticGenAITranslationProcess": ("ugar1238", "the Ugaritic language"),
+    "UrduGenAITranslationProcess": ("urdu1245", "the Urdu language"),
+    "SauraseniPrakritGenAITranslationProcess": (
+        "saur1252",
+        "the Sauraseni Prakrit language",
+    ),
+    "MagadhiPrakritGenAITranslationProcess": (
+        "maga1260",
+        "the Magadhi Prakrit language",
+    ),
+    "GandhariGenAITranslationProcess": ("gand1259", "the Gandhari language"),
+}
+
+
+def _build_language_process(
+    name: str, row: tuple[str, str]
+) -> type[GenAITranslationProcess]:
+    """Create the per-language ``GenAITranslationProcess`` subclass for ``name``."""
+    glottolog_id, language = row
+    return build_subclass(
+        GenAITranslationProcess,
+        name,
+        __name__,
+        "Language-specific translation process using a generative GPT model.",
+        {
+            "glottolog_id": (Optional[str], glottolog_id),
+            "description": (
+                str,
+                "Default textual translation process using a generative GPT model for "
+                f"{language}.",
+            ),
+            "authorship_info": (str, "CLTK"),
+        },
+    )
+
+
+_LANGUAGE_CLASSES = LazyClassTable(
+    globals(), _LANGUAGE_PROCESSES, _build_language_process
+)
 
-    glottolog_id: Optional[str] = "maga1260"
-    description: str = "Default textual translation process using a generative GPT model for the Magadhi Prakrit language."
-    authorship_info: str = "CLTK"
 
+def __getattr__(name: str) -> type[GenAITranslationProcess]:
+    """Create per-language process classes on first access."""
+    return _LANGUAGE_CLASSES.resolve(name)
 
-class GandhariGenAITranslationProcess(GenAITranslationProcess):
-    """Language-specific translation process using a generative GPT model."""
 
-    glottolog_id: Optional[str] = "gand1259"
-    description: str = "Default textual translation process using a generative GPT model for the Gandhari language."
-    authorship_info: str = "CLTK"
+def __dir__() -> list[str]:
+    """List module attributes, including classes not yet created."""
+    return _LANGUAGE_CLASSES.dir()
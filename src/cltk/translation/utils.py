@@ -49,18 +49,7 @@ def _get_backend_config(doc: Doc) -> Optional[ModelConfig]:
 
 def _format_feats(feats: Optional[UDFeatureTagSet]) -> str:
     """Serialize UDFeatureTagSet into a UD FEATS string (e.g., Case=Nom|Number=Sing)."""
-    try:
-        if not feats or not getattr(feats, "features", None):
-            return "_"
-        items: list[str] = []
-        for f in feats.features:
-            key = getattr(f, "key", None)
-            val = getattr(f, "value", None)
-            if key and val:
-                items.append(f"{key}={val}")
-        return "|".join(items) if items else "_"
-    except Exception:  # pragma: no cover - defensive
-        return "_"
+    return feats.feats_string if feats is not None else "_"
 
 
 def _strip_code_fences(text: str) -> str:
@@ -384,9 +373,12 @@ def generate_translation_for_sentence(
     if prov_id and translation is not None:
         if not doc.sentence_annotation_sources:
             doc.sentence_annotation_sources = {}
+        # Inner dicts are shared with the input doc after ``fork()``.
         entry = doc.sentence_annotation_sources.get(sentence_idx, {})
-        entry["translation"] = prov_id
-        doc.sentence_annotation_sources[sentence_idx] = entry
+        doc.sentence_annotation_sources[sentence_idx] = {
+            **entry,
+            "translation": prov_id,
+        }
     return translation, res_obj.usage
 
 
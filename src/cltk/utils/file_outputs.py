@@ -3,7 +3,9 @@
 import json
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-from cltk.core.data_types import Doc, Sentence, Word
+from cltk.core.data_types import Doc, Sentence, UDFeatureTagSet, Word
+from cltk.core.embedding_store import EmbeddingMatrix
+from cltk.core.provenance import canonical_json, sha256_hex
 
 if TYPE_CHECKING:
     import pyarrow as pa  # type: ignore[import-untyped]
@@ -47,16 +49,9 @@ def doc_to_conllu(
     def _format_feats(word: "Word") -> str:
         """Serialize UD features into the CoNLL-U feats column."""
         feats = getattr(word, "features", None)
-        feature_list = getattr(feats, "features", None)
-        if not feature_list:
+        if not isinstance(feats, UDFeatureTagSet):
             return "_"
-        items: list[str] = []
-        for feat in feature_list:
-            key = getattr(feat, "key", None)
-            val = getattr(feat, "value", None)
-            if key and val:
-                items.append(f"{key}={val}")
-        return "|".join(sorted(items)) if items else "_"
+        return feats.canonical_string or "_"
 
     def _format_head(word: "Word") -> str:
         """Return the 1-based head index or underscore for CoNLL-U."""
@@ -191,6 +186,7 @@ def doc_to_feature_table(
     *,
     include_provenance: bool = False,
     include_confidence: bool = False,
+    include_embeddings: bool = False,
 ) -> Table:
     """Return a ``pyarrow.Table`` of POS, morphology, and dependency features.
 
@@ -198,6 +194,9 @@ def doc_to_feature_table(
     - Writes an empty row (all ``None``) when a list entry is ``None``.
     - Ignores ``Word.xpos``.
     - Adds tree-shape features, document metadata, and sentence-level metrics.
+    - With ``include_embeddings``, adds an ``embedding`` column of
+      ``fixed_size_list<float>`` word vectors (null where a word has none),
+      built without copying from ``Doc.token_embeddings`` when it is set.
     - Requires ``pyarrow`` to serialize downstream. Example::
 
         >>> table = doc_to_feature_table(doc)
@@ -242,13 +241,8 @@ def doc_to_feature_table(
         if not w:
             continue
         feats = getattr(w, "features", None)
-        feature_list = getattr(feats, "features", None)
-        if not feature_list:
-            continue
-        for feat in feature_list:
-            key = getattr(feat, "key", None)
-            if key:
-                feature_keys.add(str(key))
+        if isinstance(feats, UDFeatureTagSet):
+            feature_keys.update(feats.as_dict())
     sorted_feature_keys: list[str] = sorted(feature_keys)
 
     metadata_map_raw = getattr(doc, "metadata", {}) or {}
@@ -764,15 +758,10 @@ def doc_to_feature_table(
         deprel_value = str(deprel_value_raw) if deprel_value_raw is not None else ""
 
         # Explode UD features for this word
-        feature_map: dict[str, str] = {}
         feats_obj = getattr(word, "features", None)
-        feature_list = getattr(feats_obj, "features", None)
-        if feature_list:
-            for feat in feature_list:
-                key = getattr(feat, "key", None)
-                val = getattr(feat, "value", None)
-                if key and val:
-                    feature_map[str(key)] = str(val)
+        feature_map: dict[str, str] = (
+            feats_obj.as_dict() if isinstance(feats_obj, UDFeatureTagSet) else {}
+        )
 
         row: list[Union[str, int, float, None]] = [
             sentence_idx_raw,
@@ -825,7 +814,14 @@ def doc_to_feature_table(
             columns[name].append(value)
 
     arrays = [pa.array(columns[field.name], type=field.type) for field in schema]
-    return pa.Table.from_arrays(arrays, schema=schema)
+    table = pa.Table.from_arrays(arrays, schema=schema)
+    if include_embeddings:
+        vectors = [getattr(word, "embedding", None) for word in words]
+        matrix = getattr(doc, "token_embeddings", None)
+        if matrix is None or not matrix.holds_rows(vectors):
+            matrix = EmbeddingMatrix.from_rows(vectors)
+        table = table.append_column("embedding", matrix.to_arrow())
+    return table
 
 
 def format_readers_guide(
@@ -972,10 +968,29 @@ def format_readers_guide(
                     lines.append(f"- Model: {record.model}")
                 if record.process:
                     lines.append(f"- Process: {record.process}")
-                if record.prompt_version or record.prompt_digest:
-                    pv = record.prompt_version or "-"
-                    pd = record.prompt_digest or "-"
-                    lines.append(f"- Prompt: v{pv} (sha256={pd})")
+                # Per-sentence GenAI calls record one prompt digest per sentence;
+                # they are listed and cited by the digest of the whole set.
+                sentence_digests = record.sentence_prompt_digests or {}
+                prompt_digest = record.prompt_digest
+                pv = record.prompt_version or "-"
+                if not prompt_digest and len(sentence_digests) > 1:
+                    prompt_digest = sha256_hex(canonical_json(sentence_digests))
+                    lines.append(
+                        f"- Prompt: v{pv} (sha256 per sentence, "
+                        f"combined sha256={prompt_digest})"
+                    )
+                    for sent_idx in sorted(sentence_digests):
+                        lines.append(
+                            f"  - Sentence {sent_idx + 1}: "
+                            f"sha256={record.prompt_digest_for(sent_idx)}"
+                        )
+                else:
+                    if not prompt_digest and sentence_digests:
+                        prompt_digest = record.prompt_digest_for(
+                            next(iter(sentence_digests))
+                        )
+                    if record.prompt_version or prompt_digest:
+                        lines.append(f"- Prompt: v{pv} (sha256={prompt_digest or '-'})")
                 if record.config_digest:
                     lines.append(f"- Config digest: {record.config_digest}")
                 if record.cltk_version:
@@ -988,7 +1003,7 @@ def format_readers_guide(
                     default_id or "",
                     record.backend or "",
                     record.model or "",
-                    record.prompt_digest or "",
+                    prompt_digest or "",
                     record.config_digest or "",
                     record.cltk_version or "",
                 ]
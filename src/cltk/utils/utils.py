@@ -3,7 +3,6 @@
 import os
 import re
 import sys
-import unicodedata
 from contextlib import contextmanager
 from typing import Any, Iterator, Optional, Union
 
@@ -265,10 +264,13 @@ def load_env_file(env_file: str = ".env") -> None:
 
 
 def strip_accents(s: str) -> str:
-    """Remove all accent marks from a string."""
-    return "".join(
-        c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn"
-    )
+    """Remove all accent marks from a string.
+
+    See ``cltk.text.utils.strip_accents``, which this delegates to.
+    """
+    from cltk.text.utils import strip_accents as _strip_accents
+
+    return _strip_accents(s)
 
 
 CLTK_DATA_DIR = get_cltk_data_dir()
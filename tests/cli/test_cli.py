@@ -6,7 +6,11 @@ import pytest
 
 from cltk.cli import dispatch
 from cltk.cli.main import build_parser
-from cltk.cli.utils import require_parquet_deps, write_feature_table_csv
+from cltk.cli.utils import (
+    build_cltk_config,
+    require_parquet_deps,
+    write_feature_table_csv,
+)
 from cltk.core.data_types import Classification, Doc, Language, Word
 from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
 from cltk.utils.file_outputs import doc_to_conllu
@@ -109,6 +113,21 @@ def test_parse_pipeline_describe_smoke() -> None:
     assert args.pipeline_command == "describe"
 
 
+def test_languages_search_ids(capsys: pytest.CaptureFixture[str]) -> None:
+    """Search languages and print glottocodes for completion."""
+    args = build_parser().parse_args(["languages", "greek, ancient", "--ids"])
+    assert args.func(args) == 0
+    assert capsys.readouterr().out.splitlines()[0] == "anci1242"
+
+
+def test_unknown_language_suggests_matches() -> None:
+    """Unresolvable --lang values exit with close matches."""
+    with pytest.raises(SystemExit, match="Did you mean: akka1240"):
+        build_cltk_config(
+            language="akadian", backend="openai", config=None, pipeline=None
+        )
+
+
 def test_dispatch_conllu_mapping() -> None:
     """Map dispatch output to CoNLL-U."""
     doc = _doc()
@@ -145,3 +164,51 @@ def test_parquet_requires_deps(monkeypatch: pytest.MonkeyPatch) -> None:
         RuntimeError, match="Parquet export requires pandas and pyarrow"
     ):
         require_parquet_deps()
+
+
+def test_batch_archive_skips_stored_documents(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    from cltk.core.corpus_archive import CorpusArchive
+
+    analyzed: list[str] = []
+
+    class _NLP:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def analyze(self, text: str) -> Doc:
+            analyzed.append(text)
+            return _doc()
+
+    monkeypatch.setattr("cltk.cli.analyze.NLP", _NLP)
+    input_dir = tmp_path / "texts"
+    input_dir.mkdir()
+    (input_dir / "a.txt").write_text("Arma", encoding="utf-8")
+    archive_path = tmp_path / "corpus.cltkarc"
+    argv = ["analyze", "--lang", "lati1261", "--input-dir", str(input_dir)]
+    argv += ["--archive", str(archive_path)]
+
+    args = build_parser().parse_args(argv)
+    assert args.func(args) == 0
+    (input_dir / "b.txt").write_text("cano", encoding="utf-8")
+    args = build_parser().parse_args(argv)
+    assert args.func(args) == 0
+
+    assert analyzed == ["Arma", "cano"]
+    assert "Skipping" in capsys.readouterr().err
+    with CorpusArchive(archive_path) as archive:
+        assert list(archive) == ["a.txt", "b.txt"]
+
+    out_dir = tmp_path / "out"
+    out_args = ["--out-dir", str(out_dir), "--out", "raw"]
+    args = build_parser().parse_args([*argv, *out_args])
+    assert args.func(args) == 0
+    assert analyzed == ["Arma", "cano", "Arma", "cano"]
+    err = capsys.readouterr().err
+    assert "Skipping" not in err and "writing --out-dir output only" in err
+    assert sorted(p.name for p in out_dir.iterdir()) == ["a.txt", "b.txt"]
+    with CorpusArchive(archive_path) as archive:
+        assert list(archive) == ["a.txt", "b.txt"]
@@ -1,7 +1,24 @@
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+if TYPE_CHECKING:
+    from cltk.genai.simulator import LLMSimulator
 
 # Ensure src/ is importable when running tests without installation
 _SRC = Path(__file__).resolve().parents[1] / "src"
 if str(_SRC) not in sys.path:
     sys.path.insert(0, str(_SRC))
+
+
+@pytest.fixture
+def llm_simulator(monkeypatch: pytest.MonkeyPatch) -> Iterator["LLMSimulator"]:
+    """Run a local GenAI API simulator and point the CLTK clients at it."""
+    from cltk.genai.simulator import LLMSimulator
+
+    with LLMSimulator() as simulator:
+        for key, value in simulator.env().items():
+            monkeypatch.setenv(key, value)
+        yield simulator
@@ -0,0 +1,116 @@
+"""Writing, appending to and reading corpus archives."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cltk.core import corpus_archive
+from cltk.core.corpus_archive import CorpusArchive, CorpusArchiveWriter
+from cltk.core.data_types import Doc, Language, Word
+
+_SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def _doc(*strings: str) -> Doc:
+    return Doc(
+        language=Language(name="Latin", glottolog_id="lati1261"),
+        normalized_text=" ".join(strings),
+        words=[
+            Word(string=s, index_token=i, index_sentence=0)
+            for i, s in enumerate(strings)
+        ],
+    )
+
+
+def _strings(doc: Doc) -> list[str | None]:
+    return [w.string for w in doc.words]
+
+
+def test_write_append_and_random_access(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.cltkarc"
+    with CorpusArchiveWriter(path, compression="zlib") as writer:
+        writer.add(_doc("Arma", "virumque"), doc_id="a", metadata={"book": 1})
+        writer.add(_doc("cano"))
+    with CorpusArchiveWriter(path) as writer:
+        assert "a" in writer and len(writer) == 2
+        writer.add(_doc("Troiae"), doc_id="b")
+        with pytest.raises(ValueError, match="already"):
+            writer.add(_doc("qui"), doc_id="a")
+
+    with CorpusArchive(path) as archive:
+        assert archive.compression == "zlib"
+        assert list(archive) == ["a", "1", "b"]
+        assert archive.entries["a"].metadata == {
+            "language": "lati1261",
+            "words": 2,
+            "book": 1,
+        }
+        assert _strings(archive["b"]) == ["Troiae"]
+        assert _strings(archive["a"]) == ["Arma", "virumque"]
+        docs = archive.docs(["1", "a"])
+        assert _strings(next(docs)) == ["cano"]
+        with pytest.raises(KeyError):
+            archive["missing"]
+
+
+def test_failed_append_keeps_earlier_documents(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.cltkarc"
+    with CorpusArchiveWriter(path, compression="zlib") as writer:
+        writer.add(_doc("Arma"), doc_id="a")
+    size = path.stat().st_size
+    with pytest.raises(RuntimeError):
+        with CorpusArchiveWriter(path) as writer:
+            writer.add(_doc("cano"), doc_id="b")
+            raise RuntimeError("interrupted")
+    assert path.stat().st_size == size
+    with CorpusArchive(path) as archive:
+        assert list(archive) == ["a"]
+    with pytest.raises(ValueError, match="zlib compression"):
+        CorpusArchiveWriter(path, compression="zstd")
+
+
+def test_killed_append_falls_back_to_previous_index(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.cltkarc"
+    with CorpusArchiveWriter(path, compression="zlib") as writer:
+        writer.add(_doc("Arma"), doc_id="a")
+    code = (
+        "import os, sys\n"
+        "from cltk.core.corpus_archive import CorpusArchiveWriter\n"
+        "from cltk.core.data_types import Doc, Language, Word\n"
+        "doc = Doc(language=Language(name='Latin'), words=[Word(string='cano')])\n"
+        "writer = CorpusArchiveWriter(sys.argv[1])\n"
+        "writer.add(doc, doc_id='b')\n"
+        "writer._fh.flush()\n"
+        "os._exit(1)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code, str(path)],
+        env={"PYTHONPATH": str(_SRC)},
+        check=False,
+    )
+    assert proc.returncode == 1
+    with CorpusArchive(path) as archive:
+        assert list(archive) == ["a"]
+        assert _strings(archive["a"]) == ["Arma"]
+    with CorpusArchiveWriter(path) as writer:
+        writer.add(_doc("Troiae"), doc_id="b")
+    with CorpusArchive(path) as archive:
+        assert list(archive) == ["a", "b"]
+        assert _strings(archive["b"]) == ["Troiae"]
+
+
+def test_rejects_other_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "doc.json"
+    path.write_text("{}" * 32)
+    with pytest.raises(ValueError, match="not a CLTK corpus archive"):
+        CorpusArchive(path)
+    with CorpusArchiveWriter(tmp_path / "default.cltkarc") as writer:
+        assert writer.compression == "zlib"
+    monkeypatch.setattr(corpus_archive, "_zstd", lambda: None)
+    with pytest.raises(ImportError, match="cltk\\[zstd\\]"):
+        CorpusArchiveWriter(tmp_path / "zstd.cltkarc", compression="zstd")
+    with pytest.raises(ValueError, match="Unknown archive compression"):
+        CorpusArchiveWriter(tmp_path / "new.cltkarc", compression="lz4")
+    assert not (tmp_path / "new.cltkarc").exists()
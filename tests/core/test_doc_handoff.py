@@ -0,0 +1,88 @@
+"""Copy semantics of ``Doc.fork()`` and ``Doc.snapshot()``."""
+
+from cltk.core.data_types import Doc, Language, Translation, Word
+from cltk.core.fault_tolerance import (
+    FAILED_SENTENCES_KEY,
+    clear_sentence_failure,
+    merge_sentence_words,
+    record_sentence_failure,
+)
+
+TEXT = "Arma virumque cano."
+
+
+def _doc() -> Doc:
+    translation = Translation(text="Arms I sing.")
+    return Doc(
+        language=Language(name="Latin"),
+        words=[
+            Word(string=s, index_token=i, index_sentence=0, annotation_sources={})
+            for i, s in enumerate(["Arma", "virumque", "cano"])
+        ],
+        normalized_text=TEXT,
+        sentence_boundaries=[(0, len(TEXT))],
+        translations=[translation],
+        sentence_translations={0: translation},
+        metadata={"note": {"a": 1}},
+    )
+
+
+def test_fork_owns_top_level_containers_and_shares_words() -> None:
+    doc = _doc()
+    doc.sentences  # noqa: B018 - build the index
+    fork = doc.fork()
+    assert fork == doc
+    assert fork.model_fields_set == doc.model_fields_set
+    assert fork.words is not doc.words and fork.words[0] is doc.words[0]
+    assert fork._sentence_index is not None
+    assert fork._sentence_index.words is fork.words
+    fork.words.append(Word(string="Troiae", index_token=3, index_sentence=0))
+    fork.metadata["stage"] = "pos"
+    fork.genai_use.append({"stage": "pos"})
+    assert len(doc.words) == 3 and len(fork.sentences[0].words) == 4
+    assert "stage" not in doc.metadata and doc.genai_use == []
+
+
+def test_detach_words_and_snapshot_isolate_words() -> None:
+    doc = _doc()
+    fork = doc.fork().detach_words()
+    fork.words[0].lemma = "arma"
+    fork.words[1].annotation_sources["lemma"] = "p1"
+    assert doc.words[0].lemma is None and doc.words[1].annotation_sources == {}
+    snap = doc.snapshot()
+    assert snap == doc
+    snap.metadata["note"]["a"] = 2
+    snap.translations[0].text = "Arms"
+    assert doc.metadata["note"] == {"a": 1}
+    assert doc.translations[0].text == "Arms I sing."
+    assert snap.sentence_translations[0] is snap.translations[0]
+    assert snap.language is doc.language
+
+
+def test_failure_bookkeeping_does_not_leak_into_fork_source() -> None:
+    doc = _doc()
+    record_sentence_failure(doc, stage="pos", sentence_idx=0, error=ValueError("x"))
+    fork = doc.fork()
+    record_sentence_failure(fork, stage="pos", sentence_idx=1, error=ValueError("y"))
+    clear_sentence_failure(fork, stage="pos", sentence_idx=0)
+    assert list(doc.metadata[FAILED_SENTENCES_KEY]["pos"]) == [0]
+    assert list(fork.metadata[FAILED_SENTENCES_KEY]["pos"]) == [1]
+    words = doc.words
+    merged = merge_sentence_words(words[1:], {})
+    assert [w.index_token for w in merged] == [0, 1]
+    assert [w.index_token for w in words] == [0, 1, 2]
+
+
+def test_stage_leaves_input_sentence_sources_unchanged() -> None:
+    from cltk.sentence.processes import SentenceSplittingProcess
+
+    doc = Doc(
+        language=Language(name="Latin", glottolog_id="lati1261"),
+        normalized_text="Arma virumque cano. Troiae qui primus.",
+        sentence_annotation_sources={0: {"translation": "t1"}},
+    )
+    out = SentenceSplittingProcess(glottolog_id="lati1261").run(doc)
+    prov_id = out.sentence_annotation_sources[0]["span"]
+    assert out.sentence_annotation_sources[0] == {"translation": "t1", "span": prov_id}
+    assert doc.sentence_annotation_sources == {0: {"translation": "t1"}}
+    assert doc.provenance == {}
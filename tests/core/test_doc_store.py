@@ -0,0 +1,88 @@
+"""Round trips through the binary ``Doc`` file format."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from cltk.core.data_types import (
+    Doc,
+    Gloss,
+    IdiomSpan,
+    Language,
+    OpenAIBackendConfig,
+    Translation,
+    UDPartOfSpeechTag,
+    Word,
+    WordEnrichment,
+)
+from cltk.core.fault_tolerance import get_failed_sentences, record_sentence_failure
+from cltk.core.provenance import add_provenance_record, build_provenance_record
+from cltk.core.token_store import WordSequence
+from cltk.morphosyntax.normalization import convert_pos_features_to_ud
+from cltk.morphosyntax.ud_deprels import get_ud_deprel_tag
+from cltk.text.utils import normalize_with_offsets
+
+RAW = "ﬁnis Arma virumque"
+
+
+def _doc() -> Doc:
+    normalized, offsets = normalize_with_offsets(RAW)
+    translation = Translation(text="The end.", confidence=0.5)
+    doc = Doc(
+        language=Language(name="Latin", glottolog_id="lati1261"),
+        raw=RAW,
+        normalized_text=normalized,
+        normalized_offsets=offsets,
+        words=[
+            Word(
+                string="finis",
+                lemma="finis",
+                index_token=0,
+                index_sentence=0,
+                upos=UDPartOfSpeechTag(tag="NOUN"),
+                features=convert_pos_features_to_ud("Case=Nom|Number=Sing"),
+                dependency_relation=get_ud_deprel_tag("nsubj", "pass"),
+                annotation_sources={"upos": "p1"},
+                confidence={"upos": 0.9},
+                enrichment=WordEnrichment(gloss=Gloss(dictionary="end")),
+            ),
+            Word(string="Arma", index_token=1, index_sentence=1, syllables=["ar"]),
+        ],
+        sentence_boundaries=[(0, 5), (6, len(normalized))],
+        sentence_translations={0: translation},
+        translations=[translation],
+        sentence_embeddings={0: np.ones(4, dtype=np.float32)},
+        coreferences=[("a", "b", 0, 1)],
+        idiom_spans=[IdiomSpan(token_indices=[0, 1])],
+        backend="openai",
+        metadata={"backend_config": OpenAIBackendConfig(api_key="sk-secret")},
+    )
+    add_provenance_record(doc, build_provenance_record(language="lati1261"))
+    record_sentence_failure(doc, stage="pos", sentence_idx=1, error=ValueError("x"))
+    return doc
+
+
+@pytest.mark.parametrize("mmap_file", [True, False])
+def test_save_load_round_trips_every_field(tmp_path: Path, mmap_file: bool) -> None:
+    doc = _doc()
+    loaded = Doc.load(doc.save(tmp_path / "doc.cltkdoc"), mmap_file=mmap_file)
+    assert isinstance(loaded.words, WordSequence)
+    assert loaded.words == doc.words
+    assert loaded.words[0].enrichment == doc.words[0].enrichment
+    assert loaded.model_fields_set == doc.model_fields_set
+    for name in Doc.model_fields.keys() - {"words", "tokens", "metadata"}:
+        if name != "sentence_embeddings":
+            assert getattr(loaded, name) == getattr(doc, name), name
+    np.testing.assert_array_equal(loaded.sentence_embeddings[0], np.ones(4))
+    assert get_failed_sentences(loaded) == get_failed_sentences(doc)
+    assert "api_key" not in loaded.metadata["backend_config"]
+    assert [w.string for w in loaded.sentence_words(1)] == ["Arma"]
+    assert loaded.expand().words == doc.words
+
+
+def test_load_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "doc.json"
+    path.write_text("{}")
+    with pytest.raises(ValueError, match="not a CLTK Doc file"):
+        Doc.load(path)
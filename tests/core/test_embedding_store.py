@@ -0,0 +1,111 @@
+"""Embedding matrices and their row views on ``Doc``."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from cltk.core.data_types import Doc, Language, Word
+from cltk.core.embedding_store import EmbeddingMatrix
+from cltk.utils.file_outputs import doc_to_feature_table
+
+
+def _doc() -> Doc:
+    vectors = [np.array([1.0, 0.0]), None, np.array([0.6, 0.8])]
+    return Doc(
+        language=Language(name="Latin"),
+        words=[
+            Word(string=s, index_token=i, index_sentence=0, embedding=v)
+            for i, (s, v) in enumerate(zip(["Arma", "virumque", "cano"], vectors))
+        ],
+        sentence_embeddings={0: np.array([0.0, 1.0]), 2: np.array([1.0, 1.0])},
+    )
+
+
+def test_pack_embeddings_replaces_vectors_with_row_views() -> None:
+    doc = _doc()
+    original = doc.words[0]
+    doc.pack_embeddings()
+    tokens, sentences = doc.token_embeddings, doc.sentence_embedding_matrix
+    assert tokens is not None and sentences is not None
+    assert tokens.values.dtype == np.float32 and tokens.values.shape == (3, 2)
+    assert tokens.present.tolist() == [True, False, True]
+    assert doc.words[0] is not original and original.embedding.dtype == np.float64
+    assert all(tokens.holds(i, w.embedding) for i, w in enumerate(doc.words) if i != 1)
+    assert doc.words[1].embedding is None
+    assert sentences.row(1) is None and sentences.holds(2, doc.sentence_embeddings[2])
+    assert doc.sentences[0].embedding is doc.sentence_embeddings[0]
+    with pytest.raises(ValueError):
+        doc.words[0].embedding[0] = 5.0
+    doc.pack_embeddings()
+    assert doc.token_embeddings is tokens
+
+    scores = tokens.cosine_similarity([0.6, 0.8])
+    assert np.isnan(scores[1]) and int(np.nanargmax(scores)) == 2
+
+    snap = doc.snapshot()
+    assert snap.sentence_embedding_matrix is sentences
+    assert snap.sentence_embeddings[2] is doc.sentence_embeddings[2]
+
+
+def test_compact_and_save_keep_one_matrix(tmp_path: Path) -> None:
+    doc = _doc().pack_embeddings()
+    tokens = doc.token_embeddings
+    doc.compact()
+    assert doc.tokens is not None and doc.tokens.embeddings is tokens
+    assert doc.token_embeddings is tokens
+    assert tokens is not None and tokens.holds(2, doc.words[2].embedding)
+
+    loaded = Doc.load(doc.save(tmp_path / "doc.cltkdoc"))
+    assert loaded.token_embeddings is not None
+    np.testing.assert_array_equal(loaded.token_embeddings.values, tokens.values)
+    assert loaded.token_embeddings.holds(0, loaded.words[0].embedding)
+    assert loaded.words[1].embedding is None
+    matrix = loaded.sentence_embedding_matrix
+    assert matrix is not None and sorted(loaded.sentence_embeddings) == [0, 2]
+    assert matrix.holds(0, loaded.sentence_embeddings[0])
+
+    path = tokens.save(tmp_path / "tokens.npy")
+    mapped = EmbeddingMatrix.load(path)
+    assert isinstance(mapped.values, np.memmap)
+    np.testing.assert_array_equal(mapped.values, tokens.values)
+
+
+def test_arrow_round_trip() -> None:
+    pa = pytest.importorskip("pyarrow")
+    matrix = EmbeddingMatrix.from_rows([[1.0, 2.0], None, [3.0, 4.0]])
+    array = matrix.to_arrow()
+    assert array.type == pa.list_(pa.float32(), 2)
+    assert array.to_pylist() == [[1.0, 2.0], None, [3.0, 4.0]]
+    restored = EmbeddingMatrix.from_arrow(array)
+    assert restored.present.tolist() == [True, False, True]
+    np.testing.assert_array_equal(restored.row(2), [3.0, 4.0])
+    with pytest.raises(ValueError, match="shape"):
+        EmbeddingMatrix.from_rows([[1.0], [1.0, 2.0]])
+
+    doc = _doc().pack_embeddings()
+    table = doc_to_feature_table(doc, include_embeddings=True)
+    assert table["embedding"].to_pylist()[1:] == [None, pytest.approx([0.6, 0.8])]
+
+
+def test_rows_that_would_read_back_as_missing_are_rejected() -> None:
+    with pytest.raises(ValueError, match="Embedding 1"):
+        EmbeddingMatrix.from_rows([[0.0, 1.0], [np.nan, 1.0]])
+    doc = Doc(
+        language=Language(name="Latin"),
+        words=[Word(string="Arma", embedding=np.array([np.nan, 1.0]))],
+    )
+    with pytest.raises(ValueError):
+        doc.pack_embeddings()
+
+
+def test_compact_keeps_empty_embeddings_per_word(tmp_path: Path) -> None:
+    empty = np.array([], dtype=np.float32)
+    doc = Doc(
+        language=Language(name="Latin"), words=[Word(string="Arma", embedding=empty)]
+    ).compact()
+    assert doc.tokens is not None and doc.tokens.embeddings is None
+    assert doc.words[0].embedding is empty
+    loaded = Doc.load(doc.save(tmp_path / "doc.cltkdoc"))
+    assert loaded.words[0].embedding is not None
+    assert loaded.words[0].embedding.shape == (0,)
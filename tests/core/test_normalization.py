@@ -1,6 +1,6 @@
 """Tests for UD feature normalization helpers."""
 
-from cltk.core.data_types import UDFeatureTag
+from cltk.core.data_types import UDFeatureTag, UDFeatureTagSet
 from cltk.morphosyntax.normalization import (
     UDFeatureRemapReport,
     convert_pos_features_to_ud,
@@ -75,3 +75,33 @@ def test_ud_feature_remap_report_renders_suggestions_sorted() -> None:
     num_idx = next(i for i, line in enumerate(lines) if "('NumValue', '1')" in line)
     assert pron_idx < form_idx
     assert pron_idx < num_idx
+
+
+def test_feature_tag_set_key_index_and_strings() -> None:
+    tag_set = UDFeatureTagSet(
+        features=[
+            UDFeatureTag(key="Number", value="Sing"),
+            UDFeatureTag(key="Case", value="Nom"),
+        ]
+    )
+    assert tag_set.get("Case") == UDFeatureTag(key="Case", value="Nom")
+    assert tag_set.get("Mood") is None
+    assert "Number" in tag_set and "Mood" not in tag_set
+    assert UDFeatureTag(key="Case", value="Nom") in tag_set
+    assert UDFeatureTag(key="Case", value="Acc") not in tag_set
+    assert tag_set.as_dict() == {"Number": "Sing", "Case": "Nom"}
+    assert tag_set.pairs == (("Number", "Sing"), ("Case", "Nom"))
+    assert tag_set.feats_string == "Number=Sing|Case=Nom"
+    assert tag_set.canonical_string == "Case=Nom|Number=Sing"
+    assert UDFeatureTagSet().feats_string == "_"
+
+
+def test_feature_tag_set_equality_hash_and_serialization() -> None:
+    tag_set = convert_pos_features_to_ud("Case=Nom|Number=Sing")
+    assert tag_set is not None
+    tag_set.get("Case")  # build the cached index on one side only
+    rebuilt = UDFeatureTagSet.model_validate_json(tag_set.model_dump_json())
+    assert rebuilt == tag_set
+    assert hash(rebuilt) == hash(tag_set)
+    assert {tag_set: 1}[rebuilt] == 1
+    assert tag_set.model_dump()["features"][0]["key"] == "Case"
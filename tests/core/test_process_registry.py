@@ -1,9 +1,21 @@
 """Tests for process registry behavior."""
 
+import subprocess
+import sys
+from pathlib import Path
 from typing import ClassVar
 
+import pytest
+
 from cltk.core.data_types import Doc, Process
-from cltk.core.process_registry import ProcessRegistry, register_process
+from cltk.core.process_manifest import PROCESS_MANIFEST
+from cltk.core.process_registry import (
+    ProcessRegistry,
+    generate_manifest,
+    register_process,
+)
+
+_SRC = Path(__file__).resolve().parents[2] / "src"
 
 
 class DummyProcess(Process):
@@ -28,3 +40,39 @@ def test_process_registry_register_and_get() -> None:
     assert ProcessRegistry.get_process("test.dummy") is DummyProcess
     assert "test.dummy" in ProcessRegistry.list_processes()
     assert ProcessRegistry.get_process("test.decorated") is DecoratedDummyProcess
+
+
+def test_process_manifest_is_current() -> None:
+    """The checked-in manifest matches the @register_process classes."""
+    assert PROCESS_MANIFEST == generate_manifest()
+    assert set(PROCESS_MANIFEST) <= set(ProcessRegistry.list_process_ids())
+    assert ProcessRegistry.class_names()["normalize"] == "NormalizeProcess"
+
+
+def test_compile_processes_imports_only_referenced_modules() -> None:
+    """Compiling a spec loads just the process modules its steps name."""
+    code = (
+        "import sys\n"
+        "from cltk.pipeline.compiler import compile_processes\n"
+        "from cltk.pipeline.specs import PipelineSpec, StepSpec\n"
+        "spec = PipelineSpec(steps=[StepSpec(id='normalize')])\n"
+        "print([type(p).__name__ for p in compile_processes(spec)])\n"
+        "print(sorted(m for m in sys.modules if m.endswith('.processes')))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(_SRC)},
+        check=True,
+    )
+    assert proc.stdout.splitlines() == [
+        "['NormalizeProcess']",
+        "['cltk.text.processes']",
+    ]
+
+
+def test_unknown_process_id_lists_available_ids() -> None:
+    """Unknown ids fail without importing every process module."""
+    with pytest.raises(KeyError, match="Available: .*normalize"):
+        ProcessRegistry.get_process("no.such.step")
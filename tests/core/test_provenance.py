@@ -1,9 +1,13 @@
 from cltk.core.data_types import Classification, Doc, Language, Sentence, Word
 from cltk.core.provenance import (
+    ProvenanceRecord,
     add_provenance_record,
     build_provenance_record,
     get_sentence_provenance,
     get_token_provenance,
+    merge_provenance,
+    remap_annotation_sources,
+    sha256_hex,
 )
 from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
 
@@ -52,3 +56,52 @@ def test_provenance_storage_and_helpers() -> None:
     assert prov_id in restored.provenance
     assert restored.words[0].annotation_sources["lemma"] == prov_id
     assert restored.words[0].confidence["lemma"] == 0.9
+
+
+def _sentence_record(sentence_idx: int, prompt: str) -> ProvenanceRecord:
+    return build_provenance_record(
+        language="test1234",
+        backend="openai",
+        process="morphosyntax",
+        model="gpt-5-mini",
+        prompt_version="1",
+        prompt_text=prompt,
+        config={"temperature": 1.0},
+        notes={"prompt_kind": "pos", "sentence_idx": sentence_idx},
+    )
+
+
+def test_per_sentence_records_are_interned() -> None:
+    doc = Doc(language=_language(), raw="A B")
+    first = add_provenance_record(doc, _sentence_record(0, "prompt A"))
+    second = add_provenance_record(doc, _sentence_record(1, "prompt B"))
+    other = add_provenance_record(
+        doc, build_provenance_record(process="TestProcess", model="stanza")
+    )
+    assert first == second == "p0" and other == "p1"
+    record = doc.provenance["p0"]
+    assert record.notes == {"prompt_kind": "pos"}
+    assert record.prompt_digest_for(1) == sha256_hex("prompt B")
+    assert sorted(record.sentence_prompt_digests) == [0, 1]
+
+    fork = doc.fork()
+    add_provenance_record(fork, _sentence_record(2, "prompt C"))
+    assert sorted(fork.provenance["p0"].sentence_prompt_digests) == [0, 1, 2]
+    assert sorted(record.sentence_prompt_digests) == [0, 1]
+
+
+def test_merge_provenance_remaps_short_ids() -> None:
+    doc = Doc(language=_language(), raw="A B")
+    add_provenance_record(
+        doc, build_provenance_record(process="NLP.analyze"), set_default=True
+    )
+    tmp = Doc(language=_language(), raw="B")
+    prov_id = add_provenance_record(tmp, _sentence_record(1, "prompt B"))
+    word = Word(string="B", annotation_sources={"lemma": prov_id})
+    tmp.words = [word]
+    remap = merge_provenance(doc, tmp)
+    remap_annotation_sources(tmp.words, remap)
+    assert remap == {"p0": "p1"} and word.annotation_sources == {"lemma": "p1"}
+    assert get_token_provenance(word, "lemma", doc=doc).process == "morphosyntax"
+    assert doc.default_provenance_id == "p0"
+    assert tmp.provenance["p0"].id == "p0"
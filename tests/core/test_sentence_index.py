@@ -0,0 +1,62 @@
+"""Cached sentence views on ``Doc`` and their invalidation."""
+
+import pytest
+
+from cltk.core.data_types import Doc, Language, Word
+
+TEXT = "Arma virumque cano. Troiae qui primus ab oris."
+
+
+def _doc() -> Doc:
+    words = [
+        Word(string=s, index_token=t, index_sentence=i)
+        for s, t, i in [
+            ("Troiae", 3, 1),
+            ("Arma", 0, 0),
+            ("qui", 4, 1),
+            ("cano", 2, 0),
+            ("virumque", 1, 0),
+        ]
+    ]
+    return Doc(
+        language=Language(name="Latin"),
+        words=words,
+        normalized_text=TEXT,
+        sentence_boundaries=[(0, 19), (20, len(TEXT))],
+    )
+
+
+def _strings(doc: Doc) -> list[list[str | None]]:
+    return [[w.string for w in s.words] for s in doc.sentences]
+
+
+def test_sentences_group_and_order_words() -> None:
+    doc = _doc()
+    assert _strings(doc) == [["Arma", "virumque", "cano"], ["Troiae", "qui"]]
+    assert [w.string for w in doc.sentence_words(1)] == ["Troiae", "qui"]
+    assert all(w._doc is doc for w in doc.words)
+    with pytest.raises(KeyError):
+        doc.sentence_words(7)
+
+
+def test_sentence_strings_are_cached_until_inputs_change() -> None:
+    doc = _doc()
+    first = doc.sentence_strings
+    assert first == ["Arma virumque cano.", "Troiae qui primus ab oris."]
+    assert doc.sentence_strings is first
+    doc.sentence_boundaries = [(0, 19)]
+    assert doc.sentence_strings == ["Arma virumque cano."]
+    doc.sentence_boundaries.append((20, 26))
+    assert doc.sentence_strings == ["Arma virumque cano.", "Troiae"]
+
+
+def test_sentence_index_invalidation() -> None:
+    doc = _doc()
+    doc.sentences  # noqa: B018 - build the index
+    doc.words.append(Word(string="primus", index_token=5, index_sentence=1))
+    assert _strings(doc)[1] == ["Troiae", "qui", "primus"]
+    doc.words = doc.words[:2]
+    assert _strings(doc) == [["Arma"], ["Troiae"]]
+    doc.words[0].index_sentence = 0
+    doc.invalidate_sentence_index()
+    assert _strings(doc) == [["Arma", "Troiae"]]
@@ -0,0 +1,116 @@
+"""Columnar word storage behind ``Doc.compact()``."""
+
+import pickle
+import warnings
+
+import numpy as np
+
+from cltk.core.data_types import (
+    Doc,
+    Language,
+    UDFeatureTag,
+    UDFeatureTagSet,
+    Word,
+    WordEnrichment,
+)
+from cltk.core.token_store import MISSING, TokenTable, WordSequence
+from cltk.morphosyntax.ud_deprels import get_ud_deprel_tag
+from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
+
+
+def _words() -> list[Word]:
+    nom = UDFeatureTagSet(features=[UDFeatureTag(key="Case", value="Nom")])
+    return [
+        Word(
+            index_token=0,
+            index_sentence=0,
+            index_char_start=0,
+            index_char_stop=6,
+            string="Gallia",
+            lemma="Gallia",
+            upos=UDPartOfSpeechTag(tag="PROPN"),
+            features=nom,
+            dependency_relation=get_ud_deprel_tag("nsubj"),
+            governor=1,
+            annotation_sources={"upos": "p1"},
+        ),
+        Word(
+            index_token=1,
+            index_sentence=0,
+            string="est",
+            lemma="sum",
+            upos=UDPartOfSpeechTag(tag="AUX"),
+            governor=-1,
+            confidence={"upos": 0.9},
+            stem="es",
+        ),
+        Word(
+            index_token=2,
+            index_sentence=1,
+            string="Gallia",
+            upos=UDPartOfSpeechTag(tag="PROPN"),
+            features=UDFeatureTagSet(features=[UDFeatureTag(key="Case", value="Nom")]),
+            annotation_sources={"upos": "p1"},
+        ),
+    ]
+
+
+def test_table_round_trips_words() -> None:
+    words = _words()
+    table = TokenTable.from_words(words)
+    assert len(table) == 3
+    assert table.to_words() == words
+    assert table.ints("index_char_stop").tolist() == [6, MISSING, MISSING]
+    assert table.strings("lemma") == ["Gallia", "sum", None]
+    assert table.upos_tags() == ["PROPN", "AUX", "PROPN"]
+    assert table.upos_counts() == {"PROPN": 2, "AUX": 1}
+    assert repr(table) == "TokenTable(tokens=3, strings=3, feature_bundles=1)"
+    # Equal feature bundles are stored once and shared by the built words.
+    assert table.word(0).features is table.word(2).features
+
+
+def test_compact_doc_reads_words_lazily() -> None:
+    words = _words()
+    doc = Doc(language=Language(name="Latin"), words=_words())
+    doc.compact()
+    assert isinstance(doc.words, WordSequence)
+    assert isinstance(doc.tokens, TokenTable)
+    assert list(doc.words) == words
+    assert doc.words[-1] == words[-1]
+    assert doc.words[1:] == words[1:]
+    assert [len(s.words or []) for s in doc.sentences] == [2, 1]
+    assert np.array_equal(doc.tokens.ints("governor"), [1, -1, MISSING])
+
+    restored = pickle.loads(pickle.dumps(doc))
+    assert list(restored.words) == words
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert doc.model_dump()["words"] == [w.model_dump() for w in words]
+        from_json = Doc.model_validate_json(doc.model_dump_json())
+    assert from_json.tokens is None and from_json.words == words
+
+    doc.expand()
+    assert doc.tokens is None
+    assert isinstance(doc.words, list) and doc.words == words
+
+
+def test_built_words_do_not_write_back_to_the_table() -> None:
+    words = _words()
+    words[1].syllables = ["est"]
+    words[1].enrichment = WordEnrichment(idiom_span_ids=["i1"])
+    expected = words[1].model_dump()
+    doc = Doc(language=Language(name="Latin"), words=words).compact()
+    word = doc.words[1]
+    word.confidence["upos"] = 0.1
+    word.syllables.append("x")
+    assert word.enrichment is not None
+    word.enrichment.idiom_span_ids.append("i2")
+    assert doc.words[1].model_dump() == expected
+
+
+def test_built_words_report_the_same_fields_as_set() -> None:
+    words = _words()
+    doc = Doc(language=Language(name="Latin"), words=words)
+    expected = doc.model_dump(exclude_unset=True)["words"]
+    assert doc.compact().model_dump(exclude_unset=True)["words"] == expected
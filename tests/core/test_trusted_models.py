@@ -0,0 +1,142 @@
+"""Validation-free builders used by internal token producers."""
+
+import pytest
+from pydantic import ValidationError
+
+from cltk.core.data_types import UDFeatureTag, UDFeatureTagSet, Word
+from cltk.core.trusted_models import construct_trusted
+from cltk.morphosyntax.conll import conllu_to_words
+from cltk.morphosyntax.normalization import (
+    UDFeatureRemapReport,
+    convert_pos_features_to_ud,
+)
+from cltk.morphosyntax.ud_deprels import UDDeprelTag, get_ud_deprel_tag
+from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
+
+
+def test_trusted_tags_match_validated_construction() -> None:
+    pos = UDPartOfSpeechTag.trusted("noun")
+    feature = UDFeatureTag.trusted("Tense", "Perf")
+    expected_pos = UDPartOfSpeechTag(tag="noun")
+    expected_feature = UDFeatureTag(key="Tense", value="Perf")
+    assert pos == expected_pos
+    assert pos.model_fields_set == expected_pos.model_fields_set
+    assert feature == expected_feature
+    assert feature.model_fields_set == expected_feature.model_fields_set
+
+
+def test_trusted_tags_reject_invalid_input() -> None:
+    with pytest.raises(ValidationError):
+        UDPartOfSpeechTag.trusted("NOTATAG")
+    with pytest.raises(ValidationError):
+        UDFeatureTag.trusted("Case", "NotACase")
+
+
+def test_trusted_word_matches_validated_construction() -> None:
+    fields = {
+        "string": "arma",
+        "index_token": 0,
+        "upos": UDPartOfSpeechTag.trusted("NOUN"),
+        "features": convert_pos_features_to_ud("Case=Acc|Number=Plur"),
+        "dependency_relation": get_ud_deprel_tag("obj"),
+        "governor": 1,
+    }
+    word = Word.trusted(**fields)
+    expected = Word(**fields)
+    assert word == expected
+    assert word.model_fields_set == expected.model_fields_set
+    assert word._doc is None
+    word.annotation_sources["upos"] = "p1"
+    assert Word.trusted().annotation_sources == {}
+
+
+def test_internal_producers_build_equal_models() -> None:
+    assert get_ud_deprel_tag("nsubj", "pass") == UDDeprelTag(
+        code="nsubj", name="nominal subject", subtype="pass"
+    )
+    tag_set = convert_pos_features_to_ud("Case=Nom|Gender=Masc")
+    assert tag_set == UDFeatureTagSet(
+        features=[
+            UDFeatureTag(key="Case", value="Nom"),
+            UDFeatureTag(key="Gender", value="Masc"),
+        ]
+    )
+    assert construct_trusted(UDFeatureTagSet, {}).features == ()
+
+
+def test_conllu_to_words_matches_validated_construction() -> None:
+    conllu = (
+        "# sent_id = 1\n"
+        "1\tArma\tarma\tNOUN\t_\tCase=Acc|Number=Plur\t3\tobj\t_\t_\n"
+        "2-3\tvirumque\t_\t_\t_\t_\t_\t_\t_\t_\n"
+        "2\tvirum\tvir\tnoun\t_\t_\t3\tconj\t_\t_\n"
+        "3\tcano\tcano\tBOGUS\t_\t_\t0\troot\t_\t_\n"
+        "4\t_\t_\t_\t_\t_\t_\t_\t_\t_\n"
+    )
+    expected = [
+        Word(
+            string="Arma",
+            index_token=0,
+            lemma="arma",
+            upos=UDPartOfSpeechTag(tag="NOUN"),
+            features=convert_pos_features_to_ud("Case=Acc|Number=Plur"),
+            governor=3,
+        ),
+        Word(
+            string="virum",
+            index_token=1,
+            lemma="vir",
+            upos=UDPartOfSpeechTag(tag="noun"),
+            features=None,
+            governor=3,
+        ),
+        Word(
+            string="cano",
+            index_token=2,
+            lemma="cano",
+            upos=None,
+            features=None,
+            governor=0,
+        ),
+        Word(
+            string=None,
+            index_token=3,
+            lemma=None,
+            upos=None,
+            features=None,
+            governor=None,
+        ),
+    ]
+    words = conllu_to_words(conllu)
+    assert words == expected
+    assert [w.model_fields_set for w in words] == [w.model_fields_set for w in expected]
+
+
+def test_tags_are_interned_and_immutable() -> None:
+    assert UDPartOfSpeechTag.trusted("noun") is UDPartOfSpeechTag.trusted("NOUN")
+    assert UDFeatureTag.trusted("Tense", "Perf") is UDFeatureTag.trusted(
+        "Aspect", "Perf"
+    )
+    assert get_ud_deprel_tag("obj") is get_ud_deprel_tag("obj")
+    tag = get_ud_deprel_tag("nsubj", "notasubtype")
+    assert tag is get_ud_deprel_tag("nsubj") and tag is not None
+    with pytest.raises(ValidationError):
+        tag.code = "obj"  # type: ignore[misc]
+    assert len({UDPartOfSpeechTag(tag="NOUN"), UDPartOfSpeechTag(tag="noun")}) == 1
+
+
+def test_feature_sets_are_memoized_and_report_every_call() -> None:
+    report = UDFeatureRemapReport()
+    first = convert_pos_features_to_ud(
+        "Case=Nom|Bogus=Yes", remap_report=report, source_word="rex"
+    )
+    second = convert_pos_features_to_ud(
+        "Case=Nom|Bogus=Yes", remap_report=report, source_word="lex"
+    )
+    assert first is second
+    assert report.unmapped_pairs[("Bogus", "Yes")] == 2
+    assert first is not None
+    extended = first.add_feature(UDFeatureTag.trusted("Number", "Sing"))
+    assert [f.key for f in extended.features] == ["Case", "Number"]
+    assert [f.key for f in first.features] == ["Case"]
+    assert first.add_feature(UDFeatureTag.trusted("Case", "Acc")) is first
@@ -0,0 +1,125 @@
+"""Windowed analysis: window planning, offset remapping, and merging."""
+
+from copy import copy
+
+import pytest
+
+from cltk.core.data_types import Doc, Language, Pipeline, Process, Word
+from cltk.core.windowing import merge_window_docs, shift_window_doc
+from cltk.nlp import NLP
+from cltk.sentence.processes import SentenceSplittingProcess
+from cltk.sentence.utils import sentence_window_spans
+from cltk.text.processes import NormalizeProcess
+
+TEXT = (
+    "Gallia est omnis divisa in partes tres. Quarum unam incolunt Belgae! "
+    "Aliam Aquitani, tertiam qui ipsorum lingua Celtae appellantur? "
+    "Hi omnes lingua, institutis, legibus inter se differunt. Gallos ab "
+    "Aquitanis Garumna flumen dividit"
+)
+
+
+class _WhitespaceTagger(Process):
+    """Tokenize each sentence on whitespace, GenAI-style (sentence offsets)."""
+
+    def run(self, input_doc: Doc) -> Doc:
+        output_doc = copy(input_doc)
+        words: list[Word] = []
+        for s_idx, sentence in enumerate(output_doc.sentence_strings):
+            pos = 0
+            for token in sentence.split():
+                pos = sentence.index(token, pos)
+                words.append(
+                    Word(
+                        string=token,
+                        index_token=len(words),
+                        index_sentence=s_idx,
+                        index_char_start=pos,
+                        index_char_stop=pos + len(token),
+                    )
+                )
+                pos += len(token)
+        output_doc.words = words
+        output_doc.sentence_annotation_sources = {
+            idx: {"span": "p"} for idx in range(len(output_doc.sentence_boundaries))
+        }
+        output_doc.genai_use = [{"stage": "pos", "input": 1, "output": 2, "total": 3}]
+        return output_doc
+
+
+@pytest.fixture
+def nlp() -> NLP:
+    nlp = NLP(language_code="lati1261", backend="ollama", suppress_banner=True)
+    nlp.pipeline = Pipeline(
+        processes=[NormalizeProcess, SentenceSplittingProcess, _WhitespaceTagger]
+    )
+    return nlp
+
+
+def _word_rows(doc: Doc) -> list[tuple[object, ...]]:
+    return [
+        (w.string, w.index_token, w.index_sentence, w.index_char_start)
+        for w in doc.words
+    ]
+
+
+def test_sentence_window_spans_cover_text() -> None:
+    spans = sentence_window_spans(TEXT, "lati1261", 80)
+    assert spans[0][0] == 0 and spans[-1][1] == len(TEXT)
+    assert all(a[1] == b[0] for a, b in zip(spans, spans[1:]))
+    assert len(spans) > 1
+    assert all(TEXT[stop - 2] in ".!?" for _, stop in spans[:-1])
+    with pytest.raises(ValueError):
+        sentence_window_spans(TEXT, "lati1261", 0)
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_analyze_windowed_matches_whole_document(nlp: NLP, max_workers: int) -> None:
+    whole = nlp.analyze(TEXT)
+    windowed = nlp.analyze_windowed(TEXT, window_size=60, max_workers=max_workers)
+    assert len(windowed.metadata["windows"]) > 2
+    assert windowed.raw == TEXT
+    assert windowed.normalized_text == whole.normalized_text
+    assert windowed.sentence_boundaries == whole.sentence_boundaries
+    assert windowed.sentence_strings == whole.sentence_strings
+    assert _word_rows(windowed) == _word_rows(whole)
+    assert sorted(windowed.sentence_annotation_sources) == list(
+        range(len(whole.sentence_boundaries))
+    )
+    pos_use = windowed.genai_use[0]
+    assert pos_use["total"] == 3 * len(windowed.metadata["windows"])
+    assert [s.index for s in windowed.sentences] == list(
+        range(len(whole.sentence_boundaries))
+    )
+
+
+def test_iter_windows_yields_global_coordinates(nlp: NLP) -> None:
+    docs = list(nlp.iter_windows(TEXT, window_size=60))
+    second = docs[1]
+    window = second.metadata["window"]
+    assert window["sentence_offset"] == len(docs[0].sentence_boundaries)
+    assert second.words[0].index_token == len(docs[0].words)
+    start, stop = second.sentence_boundaries[0]
+    assert start >= window["char_offset"]
+    assert TEXT[window["raw_span"][0] :].startswith(TEXT[start:stop])
+
+
+def test_shift_window_doc_moves_document_relative_offsets() -> None:
+    doc = Doc(
+        language=Language(name="Latin"),
+        backend="stanza",
+        words=[Word(string="est", index_token=0, index_sentence=0, index_char_start=3)],
+        sentence_boundaries=[(0, 10)],
+        metadata={"failed_sentences": {"pos": {0: {"error": "x"}}}},
+    )
+    shift_window_doc(doc, char_offset=100, sentence_offset=4, token_offset=20)
+    word = doc.words[0]
+    assert (word.index_char_start, word.index_token, word.index_sentence) == (
+        103,
+        20,
+        4,
+    )
+    assert doc.sentence_boundaries == [(100, 110)]
+    merged = merge_window_docs([doc])
+    assert merged.metadata["failed_sentences"] == {"pos": {4: {"error": "x"}}}
+    assert merged.words[0]._doc is merged
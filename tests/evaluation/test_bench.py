@@ -0,0 +1,110 @@
+"""Benchmark runner, report, and baseline regression tests."""
+
+import json
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from cltk.cli.main import build_parser
+from cltk.core.data_types import Classification, Doc, Language, Word
+from cltk.evaluation.bench import (
+    check_regressions,
+    load_corpus,
+    report_to_markdown,
+    run_benchmark,
+)
+from cltk.nlp import NLP
+
+
+class _StubNLP:
+    """Minimal ``NLP`` stand-in that tokenizes on whitespace."""
+
+    backend = "openai"
+    model = "gpt-5-mini"
+    language = Language(
+        name="Latin",
+        glottolog_id="lati1261",
+        level="language",
+        classification=Classification(level="language"),
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.stage_timings: dict[str, float] = {}
+
+    def analyze(self, text: str) -> Doc:
+        self.calls += 1
+        words = [
+            Word(index_token=i, index_sentence=0, string=tok)
+            for i, tok in enumerate(text.split())
+        ]
+        self.stage_timings = {"SplitProcess": 0.001, "TagProcess": 0.002}
+        doc = Doc(language=self.language, raw=text, words=words)
+        doc.genai_use = [
+            {"stage": "pos", "input": 3, "output": 2, "total": 5},
+            {"stage": "overall", "input": 3, "output": 2, "total": 5},
+        ]
+        return doc
+
+
+def _run(iterations: int = 2, warmup: int = 1) -> tuple[_StubNLP, dict[str, Any]]:
+    nlp = _StubNLP()
+    corpus = {"a": "Gallia est omnis divisa", "b": "Arma virumque cano"}
+    report = run_benchmark(cast(NLP, nlp), corpus, iterations=iterations, warmup=warmup)
+    return nlp, report
+
+
+def test_run_benchmark_collects_metrics() -> None:
+    nlp, report = _run()
+
+    assert nlp.calls == 6  # one warmup pass plus two measured passes
+    assert report["throughput"]["docs"] == 4
+    assert report["throughput"]["tokens"] == 14
+    assert report["throughput"]["docs_per_s"] > 0
+    assert set(report["latency_ms"]["stages"]) == {"SplitProcess", "TagProcess"}
+    assert report["latency_ms"]["stages"]["TagProcess"]["p95"] == pytest.approx(2.0)
+    assert set(report["latency_ms"]["document"]) >= {"p50", "p95", "p99"}
+    assert report["llm_tokens"] == {"input": 12, "output": 8, "total": 20}
+    assert report["meta"]["language"] == "lati1261"
+    json.dumps(report)
+    markdown = report_to_markdown(report)
+    assert "| TagProcess |" in markdown
+
+
+def test_check_regressions_flags_slower_and_costlier_runs() -> None:
+    _, report = _run()
+    assert check_regressions(report, report) == []
+
+    baseline = json.loads(json.dumps(report))
+    baseline["throughput"]["docs_per_s"] = report["throughput"]["docs_per_s"] * 2
+    baseline["llm_tokens"]["total"] = 10
+    regressions = check_regressions(report, baseline, tolerance=0.1)
+    assert any(msg.startswith("throughput.docs_per_s") for msg in regressions)
+    assert any(msg.startswith("llm_tokens.total") for msg in regressions)
+    assert "REGRESSION" in report_to_markdown(report, regressions)
+
+
+def test_load_corpus_from_examples_and_directory(tmp_path: Path) -> None:
+    builtin = load_corpus("lati1261")
+    assert list(builtin) == ["example:lati1261"]
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "one.txt").write_text("Salve.", encoding="utf-8")
+    (tmp_path / "sub" / "two.txt").write_text("Vale.", encoding="utf-8")
+    (tmp_path / "empty.txt").write_text("  ", encoding="utf-8")
+    assert load_corpus("lati1261", str(tmp_path)) == {
+        "one.txt": "Salve.",
+        "sub/two.txt": "Vale.",
+    }
+    with pytest.raises(ValueError):
+        load_corpus("lati1261", str(tmp_path), pattern="*.md")
+
+
+def test_parse_bench_smoke() -> None:
+    args = build_parser().parse_args(
+        ["bench", "--lang", "lati1261", "--iterations", "5", "--baseline", "b.json"]
+    )
+    assert args.command == "bench"
+    assert args.iterations == 5
+    assert args.tolerance == pytest.approx(0.1)
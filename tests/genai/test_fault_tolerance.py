@@ -0,0 +1,108 @@
+"""Fault-tolerant sentence-level GenAI execution tests."""
+
+from typing import Any
+
+import pytest
+
+from cltk.core.data_types import Classification, CLTKGenAIResponse, Doc, Language
+from cltk.core.exceptions import OpenAIInferenceError
+from cltk.core.fault_tolerance import get_failed_sentences
+from cltk.morphosyntax import utils as morph_utils
+from cltk.morphosyntax.processes import GenAIMorphosyntaxProcess
+
+SENTENCES = ["Gallia est omnis divisa.", "Arma virumque cano.", "Roma aeterna."]
+
+
+def _doc() -> Doc:
+    """Return a three-sentence Latin doc prepared for morphosyntax."""
+    text = " ".join(SENTENCES)
+    bounds = []
+    start = 0
+    for sent in SENTENCES:
+        bounds.append((start, start + len(sent)))
+        start += len(sent) + 1
+    doc = Doc(
+        language=Language(
+            name="Latin",
+            glottolog_id="lati1261",
+            level="language",
+            classification=Classification(level="language"),
+        ),
+        normalized_text=text,
+        sentence_boundaries=bounds,
+        backend="openai",
+        model="gpt-5-mini",
+    )
+    doc.metadata["fault_tolerant"] = True
+    return doc
+
+
+class _FlakyConnection:
+    """Async connection stub that fails for configured sentences."""
+
+    failing: set[str] = set()
+
+    def __init__(self, **_: Any) -> None:
+        pass
+
+    async def generate_async(
+        self, prompt: str, max_retries: int = 2
+    ) -> CLTKGenAIResponse:
+        sentence = next(s for s in SENTENCES if s in prompt)
+        if sentence in self.failing:
+            raise OpenAIInferenceError("rate limited")
+        rows = [
+            f"{tok}\t{tok.lower()}\tNOUN\tCase=Nom"
+            for tok in sentence.rstrip(".").split()
+        ]
+        return CLTKGenAIResponse(
+            response="\n".join(rows), usage={"input": 1, "output": 1, "total": 2}
+        )
+
+
+@pytest.fixture
+def flaky(monkeypatch: pytest.MonkeyPatch) -> type[_FlakyConnection]:
+    monkeypatch.setattr(morph_utils, "AsyncOpenAIConnection", _FlakyConnection)
+    _FlakyConnection.failing = {SENTENCES[1]}
+    return _FlakyConnection
+
+
+def test_failed_sentence_is_recorded_and_others_kept(
+    flaky: type[_FlakyConnection],
+) -> None:
+    doc = morph_utils.generate_gpt_morphosyntax_concurrent(_doc())
+
+    assert sorted({w.index_sentence for w in doc.words}) == [0, 2]
+    failures = get_failed_sentences(doc)
+    assert list(failures) == ["pos"]
+    assert failures["pos"][1]["error_type"] == "OpenAIInferenceError"
+    assert [w.index_token for w in doc.words] == list(range(len(doc.words)))
+
+
+def test_retry_failed_reruns_only_failed_sentences(
+    flaky: type[_FlakyConnection],
+) -> None:
+    doc = morph_utils.generate_gpt_morphosyntax_concurrent(_doc())
+    first_words = [w for w in doc.words if w.index_sentence == 0]
+
+    flaky.failing = set()
+    doc = GenAIMorphosyntaxProcess(glottolog_id="lati1261").retry_failed(doc)
+
+    assert sorted({w.index_sentence for w in doc.words}) == [0, 1, 2]
+    assert get_failed_sentences(doc) == {}
+    assert [w for w in doc.words if w.index_sentence == 0] == first_words
+    assert [w.string for w in doc.words if w.index_sentence == 1] == [
+        "Arma",
+        "virumque",
+        "cano",
+    ]
+    assert [w.index_token for w in doc.words] == list(range(len(doc.words)))
+    pos_usage = next(e for e in doc.genai_use if e["stage"] == "pos")
+    assert pos_usage["total"] == 6
+
+
+def test_strict_mode_still_raises(flaky: type[_FlakyConnection]) -> None:
+    doc = _doc()
+    doc.metadata.pop("fault_tolerant")
+    with pytest.raises(OpenAIInferenceError):
+        morph_utils.generate_gpt_morphosyntax_concurrent(doc)
@@ -0,0 +1,135 @@
+"""Local GenAI API simulator tests (stdlib HTTP only; no provider SDKs)."""
+
+import json
+import random
+import urllib.error
+import urllib.request
+from typing import Any
+
+import pytest
+
+from cltk.genai.prompts import dependency_prompt_from_tokens, morphosyntax_prompt
+from cltk.genai.simulator import (
+    LatencyProfile,
+    LLMSimulator,
+    SimulatorConfig,
+    simulate_completion,
+)
+from cltk.morphosyntax.normalization import (
+    UDFeatureRemapReport,
+    convert_pos_features_to_ud,
+)
+from cltk.morphosyntax.utils import _parse_tsv_table
+
+
+def _post(url: str, payload: dict[str, Any]) -> tuple[int, dict[str, Any], Any]:
+    """POST JSON and return status, decoded body, and headers."""
+    req = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            return resp.status, json.loads(resp.read()), resp.headers
+    except urllib.error.HTTPError as err:
+        return err.code, json.loads(err.read()), err.headers
+
+
+def test_openai_responses_endpoint_returns_valid_tsv(
+    llm_simulator: LLMSimulator,
+) -> None:
+    prompt = morphosyntax_prompt("Latin", "Gallia est omnis divisa.").text
+    status, body, _ = _post(
+        f"{llm_simulator.url}/v1/responses", {"model": "gpt-5-mini", "input": prompt}
+    )
+
+    assert status == 200
+    text = body["output"][0]["content"][0]["text"]
+    rows = _parse_tsv_table(text)
+    assert [r["form"] for r in rows] == ["Gallia", "est", "omnis", "divisa", "."]
+    report = UDFeatureRemapReport()
+    for row in rows:
+        if row["feats"] != "_":
+            convert_pos_features_to_ud(row["feats"], remap_report=report)
+    assert report.total_count == 0
+    usage = body["usage"]
+    assert usage["total_tokens"] == usage["input_tokens"] + usage["output_tokens"]
+    assert llm_simulator.stats.total_tokens == usage["total_tokens"]
+    assert llm_simulator.stats.requests == {"/v1/responses": 1}
+
+
+def test_ollama_and_mistral_endpoints(llm_simulator: LLMSimulator) -> None:
+    table = "INDEX\tFORM\tUPOS\tFEATS\n1\tArma\tNOUN\t_\n2\tcano\tVERB\t_"
+    prompt = dependency_prompt_from_tokens(table).text
+
+    status, body, _ = _post(
+        f"{llm_simulator.url}/api/generate", {"model": "llama3", "prompt": prompt}
+    )
+    assert status == 200
+    assert body["done"] is True
+    assert "Arma\t0\troot" in body["response"]
+    assert "cano\t1\tdep" in body["response"]
+    assert body["prompt_eval_count"] > 0
+
+    status, body, _ = _post(
+        f"{llm_simulator.url}/v1/chat/completions",
+        {
+            "model": "mistral-small-latest",
+            "messages": [{"role": "user", "content": prompt}],
+        },
+    )
+    assert status == 200
+    assert body["choices"][0]["message"]["content"].startswith("```tsv")
+    assert body["usage"]["completion_tokens"] > 0
+
+
+def test_json_prompts_yield_parseable_payloads() -> None:
+    enrich = simulate_completion(
+        "keys `tokens` and `idioms`.\n\nTokens:\n\nINDEX\tFORM\n1\tRoma\n\n"
+    )
+    payload = json.loads(enrich.strip("`").removeprefix("json"))
+    assert payload["tokens"][0]["index"] == 1
+    assert payload["idioms"] == []
+
+    translation = simulate_completion(
+        "Translate the following Latin sentence.\n\nContext:\n\n"
+        "Source sentence:\nRoma aeterna.\n"
+    )
+    payload = json.loads(translation.strip("`").removeprefix("json"))
+    assert payload["translation"].endswith("Roma aeterna.")
+
+
+def test_rate_limit_and_error_injection() -> None:
+    config = SimulatorConfig(rate_limit_rate=1.0, retry_after_s=2)
+    with LLMSimulator(config) as sim:
+        status, body, headers = _post(f"{sim.url}/v1/responses", {"input": "x"})
+        assert status == 429
+        assert headers["Retry-After"] == "2"
+        assert body["error"]["type"] == "rate_limit_error"
+        assert sim.stats.rate_limited == 1
+
+    with LLMSimulator(SimulatorConfig(error_rate=1.0)) as sim:
+        status, _, _ = _post(f"{sim.url}/api/generate", {"prompt": "x"})
+        assert status == 500
+        assert sim.stats.errors_injected == 1
+        assert sim.stats.total_tokens == 0
+
+
+@pytest.mark.parametrize("distribution", ["fixed", "uniform", "normal", "lognormal"])
+def test_latency_is_seeded_and_bounded(distribution: str) -> None:
+    profile = LatencyProfile(
+        distribution=distribution,  # type: ignore[arg-type]
+        mean_ms=50,
+        stddev_ms=20,
+        min_ms=10,
+        max_ms=100,
+    )
+    rng_a, rng_b = random.Random(7), random.Random(7)
+    assert [profile.sample(rng_a) for _ in range(5)] == [
+        profile.sample(rng_b) for _ in range(5)
+    ]
+    rng = random.Random(3)
+    samples = [profile.sample(rng) for _ in range(200)]
+    assert all(10 <= s <= 100 for s in samples)
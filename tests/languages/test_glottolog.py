@@ -0,0 +1,101 @@
+"""Language resolution: cached indices, batch resolver, and search."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from cltk.core.data_types import Language
+from cltk.languages import glottolog
+from cltk.languages.glottolog import get_language, get_languages, search_languages
+from cltk.languages.languages import LANGUAGES
+
+_SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def test_indices_are_cached_until_registry_changes() -> None:
+    indices = glottolog._build_indices()
+    assert glottolog._build_indices() is indices
+
+    LANGUAGES["test0001"] = Language(name="Testish", glottolog_id="test0001")
+    try:
+        rebuilt = glottolog._build_indices()
+        assert rebuilt is not indices
+        assert rebuilt["by_name_lang"]["testish"] == ["test0001"]
+    finally:
+        del LANGUAGES["test0001"]
+    assert "testish" not in glottolog._build_indices()["by_name_lang"]
+
+
+def test_get_languages_resolves_in_input_order() -> None:
+    result = get_languages(["lat", "grc", "lati1261", "lat"])
+    assert list(result) == ["lat", "grc", "lati1261"]
+    assert result["lat"] == get_language("lat")
+    assert result["lat"][0] is result["lati1261"][0]
+
+
+def test_get_languages_reports_every_failure() -> None:
+    with pytest.raises(KeyError) as excinfo:
+        get_languages(["lat", "zzzz", "", "yyyy"])
+    message = str(excinfo.value)
+    assert "3 language key(s)" in message
+    assert "'zzzz'" in message and "'yyyy'" in message
+
+
+@pytest.mark.parametrize(
+    "query", ["ancient greek", "grc", "Greek, Ancient", "greek ancient", "anc gre"]
+)
+def test_search_languages_finds_ancient_greek(query: str) -> None:
+    assert search_languages(query)[0].glottolog_id == "anci1242"
+
+
+def test_search_languages_ranks_exact_prefix_then_fuzzy() -> None:
+    exact = search_languages("lat")
+    assert exact[0].glottolog_id == "lati1261" and exact[0].kind == "exact"
+    assert all(m.kind != "exact" for m in exact[1:])
+    assert [m.score for m in exact] == sorted((m.score for m in exact), reverse=True)
+
+    misspelled = search_languages("akadian", limit=3)
+    assert misspelled[0].glottolog_id == "akka1240"
+    assert misspelled[0].kind == "fuzzy"
+    assert search_languages("qqqqqq") == []
+    assert search_languages("lat", limit=0) == []
+
+
+def test_search_languages_breaks_ties_by_historic_rank() -> None:
+    index = glottolog._search_index()
+    matches = search_languages("egyptian", limit=20)
+    for a, b in zip(matches, matches[1:]):
+        if a.score == b.score:
+            assert index.rank(a.glottolog_id) >= index.rank(b.glottolog_id)
+
+
+def test_search_ranks_without_materializing_languages() -> None:
+    code = (
+        "from cltk.languages.glottolog import search_languages\n"
+        "from cltk.languages.languages import LANGUAGES\n"
+        "for query in ('a', 'old', 'egyptian'):\n"
+        "    search_languages(query, limit=50)\n"
+        "print(sum(LANGUAGES.is_materialized(key) for key in LANGUAGES))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(_SRC)},
+        check=True,
+    )
+    assert proc.stdout.strip() == "0"
+
+
+def test_search_languages_is_fast() -> None:
+    queries = ("ancient greek", "grc", "sanskrt", "old eng")
+    for query in queries:  # build the index and cache historic ranks
+        search_languages(query)
+    start = time.perf_counter()
+    for query in queries:
+        search_languages(query)
+    elapsed = (time.perf_counter() - start) / len(queries)
+    assert elapsed < 0.005  # target is < 1 ms; headroom for slow CI machines
@@ -0,0 +1,55 @@
+"""Table-driven pipeline and process classes created on first access."""
+
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cltk.languages import pipelines
+
+_SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def test_importing_pipelines_defers_process_modules() -> None:
+    code = (
+        "import sys, cltk.languages.pipelines as p\n"
+        "p.MAP_LANGUAGE_CODE_TO_GENERATIVE_PIPELINE['lati1261']\n"
+        "print(sorted(m for m in sys.modules if m.endswith('.processes')))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(_SRC)},
+        check=True,
+    )
+    assert proc.stdout.strip() == "[]"
+
+
+def test_classes_are_created_once_and_pickle() -> None:
+    from cltk.languages.pipelines import LatinGenAIPipeline
+    from cltk.morphosyntax.processes import LatinGenAIMorphosyntaxProcess
+
+    assert pipelines.LatinGenAIPipeline is LatinGenAIPipeline
+    assert LatinGenAIPipeline.__module__ == "cltk.languages.pipelines"
+    assert pickle.loads(pickle.dumps(LatinGenAIPipeline)) is LatinGenAIPipeline
+
+    pipeline = LatinGenAIPipeline()
+    assert pipeline.glottolog_id == "lati1261"
+    assert LatinGenAIMorphosyntaxProcess in pipeline.processes
+    assert pickle.loads(pickle.dumps(pipeline)) == pipeline
+
+
+def test_process_reexports_and_maps() -> None:
+    from cltk.dependency.processes import LatinGenAIDependencyProcess
+    from cltk.languages.pipelines import LatinGenAIDependencyProcess as reexported
+
+    assert reexported is LatinGenAIDependencyProcess
+    genai = pipelines.MAP_LANGUAGE_CODE_TO_GENERATIVE_PIPELINE
+    assert genai.class_name("lati1261") == "LatinGenAIPipeline"
+    assert genai["lati1261"] is pipelines.LatinGenAIPipeline
+    assert "LatinGenAIPipeline" in dir(pipelines)
+    with pytest.raises(AttributeError):
+        pipelines.KlingonGenAIPipeline  # noqa: B018
@@ -0,0 +1,77 @@
+"""Compiled language registry: lazy materialization, mutation, and round-trips."""
+
+from pathlib import Path
+
+import pytest
+
+from cltk.core.data_types import Dialect, Language
+from cltk.languages.glottolog import get_dialect, get_language
+from cltk.languages.languages import LANGUAGES, LANGUAGES_ARTIFACT
+from cltk.languages.registry import (
+    LanguageRegistry,
+    summarize_language,
+    write_language_artifact,
+)
+
+
+def test_lookup_materializes_only_requested_language() -> None:
+    registry = LanguageRegistry(LANGUAGES_ARTIFACT)
+    assert len(registry) == len(LANGUAGES)
+    assert "lati1261" in registry
+    assert not registry.is_materialized("lati1261")
+
+    latin = registry["lati1261"]
+    assert latin.name == "Latin"
+    assert registry["lati1261"] is latin
+    assert [key for key in registry if registry.is_materialized(key)] == ["lati1261"]
+
+
+def test_summaries_match_materialized_languages() -> None:
+    registry = LanguageRegistry(LANGUAGES_ARTIFACT)
+    summaries = dict(registry.summaries())
+    assert not any(registry.is_materialized(key) for key in registry)
+    for key, summary in summaries.items():
+        language = registry[key]
+        assert summary.iso == language.iso
+        assert summary.names[0] == language.name
+        assert [d[0] for d in summary.dialects] == [
+            d.glottolog_id for d in language.dialects
+        ]
+        assert summary == summarize_language(language)
+
+
+def test_artifact_round_trip(tmp_path: Path) -> None:
+    source = LanguageRegistry(LANGUAGES_ARTIFACT)
+    path = tmp_path / "languages.jsonl"
+    write_language_artifact(source, path)
+    copy = LanguageRegistry(path)
+    assert list(copy) == list(source)
+    assert all(copy[key] == source[key] for key in ("lati1261", "anci1242"))
+
+
+def test_user_defined_language_is_resolvable() -> None:
+    language = Language(
+        name="Old Catalan",
+        glottolog_id="oldc1251",
+        iso="xoc",
+        dialects=[Dialect(name="Rossellonès antic", glottolog_id="ross9999")],
+    )
+    version = LANGUAGES.version
+    LANGUAGES["oldc1251"] = language
+    try:
+        assert LANGUAGES.version == version + 1
+        assert list(LANGUAGES)[-1] == "oldc1251"
+        assert get_language("oldc1251") == (language, None)
+        assert get_language("xoc")[0] is language
+        assert get_dialect("ross9999") == (language, language.dialects[0])
+    finally:
+        del LANGUAGES["oldc1251"]
+    with pytest.raises(KeyError):
+        get_language("oldc1251")
+
+
+def test_rejects_foreign_artifact(tmp_path: Path) -> None:
+    path = tmp_path / "other.jsonl"
+    path.write_text('{"format": "other"}\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        len(LanguageRegistry(path))
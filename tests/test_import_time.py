@@ -0,0 +1,87 @@
+"""Import-time budget for ``cltk`` and ``cltk.nlp`` measured with ``-X importtime``.
+
+Language metadata, pipeline definitions, and the per-language process modules
+are loaded on demand once a language and backend are resolved. These tests
+keep them off the ``import cltk.nlp`` path and cap the time spent importing
+CLTK's own modules there. Override the cap with ``CLTK_IMPORT_BUDGET_MS`` on
+unusually slow machines.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+
+DEFAULT_BUDGET_MS = 200.0
+
+# Heavy modules that must not be imported just by ``import cltk.nlp``.
+DEFERRED_MODULES = (
+    "cltk.languages.languages",
+    "cltk.languages.pipelines",
+    "cltk.dependency.processes",
+    "cltk.enrichment.processes",
+    "cltk.morphosyntax.processes",
+    "cltk.sentence.processes",
+    "cltk.translation.processes",
+    "cltk.genai.openai",
+    "cltk.genai.ollama",
+    "cltk.genai.mistral",
+    "cltk.stanza.processes",
+)
+
+
+def _import_profile(module: str) -> dict[str, tuple[int, int]]:
+    """Return ``{module: (self_us, cumulative_us)}`` for a fresh import."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(_SRC), env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    profile: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        profile[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return profile
+
+
+def test_import_cltk_is_minimal() -> None:
+    profile = _import_profile("cltk")
+    assert "cltk" in profile
+    assert [name for name in profile if name.startswith("cltk.")] == []
+
+
+def test_import_nlp_defers_heavy_modules() -> None:
+    profile = _import_profile("cltk.nlp")
+    assert "cltk.nlp" in profile
+    loaded = [name for name in DEFERRED_MODULES if name in profile]
+    assert loaded == [], f"Imported eagerly by cltk.nlp: {loaded}"
+
+
+def test_import_nlp_within_budget() -> None:
+    budget_ms = float(os.environ.get("CLTK_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+    profile = _import_profile("cltk.nlp")
+    own_us = sum(
+        self_us
+        for name, (self_us, _) in profile.items()
+        if name == "cltk" or name.startswith("cltk.")
+    )
+    slowest = sorted(
+        ((self_us, name) for name, (self_us, _) in profile.items() if "cltk" in name),
+        reverse=True,
+    )[:5]
+    assert own_us / 1000 <= budget_ms, (
+        f"CLTK modules took {own_us / 1000:.1f} ms to import "
+        f"(budget {budget_ms:.0f} ms); slowest: {slowest}"
+    )
@@ -40,6 +40,8 @@ def test_public_manifest_enforced() -> None:
 def test_morphosyntax_processes_subclasses_use_glottolog_ids() -> None:
     mod = importlib.import_module("cltk.morphosyntax.processes")
     Base = getattr(mod, "GenAIMorphosyntaxProcess")
+    for name in dir(mod):  # per-language classes are created on first access
+        getattr(mod, name)
     subclasses = Base.__subclasses__()
     assert len(subclasses) >= 80
 
@@ -55,6 +57,8 @@ def test_morphosyntax_processes_subclasses_use_glottolog_ids() -> None:
 def test_dependency_processes_subclasses_use_glottolog_ids() -> None:
     mod = importlib.import_module("cltk.dependency.processes")
     Base = getattr(mod, "GenAIDependencyProcess")
+    for name in dir(mod):  # per-language classes are created on first access
+        getattr(mod, name)
     subclasses = Base.__subclasses__()
     assert len(subclasses) >= 80
 
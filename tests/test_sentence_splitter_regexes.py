@@ -1,6 +1,13 @@
+from pathlib import Path
+
 import pytest
 
-from cltk.sentence.utils import split_sentences_multilang
+from cltk.sentence.processes import SentenceSplittingProcess
+from cltk.sentence.utils import (
+    iter_sentences,
+    split_sentences_multilang,
+    split_sentences_multilang_batch,
+)
 
 
 @pytest.mark.parametrize(
@@ -28,3 +35,57 @@ def test_sentence_splitter_endings(glotto: str, text: str) -> None:
     assert text.startswith(pieces[0])
     # And include the boundary character(s)
     assert any(b in text for b in ("·", "||"))
+
+
+@pytest.mark.parametrize(
+    "glotto,text,expected",
+    [
+        # Stops are measured from the stripped sentence, so whitespace before
+        # an ending shifts later offsets; these values pin that behavior.
+        (
+            "lati1261",
+            "Arma virumque cano . Troiae qui primus ab oris?  Italiam",
+            [(0, 19), (19, 45), (45, 52)],
+        ),
+        ("cune1239", "\n\nA.\nB", [(2, 4), (5, 7), (7, 8), (8, 9)]),
+        ("lati1261", "  ..  ", [(2, 3), (3, 4)]),
+        ("lati1261", "", []),
+    ],
+)
+def test_sentence_splitter_offsets(
+    glotto: str, text: str, expected: list[tuple[int, int]]
+) -> None:
+    assert split_sentences_multilang(text, glotto) == expected
+
+
+def test_sentence_splitter_batch_matches_single() -> None:
+    texts = ["Gallia est omnis divisa. Quarum unam!", "", "Arma virumque cano"]
+    assert split_sentences_multilang_batch(texts, "lati1261") == [
+        split_sentences_multilang(text, "lati1261") for text in texts
+    ]
+    with pytest.raises(ValueError):
+        split_sentences_multilang_batch(texts, "zzzz0000")
+
+
+def test_iter_sentences_matches_whole_text_split(tmp_path: Path) -> None:
+    text = "Gallia est omnis divisa in partes tres . Quarum unam incolunt Belgae!  x"
+    expected = [
+        (a, b, text[a:b]) for a, b in split_sentences_multilang(text, "lati1261")
+    ]
+    chunks = [text[i : i + 7] for i in range(0, len(text), 7)]
+    assert list(iter_sentences(chunks, "lati1261")) == expected
+
+    path = tmp_path / "text.txt"
+    path.write_text(text, encoding="utf-8")
+    process = SentenceSplittingProcess(glottolog_id="lati1261")
+    with path.open(encoding="utf-8") as handle:
+        assert list(process.stream(handle, chunk_size=3)) == expected
+
+
+def test_iter_sentences_waits_for_endings_across_chunks() -> None:
+    # "||" and "\n+" endings can straddle a chunk boundary.
+    text = "A || B\n\n\nC || D"
+    expected = [
+        (a, b, text[a:b]) for a, b in split_sentences_multilang(text, "cune1239")
+    ]
+    assert list(iter_sentences(list(text), "cune1239")) == expected
@@ -0,0 +1,94 @@
+"""Chunked Unicode normalization and the normalized-to-raw offset map."""
+
+import io
+import unicodedata
+from functools import cached_property
+from typing import Callable
+
+import pytest
+
+from cltk.core.data_types import Doc, Language
+from cltk.text.processes import NormalizeProcess
+from cltk.text.utils import (
+    NormalizationOffsets,
+    cltk_normalize,
+    iter_normalized,
+    normalize_with_offsets,
+)
+
+# Ligatures, compatibility forms, combining marks, polytonic Greek, Hangul jamo.
+TEXT = "ﬁne café ①　μῆνιν ἄειδε θεά· δ᾽ Åx 각 ẹ̇."
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+@pytest.mark.parametrize("compatibility", [True, False])
+def test_iter_normalized_matches_whole_text(
+    chunk_size: int, compatibility: bool
+) -> None:
+    form = "NFKC" if compatibility else "NFC"
+    expected = unicodedata.normalize(form, TEXT)
+    for source in (TEXT, io.StringIO(TEXT), list(TEXT)):
+        chunks = iter_normalized(
+            source, compatibility=compatibility, chunk_size=chunk_size
+        )
+        assert "".join(chunks) == expected
+
+
+def test_cltk_normalize_chunks_long_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("cltk.text.utils.DEFAULT_STREAM_CHUNK_SIZE", 4)
+    assert cltk_normalize(TEXT * 3) == unicodedata.normalize("NFKC", TEXT * 3)
+    with pytest.raises(ValueError):
+        list(iter_normalized(TEXT, chunk_size=0))
+
+
+def test_offsets_point_back_into_raw_text() -> None:
+    normalized, offsets = normalize_with_offsets(TEXT)
+    assert isinstance(offsets, NormalizationOffsets)
+    assert len(offsets) == len(normalized) + 1
+    assert list(offsets.starts) == sorted(offsets.starts)
+    assert offsets.to_raw_span(0, len(normalized)) == (0, len(TEXT))
+    # "ﬁ" expands to "fi": both characters map back to the ligature.
+    assert offsets.to_raw_span(0, 1) == (0, 1)
+    assert offsets.to_raw_span(0, 3) == (0, 2)
+    start = normalized.index("café")
+    assert TEXT[slice(*offsets.to_raw_span(start, start + 4))] == "café"
+    start = normalized.index("1")
+    assert TEXT[slice(*offsets.to_raw_span(start, start + 1))] == "①"
+
+    streamed = NormalizationOffsets()
+    list(iter_normalized(io.StringIO(TEXT), chunk_size=3, offsets=streamed))
+    assert streamed == offsets
+
+
+def test_normalize_process_tracks_offsets() -> None:
+    doc = Doc(language=Language(name="Latin"), raw="ﬁnis")
+    NormalizeProcess(track_offsets=True).run(doc)
+    assert doc.normalized_text == "finis"
+    assert doc.normalized_offsets is not None
+    assert doc.normalized_offsets.to_raw_span(2, 5) == (1, 4)
+
+    plain = NormalizeProcess().run(Doc(language=Language(name="Latin"), raw="ﬁnis"))
+    assert plain.normalized_offsets is None
+
+
+def test_normalize_process_rejects_offsets_for_other_algorithms() -> None:
+    class UpperNormalizeProcess(NormalizeProcess):
+        @cached_property
+        def algorithm(self) -> Callable[[str], str]:
+            return str.upper
+
+    doc = Doc(language=Language(name="Latin"), raw="finis")
+    assert UpperNormalizeProcess().run(doc).normalized_text == "FINIS"
+    with pytest.raises(ValueError, match="track_offsets"):
+        UpperNormalizeProcess(track_offsets=True).run(doc)
+
+
+def test_doc_with_offsets_round_trips_through_json() -> None:
+    doc = NormalizeProcess(track_offsets=True).run(
+        Doc(language=Language(name="Latin"), raw="ﬁnis")
+    )
+    assert doc.normalized_offsets is not None
+    dumped = doc.model_dump_json()
+    restored = Doc.model_validate_json(dumped)
+    assert restored.normalized_offsets == doc.normalized_offsets
+    assert doc.model_dump()["normalized_offsets"] is doc.normalized_offsets
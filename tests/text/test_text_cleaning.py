@@ -0,0 +1,61 @@
+"""Compiled text-cleaning helpers and ``TextCleaner``."""
+
+import pytest
+
+from cltk.text.utils import (
+    TextCleaner,
+    remove_non_latin,
+    remove_odd_punct,
+    split_leading_punct,
+    split_trailing_punct,
+    strip_accents,
+    strip_section_numbers,
+)
+from cltk.utils.utils import strip_accents as legacy_strip_accents
+
+RAW = "[12] ‘κατηγόρων’, οὐκ οἶδα: ἐγὼ δ᾽ οὖν 1.2.3 “Gallia” 2:4b"
+
+
+def test_helpers_keep_their_behavior() -> None:
+    assert split_trailing_punct("κατηγόρων’, οὐκ οἶδα: ἐγὼ") == (
+        "κατηγόρων ’, οὐκ οἶδα : ἐγὼ"
+    )
+    assert split_leading_punct("‘κατηγόρων’, οὐκ") == "‘ κατηγόρων’, οὐκ"
+    assert remove_odd_punct("‘κατηγόρων’, οὐκ") == "κατηγόρων, οὐκ"
+    assert remove_odd_punct("a-b]c", punctuation=["-", "]", "xy"]) == "abc"
+    assert strip_section_numbers("[55A] arma 1.2.2 virum 7 cano") == ("arma virum cano")
+    also_keep = ["."]
+    assert remove_non_latin("Gallia 1, est.", also_keep=also_keep) == "Gallia  est."
+    assert also_keep == ["."]
+    assert strip_accents("ἐγὼ δ᾽ οὖν") == legacy_strip_accents("ἐγὼ δ᾽ οὖν")
+    assert strip_accents("ἐγὼ") == "εγω"
+
+
+def test_cleaner_matches_helpers_in_sequence() -> None:
+    steps = [
+        "strip_section_numbers",
+        "split_leading_punct",
+        ("split_trailing_punct", {"punctuation": [":"]}),
+        "remove_odd_punct",
+        "strip_accents",
+    ]
+    expected = strip_accents(
+        remove_odd_punct(
+            split_trailing_punct(
+                split_leading_punct(strip_section_numbers(RAW)), punctuation=[":"]
+            )
+        )
+    )
+    cleaner = TextCleaner(steps)
+    assert cleaner(RAW) == expected
+    assert cleaner.clean_batch([RAW, "", RAW]) == [expected, "", expected]
+
+
+def test_cleaner_combines_adjacent_removals() -> None:
+    cleaner = TextCleaner(
+        ["remove_odd_punct", ("remove_non_latin", {"also_keep": ["’"]})]
+    )
+    assert len(cleaner._ops) == 1
+    assert cleaner("‘Gallia’ est 1") == "Gallia est "
+    with pytest.raises(ValueError, match="Unknown cleaning step"):
+        TextCleaner(["remove_vowels"])
@@ -1,7 +1,12 @@
 import pytest
 
 from cltk.core.data_types import Classification, Doc, Language, Word
-from cltk.core.provenance import add_provenance_record, build_provenance_record
+from cltk.core.provenance import (
+    add_provenance_record,
+    build_provenance_record,
+    canonical_json,
+    sha256_hex,
+)
 from cltk.morphosyntax.ud_pos import UDPartOfSpeechTag
 from cltk.utils.file_outputs import (
     doc_to_conllu,
@@ -59,6 +64,45 @@ def test_readers_guide_includes_provenance_and_confidence() -> None:
     assert "**Confidence:**" in guide
 
 
+def test_readers_guide_lists_per_sentence_prompt_digests() -> None:
+    doc = Doc(language=_language(), raw="A. B.", words=[])
+    prov_ids = {
+        add_provenance_record(
+            doc,
+            build_provenance_record(
+                backend="openai",
+                model="gpt-test",
+                prompt_version="2",
+                prompt_text=f"Analyze: {text}",
+                notes={"sentence_idx": idx},
+            ),
+            set_default=True,
+        )
+        for idx, text in enumerate(["A.", "B."])
+    }
+    assert len(prov_ids) == 1
+    digests = doc.provenance[prov_ids.pop()].sentence_prompt_digests
+    assert digests is not None and len(digests) == 2
+    combined = sha256_hex(canonical_json(digests))
+
+    guide = format_readers_guide(doc, include_provenance=True)
+    assert f"- Prompt: v2 (sha256 per sentence, combined sha256={combined})" in guide
+    assert f"  - Sentence 2: sha256={digests[1]}" in guide
+    cite = next(line for line in guide.splitlines() if line.startswith("- Cite:"))
+    assert combined in cite
+
+    single = Doc(language=_language(), raw="A.", words=[])
+    add_provenance_record(
+        single,
+        build_provenance_record(
+            backend="openai", prompt_text="Analyze: A.", notes={"sentence_idx": 0}
+        ),
+        set_default=True,
+    )
+    guide = format_readers_guide(single, include_provenance=True)
+    assert f"- Prompt: v- (sha256={sha256_hex('Analyze: A.')})" in guide
+
+
 def test_feature_table_includes_provenance_columns() -> None:
     pytest.importorskip("pyarrow")
     doc, prov_id = _doc_with_provenance()